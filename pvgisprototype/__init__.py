@@ -33,26 +33,33 @@
 """
 Dynamic Data Model Initialization
 
-This module generates PVGIS-native data model classes (in fact Pydantic data models)
-from centralized definitions and registers them into the global namespace. The generated
+This module exposes PVGIS-native data model classes (in fact Pydantic data models)
+generated from centralized definitions. Each class is generated on first access,
+through a module-level ``__getattr__`` (PEP 562), and registered into the global
+namespace. A command touching a few data models pays only for these. The generated
 models are then exposed at the package level, so applications usually
 import them directly from ``pvgisprototype`` rather than from this module.
 
 
 Architecture
 ------------
-The initialization process follows these steps :
+Data model classes are preferably taken from the ahead-of-time generated
+``pvgisprototype.core.data_model.models`` module, whose field types and initial
+values are resolved once, when generating it along with the definitions. Only
+if that module is missing, accessing a data model follows these steps :
 
 1. Import data model definitions from ``PVGIS_DATA_MODEL_DEFINITIONS``.
-2. For each data model definition, ask ``DataModelFactory`` to build the corresponding
-   data model class.
-3. Register each generated data model class into the module's global namespace
-4. Remove the raw definitions to keep the public API clean.
+2. Ask ``DataModelFactory`` to build the requested data model class, along with
+   the data model classes its fields depend on.
+3. Register the generated data model class into the module's global namespace
 
 This approach provides several benefits:
 
 - **Centralized Configuration**: All data model schemas defined in one place
-- **Dynamic Generation**: Models created at import time from declarative definitions
+- **Ahead-of-time Generation**: No definition walking at import time, and
+  Pydantic validation schemas are built at first use
+- **Lazy Generation**: Models created on first access only
+- **Dynamic Fallback**: Models created from declarative definitions
 - **Clean Namespace**: Generated models appear as if directly defined in the module
 - **Consistency**: Factory-based approach avoids repetitive boilerplate
 
@@ -69,9 +76,12 @@ Direct imports from this `__init__` module are typically not required.
 
 Implementation Details
 ----------------------
-- Uses `DataModelFactory.get_data_model()` to construct data model classes
-- Modifies `globals()` to register models at module level
-- Definitions are deleted after generation to reduce memory footprint
+- Takes the classes listed in `DATA_MODELS` of the generated module, itself
+  imported on first access, so that importing the package costs nothing
+- Falls back to `DataModelFactory.get_data_model()` to construct data model classes
+- Modifies `globals()` to register models at module level, so that
+  `__getattr__` is called once per data model
+- `generate_data_models()` still generates all data models eagerly
 
 
 See Also
@@ -85,14 +95,20 @@ Notes
 -----
 - All model schemas are centrally defined, making them easy to maintain and evolve
 - Runtime model customization is possible based on configuration
-- Because models are generated dynamically at import time, static analysis tools 
+- The generated module must be regenerated whenever the definitions change
+  (see ``pvgisprototype/core/data_model/generate.py``)
+- Because models are registered dynamically on first access, static analysis tools 
   (IDEs, type checkers) may not recognize them for autocompletion or type checking
 - Consider using type stubs (``.pyi`` files) or explicit type annotations for 
   better IDE support and static analysis
 """
 
-from pvgisprototype.core.factory.data_model import DataModelFactory
-from pvgisprototype.core.data_model.definitions import PVGIS_DATA_MODEL_DEFINITIONS
+from functools import cache
+from threading import RLock
+
+
+# Re-entrant : importing the data models may access other data models
+_data_model_lock = RLock()
 
 
 def generate_data_models(data_model_definitions: dict):
@@ -129,6 +145,8 @@ def generate_data_models(data_model_definitions: dict):
     >>> generate_data_models(definitions)
     >>> # UserModel and ProductModel are now available as module attributes
     """
+    from pvgisprototype.core.factory.data_model import DataModelFactory
+
     for data_model_name in data_model_definitions.keys():
         globals()[data_model_name] = DataModelFactory.get_data_model(
                 data_model_name=data_model_name,
@@ -136,8 +154,59 @@ def generate_data_models(data_model_definitions: dict):
                 )
 
 
-# Generate data models at module import time
-generate_data_models(PVGIS_DATA_MODEL_DEFINITIONS)
+@cache
+def _data_models():
+    """Ahead-of-time generated data models, imported on first need"""
+    try:
+        from pvgisprototype.core.data_model import models
+
+    except ImportError:
+        return None
+
+    return models
+
+
+def _data_model_definitions() -> dict:
+    """Data model definitions, imported on first need"""
+    from pvgisprototype.core.data_model.definitions import PVGIS_DATA_MODEL_DEFINITIONS
+
+    return PVGIS_DATA_MODEL_DEFINITIONS
+
+
+def _data_model_names() -> tuple:
+    if _data_models() is not None:
+        return _data_models().DATA_MODELS
+    return tuple(_data_model_definitions())
+
+
+def __getattr__(name: str):
+    """Generate and register a data model class on first access"""
+    if name.startswith("__"):  # i.e. probing for __path__ or __version__
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    with _data_model_lock:
+        # Another thread may have generated it meanwhile
+        if name in globals():
+            return globals()[name]
+
+        data_models = _data_models()
+        if data_models is not None and name in data_models.DATA_MODELS:
+            data_model = getattr(data_models, name)
+
+        elif data_models is None and name in _data_model_definitions():
+            from pvgisprototype.core.factory.data_model import DataModelFactory
+
+            data_model = DataModelFactory.get_data_model(
+                data_model_name=name,
+                data_model_definitions=_data_model_definitions(),
+            )
+
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+        globals()[name] = data_model
+        return data_model
+
 
-# Remove definitions from namespace : prevent external access, reduce footprint ?
-del(PVGIS_DATA_MODEL_DEFINITIONS)
+def __dir__():
+    return sorted({*globals(), *_data_model_names()})
@@ -264,6 +264,7 @@ def calculate_clear_sky_diffuse_horizontal_irradiance_hofierka(
     # Should this maybe happen already outside this function ? ---------------
     # Suppress negative solar altitude, else we get high-negative diffuse output
     solar_altitude_series.value[solar_altitude_series.value < 0] = np.nan
+    solar_altitude_series.invalidate_memoised_values()  # modified in place
     # ------------------------------------------------------------------------
 
     diffuse_horizontal_irradiance_series = (
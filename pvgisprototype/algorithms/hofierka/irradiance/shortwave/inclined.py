@@ -49,6 +49,12 @@ from pvgisprototype.algorithms.hofierka.irradiance.direct.inclined import calcul
 from pvgisprototype.api.irradiance.diffuse.ground_reflected import (
     calculate_ground_reflected_inclined_irradiance_series,
 )
+from pvgisprototype.api.position.categorical import (
+    CATEGORY_UNSET,
+    SUN_HORIZON_POSITION_CODES,
+    create_categorical_series,
+    decode_sun_horizon_position_series,
+)
 from pvgisprototype.api.position.models import (
     SUN_HORIZON_POSITION_DEFAULT,
     ShadingState,
@@ -161,7 +167,7 @@ def calculate_global_inclined_irradiance_hofierka(
     #     direct_horizontal_irradiance = zero_array
     # # Important ! -----------------------------------------------
 
-    direct_inclined_irradiance_series = DirectInclinedIrradiance(
+    direct_inclined_irradiance_series = DirectInclinedIrradiance.series(
         value=zero_array,
         solar_incidence=SolarIncidence(value=unset_series),
     )
@@ -204,7 +210,7 @@ def calculate_global_inclined_irradiance_hofierka(
     )
 
     # diffuse sky-reflected
-    diffuse_inclined_irradiance_series = DiffuseSkyReflectedInclinedIrradiance(
+    diffuse_inclined_irradiance_series = DiffuseSkyReflectedInclinedIrradiance.series(
         value=zero_array,
         extraterrestrial_normal_irradiance=extraterrestrial_normal_irradiance_series,
         extraterrestrial_horizontal_irradiance=extraterrestrial_horizontal_irradiance_series,
@@ -218,7 +224,7 @@ def calculate_global_inclined_irradiance_hofierka(
 
     # diffuse ground-reflected
     # note : there is no ground-reflected _horizontal_ component as such !
-    ground_reflected_inclined_irradiance_series = DiffuseGroundReflectedInclinedIrradiance(
+    ground_reflected_inclined_irradiance_series = DiffuseGroundReflectedInclinedIrradiance.series(
         value=zero_array
     )
     ground_reflected_inclined_irradiance_series.reflected = zero_array
@@ -231,19 +237,21 @@ def calculate_global_inclined_irradiance_hofierka(
         SunHorizonPositionModel, sun_horizon_position
     )  # Using a Typer callback fails !
     # and keep track of the position of the sun relative to the horizon
-    sun_horizon_position_series = create_array(
-        timestamps.shape, dtype="object", init_method="empty", backend=array_backend
+    sun_horizon_position_series = create_categorical_series(
+        timestamps.shape, backend=array_backend
     )
     # Following, create masks based on the solar altitude series --------
 
     # For sun below the horizon
     if SunHorizonPositionModel.below in sun_horizon_positions:
         mask_below_horizon = solar_altitude_series.value < 0
-        sun_horizon_position_series[mask_below_horizon] = [SunHorizonPositionModel.below.value]
+        sun_horizon_position_series[mask_below_horizon] = SUN_HORIZON_POSITION_CODES[
+            SunHorizonPositionModel.below
+        ]
         if numpy.any(mask_below_horizon):
             logger.info(
-                f"Positions of the sun below horizon :\n{sun_horizon_position_series}",
-                alt=f"Positions of the sun [bold gray50]below horizon[/bold gray50] :\n{sun_horizon_position_series}"
+                lambda: f"Positions of the sun below horizon :\n{decode_sun_horizon_position_series(sun_horizon_position_series)}",
+                alt=lambda: f"Positions of the sun [bold gray50]below horizon[/bold gray50] :\n{decode_sun_horizon_position_series(sun_horizon_position_series)}"
             )
             # no incident radiance without direct sunlight !
             direct_inclined_irradiance_series.value[mask_below_horizon] = 0
@@ -255,10 +263,10 @@ def calculate_global_inclined_irradiance_hofierka(
         mask_low_angle = numpy.logical_and(
             solar_altitude_series.value >= 0,
             solar_altitude_series.value < solar_altitude_series.low_angle_threshold_radians,  # attribute in SolarAltitude data model
-            sun_horizon_position_series == None,  # operate only on unset elements
+            sun_horizon_position_series == CATEGORY_UNSET,  # operate only on unset elements
         )
-        sun_horizon_position_series[mask_low_angle] = [
-            SunHorizonPositionModel.low_angle.value
+        sun_horizon_position_series[mask_low_angle] = SUN_HORIZON_POSITION_CODES[
+            SunHorizonPositionModel.low_angle
         ]
         direct_inclined_irradiance_series.value[mask_low_angle] = (
             0  # Direct radiation is negligible
@@ -268,10 +276,10 @@ def calculate_global_inclined_irradiance_hofierka(
     if SunHorizonPositionModel.above in sun_horizon_positions:
         mask_above_horizon = numpy.logical_and(
             solar_altitude_series.value > 0,
-            sun_horizon_position_series == None,  # operate only on unset elements
+            sun_horizon_position_series == CATEGORY_UNSET,  # operate only on unset elements
         )
-        sun_horizon_position_series[mask_above_horizon] = [
-            SunHorizonPositionModel.above.value
+        sun_horizon_position_series[mask_above_horizon] = SUN_HORIZON_POSITION_CODES[
+            SunHorizonPositionModel.above
         ]
 
         # For sun above horizon and not in shade
@@ -279,14 +287,14 @@ def calculate_global_inclined_irradiance_hofierka(
         mask_above_horizon_not_in_shade = numpy.logical_and(
             mask_above_horizon,
             mask_not_in_shade,
-            sun_horizon_position_series == None,
+            sun_horizon_position_series == CATEGORY_UNSET,
         )
 
         if numpy.any(mask_above_horizon_not_in_shade):
             # sun_horizon_position_series[mask_above_horizon_not_in_shade] = [SunHorizonPositionModel.above.name]
             logger.info(
-                f"Including positions of the sun above horizon and not in shade :\n{sun_horizon_position_series}",
-                alt=f"Including positions of the sun [bold yellow]above horizon[/bold yellow] and [bold red]not in shade[/bold red] :\n{sun_horizon_position_series}"
+                lambda: f"Including positions of the sun above horizon and not in shade :\n{decode_sun_horizon_position_series(sun_horizon_position_series)}",
+                alt=lambda: f"Including positions of the sun [bold yellow]above horizon[/bold yellow] and [bold red]not in shade[/bold red] :\n{decode_sun_horizon_position_series(sun_horizon_position_series)}"
             )
             if verbose > HASH_AFTER_THIS_VERBOSITY_LEVEL:
                 logger.info(
@@ -403,7 +411,7 @@ def calculate_global_inclined_irradiance_hofierka(
     out_of_range, out_of_range_index = identify_values_out_of_range(
         series=global_inclined_irradiance_series,
         shape=timestamps.shape,
-        data_model=GlobalInclinedIrradianceFromExternalData(),
+        data_model=GlobalInclinedIrradianceFromExternalData.series(),
     )
 
     if verbose > DEBUG_AFTER_THIS_VERBOSITY_LEVEL:
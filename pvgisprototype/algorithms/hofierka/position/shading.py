@@ -15,9 +15,14 @@
 # governing permissions and limitations under the Licence.
 #
 from devtools import debug
-from numpy import where
+from numpy import atleast_2d, empty, ndarray, ravel, where
 from xarray import DataArray
 from pvgisprototype import HorizonHeight, LocationShading, SolarAltitude, SolarAzimuth
+from pvgisprototype.api.series.horizon_table import (
+    generate_periodic_interpolation_weights,
+    interpolate_horizon_height,
+    sort_horizon_azimuths,
+)
 from pvgisprototype.core.caching import custom_cached
 from pvgisprototype.constants import (
     ARRAY_BACKEND_DEFAULT,
@@ -37,13 +42,15 @@ from pvgisprototype.validation.functions import (
     validate_with_pydantic,
 )
 
+HORIZON_PROFILES_PER_CHUNK = 256
+
 
 @log_function_call
 @custom_cached
 @validate_with_pydantic(CalculateHorizonHeightSeriesInputModel)
 def calculate_horizon_height_series(
     solar_azimuth_series: SolarAzimuth,
-    horizon_profile: DataArray | None = None,
+    horizon_profile: DataArray | ndarray | None = None,
     dtype: str = DATA_TYPE_DEFAULT,
     array_backend: str = ARRAY_BACKEND_DEFAULT,
     validate_output: bool = VALIDATE_OUTPUT_DEFAULT,
@@ -78,9 +85,16 @@ def calculate_horizon_height_series(
     #     horizon_height_series[needs_interpolation] = horizon_profile.interp(
     #         azimuth=solar_azimuth_series.radians[needs_interpolation]
     #     )
-    if isinstance(horizon_profile, DataArray):
+    if isinstance(horizon_profile, DataArray | ndarray):
+        # A horizon table of equally spaced azimuths or a profile along its
+        # `azimuth` coordinate, interpolated with a periodic wrap at 2π
+        horizon_azimuths = None
+        horizon_heights = horizon_profile
+        if isinstance(horizon_profile, DataArray):
+            horizon_azimuths = horizon_profile["azimuth"].values
+            horizon_heights = horizon_profile.values
 
-        if (horizon_profile == 0).all():
+        if not horizon_heights.any():
             from pvgisprototype.core.arrays import create_array
 
             # If all values are zero, assume flat terrain
@@ -93,27 +107,11 @@ def calculate_horizon_height_series(
             horizon_height_series = create_array(**array_parameters)
 
         else:
-            max_horizon_azimuth = horizon_profile.values.max().item()
-            max_solar_azimuth = solar_azimuth_series.value.max().item()
-
-            if max_solar_azimuth > max_horizon_azimuth:
-                # Before interpollate, append one more pair of solar azimuth at 360 degrees (or 2*pi) and
-                # repeat the 0 degrees solar azimuth value at the 360 degrees solar azimuth
-                from pvgisprototype.constants import pi
-                import xarray as xr
-
-                new_max_horizon_azimuth = 2 * pi
-                last_horizon_height_value = horizon_profile[0].values
-                new_point = xr.DataArray(
-                    [last_horizon_height_value],
-                    dims="azimuth",
-                    coords={"azimuth": [new_max_horizon_azimuth]},
-                )
-                horizon_profile = xr.concat([horizon_profile, new_point], dim="azimuth")
-
-            horizon_height_series = horizon_profile.interp(
+            horizon_height_series = interpolate_horizon_height(
+                horizon_heights=horizon_heights,
                 azimuth=solar_azimuth_series.radians,
-            ).values  # retrieve the NumPy array of values here !
+                horizon_azimuths=horizon_azimuths,
+            )
 
     else:  # we assume a flat terrain
         from pvgisprototype.core.arrays import create_array
@@ -135,7 +133,7 @@ def calculate_horizon_height_series(
 def calculate_surface_in_shade_series_pvgis(
     solar_altitude_series: SolarAltitude,
     solar_azimuth_series: SolarAzimuth,
-    horizon_profile: DataArray | None = None,
+    horizon_profile: DataArray | ndarray | None = None,
     dtype: str = DATA_TYPE_DEFAULT,
     array_backend: str = ARRAY_BACKEND_DEFAULT,
     validate_output: bool = VALIDATE_OUTPUT_DEFAULT,
@@ -174,7 +172,7 @@ def calculate_surface_in_shade_series_pvgis(
     surface_in_shade_series = where(
         solar_altitude_series.value < horizon_height_series.value, True, False
     )
-    logger.debug(f"In shade : {surface_in_shade_series}")
+    logger.debug(lambda: f"In shade : {surface_in_shade_series}")
 
     if verbose > DEBUG_AFTER_THIS_VERBOSITY_LEVEL:
         debug(locals())
@@ -196,3 +194,77 @@ def calculate_surface_in_shade_series_pvgis(
         solar_positioning_algorithm=solar_altitude_series.solar_positioning_algorithm,
         solar_timing_algorithm=solar_altitude_series.solar_timing_algorithm,
     )
+
+
+@log_function_call
+def calculate_surface_in_shade_series_for_horizon_profiles_pvgis(
+    solar_altitude_series: SolarAltitude,
+    solar_azimuth_series: SolarAzimuth,
+    horizon_heights: ndarray,
+    horizon_azimuths: ndarray | None = None,
+    profiles_per_chunk: int = HORIZON_PROFILES_PER_CHUNK,
+    verbose: int = VERBOSE_LEVEL_DEFAULT,
+    log: int = LOG_LEVEL_DEFAULT,
+) -> ndarray:
+    """Determine when a location is in shade for many horizon profiles at once.
+
+    All profiles share the same solar altitude and azimuth series, e.g.
+    candidate surfaces at one location. The solar azimuths are located once
+    among the horizon azimuths and the resulting interpolation weights are
+    applied to all profiles, chunk by chunk to bound memory use.
+
+    Parameters
+    ----------
+    solar_altitude_series: SolarAltitude
+        Solar altitude angles for each timestamp
+    solar_azimuth_series: SolarAzimuth
+        Solar azimuth angles for each timestamp
+    horizon_heights: numpy array
+        Horizon heights, in radians, of shape (profile, azimuth)
+    horizon_azimuths: numpy array, optional
+        Azimuths, in radians, of the horizon heights. If None, equally spaced
+        azimuths starting from North.
+    profiles_per_chunk: int
+        Number of profiles to interpolate at once
+
+    Returns
+    -------
+    NumPy array: Boolean array of shape (profile, time) indicating whether the
+    surface is in shade at each timestamp for each horizon profile.
+
+    Notes
+    -----
+    Unlike `calculate_surface_in_shade_series_pvgis()`, this function is not
+    cached : its key would hash the complete matrix of horizon heights.
+    """
+    horizon_heights, horizon_azimuths = sort_horizon_azimuths(
+        horizon_heights=atleast_2d(horizon_heights),
+        horizon_azimuths=horizon_azimuths,
+    )
+    lower, upper, weights = generate_periodic_interpolation_weights(
+        horizon_azimuths=horizon_azimuths,
+        azimuth=ravel(solar_azimuth_series.radians),
+    )
+    solar_altitude = ravel(solar_altitude_series.value)
+    surface_in_shade_series = empty(
+        (horizon_heights.shape[0], solar_altitude.size), dtype=bool
+    )
+    for start in range(0, horizon_heights.shape[0], profiles_per_chunk):
+        chunk = horizon_heights[start : start + profiles_per_chunk]
+        surface_in_shade_series[start : start + profiles_per_chunk] = solar_altitude < (
+            chunk[:, lower] * (1 - weights) + chunk[:, upper] * weights
+        )
+    logger.debug(
+        lambda: f"Evaluated shading for {horizon_heights.shape[0]} horizon profiles over {solar_altitude.size} timestamps",
+    )
+
+    if verbose > DEBUG_AFTER_THIS_VERBOSITY_LEVEL:
+        debug(locals())
+
+    log_data_fingerprint(
+        data=surface_in_shade_series,
+        log_level=log,
+        hash_after_this_verbosity_level=HASH_AFTER_THIS_VERBOSITY_LEVEL,
+    )
+
+    return surface_in_shade_series
@@ -45,6 +45,11 @@ from pvgisprototype.algorithms.noaa.solar_zenith import (
     calculate_solar_zenith_series_noaa,
 )
 from pvgisprototype.api.datetime.now import now_utc_datetimezone
+from pvgisprototype.api.position.categorical import (
+    CATEGORY_UNSET,
+    SUN_HORIZON_POSITION_CODES,
+    create_categorical_series,
+)
 from pvgisprototype.api.position.models import (
     SUN_HORIZON_POSITION_DEFAULT,
     SunHorizonPositionModel,
@@ -288,8 +293,8 @@ def calculate_solar_incidence_series_iqbal(
     incidence_angle_description = SolarIncidence().description_typical
     if complementary_incidence_angle:
         logger.debug(
-            f":information: Converting solar incidence angle to {COMPLEMENTARY_INCIDENCE_ANGLE_DEFINITION}...",
-            alt=f":information: [bold][magenta]Converting[/magenta] solar incidence angle to {COMPLEMENTARY_INCIDENCE_ANGLE_DEFINITION}[/bold]...",
+            lambda: f":information: Converting solar incidence angle to {COMPLEMENTARY_INCIDENCE_ANGLE_DEFINITION}...",
+            alt=lambda: f":information: [bold][magenta]Converting[/magenta] solar incidence angle to {COMPLEMENTARY_INCIDENCE_ANGLE_DEFINITION}[/bold]...",
         )
         solar_incidence_series = (pi / 2) - solar_incidence_series
         incidence_angle_definition = SolarIncidence().definition_complementary
@@ -302,8 +307,8 @@ def calculate_solar_incidence_series_iqbal(
         SunHorizonPositionModel, sun_horizon_position
     )  # Using a callback fails!
     # and keep track of the position of the sun relative to the horizon
-    sun_horizon_position_series = create_array(
-        timestamps.shape, dtype="object", init_method="empty", backend=array_backend
+    sun_horizon_position_series = create_categorical_series(
+        timestamps.shape, backend=array_backend
     )
     mask_below_horizon = create_array(
         timestamps.shape, dtype="bool", init_method="empty", backend=array_backend
@@ -318,8 +323,8 @@ def calculate_solar_incidence_series_iqbal(
     # For sun below the horizon
     if SunHorizonPositionModel.below in sun_horizon_positions:
         mask_below_horizon = solar_zenith_series.value > pi / 2
-        sun_horizon_position_series[mask_below_horizon] = [
-            SunHorizonPositionModel.below.value
+        sun_horizon_position_series[mask_below_horizon] = SUN_HORIZON_POSITION_CODES[
+            SunHorizonPositionModel.below
         ]
 
     # For very low sun angles
@@ -329,19 +334,19 @@ def calculate_solar_incidence_series_iqbal(
             & (
                 solar_zenith_series.value > solar_zenith_series.low_angle_threshold_radians
             )
-            & (sun_horizon_position_series == None)  # Operate only on unset elements
-        )
-        sun_horizon_position_series[mask_low_angle] = (
-            SunHorizonPositionModel.low_angle.value
+            & (sun_horizon_position_series == CATEGORY_UNSET)  # Operate only on unset elements
         )
+        sun_horizon_position_series[mask_low_angle] = SUN_HORIZON_POSITION_CODES[
+            SunHorizonPositionModel.low_angle
+        ]
 
     if SunHorizonPositionModel.above in sun_horizon_positions:
         mask_above_horizon = numpy.logical_and(
             (solar_zenith_series.value < pi / 2),
-            sun_horizon_position_series == None,  # operate only on unset elements
+            sun_horizon_position_series == CATEGORY_UNSET,  # operate only on unset elements
         )
-        sun_horizon_position_series[mask_above_horizon] = [
-            SunHorizonPositionModel.above.value
+        sun_horizon_position_series[mask_above_horizon] = SUN_HORIZON_POSITION_CODES[
+            SunHorizonPositionModel.above
         ]
 
     # Combine relevant conditions for no solar incidence
@@ -349,14 +354,14 @@ def calculate_solar_incidence_series_iqbal(
         (solar_incidence_series < 0)
         | mask_below_horizon
         | surface_in_shade_series.value,
-        sun_horizon_position_series == None,
+        sun_horizon_position_series == CATEGORY_UNSET,
     )
 
     # Zero out negative solar incidence angles : is the default behavior !
     if zero_negative_solar_incidence_angle:
         logger.debug(
-            f":information: Setting negative solar incidence angle values to zero...",
-            alt=f":information: [bold][magenta]Setting[/magenta] [red]negative[/red] solar incidence angle values to [bold]zero[/bold]...",
+            lambda: f":information: Setting negative solar incidence angle values to zero...",
+            alt=lambda: f":information: [bold][magenta]Setting[/magenta] [red]negative[/red] solar incidence angle values to [bold]zero[/bold]...",
         )
         solar_incidence_series = numpy.where(
             mask_no_solar_incidence_series,
@@ -139,8 +139,8 @@ def calculate_reflectivity_factor_for_direct_irradiance_series(
 
     """
     logger.debug(
-        f"> Executing solar radiation modelling function calculate_reflectivity_factor_for_direct_irradiance_series()",
-        alt=f"> Executing [underline]solar radiation modelling[/underline] function calculate_reflectivity_factor_for_direct_irradiance_series()",
+        lambda: f"> Executing solar radiation modelling function calculate_reflectivity_factor_for_direct_irradiance_series()",
+        alt=lambda: f"> Executing [underline]solar radiation modelling[/underline] function calculate_reflectivity_factor_for_direct_irradiance_series()",
     )
     try:
         numerator = 1 - np.exp(
@@ -165,8 +165,8 @@ def calculate_reflectivity_factor_for_direct_irradiance_series(
         )
 
         logger.debug(
-            f"  < Returning incidence angle modifier series :\n{incidence_angle_modifier_series}",
-            alt=f"  [green]<[/green] Returning incidence angle modifier series :\n{incidence_angle_modifier_series}",
+            lambda: f"  < Returning incidence angle modifier series :\n{incidence_angle_modifier_series}",
+            alt=lambda: f"  [green]<[/green] Returning incidence angle modifier series :\n{incidence_angle_modifier_series}",
         )
 
         return incidence_angle_modifier_series
@@ -222,8 +222,8 @@ def calculate_reflectivity_factor_for_nondirect_irradiance(
 
     """
     logger.debug(
-        f"> Executing solar radiation modelling function calculate_reflectivity_factor_for_nondirect_irradiance()",
-        alt=f"> Executing [underline]solar radiation modelling[/underline] function calculate_reflectivity_factor_for_nondirect_irradiance()",
+        lambda: f"> Executing solar radiation modelling function calculate_reflectivity_factor_for_nondirect_irradiance()",
+        alt=lambda: f"> Executing [underline]solar radiation modelling[/underline] function calculate_reflectivity_factor_for_nondirect_irradiance()",
     )
     angular_loss_coefficient_product = angular_loss_coefficient / 2 - 0.154
     c1 = 4 / (3 * pi)
@@ -238,8 +238,8 @@ def calculate_reflectivity_factor_for_nondirect_irradiance(
         debug(locals())
 
     logger.debug(
-        f"  < Returning incidence angle modifier :\n{incidence_angle_modifier}",
-        alt=f"  [green]<[/green] Returning incidence angle modifier :\n{incidence_angle_modifier}",
+        lambda: f"  < Returning incidence angle modifier :\n{incidence_angle_modifier}",
+        alt=lambda: f"  [green]<[/green] Returning incidence angle modifier :\n{incidence_angle_modifier}",
     )
 
     return incidence_angle_modifier
@@ -56,6 +56,7 @@ from pvgisprototype.algorithms.martin_ruiz.reflectivity import (
     calculate_reflectivity_effect,
     calculate_reflectivity_factor_for_nondirect_irradiance,
 )
+from pvgisprototype.api.position.categorical import create_categorical_series
 from pvgisprototype.api.position.models import (
     ShadingState,
 )
@@ -204,8 +205,8 @@ def calculate_clear_sky_diffuse_inclined_irradiance_muneer(
     # calculated from external time series  Or  modelled
 
     # Initialise shading_state_series to avoid the "UnboundLocalError"
-    shading_state_series = create_array(
-        timestamps.shape, dtype='object', init_method="empty", backend=array_backend
+    shading_state_series = create_categorical_series(
+        timestamps.shape, backend=array_backend
     )
     nan_series = create_array(
         timestamps.shape, dtype=dtype, init_method=np.nan, backend=array_backend
@@ -359,10 +360,6 @@ def calculate_clear_sky_diffuse_inclined_irradiance_muneer(
             diffuse_horizontal_irradiance=diffuse_horizontal_irradiance_series,
         )
 
-    # Replace None with a placeholder -- this is important for printing !
-    shading_state_series = np.where(
-        shading_state_series == None, "Unset", shading_state_series
-    )
     # ------------------------------------------------------------------------
 
     # diffuse_inclined_irradiance_series = np.nan_to_num(
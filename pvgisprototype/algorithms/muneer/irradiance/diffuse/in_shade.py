@@ -21,6 +21,10 @@ from pvgisprototype.log import log_function_call, logger
 from pvgisprototype.algorithms.muneer.irradiance.diffuse.sky_irradiance import (
     calculate_diffuse_sky_irradiance_series_hofierka,
 )
+from pvgisprototype.api.position.categorical import (
+    SHADING_STATE_CODES,
+    decode_shading_state_series,
+)
 from pvgisprototype.api.position.models import (
     ShadingState,
 )
@@ -55,10 +59,10 @@ def calculate_diffuse_inclined_irradiance_in_shade(
         # Is this the _complementary_ incidence angle series ?
         #  Review Me -----------------------------------------------------
         if np.any(mask_surface_in_shade_series):
-            shading_state_series[mask_surface_in_shade_series] = ShadingState.in_shade.value
+            shading_state_series[mask_surface_in_shade_series] = SHADING_STATE_CODES[ShadingState.in_shade]
             logger.info(
-                f"Shading state series including {ShadingState.in_shade.value} :\n{shading_state_series}",
-                alt=f"[bold]Shading state[/bold] series including [bold white]{ShadingState.in_shade.value}[/bold white] :\n{shading_state_series}",
+                lambda: f"Shading state series including {ShadingState.in_shade.value} :\n{decode_shading_state_series(shading_state_series)}",
+                alt=lambda: f"[bold]Shading state[/bold] series including [bold white]{ShadingState.in_shade.value}[/bold white] :\n{decode_shading_state_series(shading_state_series)}",
             )
             diffuse_sky_irradiance[mask_surface_in_shade_series] = (
                 calculate_diffuse_sky_irradiance_series_hofierka(
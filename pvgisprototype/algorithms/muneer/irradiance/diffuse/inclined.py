@@ -61,6 +61,7 @@ from pvgisprototype.algorithms.martin_ruiz.reflectivity import (
 from pvgisprototype.algorithms.hofierka.irradiance.extraterrestrial.normal import (
     calculate_extraterrestrial_normal_irradiance_hofierka,
 )
+from pvgisprototype.api.position.categorical import create_categorical_series
 from pvgisprototype.api.position.models import (
     ShadingState,
 )
@@ -147,11 +148,8 @@ def calculate_diffuse_inclined_irradiance_muneer(
     # calculated from external time series  Or  modelled
 
     # Initialise shading_state_series to avoid the "UnboundLocalError"
-    shading_state_series = create_array(
-        shape=timestamps.shape,
-        dtype="object",
-        init_method="empty",
-        backend=array_backend,
+    shading_state_series = create_categorical_series(
+        timestamps.shape, backend=array_backend
     )
     nan_series = create_array(**extended_array_parameters, init_method=np.nan)
     unset_series = create_array(**extended_array_parameters, init_method="unset")
@@ -285,10 +283,6 @@ def calculate_diffuse_inclined_irradiance_muneer(
             **diffuse_irradiance,
         )
 
-    # Replace None with a placeholder -- this is important for printing !
-    shading_state_series = np.where(
-        shading_state_series == None, "Unset", shading_state_series
-    )
     # ------------------------------------------------------------------------
 
     # diffuse_inclined_irradiance_series = np.nan_to_num(
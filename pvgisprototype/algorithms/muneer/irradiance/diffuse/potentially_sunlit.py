@@ -18,6 +18,11 @@ from pvgisprototype import (
     SurfaceOrientation,
 )
 from pvgisprototype.log import log_function_call, logger
+from pvgisprototype.api.position.categorical import (
+    CATEGORY_UNSET,
+    SHADING_STATE_CODES,
+    decode_shading_state_series,
+)
 from pvgisprototype.api.position.models import (
     ShadingState,
 )
@@ -44,14 +49,14 @@ def calculate_diffuse_inclined_irradiance_potentially_sunlit(
         mask_potentially_sunlit_surface_series = np.logical_and(
                 solar_altitude.radians > 0,  #  sun above horizon
             solar_altitude.radians < 0.1,  #  radians or < 5.7 degrees
-            shading_state_series == None  # operate only on unset elements
+            shading_state_series == CATEGORY_UNSET  # operate only on unset elements
         )
         # else:  # if solar altitude < 0.1 : potentially sunlit surface series
         if np.any(mask_potentially_sunlit_surface_series):
-            shading_state_series[mask_potentially_sunlit_surface_series] = ShadingState.potentially_sunlit.value
+            shading_state_series[mask_potentially_sunlit_surface_series] = SHADING_STATE_CODES[ShadingState.potentially_sunlit]
             logger.info(
-                f"Shading state series including {ShadingState.potentially_sunlit.value} :\n{shading_state_series}",
-                alt=f"[bold]Shading state[/bold] series including [bold orange]{ShadingState.potentially_sunlit.value}[/bold orange] :\n{shading_state_series}",
+                lambda: f"Shading state series including {ShadingState.potentially_sunlit.value} :\n{decode_shading_state_series(shading_state_series)}",
+                alt=lambda: f"[bold]Shading state[/bold] series including [bold orange]{ShadingState.potentially_sunlit.value}[/bold orange] :\n{decode_shading_state_series(shading_state_series)}",
             )
             # requires the solar azimuth
             # Normalize the azimuth difference to be within the range -pi to pi
@@ -15,6 +15,11 @@
 # governing permissions and limitations under the Licence.
 #
 from pvgisprototype.log import log_function_call, logger
+from pvgisprototype.api.position.categorical import (
+    CATEGORY_UNSET,
+    SHADING_STATE_CODES,
+    decode_shading_state_series,
+)
 from pvgisprototype.api.position.models import (
     ShadingState,
 )
@@ -37,17 +42,17 @@ def calculate_diffuse_inclined_irradiance_sunlit(
     if ShadingState.sunlit in shading_states:
         mask_sunlit_surface_series = np.logical_and(
             solar_altitude.radians >= 0.1,  # or >= 5.7 degrees
-            shading_state_series == None  # operate only on unset elements
+            shading_state_series == CATEGORY_UNSET  # operate only on unset elements
         )
         # else:  # sunlit surface and non-overcast sky
         #     # ----------------------------------------------------------------
         #     solar_azimuth_series = None ?
         #     # ----------------------------------------------------------------
         if np.any(mask_sunlit_surface_series):
-            shading_state_series[mask_sunlit_surface_series] = ShadingState.sunlit.value
+            shading_state_series[mask_sunlit_surface_series] = SHADING_STATE_CODES[ShadingState.sunlit]
             logger.info(
-                f"Shading state series including {ShadingState.sunlit.value} :\n{shading_state_series}",
-                alt=f"[bold]Shading state[/bold] series including [bold yellow]{ShadingState.sunlit.value}[/bold yellow] :\n{shading_state_series}",
+                lambda: f"Shading state series including {ShadingState.sunlit.value} :\n{decode_shading_state_series(shading_state_series)}",
+                alt=lambda: f"[bold]Shading state[/bold] series including [bold yellow]{ShadingState.sunlit.value}[/bold yellow] :\n{decode_shading_state_series(shading_state_series)}",
             )
             diffuse_inclined_irradiance[
                 mask_sunlit_surface_series
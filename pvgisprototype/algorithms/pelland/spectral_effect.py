@@ -14,9 +14,13 @@
 # OF ANY KIND, either express or implied. See the Licence for the specific language
 # governing permissions and limitations under the Licence.
 #
-from pvgisprototype import SpectralFactorSeries
+from typing import Dict, Hashable
+
+import numpy
 from pandas import DataFrame
 from xarray import DataArray
+
+from pvgisprototype import SpectralFactorSeries
 from pvgisprototype.constants import (
     SPECTRAL_FACTOR_COLUMN_NAME,
     SPECTRAL_FACTOR_NAME,
@@ -26,131 +30,175 @@ from pvgisprototype.constants import (
 from pvgisprototype.log import log_function_call, logger
 
 
+def _zero_missing(array: numpy.ndarray) -> numpy.ndarray:
+    """Replace NaN with 0 so that matrix products behave like `skipna` sums."""
+    return numpy.where(numpy.isnan(array), 0, array)
+
+
 @log_function_call
-def calculate_spectral_factor_pelland(
+def calculate_spectral_factors_pelland(
     irradiance: DataArray,
-    responsivity: DataFrame,
+    responsivities: Dict[Hashable, DataArray],
     reference_spectrum: DataFrame,
-) -> DataFrame:
-    """Calculate the spectral factor for each PV technology based on
-    Pelland 2022.
+) -> Dict[Hashable, SpectralFactorSeries]:
+    """Calculate the spectral factor for multiple PV technologies at once
+    based on Pelland 2022.
+
+    The spectral responsivities of all requested PV technologies are stacked
+    into a single (module, band) matrix. The reference current densities are
+    computed once for the given reference spectrum and the observed current
+    densities for all technologies are derived from a single matrix product
+    over the (time, band) spectrally resolved irradiance.
+
+    Parameters
+    ----------
+    irradiance : DataArray
+        Spectrally resolved irradiance with a `center_wavelength` dimension
+    responsivities : dict
+        Spectral responsivity per PV technology, each along the
+        `center_wavelength` dimension
+    reference_spectrum : DataFrame
+        Reference spectrum whose row `global` is indexed by wavelength
+
+    Returns
+    -------
+    dict
+        A SpectralFactorSeries per key of the `responsivities` input
 
     Notes
     -----
-    Some Python source code shared via personal communication.
+    Missing (NaN) values are ignored in the sums, as in xarray's and pandas'
+    default `skipna` behaviour. Each PV technology is evaluated over the
+    wavelengths common to the irradiance, the reference spectrum and its own
+    responsivity, i.e. independently of the other requested technologies. A
+    (module, band) mask of these wavelengths restricts the sums per module.
 
     """
-    # Verify the reference spectrum is valid (no zero or near-zero values) ?
-    # if (reference_spectrum <= 0).any():
-    #     raise ValueError(
-    #         "The reference spectrum contains zero or negative values, which are invalid."
-    #     )
-    # else:
-    #     print(f'Reference spectrum input : {reference_spectrum}')
-
-    # Align wavelengths (columns) between dataframes
-    # if not isinstance(irradiance, DataFrame):
-    #     irradiance = irradiance.to_dataframe()
-    # wavelengths = irradiance.columns.intersection(responsivity.index).intersection(
-    #     reference_spectrum.columns
-    # )
-    import numpy
-
-    logger.debug(
-        f"Wavelengths in `irradiance` input : {irradiance.center_wavelength.values}",
-    )
-    logger.debug(
-        f"Wavelengths in `responsivity` input : {responsivity}",
-    )
-    logger.debug(
-        f"Wavelengths in `reference_spectrum` input : {reference_spectrum.columns}"
-    )
-
-    # Common wavelength range
+    # Common wavelength range of the irradiance and the reference spectrum
     common_wavelengths = numpy.intersect1d(
-        irradiance.center_wavelength.values,
-        numpy.intersect1d(responsivity.center_wavelength, reference_spectrum.columns),
+        irradiance.center_wavelength.values, reference_spectrum.columns
     )
+    # Wavelengths of each module's responsivity within the common range
+    wavelength_mask = numpy.stack(
+        [
+            numpy.isin(common_wavelengths, responsivity.center_wavelength.values)
+            for responsivity in responsivities.values()
+        ]
+    )  # (module, band)
     logger.debug(
-        f"Intersection of wavelengths across input data : {common_wavelengths}"
+        lambda: f"Intersection of wavelengths across input data : {wavelength_mask.sum(axis=-1)} bands per module"
     )
 
     # in Pelland : useful reference spectrum > average over the reference spectrum
-    responsivity_selected = responsivity.sel(center_wavelength=common_wavelengths)
-    logger.debug(f"Selected responsivity data : {responsivity_selected}")
+    responsivity_matrix = numpy.stack(
+        [
+            responsivity.reindex(center_wavelength=common_wavelengths).to_numpy()
+            for responsivity in responsivities.values()
+        ]
+    )  # (module, band), NaN outside each module's wavelengths
+    responsivity_matrix = _zero_missing(responsivity_matrix)
+    band_weights = wavelength_mask.astype(responsivity_matrix.dtype)
 
-    reference_spectrum_selected = reference_spectrum.loc["global", common_wavelengths]
-    logger.debug(f"Selected reference spectrum data : {reference_spectrum_selected}")
+    reference_spectrum_selected = _zero_missing(
+        reference_spectrum.loc["global", common_wavelengths].to_numpy(dtype=float)
+    )
 
     # in Pelland 2022 : useful fraction of reference spectrum
-    reference_current_density = (
-        responsivity_selected * reference_spectrum_selected
-    ).sum() / reference_spectrum_selected.sum()
+    reference_current_densities = (
+        responsivity_matrix @ reference_spectrum_selected
+    ) / (band_weights @ reference_spectrum_selected)  # (module,)
     logger.debug(
-        f"Reference Current Density : {reference_current_density}",
-        alt=f"[bold][yellow]Reference[/yellow] current density[/bold] : {reference_current_density}",
+        lambda: f"Reference Current Densities : {reference_current_densities}",
+        alt=lambda: f"[bold][yellow]Reference[/yellow] current densities[/bold] : {reference_current_densities}",
     )
 
     # useful irradiance (time-varying)
     irradiance_selected = irradiance.sel(center_wavelength=common_wavelengths)
-    logger.debug(f"Selected irradiance data : {irradiance_selected}")
+    irradiance_matrix = _zero_missing(
+        irradiance_selected.transpose(..., "center_wavelength").to_numpy()
+    )  # (time, band)
     sum_of_responsivity_by_irradiance = (
-        responsivity_selected * irradiance_selected
-    ).sum(dim="center_wavelength")
-    logger.debug(
-        f"Sum of responsivity * irradiance : {sum_of_responsivity_by_irradiance}"
-    )
-    sum_of_irradiance = (irradiance_selected).sum(dim="center_wavelength")
-    logger.debug(f"Sum of irradiance : {sum_of_irradiance}")
-
-    observed_current_density = (responsivity_selected * irradiance_selected).sum(
-        dim="center_wavelength"
-    ) / irradiance_selected.sum(dim="center_wavelength")
-    logger.debug(f"Current Density of Observed Irradiance : {observed_current_density}")
-
-    spectral_factor = observed_current_density / reference_current_density
-    logger.debug(f"Spectral factor = {spectral_factor}")
-
-    components_container = {
-        "Metadata": lambda: {},
-        "Spectral factor": lambda: {
-            TITLE_KEY_NAME: SPECTRAL_FACTOR_NAME,
-            SPECTRAL_FACTOR_COLUMN_NAME: spectral_factor.to_numpy(),
-        },  # if verbose > 0 else {},
-        "Inputs": lambda: {
-            "Irradiance": irradiance,
-            "Responsivity": responsivity,
-            "Reference spectrum": reference_spectrum,
-        },
-        "Intermediate quantities": lambda: {
-            "Common spectral wavelengths": common_wavelengths,
-            "Selected spectral responsivity": responsivity_selected,
-            "Selected observed irradiance": irradiance_selected,
-            "Selected reference spectrum": reference_spectrum_selected,
-        },
-        "Sum of quantities": lambda: {
-            "Sum of Irradiance": sum_of_irradiance,
-            "Sum of responsivity by irradiance": sum_of_responsivity_by_irradiance,
-            "Sum of Reference spectrum": reference_spectrum.sum(),
-        },
-        # "Energy" : lambda: {
-        #     'Reference energy': total_reference_energy,
-        #     'Observed energy': total_observed_energy,
-        #     },
-        "Current density": lambda: {
-            "Reference current": reference_current_density,
-            "Observed current": observed_current_density,
-        },
-        # if verbose > 1
-        # else {},
-    }
-    components = {}
-    for _, component in components_container.items():
-        components.update(component())
-
-    return SpectralFactorSeries(
-        value=spectral_factor.to_numpy(),
-        unit=UNITLESS,
-        spectral_factor_algorithm="Pelland 2022",
-        components=components,
+        irradiance_matrix @ responsivity_matrix.T
+    )  # (time, module)
+    sum_of_irradiance = irradiance_matrix @ band_weights.T  # (time, module)
+    observed_current_densities = (
+        sum_of_responsivity_by_irradiance / sum_of_irradiance
     )
+    spectral_factors = observed_current_densities / reference_current_densities
+    logger.debug(lambda: f"Spectral factors array of shape {spectral_factors.shape}")
+
+    spectral_factor_series = {}
+    for index, (module_type, responsivity) in enumerate(responsivities.items()):
+        spectral_factor = spectral_factors[..., index]
+        module_bands = wavelength_mask[index]
+        components_container = {
+            "Metadata": lambda: {},
+            "Spectral factor": lambda: {
+                TITLE_KEY_NAME: SPECTRAL_FACTOR_NAME,
+                SPECTRAL_FACTOR_COLUMN_NAME: spectral_factor,
+            },  # if verbose > 0 else {},
+            "Inputs": lambda: {
+                "Irradiance": irradiance,
+                "Responsivity": responsivity,
+                "Reference spectrum": reference_spectrum,
+            },
+            "Intermediate quantities": lambda: {
+                "Common spectral wavelengths": common_wavelengths[module_bands],
+                "Selected spectral responsivity": responsivity_matrix[index][
+                    module_bands
+                ],
+                "Selected observed irradiance": irradiance_selected.isel(
+                    center_wavelength=module_bands
+                ),
+                "Selected reference spectrum": reference_spectrum_selected[
+                    module_bands
+                ],
+            },
+            "Sum of quantities": lambda: {
+                "Sum of Irradiance": sum_of_irradiance[..., index],
+                "Sum of responsivity by irradiance": sum_of_responsivity_by_irradiance[
+                    ..., index
+                ],
+                "Sum of Reference spectrum": reference_spectrum.sum(),
+            },
+            "Current density": lambda: {
+                "Reference current": reference_current_densities[index],
+                "Observed current": observed_current_densities[..., index],
+            },
+        }
+        components = {}
+        for _, component in components_container.items():
+            components.update(component())
+
+        spectral_factor_series[module_type] = SpectralFactorSeries(
+            value=spectral_factor,
+            unit=UNITLESS,
+            spectral_factor_algorithm="Pelland 2022",
+            components=components,
+        )
+
+    return spectral_factor_series
+
+
+@log_function_call
+def calculate_spectral_factor_pelland(
+    irradiance: DataArray,
+    responsivity: DataArray,
+    reference_spectrum: DataFrame,
+) -> SpectralFactorSeries:
+    """Calculate the spectral factor for a single PV technology based on
+    Pelland 2022.
+
+    Notes
+    -----
+    Some Python source code shared via personal communication.
+
+    See also `calculate_spectral_factors_pelland()` which evaluates multiple
+    PV technologies in one pass.
+
+    """
+    return calculate_spectral_factors_pelland(
+        irradiance=irradiance,
+        responsivities={None: responsivity},
+        reference_spectrum=reference_spectrum,
+    )[None]
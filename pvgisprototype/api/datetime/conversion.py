@@ -48,8 +48,8 @@ def convert_timestamps_to_utc(
         user_requested_timestamps = Timestamp.now()
 
     logger.debug(
-        f"Input time zone : {user_requested_timezone}",
-        alt=f"Input time zone : [code]{user_requested_timezone}[/code]",
+        lambda: f"Input time zone : {user_requested_timezone}",
+        alt=lambda: f"Input time zone : [code]{user_requested_timezone}[/code]",
     )
     utc_timestamps = user_requested_timestamps  # Fallback if already UTC
 
@@ -57,15 +57,15 @@ def convert_timestamps_to_utc(
     if user_requested_timestamps.tz is None:
         utc_timestamps = user_requested_timestamps.tz_localize(ZONEINFO_UTC)
         logger.debug(
-            f"Naive input timestamps\n({user_requested_timestamps})\nlocalized to UTC aware for all internal calculations :\n{utc_timestamps}"
+            lambda: f"Naive input timestamps\n({user_requested_timestamps})\nlocalized to UTC aware for all internal calculations :\n{utc_timestamps}"
         )
 
     # timezone aware timestamps
     elif user_requested_timestamps.tz != ZONEINFO_UTC:
         utc_timestamps = user_requested_timestamps.tz_convert(ZONEINFO_UTC)
         logger.debug(
-            f"Input zone\n{user_requested_timezone}\n& timestamps :\n{user_requested_timestamps}\n\nconverted for all internal calculations to :\n{utc_timestamps}",
-            alt=f"Input zone : [code]{user_requested_timezone}[/code]\n& timestamps :\n{user_requested_timestamps}\n\nconverted for all internal calculations to :\n{utc_timestamps}",
+            lambda: f"Input zone\n{user_requested_timezone}\n& timestamps :\n{user_requested_timestamps}\n\nconverted for all internal calculations to :\n{utc_timestamps}",
+            alt=lambda: f"Input zone : [code]{user_requested_timezone}[/code]\n& timestamps :\n{user_requested_timestamps}\n\nconverted for all internal calculations to :\n{utc_timestamps}",
         )
 
     return utc_timestamps
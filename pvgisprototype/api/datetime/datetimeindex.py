@@ -212,8 +212,8 @@ def generate_timestamps(
     # Extract timestamps from first available space-time data file
     if data_file is not None:
         logger.debug(
-            f"Retrieving timestamps from input time series data {data_file}",
-            alt=f"[bold]Retrieving[/bold] timestamps from input time series data [code]{data_file}[/code]",
+            lambda: f"Retrieving timestamps from input time series data {data_file}",
+            alt=lambda: f"[bold]Retrieving[/bold] timestamps from input time series data [code]{data_file}[/code]",
         )
         if isinstance(data_file, Path | str):
             timestamps = read_data_array_or_set(data_file).time  # type: ignore
@@ -272,13 +272,13 @@ def generate_timestamps(
         if start_time or end_time:
 
             logger.debug(
-                f"> Slicing timestamps from {start_time} to {end_time}",
-                alt=f"> [bold]Slicing[/bold] timestamps from {start_time} to {end_time}",
+                lambda: f"> Slicing timestamps from {start_time} to {end_time}",
+                alt=lambda: f"> [bold]Slicing[/bold] timestamps from {start_time} to {end_time}",
             )
             timestamps = timestamps.sel(time=slice(start_time, end_time))
             logger.debug(
-                f"  : Slice of timestamps :\n{timestamps}",
-                alt=f"  [blue]:[/blue] Slice of timestamps :\n{timestamps}",
+                lambda: f"  : Slice of timestamps :\n{timestamps}",
+                alt=lambda: f"  [blue]:[/blue] Slice of timestamps :\n{timestamps}",
             )
 
         if start_time and periods and not end_time:
@@ -318,8 +318,8 @@ def generate_timestamps(
 
     else:
         logger.debug(
-            f"  + Generating timestamps based on user-requested time series parameters",
-            alt=f"  [magenta]+[/magenta] [bold]Generating[/bold] timestamps based on user-requested time series parameters",
+            lambda: f"  + Generating timestamps based on user-requested time series parameters",
+            alt=lambda: f"  [magenta]+[/magenta] [bold]Generating[/bold] timestamps based on user-requested time series parameters",
         )
         timestamps = generate_datetime_series(
             start_time=start_time,
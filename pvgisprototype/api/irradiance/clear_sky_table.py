@@ -0,0 +1,508 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Precomputed per-pixel clear-sky irradiance tables
+
+The clear-sky direct and diffuse horizontal irradiance after Hofierka (2002)
+depend only on the location, the elevation, the Linke turbidity factor and
+the solar geometry. For a given pixel and monthly Linke turbidity factors,
+they are a climatology over the day of the year and the time of the day.
+
+A clear-sky table holds this climatology for all pixels of a grid, sampled
+every `day_step` days of a reference leap year and every `time_step` minutes
+of a UTC day, including the end of the day. It is written once and memory-
+mapped on reading. The clear-sky functions then replace the solar position
+and the clear-sky model calculations by a bilinear lookup over the day of the
+year and the time of the day, as long as the request matches the parameters
+the table was computed with.
+
+A clear-sky table is a directory holding :
+
+- `irradiance.npy` : the `(latitude * longitude, component, day, time)`
+  float32 table, where the components are the direct and the diffuse
+  horizontal irradiance
+- `grid.npz` : the longitude and latitude axes in degrees, the elevation and
+  the monthly Linke turbidity factors of each pixel, the sampling steps and
+  the parameters of the clear-sky model
+"""
+
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import lru_cache
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+import numpy
+from numpy.lib.format import open_memmap
+from pandas import DatetimeIndex, Timedelta, date_range
+
+from pvgisprototype import LinkeTurbidityFactor
+from pvgisprototype.api.position.models import (
+    SOLAR_POSITION_ALGORITHM_DEFAULT,
+    SolarPositionModel,
+)
+from pvgisprototype.api.series.linke_turbidity import (
+    MONTHS_IN_A_YEAR,
+    expand_monthly_linke_turbidity,
+)
+from pvgisprototype.constants import (
+    ATMOSPHERIC_REFRACTION_FLAG_DEFAULT,
+    ECCENTRICITY_CORRECTION_FACTOR,
+    ECCENTRICITY_PHASE_OFFSET,
+    SOLAR_CONSTANT,
+    TOLERANCE_DEFAULT,
+)
+from pvgisprototype.log import logger
+
+CLEAR_SKY_TABLE_SUFFIX = ".clearsky"
+CLEAR_SKY_TABLE_IRRADIANCE = "irradiance.npy"
+CLEAR_SKY_TABLE_GRID = "grid.npz"
+CLEAR_SKY_TABLE_CACHE_MAXSIZE = 4
+CLEAR_SKY_TABLE_TIME_STEP_DEFAULT = 15  # minutes
+CLEAR_SKY_TABLE_DAY_STEP_DEFAULT = 1  # days
+CLEAR_SKY_TABLE_TOLERANCE_DEFAULT = 10  # W/m², maximum absolute difference from the analytical path
+CLEAR_SKY_TABLE_REFERENCE_YEAR = 2024  # a leap year : every day of any year is in
+DAYS_IN_REFERENCE_YEAR = 366
+MINUTES_IN_A_DAY = 1440
+FIRST_DAY_AFTER_FEBRUARY_IN_COMMON_YEARS = 60
+
+
+class ClearSkyComponent(IntEnum):
+    direct = 0
+    diffuse = 1
+
+
+def _reference_day_of_year(timestamps: DatetimeIndex) -> numpy.ndarray:
+    """Day of the year, from 0, in the reference leap year for the same date"""
+    day_of_year = timestamps.dayofyear.to_numpy() - 1
+    after_february_in_common_year = ~timestamps.is_leap_year & (
+        day_of_year >= FIRST_DAY_AFTER_FEBRUARY_IN_COMMON_YEARS - 1
+    )
+    return day_of_year + after_february_in_common_year
+
+
+def generate_clear_sky_table_timestamps(
+    time_step: int = CLEAR_SKY_TABLE_TIME_STEP_DEFAULT,
+    day_step: int = CLEAR_SKY_TABLE_DAY_STEP_DEFAULT,
+) -> DatetimeIndex:
+    """UTC timestamps of the `(day, time)` samples of a clear-sky table
+
+    Each sampled day of the reference year spans from 00:00 up to and
+    including 24:00, i.e. the midnight of the following day, so that the
+    lookup of any time of the day is between two samples of the same day.
+    """
+    days = date_range(
+        start=f"{CLEAR_SKY_TABLE_REFERENCE_YEAR}-01-01",
+        periods=-(-DAYS_IN_REFERENCE_YEAR // day_step),
+        freq=f"{day_step}D",
+    )
+    times = numpy.arange(0, MINUTES_IN_A_DAY + 1, time_step)
+    if times[-1] != MINUTES_IN_A_DAY:
+        raise ValueError(f"The time step of {time_step} minutes does not divide a day")
+
+    minutes = (days.to_numpy()[:, None] + times * numpy.timedelta64(1, "m")).ravel()
+    return DatetimeIndex(minutes)
+
+
+def calculate_clear_sky_table_pixel(
+    longitude: float,
+    latitude: float,
+    elevation: float,
+    monthly_linke_turbidity: numpy.ndarray,
+    timestamps: DatetimeIndex,
+    solar_position_model: SolarPositionModel = SOLAR_POSITION_ALGORITHM_DEFAULT,
+    adjust_for_atmospheric_refraction: bool = ATMOSPHERIC_REFRACTION_FLAG_DEFAULT,
+    solar_constant: float = SOLAR_CONSTANT,
+    eccentricity_phase_offset: float = ECCENTRICITY_PHASE_OFFSET,
+    eccentricity_amplitude: float = ECCENTRICITY_CORRECTION_FACTOR,
+) -> numpy.ndarray:
+    """Clear-sky direct and diffuse horizontal irradiance of a pixel
+
+    Returns
+    -------
+    numpy.ndarray
+        The `(component, timestamp)` clear-sky irradiance calculated along the
+        analytical path
+    """
+    # imported here : the clear-sky functions look tables up in this module
+    from pvgisprototype.api.irradiance.diffuse.clear_sky.horizontal import (
+        calculate_clear_sky_diffuse_horizontal_irradiance,
+    )
+    from pvgisprototype.api.irradiance.direct.horizontal import (
+        calculate_clear_sky_direct_horizontal_irradiance_series,
+    )
+
+    parameters = {
+        "longitude": numpy.radians(longitude),
+        "latitude": numpy.radians(latitude),
+        "timestamps": timestamps,
+        "timezone": ZoneInfo("UTC"),
+        "solar_position_model": solar_position_model,
+        "adjust_for_atmospheric_refraction": adjust_for_atmospheric_refraction,
+        "linke_turbidity_factor_series": expand_monthly_linke_turbidity(
+            monthly_linke_turbidity, timestamps
+        ),
+        "solar_constant": solar_constant,
+        "eccentricity_phase_offset": eccentricity_phase_offset,
+        "eccentricity_amplitude": eccentricity_amplitude,
+    }
+    direct = calculate_clear_sky_direct_horizontal_irradiance_series(
+        elevation=elevation, **parameters
+    )
+    diffuse = calculate_clear_sky_diffuse_horizontal_irradiance(**parameters)
+
+    return numpy.stack([direct.value, diffuse.value])
+
+
+def write_clear_sky_table(
+    longitude: numpy.ndarray,
+    latitude: numpy.ndarray,
+    elevation: numpy.ndarray,
+    path: Path,
+    monthly_linke_turbidity: numpy.ndarray | float = LinkeTurbidityFactor().value,
+    time_step: int = CLEAR_SKY_TABLE_TIME_STEP_DEFAULT,
+    day_step: int = CLEAR_SKY_TABLE_DAY_STEP_DEFAULT,
+    solar_position_model: SolarPositionModel = SOLAR_POSITION_ALGORITHM_DEFAULT,
+    adjust_for_atmospheric_refraction: bool = ATMOSPHERIC_REFRACTION_FLAG_DEFAULT,
+    solar_constant: float = SOLAR_CONSTANT,
+    eccentricity_phase_offset: float = ECCENTRICITY_PHASE_OFFSET,
+    eccentricity_amplitude: float = ECCENTRICITY_CORRECTION_FACTOR,
+) -> Path:
+    """Precompute the clear-sky table of a grid of pixels
+
+    The table is written one pixel at a time into a memory-mapped array.
+
+    Parameters
+    ----------
+    longitude : numpy.ndarray
+        Longitude axis of the grid in degrees
+    latitude : numpy.ndarray
+        Latitude axis of the grid in degrees
+    elevation : numpy.ndarray
+        The `(latitude, longitude)` elevation of the pixels in meters
+    path : Path
+        Output directory, by convention with a `.clearsky` suffix
+    monthly_linke_turbidity : numpy.ndarray or float
+        The `(latitude, longitude, month)` Linke turbidity factors, or 12
+        monthly values, or a single value for all pixels and months
+    time_step : int
+        Minutes between the samples of a day
+    day_step : int
+        Days between the sampled days of the reference year
+
+    Returns
+    -------
+    Path
+        The path to the clear-sky table
+    """
+    longitude = numpy.atleast_1d(numpy.asarray(longitude, dtype=numpy.float64))
+    latitude = numpy.atleast_1d(numpy.asarray(latitude, dtype=numpy.float64))
+    shape = (latitude.size, longitude.size)
+    elevation = numpy.broadcast_to(numpy.asarray(elevation, dtype=numpy.float64), shape)
+    monthly_linke_turbidity = numpy.broadcast_to(
+        numpy.asarray(monthly_linke_turbidity, dtype=numpy.float64),
+        shape + (MONTHS_IN_A_YEAR,),
+    )
+    timestamps = generate_clear_sky_table_timestamps(time_step=time_step, day_step=day_step)
+    days = timestamps.size // (MINUTES_IN_A_DAY // time_step + 1)
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    numpy.savez(
+        path / CLEAR_SKY_TABLE_GRID,
+        longitude=longitude,
+        latitude=latitude,
+        elevation=elevation,
+        linke_turbidity=monthly_linke_turbidity,
+        time_step=time_step,
+        day_step=day_step,
+        solar_position_model=SolarPositionModel(solar_position_model).value,
+        adjust_for_atmospheric_refraction=adjust_for_atmospheric_refraction,
+        solar_constant=solar_constant,
+        eccentricity_phase_offset=eccentricity_phase_offset,
+        eccentricity_amplitude=eccentricity_amplitude,
+    )
+    irradiance = open_memmap(
+        path / CLEAR_SKY_TABLE_IRRADIANCE,
+        mode="w+",
+        dtype=numpy.float32,
+        shape=(latitude.size * longitude.size, len(ClearSkyComponent), days, timestamps.size // days),
+    )
+    for row, column in numpy.ndindex(shape):
+        irradiance[row * longitude.size + column] = calculate_clear_sky_table_pixel(
+            longitude=longitude[column],
+            latitude=latitude[row],
+            elevation=elevation[row, column],
+            monthly_linke_turbidity=monthly_linke_turbidity[row, column],
+            timestamps=timestamps,
+            solar_position_model=solar_position_model,
+            adjust_for_atmospheric_refraction=adjust_for_atmospheric_refraction,
+            solar_constant=solar_constant,
+            eccentricity_phase_offset=eccentricity_phase_offset,
+            eccentricity_amplitude=eccentricity_amplitude,
+        ).reshape(len(ClearSkyComponent), days, -1)
+    irradiance.flush()
+    logger.debug(
+        lambda: f"Wrote a clear-sky table of {latitude.size} x {longitude.size} pixels, {days} days every {day_step} and a sample every {time_step} minutes to {path}",
+    )
+    del irradiance
+
+    return path
+
+
+def is_clear_sky_table(path: Path) -> bool:
+    """Whether a path is a precomputed clear-sky table"""
+    path = Path(path)
+    return (path / CLEAR_SKY_TABLE_IRRADIANCE).is_file() and (
+        path / CLEAR_SKY_TABLE_GRID
+    ).is_file()
+
+
+def _nearest_index(axis: numpy.ndarray, value: float, tolerance: float | None) -> int:
+    index = int(numpy.abs(axis - value).argmin())
+    if tolerance is not None and abs(axis[index] - value) > tolerance:
+        raise ValueError(
+            f"No pixel within {tolerance} degrees of {value} : nearest is {axis[index]}"
+        )
+    return index
+
+
+def interpolate_bilinear(
+    table: numpy.ndarray,
+    day: numpy.ndarray,
+    time: numpy.ndarray,
+) -> numpy.ndarray:
+    """Bilinear interpolation over a `(day, time)` table
+
+    Parameters
+    ----------
+    table : numpy.ndarray
+        The `(..., day, time)` table
+    day : numpy.ndarray
+        Fractional day indices, wrapping around after the last day
+    time : numpy.ndarray
+        Fractional time indices within the time axis
+
+    Returns
+    -------
+    numpy.ndarray
+        The interpolated values of shape `(..., len(day))`
+    """
+    days, times = table.shape[-2:]
+    lower_day = numpy.floor(day).astype(numpy.intp)
+    day_weight = day - lower_day
+    upper_day = (lower_day + 1) % days
+    lower_day %= days
+    lower_time = numpy.minimum(numpy.floor(time).astype(numpy.intp), times - 2)
+    time_weight = time - lower_time
+    upper_time = lower_time + 1
+
+    return (
+        table[..., lower_day, lower_time] * (1 - day_weight) * (1 - time_weight)
+        + table[..., lower_day, upper_time] * (1 - day_weight) * time_weight
+        + table[..., upper_day, lower_time] * day_weight * (1 - time_weight)
+        + table[..., upper_day, upper_time] * day_weight * time_weight
+    )
+
+
+@dataclass(frozen=True, eq=False)
+class ClearSkyTable:
+    """Memory-mapped per-pixel clear-sky irradiance table"""
+
+    path: Path
+    longitude: numpy.ndarray
+    latitude: numpy.ndarray
+    elevation: numpy.ndarray  # (latitude, longitude)
+    linke_turbidity: numpy.ndarray  # (latitude, longitude, month)
+    time_step: int
+    day_step: int
+    solar_position_model: str
+    adjust_for_atmospheric_refraction: bool
+    solar_constant: float
+    eccentricity_phase_offset: float
+    eccentricity_amplitude: float
+    irradiance: numpy.ndarray  # (pixel, component, day, time)
+
+    def pixel(
+        self,
+        longitude: float,
+        latitude: float,
+        tolerance: float | None = TOLERANCE_DEFAULT,
+    ) -> tuple[int, int]:
+        """Row and column of the pixel nearest to a location in degrees"""
+        return _nearest_index(self.latitude, latitude, tolerance), _nearest_index(
+            self.longitude, longitude, tolerance
+        )
+
+    def matches(
+        self,
+        solar_position_model: SolarPositionModel,
+        adjust_for_atmospheric_refraction: bool,
+        solar_constant: float,
+        eccentricity_phase_offset: float,
+        eccentricity_amplitude: float,
+    ) -> bool:
+        """Whether the table was computed with the same clear-sky parameters"""
+        return (
+            SolarPositionModel(solar_position_model).value == self.solar_position_model
+            and bool(adjust_for_atmospheric_refraction)
+            == self.adjust_for_atmospheric_refraction
+            and numpy.isclose(solar_constant, self.solar_constant)
+            and numpy.isclose(eccentricity_phase_offset, self.eccentricity_phase_offset)
+            and numpy.isclose(eccentricity_amplitude, self.eccentricity_amplitude)
+        )
+
+    def look_up(
+        self,
+        row: int,
+        column: int,
+        timestamps: DatetimeIndex,
+        component: ClearSkyComponent | None = None,
+    ) -> numpy.ndarray:
+        """Clear-sky irradiance of a pixel at UTC timestamps
+
+        Returns
+        -------
+        numpy.ndarray
+            The `(component, timestamp)` irradiance, or the `(timestamp,)`
+            irradiance of a single `component`
+        """
+        table = self.irradiance[row * self.longitude.size + column]
+        if component is not None:
+            table = table[component]
+        minutes = (timestamps - timestamps.normalize()) / Timedelta(minutes=1)
+
+        return interpolate_bilinear(
+            table=numpy.asarray(table),
+            day=_reference_day_of_year(timestamps) / self.day_step,
+            time=numpy.asarray(minutes) / self.time_step,
+        )
+
+
+def select_clear_sky_irradiance(
+    clear_sky_table: ClearSkyTable,
+    component: ClearSkyComponent,
+    longitude: float,
+    latitude: float,
+    timestamps: DatetimeIndex,
+    timezone: ZoneInfo | None,
+    linke_turbidity_factor_series: LinkeTurbidityFactor,
+    elevation: float | None = None,
+    solar_position_model: SolarPositionModel = SOLAR_POSITION_ALGORITHM_DEFAULT,
+    adjust_for_atmospheric_refraction: bool = ATMOSPHERIC_REFRACTION_FLAG_DEFAULT,
+    solar_constant: float = SOLAR_CONSTANT,
+    eccentricity_phase_offset: float = ECCENTRICITY_PHASE_OFFSET,
+    eccentricity_amplitude: float = ECCENTRICITY_CORRECTION_FACTOR,
+    dtype: str = "float32",
+) -> numpy.ndarray | None:
+    """Look a clear-sky irradiance component up in a clear-sky table
+
+    Parameters
+    ----------
+    longitude : float
+        Longitude in radians, as in the clear-sky functions
+    latitude : float
+        Latitude in radians, as in the clear-sky functions
+    elevation : float, optional
+        Elevation in meters, required for the direct component
+
+    Returns
+    -------
+    numpy.ndarray or None
+        The irradiance series, or None if the table does not apply to the
+        request, in which case the caller falls back to the analytical path
+    """
+    reason = None
+    if not clear_sky_table.matches(
+        solar_position_model=solar_position_model,
+        adjust_for_atmospheric_refraction=adjust_for_atmospheric_refraction,
+        solar_constant=solar_constant,
+        eccentricity_phase_offset=eccentricity_phase_offset,
+        eccentricity_amplitude=eccentricity_amplitude,
+    ):
+        reason = "different clear-sky model parameters"
+
+    elif (timezone is not None and timezone != ZoneInfo("UTC")) or (
+        timestamps.tz is not None and str(timestamps.tz) != "UTC"
+    ):
+        reason = "timestamps not in UTC"
+
+    else:
+        try:
+            row, column = clear_sky_table.pixel(
+                longitude=numpy.degrees(longitude),
+                latitude=numpy.degrees(latitude),
+            )
+        except ValueError as error:
+            reason = str(error)
+
+    if reason is None:
+        monthly_linke_turbidity = clear_sky_table.linke_turbidity[row, column]
+        linke_turbidity = numpy.broadcast_to(
+            numpy.asarray(linke_turbidity_factor_series.value, dtype=numpy.float64),
+            timestamps.shape,
+        )
+        if not numpy.allclose(
+            linke_turbidity, monthly_linke_turbidity[timestamps.month.to_numpy() - 1]
+        ):
+            reason = "different Linke turbidity factors"
+
+        elif component == ClearSkyComponent.direct and not numpy.isclose(
+            elevation, clear_sky_table.elevation[row, column]
+        ):
+            reason = "different elevation"
+
+    if reason is not None:
+        logger.debug(
+            lambda: f"Calculating the clear-sky {component.name} irradiance : the table {clear_sky_table.path} does not apply, {reason}",
+        )
+        return None
+
+    return clear_sky_table.look_up(
+        row=row,
+        column=column,
+        timestamps=timestamps.tz_localize(None),
+        component=component,
+    ).astype(dtype, copy=False)
+
+
+@lru_cache(maxsize=CLEAR_SKY_TABLE_CACHE_MAXSIZE)
+def _open_clear_sky_table(path: Path, modification_time: int) -> ClearSkyTable:
+    grid = numpy.load(path / CLEAR_SKY_TABLE_GRID)
+    return ClearSkyTable(
+        path=path,
+        longitude=grid["longitude"],
+        latitude=grid["latitude"],
+        elevation=grid["elevation"],
+        linke_turbidity=grid["linke_turbidity"],
+        time_step=int(grid["time_step"]),
+        day_step=int(grid["day_step"]),
+        solar_position_model=str(grid["solar_position_model"]),
+        adjust_for_atmospheric_refraction=bool(grid["adjust_for_atmospheric_refraction"]),
+        solar_constant=float(grid["solar_constant"]),
+        eccentricity_phase_offset=float(grid["eccentricity_phase_offset"]),
+        eccentricity_amplitude=float(grid["eccentricity_amplitude"]),
+        irradiance=numpy.load(path / CLEAR_SKY_TABLE_IRRADIANCE, mmap_mode="r"),
+    )
+
+
+def open_clear_sky_table(path: Path) -> ClearSkyTable:
+    """Memory-map a clear-sky table, once per modification of its irradiance"""
+    path = Path(path).resolve()
+    return _open_clear_sky_table(
+        path, (path / CLEAR_SKY_TABLE_IRRADIANCE).stat().st_mtime_ns
+    )
@@ -17,8 +17,17 @@
 from zoneinfo import ZoneInfo
 from devtools import debug
 from pandas import DatetimeIndex, Timestamp
-from pvgisprototype import LinkeTurbidityFactor, UnrefractedSolarZenith
+from pvgisprototype import (
+    DiffuseSkyReflectedHorizontalIrradiance,
+    LinkeTurbidityFactor,
+    UnrefractedSolarZenith,
+)
 from pvgisprototype.algorithms.hofierka.irradiance.diffuse.clear_sky.horizontal import calculate_clear_sky_diffuse_horizontal_irradiance_hofierka
+from pvgisprototype.api.irradiance.clear_sky_table import (
+    ClearSkyComponent,
+    ClearSkyTable,
+    select_clear_sky_irradiance,
+)
 from pvgisprototype.api.position.altitude import model_solar_altitude_series
 from pvgisprototype.api.position.models import (
     SOLAR_POSITION_ALGORITHM_DEFAULT,
@@ -57,6 +66,7 @@ def calculate_clear_sky_diffuse_horizontal_irradiance(
     solar_constant: float = SOLAR_CONSTANT,
     eccentricity_phase_offset: float = ECCENTRICITY_PHASE_OFFSET,
     eccentricity_amplitude: float = ECCENTRICITY_CORRECTION_FACTOR,
+    clear_sky_table: ClearSkyTable | None = None,
     # angle_output_units: str = RADIANS,
     dtype: str = DATA_TYPE_DEFAULT,
     array_backend: str = ARRAY_BACKEND_DEFAULT,
@@ -64,8 +74,40 @@ def calculate_clear_sky_diffuse_horizontal_irradiance(
     log: int = LOG_LEVEL_DEFAULT,
     fingerprint: bool = FINGERPRINT_FLAG_DEFAULT,
 ):
+    """Calculate the clear-sky diffuse horizontal irradiance
+
+    If a precomputed `clear_sky_table` applies to the request, i.e. the
+    location, Linke turbidity factors and clear-sky model parameters match
+    those of the table, the irradiance is looked up in the table without
+    calculating the solar position.
     """
-    """
+    if clear_sky_table is not None:
+        diffuse_horizontal_irradiance = select_clear_sky_irradiance(
+            clear_sky_table=clear_sky_table,
+            component=ClearSkyComponent.diffuse,
+            longitude=longitude,
+            latitude=latitude,
+            timestamps=timestamps,
+            timezone=timezone,
+            linke_turbidity_factor_series=linke_turbidity_factor_series,
+            solar_position_model=solar_position_model,
+            adjust_for_atmospheric_refraction=adjust_for_atmospheric_refraction,
+            solar_constant=solar_constant,
+            eccentricity_phase_offset=eccentricity_phase_offset,
+            eccentricity_amplitude=eccentricity_amplitude,
+            dtype=dtype,
+        )
+        if diffuse_horizontal_irradiance is not None:
+            diffuse_horizontal_irradiance_series = DiffuseSkyReflectedHorizontalIrradiance(
+                value=diffuse_horizontal_irradiance,
+                linke_turbidity_factor=linke_turbidity_factor_series,
+                data_source=str(clear_sky_table.path),
+            )
+            diffuse_horizontal_irradiance_series.build_output(
+                verbose=verbose, fingerprint=fingerprint
+            )
+            return diffuse_horizontal_irradiance_series
+
     # solar altitude : required by
         # `calculate_diffuse_horizontal_irradiance_hofierka()`
         # to calculate the extraterrestrial irradiance on a horizontal surface
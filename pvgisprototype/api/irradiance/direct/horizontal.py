@@ -33,8 +33,13 @@ from devtools import debug
 from pandas import DatetimeIndex
 from xarray import DataArray
 
-from pvgisprototype import LinkeTurbidityFactor
+from pvgisprototype import DirectHorizontalIrradiance, LinkeTurbidityFactor
 from pvgisprototype.algorithms.hofierka.irradiance.direct.clear_sky.horizontal import calculate_clear_sky_direct_horizontal_irradiance_hofierka
+from pvgisprototype.api.irradiance.clear_sky_table import (
+    ClearSkyComponent,
+    ClearSkyTable,
+    select_clear_sky_irradiance,
+)
 from pvgisprototype.api.position.altitude import model_solar_altitude_series
 from pvgisprototype.api.position.models import (
     SOLAR_POSITION_ALGORITHM_DEFAULT,
@@ -54,6 +59,7 @@ from pvgisprototype.constants import (
     ECCENTRICITY_CORRECTION_FACTOR,
     FINGERPRINT_FLAG_DEFAULT,
     HASH_AFTER_THIS_VERBOSITY_LEVEL,
+    HOFIERKA_2002,
     LOG_LEVEL_DEFAULT,
     ECCENTRICITY_PHASE_OFFSET,
     UNREFRACTED_SOLAR_ZENITH_ANGLE_DEFAULT,
@@ -82,6 +88,7 @@ def calculate_clear_sky_direct_horizontal_irradiance_series(
     eccentricity_amplitude: float = ECCENTRICITY_CORRECTION_FACTOR,
     horizon_profile: DataArray | None = None,
     shading_model: ShadingModel = ShadingModel.pvgis,
+    clear_sky_table: ClearSkyTable | None = None,
     # angle_output_units: str = RADIANS,
     dtype: str = DATA_TYPE_DEFAULT,
     array_backend: str = ARRAY_BACKEND_DEFAULT,
@@ -98,6 +105,11 @@ def calculate_clear_sky_direct_horizontal_irradiance_series(
     -----
     Known also as : SID, units : W*m-2
 
+    If a precomputed `clear_sky_table` applies to the request, i.e. there is
+    no horizon profile and the location, elevation, Linke turbidity factors
+    and clear-sky model parameters match those of the table, the irradiance
+    is looked up in the table without calculating the solar position.
+
     References
     ----------
     .. [1] Hofierka, J. (2002). Some title of the paper. Journal Name, vol(issue), pages.
@@ -133,6 +145,30 @@ def calculate_clear_sky_direct_horizontal_irradiance_series(
     solar_time_model = validate_model(
         SolarTimeModel, solar_time_model
     )  # can be only one of!
+    if clear_sky_table is not None and horizon_profile is None:
+        direct_horizontal_irradiance = select_clear_sky_irradiance(
+            clear_sky_table=clear_sky_table,
+            component=ClearSkyComponent.direct,
+            **coordinates,
+            elevation=elevation,
+            **time,
+            linke_turbidity_factor_series=linke_turbidity_factor_series,
+            solar_position_model=solar_position_model,
+            adjust_for_atmospheric_refraction=adjust_for_atmospheric_refraction,
+            solar_constant=solar_constant,
+            **earth_orbit,
+            dtype=dtype,
+        )
+        if direct_horizontal_irradiance is not None:
+            direct_horizontal_irradiance_series = DirectHorizontalIrradiance(
+                value=direct_horizontal_irradiance,
+                elevation=elevation,
+                solar_radiation_model=HOFIERKA_2002,
+                data_source=str(clear_sky_table.path),
+            )
+            direct_horizontal_irradiance_series.build_output(verbose, fingerprint)
+            return direct_horizontal_irradiance_series
+
     solar_altitude_series = model_solar_altitude_series(
         **coordinates,
         **time,
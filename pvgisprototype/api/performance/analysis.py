@@ -21,9 +21,10 @@ from pandas import DatetimeIndex, Timestamp
 
 from pvgisprototype.core.arrays import create_array
 from pvgisprototype.api.performance.helpers import kilofy_unit
-from pvgisprototype.api.statistics.polars import (
-    calculate_mean_of_series_per_time_unit,
-    calculate_statistics,
+from pvgisprototype.api.statistics.grouped import (
+    calculate_grouped_statistics,
+    calculate_mean_of_group_sums,
+    summarise_group_statistics,
 )
 from pvgisprototype.constants import (
     ARRAY_BACKEND_DEFAULT,
@@ -175,69 +176,94 @@ def analyse_photovoltaic_performance(
     it to a series for the following reasons :
     
     1. to make it easier for the function
-    `calculate_mean_of_series_per_time_unit()` to derive the quantity
-    'system_efficiency_effect_mean' : essentially, the function
-    `polars.DataFrame()` expects all input "data series" to be of the same
-    length.
+    `calculate_grouped_statistics()` to derive the quantity
+    'system_efficiency_effect_mean' : essentially, all input "data series"
+    are reduced together and are expected to be of the same length.
     
     2. to support scenarios of a fine-grained system efficiency time series
 
     """
+    inclined_irradiance_series = dictionary.global_inclined_before_reflectivity
+    reflected_series = dictionary.global_inclined_reflected
+    spectral_effect_series = dictionary.spectral_effect
+    photovoltaic_power_without_system_loss_series = dictionary.photovoltaic_power_without_system_loss
+    photovoltaic_power_series = dictionary.value
+
+    # System efficiency _series_ -- see Notes in the docstring
+
+    array_parameters = {
+        "shape": timestamps.shape,
+        "dtype": dtype,
+        "init_method": dictionary.system_efficiency,  # or 'empty' ?
+        "backend": array_backend,
+    }  # Borrow shape from timestamps
+    system_efficiency_series = create_array(**array_parameters)
+
+    # Group once, reduce all series in one pass
+
+    group_statistics = calculate_grouped_statistics(
+        quantities={
+            "inclined_irradiance": inclined_irradiance_series,
+            "reflectivity_effect": reflected_series,
+            "irradiance_after_reflectivity": inclined_irradiance_series
+            + reflected_series,
+            "spectral_effect": spectral_effect_series,
+            "photovoltaic_power_without_system_loss": photovoltaic_power_without_system_loss_series,
+            "system_efficiency_loss": system_efficiency_series - 1,
+            "photovoltaic_power": photovoltaic_power_series,
+        },
+        timestamps=timestamps,
+        frequency=frequency,
+    )
+
     # In-Plane irradiance (before effects)
     # ------------------------------------------------------------------------
     # To Do : In-Plane "Irradiation" ?
     # Add Standard Deviation in kWh ? Monthly, Yearly ?
     # ------------------------------------------------------------------------
-    inclined_irradiance_series = dictionary.global_inclined_before_reflectivity
     inclined_irradiance, inclined_irradiance_mean, inclined_irradiance_std, _ = (
-        calculate_statistics(
-            inclined_irradiance_series,
-            timestamps,
-            frequency,
-            1,
-            rounding_places,
+        summarise_group_statistics(
+            group_statistics["inclined_irradiance"],
+            frequency=frequency,
+            reference_series=1,
+            rounding_places=rounding_places,
         )
     )
 
     # Reflectivity
 
-    reflected_series = dictionary.global_inclined_reflected
     (
         reflectivity_effect,
         reflectivity_effect_mean,
         reflectivity_effect_std,
         reflectivity_effect_percentage,
-    ) = calculate_statistics(
-        reflected_series,
-        timestamps,
-        frequency,
-        inclined_irradiance,
-        rounding_places,
+    ) = summarise_group_statistics(
+        group_statistics["reflectivity_effect"],
+        frequency=frequency,
+        reference_series=inclined_irradiance,
+        rounding_places=rounding_places,
     )
 
     # After reflectivity
 
     irradiance_after_reflectivity = inclined_irradiance + reflectivity_effect
-    irradiance_after_reflectivity_mean = calculate_mean_of_series_per_time_unit(
-        inclined_irradiance_series + reflected_series,
-        timestamps=timestamps,
+    irradiance_after_reflectivity_mean = calculate_mean_of_group_sums(
+        group_statistics["irradiance_after_reflectivity"],
         frequency=frequency,
     )
 
     # Spectral effect
 
-    spectral_effect_series = dictionary.spectral_effect
     (
         spectral_effect,
         spectral_effect_mean,
         spectral_effect_std,
         spectral_effect_percentage,
-    ) = calculate_statistics(
-        spectral_effect_series,
-        timestamps,
-        frequency,
-        irradiance_after_reflectivity,
-        rounding_places,
+    ) = summarise_group_statistics(
+        group_statistics["spectral_effect"],
+        frequency=frequency,
+        reference_series=irradiance_after_reflectivity,
+        rounding_places=rounding_places,
     )
 
     effective_irradiance = irradiance_after_reflectivity + spectral_effect
@@ -259,20 +285,17 @@ def analyse_photovoltaic_performance(
 
     # "Effective" Power without System Loss
 
-    photovoltaic_power_without_system_loss_series = dictionary.photovoltaic_power_without_system_loss
     (
         photovoltaic_power_without_system_loss,
         photovoltaic_power_without_system_loss_mean,
         photovoltaic_power_without_system_loss_std,
         _,
-    ) = calculate_statistics(
-        photovoltaic_power_without_system_loss_series,
-        timestamps,
-        frequency,
+    ) = summarise_group_statistics(
+        group_statistics["photovoltaic_power_without_system_loss"],
+        frequency=frequency,
         reference_series=1,
         rounding_places=rounding_places,
         dtype=dtype,
-        array_backend=array_backend,
     )
 
     # Temperature & Low Irradiance
@@ -295,26 +318,21 @@ def analyse_photovoltaic_performance(
             0,
         ).item()  # get a Python float
 
-    # System efficiency _series_ -- see Notes in the docstring
+    # System efficiency
 
-    array_parameters = {
-        "shape": timestamps.shape,
-        "dtype": dtype,
-        "init_method": dictionary.system_efficiency,  # or 'empty' ?
-        "backend": array_backend,
-    }  # Borrow shape from timestamps
-    system_efficiency_series = create_array(**array_parameters)
     system_efficiency = numpy.nanmedian(system_efficiency_series).astype(dtype)
     system_efficiency_effect = numpy.array(
         photovoltaic_power_without_system_loss * system_efficiency
         - photovoltaic_power_without_system_loss,
         dtype=dtype
     ).item()  # Important !
-    system_efficiency_effect_mean = calculate_mean_of_series_per_time_unit(
-        photovoltaic_power_without_system_loss_mean * system_efficiency_series
-        - photovoltaic_power_without_system_loss_mean,
-        timestamps=timestamps,
-        frequency=frequency,
+    # mean * series - mean == mean * (series - 1) per time unit
+    system_efficiency_effect_mean = (
+        photovoltaic_power_without_system_loss_mean
+        * calculate_mean_of_group_sums(
+            group_statistics["system_efficiency_loss"],
+            frequency=frequency,
+        )
     )
     with numpy.errstate(divide="ignore", invalid="ignore"):  # if irradiance == 0
         system_efficiency_effect_percentage = where(
@@ -328,14 +346,12 @@ def analyse_photovoltaic_performance(
         ).item()  # get a Python float
 
     # Photovoltaic Power
-    photovoltaic_power_series = dictionary.value
     photovoltaic_power, photovoltaic_power_mean, photovoltaic_power_std, _ = (
-        calculate_statistics(
-            photovoltaic_power_series,
-            timestamps,
-            frequency,
-            1,
-            rounding_places,
+        summarise_group_statistics(
+            group_statistics["photovoltaic_power"],
+            frequency=frequency,
+            reference_series=1,
+            rounding_places=rounding_places,
         )
     )
     peak_power = dictionary.peak_power
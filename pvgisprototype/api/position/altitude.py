@@ -95,8 +95,8 @@ def model_solar_altitude_series(
 
     """
     logger.debug(
-        f"Executing solar positioning modelling function model_solar_altitude_series() for\n{timestamps}",
-        alt=f"Executing [underline]solar positioning modelling[/underline] function model_solar_altitude_series() for\n{timestamps}",
+        lambda: f"Executing solar positioning modelling function model_solar_altitude_series() for\n{timestamps}",
+        alt=lambda: f"Executing [underline]solar positioning modelling[/underline] function model_solar_altitude_series() for\n{timestamps}",
     )
     solar_altitude_series = None
 
@@ -190,8 +190,8 @@ def model_solar_altitude_series(
         debug(locals())
 
     logger.debug(
-        f"Returning solar altitude time series :\n{solar_altitude_series}",
-        alt=f"Returning [yellow]solar altitude[/yellow] time series :\n{solar_altitude_series}",
+        lambda: f"Returning solar altitude time series :\n{solar_altitude_series}",
+        alt=lambda: f"Returning [yellow]solar altitude[/yellow] time series :\n{solar_altitude_series}",
     )
     return solar_altitude_series
 
@@ -111,8 +111,8 @@ def model_solar_azimuth_series(
 
     """
     logger.debug(
-        f"Executing solar positioning modelling function model_solar_azimuth_series() for\n{timestamps}",
-        alt=f"Executing [underline]solar positioning modelling[/underline] function model_solar_azimuth_series() for\n{timestamps}"
+        lambda: f"Executing solar positioning modelling function model_solar_azimuth_series() for\n{timestamps}",
+        alt=lambda: f"Executing [underline]solar positioning modelling[/underline] function model_solar_azimuth_series() for\n{timestamps}"
     )
     solar_azimuth_series = None
 
@@ -199,8 +199,8 @@ def model_solar_azimuth_series(
         debug(locals())
 
     logger.debug(
-        f"Returning solar azimuth time series :\n{solar_azimuth_series}",
-        alt=f"Returning [yellow]solar azimuth[/yellow] time series :\n{solar_azimuth_series}"
+        lambda: f"Returning solar azimuth time series :\n{solar_azimuth_series}",
+        alt=lambda: f"Returning [yellow]solar azimuth[/yellow] time series :\n{solar_azimuth_series}"
     )
 
     return solar_azimuth_series
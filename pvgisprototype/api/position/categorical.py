@@ -0,0 +1,125 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Compact categorical encodings for time series of states
+
+Time series of categorical states, such as the position of the sun relative
+to the horizon or the shading state of a surface, are kept as `int8` codes
+throughout the calculations instead of arrays of Python strings. A code is
+the position of a state in its enumeration, not counting the `all` member,
+while `CATEGORY_UNSET` marks moments for which no state was assigned.
+
+The codes are decoded to their labels only at output time, i.e. when a data
+model populates its output structure which is, in turn, consumed by the
+printers, the CSV writers and the Web API.
+"""
+
+from enum import Enum
+from typing import Dict, Type
+
+import numpy
+from numpy import ndarray
+
+from pvgisprototype.api.position.models import ShadingState, SunHorizonPositionModel
+from pvgisprototype.core.arrays import create_array
+
+CATEGORY_DATA_TYPE = "int8"
+CATEGORY_UNSET = -1
+SHADING_STATE_UNSET = "Unset"
+
+
+def generate_category_codes(enumeration: Type[Enum]) -> Dict[Enum, int]:
+    """Map the members of an enumeration, except `all`, to integer codes"""
+    members = [member for member in enumeration if member.name != "all"]
+    return {member: code for code, member in enumerate(members)}
+
+
+SUN_HORIZON_POSITION_CODES = generate_category_codes(SunHorizonPositionModel)
+SHADING_STATE_CODES = generate_category_codes(ShadingState)
+
+
+def create_categorical_series(
+    shape,
+    backend: str = "numpy",
+) -> ndarray:
+    """Create a series of unset categorical codes"""
+    return create_array(
+        shape,
+        dtype=CATEGORY_DATA_TYPE,
+        init_method=CATEGORY_UNSET,
+        backend=backend,
+    )
+
+
+def decode_categorical_series(
+    codes: ndarray,
+    enumeration: Type[Enum],
+    unset: str | None = None,
+) -> ndarray:
+    """Decode a series of categorical codes to an array of labels
+
+    Parameters
+    ----------
+    codes: ndarray
+        Integer codes as generated by `generate_category_codes`
+    enumeration: Type[Enum]
+        The enumeration of the states
+    unset: str | None
+        The label for moments without a state
+
+    Returns
+    -------
+    ndarray
+        An `object` array of the state labels, i.e. the enumeration values
+
+    Notes
+    -----
+    The label of unset moments is appended last in the lookup table, hence
+    the `CATEGORY_UNSET` (-1) code indexes it directly.
+    """
+    labels = [member.value for member in generate_category_codes(enumeration)]
+    lookup = numpy.array(labels + [unset], dtype=object)
+    return lookup[codes]
+
+
+def decode_sun_horizon_position_series(codes: ndarray) -> ndarray:
+    """Decode codes of sun-to-horizon positions to their labels"""
+    return decode_categorical_series(codes, SunHorizonPositionModel)
+
+
+def decode_shading_state_series(codes: ndarray) -> ndarray:
+    """Decode codes of shading states to their labels"""
+    return decode_categorical_series(codes, ShadingState, unset=SHADING_STATE_UNSET)
+
+
+CATEGORICAL_SERIES_DECODERS = {
+    "sun_horizon_position": decode_sun_horizon_position_series,
+    "shading_state": decode_shading_state_series,
+}
+
+
+def decode_categorical_field(field: str, value):
+    """Decode the value of a data model field if it is a categorical series"""
+    decoder = CATEGORICAL_SERIES_DECODERS.get(field)
+    if (
+        decoder is not None
+        and isinstance(value, ndarray)
+        and value.dtype.kind == "i"
+    ):
+        return decoder(value)
+
+    return value
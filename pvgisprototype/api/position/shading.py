@@ -18,11 +18,15 @@ from typing import Dict, List
 from zoneinfo import ZoneInfo
 
 from devtools import debug
+from numpy import ndarray
 from pandas import DatetimeIndex, Timestamp
 from xarray import DataArray
 
 from pvgisprototype import Latitude, Longitude, LocationShading
-from pvgisprototype.algorithms.hofierka.position.shading import calculate_surface_in_shade_series_pvgis
+from pvgisprototype.algorithms.hofierka.position.shading import (
+    calculate_surface_in_shade_series_for_horizon_profiles_pvgis,
+    calculate_surface_in_shade_series_pvgis,
+)
 from pvgisprototype.api.position.models import SolarPositionModel, SolarTimeModel, ShadingModel
 from pvgisprototype.api.position.altitude import model_solar_altitude_series
 from pvgisprototype.api.position.azimuth import model_solar_azimuth_series
@@ -72,8 +76,8 @@ def model_surface_in_shade_series(
 ) -> LocationShading:
     """ """
     logger.debug(
-        f"Executing shading modelling function model_shade_series() for\n{timestamps}",
-        alt=f"Executing [underline]shading modelling[/underline] function model_shade_series() for\n{timestamps}"
+        lambda: f"Executing shading modelling function model_shade_series() for\n{timestamps}",
+        alt=lambda: f"Executing [underline]shading modelling[/underline] function model_shade_series() for\n{timestamps}"
     )
     surface_in_shade_series = None
     solar_altitude_series = model_solar_altitude_series(
@@ -132,13 +136,92 @@ def model_surface_in_shade_series(
         debug(locals())
 
     logger.debug(
-        f"Returning surface in shade time series :\n{surface_in_shade_series}",
-        alt=f"Returning [gray]surface in shade[/gray] time series :\n{surface_in_shade_series}"
+        lambda: f"Returning surface in shade time series :\n{surface_in_shade_series}",
+        alt=lambda: f"Returning [gray]surface in shade[/gray] time series :\n{surface_in_shade_series}"
     )
 
     return surface_in_shade_series
 
 
+@log_function_call
+def model_surface_in_shade_series_for_horizon_profiles(
+    longitude: Longitude,
+    latitude: Latitude,
+    timestamps: DatetimeIndex | Timestamp | None,
+    timezone: ZoneInfo | None,
+    horizon_heights: ndarray,
+    horizon_azimuths: ndarray | None = None,
+    solar_time_model: SolarTimeModel = SolarTimeModel.noaa,
+    solar_position_model: SolarPositionModel = SolarPositionModel.noaa,
+    adjust_for_atmospheric_refraction: bool = ATMOSPHERIC_REFRACTION_FLAG_DEFAULT,
+    eccentricity_phase_offset: float = ECCENTRICITY_PHASE_OFFSET,
+    eccentricity_amplitude: float = ECCENTRICITY_CORRECTION_FACTOR,
+    dtype: str = DATA_TYPE_DEFAULT,
+    array_backend: str = ARRAY_BACKEND_DEFAULT,
+    validate_output: bool = VALIDATE_OUTPUT_DEFAULT,
+    verbose: int = VERBOSE_LEVEL_DEFAULT,
+    log: int = LOG_LEVEL_DEFAULT,
+) -> ndarray:
+    """Model when a location is in shade for many horizon profiles at once.
+
+    The solar position is modelled once for the location and timestamps and
+    compared to all horizon profiles, e.g. of candidate rooftops, as done by
+    the PVGIS shading model.
+
+    Parameters
+    ----------
+    horizon_heights: numpy array
+        Horizon heights, in radians, of shape (profile, azimuth)
+    horizon_azimuths: numpy array, optional
+        Azimuths, in radians, of the horizon heights. If None, equally spaced
+        azimuths starting from North.
+
+    Returns
+    -------
+    NumPy array: Boolean array of shape (profile, time), True when in shade.
+    """
+    solar_altitude_series = model_solar_altitude_series(
+        longitude=longitude,
+        latitude=latitude,
+        timestamps=timestamps,
+        timezone=timezone,
+        solar_position_model=solar_position_model,
+        adjust_for_atmospheric_refraction=adjust_for_atmospheric_refraction,
+        eccentricity_phase_offset=eccentricity_phase_offset,
+        eccentricity_amplitude=eccentricity_amplitude,
+        dtype=dtype,
+        array_backend=array_backend,
+        verbose=verbose,
+        log=log,
+        validate_output=validate_output,
+    )
+    solar_azimuth_series = model_solar_azimuth_series(
+        longitude=longitude,
+        latitude=latitude,
+        timestamps=timestamps,
+        timezone=timezone,
+        solar_position_model=solar_position_model,
+        adjust_for_atmospheric_refraction=adjust_for_atmospheric_refraction,
+        solar_time_model=solar_time_model,
+        eccentricity_phase_offset=eccentricity_phase_offset,
+        eccentricity_amplitude=eccentricity_amplitude,
+        dtype=dtype,
+        array_backend=array_backend,
+        verbose=0,
+        log=log,
+        validate_output=validate_output,
+    )
+
+    return calculate_surface_in_shade_series_for_horizon_profiles_pvgis(
+        solar_altitude_series=solar_altitude_series,
+        solar_azimuth_series=solar_azimuth_series,
+        horizon_heights=horizon_heights,
+        horizon_azimuths=horizon_azimuths,
+        verbose=verbose,
+        log=log,
+    )
+
+
 @log_function_call
 @validate_with_pydantic(CalculateSurfaceInShadeSeriesInputModel)
 def calculate_surface_in_shade_series(
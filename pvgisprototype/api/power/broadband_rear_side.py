@@ -47,6 +47,12 @@ from pvgisprototype.algorithms.huld.models import PhotovoltaicModulePerformanceM
 from pvgisprototype.algorithms.huld.photovoltaic_module import PhotovoltaicModuleModel, PhotovoltaicModuleType
 from pvgisprototype.api.position.altitude import model_solar_altitude_series
 from pvgisprototype.api.position.azimuth import model_solar_azimuth_series
+from pvgisprototype.api.position.categorical import (
+    CATEGORY_UNSET,
+    SUN_HORIZON_POSITION_CODES,
+    create_categorical_series,
+    decode_sun_horizon_position_series,
+)
 from pvgisprototype.api.position.models import (
     SOLAR_POSITION_ALGORITHM_DEFAULT,
     SOLAR_TIME_ALGORITHM_DEFAULT,
@@ -415,20 +421,20 @@ def calculate_rear_side_photovoltaic_power_output_series(
         SunHorizonPositionModel, sun_horizon_position
     )  # Using a callback fails!
     # and keep track of the position of the sun relative to the horizon
-    sun_horizon_position_series = create_array(
-        timestamps.shape, dtype="object", init_method="empty", backend=array_backend
+    sun_horizon_position_series = create_categorical_series(
+        timestamps.shape, backend=array_backend
     )
 
     # For sun below the horizon
     if SunHorizonPositionModel.below in sun_horizon_positions:
         mask_below_horizon = solar_altitude_series.value < 0
-        sun_horizon_position_series[mask_below_horizon] = [
-            SunHorizonPositionModel.below.value
+        sun_horizon_position_series[mask_below_horizon] = SUN_HORIZON_POSITION_CODES[
+            SunHorizonPositionModel.below
         ]
         if numpy.any(mask_below_horizon):
             logger.debug(
-                f"Positions of the sun below horizon :\n{sun_horizon_position_series}",
-                alt=f"Positions of the sun [bold gray50]below horizon[/bold gray50] :\n{sun_horizon_position_series}",
+                lambda: f"Positions of the sun below horizon :\n{decode_sun_horizon_position_series(sun_horizon_position_series)}",
+                alt=lambda: f"Positions of the sun [bold gray50]below horizon[/bold gray50] :\n{decode_sun_horizon_position_series(sun_horizon_position_series)}",
             )
             rear_side_direct_inclined_irradiance_series[mask_below_horizon] = 0
             rear_side_diffuse_inclined_irradiance_series[mask_below_horizon] = 0
@@ -442,10 +448,10 @@ def calculate_rear_side_photovoltaic_power_output_series(
             solar_altitude_series.value >= 0,
             solar_altitude_series.value
             < solar_altitude_series.low_angle_threshold_radians,
-            sun_horizon_position_series == None,  # operate only on unset elements
+            sun_horizon_position_series == CATEGORY_UNSET,  # operate only on unset elements
         )
-        sun_horizon_position_series[mask_low_angle] = [
-            SunHorizonPositionModel.low_angle.value
+        sun_horizon_position_series[mask_low_angle] = SUN_HORIZON_POSITION_CODES[
+            SunHorizonPositionModel.low_angle
         ]
         rear_side_direct_inclined_irradiance_series[mask_low_angle] = (
             0  # Direct radiation is negligible
@@ -454,10 +460,10 @@ def calculate_rear_side_photovoltaic_power_output_series(
     if SunHorizonPositionModel.above in sun_horizon_positions:
         mask_above_horizon = numpy.logical_and(
             solar_altitude_series.value > 0,
-            sun_horizon_position_series == None,  # operate only on unset elements
+            sun_horizon_position_series == CATEGORY_UNSET,  # operate only on unset elements
         )
-        sun_horizon_position_series[mask_above_horizon] = [
-            SunHorizonPositionModel.above.value
+        sun_horizon_position_series[mask_above_horizon] = SUN_HORIZON_POSITION_CODES[
+            SunHorizonPositionModel.above
         ]
 
         # For sun above horizon and not in shade
@@ -466,13 +472,13 @@ def calculate_rear_side_photovoltaic_power_output_series(
         mask_above_horizon_not_in_shade = numpy.logical_and(
             mask_above_horizon,
             mask_not_in_shade,
-            sun_horizon_position_series == None,
+            sun_horizon_position_series == CATEGORY_UNSET,
         )
         if numpy.any(mask_above_horizon_not_in_shade):
             # sun_horizon_position_series[mask_above_horizon_not_in_shade] = [SunHorizonPositionModel.above.name]
             logger.debug(
-                f"Including positions of the sun above horizon and not in shade :\n{sun_horizon_position_series}",
-                alt=f"Including positions of the sun [bold yellow]above horizon[/bold yellow] and [bold red]not in shade[/bold red] :\n{sun_horizon_position_series}",
+                lambda: f"Including positions of the sun above horizon and not in shade :\n{decode_sun_horizon_position_series(sun_horizon_position_series)}",
+                alt=lambda: f"Including positions of the sun [bold yellow]above horizon[/bold yellow] and [bold red]not in shade[/bold red] :\n{decode_sun_horizon_position_series(sun_horizon_position_series)}",
             )
 
             if verbose > HASH_AFTER_THIS_VERBOSITY_LEVEL:
@@ -872,7 +878,9 @@ def calculate_rear_side_photovoltaic_power_output_series(
                     solar_altitude_series, angle_output_units
                 ),
                 AZIMUTH_COLUMN_NAME: getattr(solar_azimuth_series, angle_output_units),
-                SUN_HORIZON_POSITION_COLUMN_NAME: sun_horizon_position_series,
+                SUN_HORIZON_POSITION_COLUMN_NAME: decode_sun_horizon_position_series(
+                    sun_horizon_position_series
+                ),
             }
             if verbose > 9
             else {}
@@ -0,0 +1,224 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Photovoltaic power over grids in spatial chunks
+
+The position, irradiance and power functions estimate the photovoltaic power
+of one location over a time series. Over a grid, the inputs are `(time,
+latitude, longitude)` DataArrays, possibly backed by lazily opened or chunked
+Dask arrays. The per-location pipeline is mapped over the spatial blocks of
+the inputs with `xarray.apply_ufunc(dask="parallelized")`. Dask then computes
+one `(latitude, longitude)` block, holding the complete time series of its
+pixels, at a time and its scheduler spreads the blocks across workers. The
+pipeline is mostly Python bound : a process-based or distributed scheduler
+scales better than the default threads.
+"""
+
+from typing import Any
+
+import numpy
+from pandas import DatetimeIndex
+from xarray import DataArray, apply_ufunc
+
+from pvgisprototype import TemperatureSeries, WindSpeedSeries
+from pvgisprototype.api.power.broadband import (
+    calculate_photovoltaic_power_output_series,
+)
+from pvgisprototype.api.power.streaming import STREAMED_QUANTITIES
+from pvgisprototype.constants import (
+    DATA_TYPE_DEFAULT,
+    PHOTOVOLTAIC_POWER_COLUMN_NAME,
+    TEMPERATURE_DEFAULT,
+    WIND_SPEED_DEFAULT,
+)
+from pvgisprototype.log import log_function_call, logger
+
+GRID_TIME_DIMENSION = "time"
+GRID_SERIES_MODELS = {
+    "temperature_series": (TemperatureSeries, TEMPERATURE_DEFAULT),
+    "wind_speed_series": (WindSpeedSeries, WIND_SPEED_DEFAULT),
+}
+
+
+def _spatial_dimensions(data: DataArray) -> tuple[str, str]:
+    """Names of the latitude and longitude dimensions of a DataArray"""
+    for latitude, longitude in (("lat", "lon"), ("latitude", "longitude")):
+        if latitude in data.dims and longitude in data.dims:
+            return latitude, longitude
+    raise ValueError(
+        f"No latitude and longitude dimensions in '{data.name}' : {data.dims}"
+    )
+
+
+def _calculate_photovoltaic_power_block(
+    longitude: numpy.ndarray,
+    latitude: numpy.ndarray,
+    elevation: numpy.ndarray,
+    *series: numpy.ndarray,
+    series_names: tuple[str, ...],
+    timestamps: DatetimeIndex,
+    attribute: str,
+    dtype: str,
+    parameters: dict,
+) -> numpy.ndarray:
+    """Photovoltaic power of each pixel of a `(latitude, longitude)` block
+
+    The time series inputs hold the time dimension last, as moved there by
+    `apply_ufunc()`, and so does the output.
+    """
+    output = numpy.empty(longitude.shape + (timestamps.size,), dtype=dtype)
+    for pixel in numpy.ndindex(longitude.shape):
+        pixel_series = {}
+        for name, values in zip(series_names, series):
+            model, _ = GRID_SERIES_MODELS.get(name, (None, None))
+            pixel_series[name] = (
+                model(value=values[pixel]) if model else values[pixel]
+            )
+        photovoltaic_power = calculate_photovoltaic_power_output_series(
+            longitude=float(numpy.radians(longitude[pixel])),
+            latitude=float(numpy.radians(latitude[pixel])),
+            elevation=float(elevation[pixel]),
+            timestamps=timestamps,
+            dtype=dtype,
+            **pixel_series,
+            **parameters,
+        )
+        output[pixel] = getattr(photovoltaic_power, attribute)
+
+    return output
+
+
+@log_function_call
+def calculate_photovoltaic_power_output_series_over_grid(
+    timestamps: DatetimeIndex,
+    elevation: DataArray | float,
+    global_horizontal_irradiance: DataArray,
+    direct_horizontal_irradiance: DataArray,
+    chunks: dict[str, int] | None = None,
+    quantity: str = PHOTOVOLTAIC_POWER_COLUMN_NAME,
+    dtype: str = DATA_TYPE_DEFAULT,
+    **parameters: Any,
+) -> DataArray:
+    """Estimate the photovoltaic power of each pixel of a grid.
+
+    Parameters
+    ----------
+    timestamps : DatetimeIndex
+        Timestamps of the `time` dimension of the time series inputs
+    elevation : DataArray | float
+        Elevation of each pixel in meters, as a `(latitude, longitude)`
+        DataArray, or a single elevation for all pixels
+    global_horizontal_irradiance : DataArray
+        The `(time, latitude, longitude)` global horizontal irradiance. Its
+        spatial coordinates, in degrees, define the grid.
+    direct_horizontal_irradiance : DataArray
+        The `(time, latitude, longitude)` direct horizontal irradiance
+    chunks : dict, optional
+        Block sizes along the spatial dimensions, e.g. `{"lat": 16, "lon":
+        16}`. Chunks the inputs with Dask. The time dimension is always kept
+        in a single chunk.
+    quantity : str
+        Name of the quantity to return, among `STREAMED_QUANTITIES`
+    dtype : str
+        Data type of the output
+    **parameters
+        Any other parameter of `calculate_photovoltaic_power_output_series()`.
+        DataArrays, e.g. a `(time, latitude, longitude)` temperature series,
+        are aligned to the grid and selected per pixel, anything else applies
+        to all pixels.
+
+    Returns
+    -------
+    DataArray
+        The `(latitude, longitude, time)` quantity. It is lazy, to be computed
+        in parallel block by block, if any input is a Dask array.
+    """
+    if quantity not in STREAMED_QUANTITIES:
+        raise ValueError(
+            f"Unknown quantity '{quantity}'. Choose among {list(STREAMED_QUANTITIES)}."
+        )
+    latitude_dimension, longitude_dimension = _spatial_dimensions(
+        global_horizontal_irradiance
+    )
+    grid = global_horizontal_irradiance.isel({GRID_TIME_DIMENSION: 0}, drop=True)
+    longitude = grid[longitude_dimension].broadcast_like(grid)
+    latitude = grid[latitude_dimension].broadcast_like(grid)
+    elevation = DataArray(elevation).broadcast_like(grid)
+
+    series = {
+        "global_horizontal_irradiance": global_horizontal_irradiance,
+        "direct_horizontal_irradiance": direct_horizontal_irradiance,
+    }
+    series |= {
+        name: parameters.pop(name)
+        for name, value in list(parameters.items())
+        if isinstance(value, DataArray)
+    }
+    for name, data in series.items():
+        if GRID_TIME_DIMENSION not in data.dims:
+            raise ValueError(f"No '{GRID_TIME_DIMENSION}' dimension in {name}")
+        if data.sizes[GRID_TIME_DIMENSION] != timestamps.size:
+            raise ValueError(
+                f"{name} has {data.sizes[GRID_TIME_DIMENSION]} time steps "
+                f"for {timestamps.size} timestamps"
+            )
+
+    for name, (model, default) in GRID_SERIES_MODELS.items():
+        if name not in series and not isinstance(parameters.get(name), model):
+            value = parameters.get(name, default)
+            parameters[name] = model(
+                value=numpy.full(timestamps.size, value, dtype=dtype)
+            )
+
+    inputs = [longitude, latitude, elevation, *series.values()]
+    if chunks is not None:
+        inputs = [
+            data.chunk(
+                {
+                    dimension: size
+                    for dimension, size in chunks.items()
+                    if dimension in data.dims
+                }
+            )
+            for data in inputs
+        ]
+    inputs = [
+        data.chunk({GRID_TIME_DIMENSION: -1})
+        if data.chunks and GRID_TIME_DIMENSION in data.dims
+        else data
+        for data in inputs
+    ]
+    logger.debug(
+        lambda: f"Estimating the photovoltaic power over a grid of {longitude.shape} pixels"
+        f" in blocks of {inputs[0].chunks or longitude.shape}",
+    )
+
+    return apply_ufunc(
+        _calculate_photovoltaic_power_block,
+        *inputs,
+        input_core_dims=[[], [], [], *([[GRID_TIME_DIMENSION]] * len(series))],
+        output_core_dims=[[GRID_TIME_DIMENSION]],
+        kwargs={
+            "series_names": tuple(series),
+            "timestamps": timestamps,
+            "attribute": STREAMED_QUANTITIES[quantity],
+            "dtype": dtype,
+            "parameters": parameters,
+        },
+        dask="parallelized",
+        output_dtypes=[dtype],
+    ).rename(quantity)
@@ -0,0 +1,147 @@
+#
+# Copyright (C) 2025 European Union
+#
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Photovoltaic power statistics over long periods in time chunks
+
+The photovoltaic power is estimated for one time chunk, e.g. one year, at a
+time. Each chunk feeds streaming accumulators and is discarded, so that memory
+use does not grow with the length of the period.
+"""
+
+from typing import Dict, Sequence
+
+import numpy
+from pandas import DatetimeIndex
+from pydantic import BaseModel
+from xarray import DataArray
+
+from pvgisprototype.api.power.broadband import (
+    calculate_photovoltaic_power_output_series,
+)
+from pvgisprototype.api.statistics.grouped import generate_group_keys
+from pvgisprototype.api.statistics.streaming import StreamingStatistics
+from pvgisprototype.constants import (
+    GLOBAL_INCLINED_IRRADIANCE_COLUMN_NAME,
+    PHOTOVOLTAIC_POWER_COLUMN_NAME,
+    PHOTOVOLTAIC_POWER_WITHOUT_SYSTEM_LOSS_COLUMN_NAME,
+)
+from pvgisprototype.log import log_function_call, logger
+
+CHUNK_FREQUENCY_DEFAULT = "YE"
+STREAMING_STATISTICS_FREQUENCY_DEFAULT = "month"
+STREAMED_QUANTITIES = {
+    PHOTOVOLTAIC_POWER_COLUMN_NAME: "value",
+    PHOTOVOLTAIC_POWER_WITHOUT_SYSTEM_LOSS_COLUMN_NAME: "photovoltaic_power_without_system_loss",
+    GLOBAL_INCLINED_IRRADIANCE_COLUMN_NAME: "global_inclined_irradiance",
+}
+
+
+def generate_time_chunks(
+    timestamps: DatetimeIndex,
+    chunk_frequency: str = CHUNK_FREQUENCY_DEFAULT,
+) -> list[slice]:
+    """Split sorted timestamps in contiguous chunks of a time frequency"""
+    chunk_keys = generate_group_keys(timestamps=timestamps, frequency=chunk_frequency)
+    boundaries = numpy.flatnonzero(chunk_keys[1:] != chunk_keys[:-1]) + 1
+    starts = [0, *boundaries.tolist()]
+    stops = [*boundaries.tolist(), timestamps.size]
+
+    return [slice(start, stop) for start, stop in zip(starts, stops)]
+
+
+def slice_time_series(value, time_slice: slice, length: int):
+    """Slice an input along time if it is a time series of `length` values
+
+    Arrays are sliced directly, Xarray DataArrays are sliced first and loaded
+    after, so that lazily opened data are read one chunk at a time, and data
+    models are copied with a sliced `value`. Anything else is returned as is.
+    """
+    if isinstance(value, DataArray) and value.ndim > 0 and value.shape[0] == length:
+        return value[time_slice].to_numpy()
+
+    if isinstance(value, numpy.ndarray) and value.ndim > 0 and value.shape[0] == length:
+        return value[time_slice]
+
+    if isinstance(value, BaseModel) and isinstance(
+        getattr(value, "value", None), (numpy.ndarray, DataArray)
+    ):
+        sliced = slice_time_series(value.value, time_slice, length)
+        if sliced is not value.value:
+            return value.model_copy(update={"value": sliced})
+
+    return value
+
+
+@log_function_call
+def calculate_photovoltaic_power_output_statistics(
+    timestamps: DatetimeIndex,
+    chunk_frequency: str = CHUNK_FREQUENCY_DEFAULT,
+    frequency: str = STREAMING_STATISTICS_FREQUENCY_DEFAULT,
+    quantities: Sequence[str] = tuple(STREAMED_QUANTITIES),
+    percentiles: bool = True,
+    **parameters,
+) -> Dict[str, StreamingStatistics]:
+    """Accumulate statistics of the photovoltaic power output in time chunks.
+
+    Parameters
+    ----------
+    timestamps : DatetimeIndex
+        Timestamps of the full period
+    chunk_frequency : str
+        Frequency of the time chunks to estimate at once, e.g. 'YE' for one
+        year at a time
+    frequency : str
+        Grouping of the statistics, see `grouped.generate_group_keys()`
+    quantities : Sequence[str]
+        Names of the quantities, among `STREAMED_QUANTITIES`, to accumulate
+    percentiles : bool
+        Whether to estimate percentiles per group
+    **parameters
+        Any other parameter of `calculate_photovoltaic_power_output_series()`.
+        Inputs with as many values as `timestamps` are sliced per chunk.
+
+    Returns
+    -------
+    dict
+        A `StreamingStatistics` per quantity
+    """
+    statistics = {
+        quantity: StreamingStatistics(frequency=frequency, percentiles=percentiles)
+        for quantity in quantities
+    }
+    length = timestamps.size
+    for time_slice in generate_time_chunks(timestamps, chunk_frequency):
+        chunk_timestamps = timestamps[time_slice]
+        chunk_parameters = {
+            name: slice_time_series(value, time_slice, length)
+            for name, value in parameters.items()
+        }
+        photovoltaic_power = calculate_photovoltaic_power_output_series(
+            timestamps=chunk_timestamps,
+            **chunk_parameters,
+        )
+        for quantity, accumulator in statistics.items():
+            accumulator.update(
+                values=getattr(photovoltaic_power, STREAMED_QUANTITIES[quantity]),
+                timestamps=chunk_timestamps,
+            )
+        logger.debug(
+            lambda: f"Accumulated statistics from {chunk_timestamps[0]} to {chunk_timestamps[-1]}",
+        )
+        del photovoltaic_power
+
+    return statistics
@@ -0,0 +1,95 @@
+#
+# Copyright (C) 2025 European Union
+#
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Concurrent reading of input time series
+
+Reading NetCDF/HDF5 data is dominated by I/O and decompression, both of which
+release the GIL. Independent inputs, e.g. irradiance components, temperature,
+wind speed and spectral factor, are thus read concurrently in a thread pool,
+as the Web API does with `asyncio.TaskGroup`.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Callable, Dict
+
+from pvgisprototype.api.series.progress import console
+from pvgisprototype.constants import MULTI_THREAD_FLAG_DEFAULT, cPROFILE_FLAG_DEFAULT
+from pvgisprototype.core.caching import share_request_caches
+from pvgisprototype.log import logger
+
+
+def _timed(reader: Callable[[], Any]) -> tuple[Any, float]:
+    start = perf_counter()
+    result = reader()
+    return result, perf_counter() - start
+
+
+def report_read_timings(timings: Dict[str, float], total: float):
+    """Print the time to read each input and the time to read all of them"""
+    for name, elapsed in timings.items():
+        console.print(f"Read [bold]{name}[/bold] in {elapsed:.3f} s")
+    console.print(f"Read {len(timings)} inputs in [bold]{total:.3f}[/bold] s")
+
+
+def read_concurrently(
+    readers: Dict[str, Callable[[], Any]],
+    multi_thread: bool = MULTI_THREAD_FLAG_DEFAULT,
+    profile: bool = cPROFILE_FLAG_DEFAULT,
+) -> Dict[str, Any]:
+    """Run independent readers concurrently in a thread pool.
+
+    Parameters
+    ----------
+    readers : dict
+        Callables without arguments, e.g. `functools.partial` of a time series
+        selection function, by the name of their result
+    multi_thread : bool
+        If False, run the readers one after another
+    profile : bool
+        Print the time each reader took
+
+    Returns
+    -------
+    dict
+        The result of each reader by its name
+
+    Notes
+    -----
+    An exception raised by a reader is raised again here, once all other
+    readers are done.
+
+    The readers share the per-request caches of the calling thread, see
+    `share_request_caches()`, so that cached selections outlive the pool.
+    """
+    start = perf_counter()
+    if multi_thread and len(readers) > 1:
+        with ThreadPoolExecutor(max_workers=len(readers)) as executor:
+            futures = {
+                name: executor.submit(share_request_caches(_timed), reader)
+                for name, reader in readers.items()
+            }
+            outcomes = {name: future.result() for name, future in futures.items()}
+    else:
+        outcomes = {name: _timed(reader) for name, reader in readers.items()}
+
+    timings = {name: elapsed for name, (_, elapsed) in outcomes.items()}
+    logger.debug(lambda: f"Read timings : {timings}")
+    if profile:
+        report_read_timings(timings, total=perf_counter() - start)
+
+    return {name: result for name, (result, _) in outcomes.items()}
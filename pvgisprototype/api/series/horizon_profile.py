@@ -5,6 +5,7 @@ from pandas import DatetimeIndex, Timestamp
 from xarray import DataArray, Dataset
 
 from pvgisprototype.api.irradiance.models import MethodForInexactMatches
+from pvgisprototype.api.series.horizon_table import HorizonTable
 from pvgisprototype.api.series.select import select_time_series_from_array_or_set
 from pvgisprototype.constants import (
     ARRAY_BACKEND_DEFAULT,
@@ -22,7 +23,7 @@ from pvgisprototype.constants import (
 def get_horizon_profile_from_array_or_set(
     longitude: float,
     latitude: float,
-    horizon_profile: DataArray | Dataset,
+    horizon_profile: DataArray | Dataset | HorizonTable,
     neighbor_lookup: MethodForInexactMatches | None = NEIGHBOR_LOOKUP_DEFAULT,
     tolerance: float | None = TOLERANCE_DEFAULT,
     dtype: str = DATA_TYPE_DEFAULT,
@@ -43,9 +44,10 @@ def get_horizon_profile_from_array_or_set(
     latitude : float
         Latitude coordinate for data extraction (in degrees or radians).
         Will be converted to degrees internally if needed.
-    horizon_profile : DataArray | Dataset
+    horizon_profile : DataArray | Dataset | HorizonTable
         Input xarray DataArray or Dataset containing horizon profile data
-        with spatial (longitude, latitude) and azimuth dimensions.
+        with spatial (longitude, latitude) and azimuth dimensions, or a
+        precomputed horizon table.
     neighbor_lookup : MethodForInexactMatches | None, optional
         Method for spatial interpolation when exact coordinate matches are not found,
         by default NEIGHBOR_LOOKUP_DEFAULT
@@ -61,10 +63,9 @@ def get_horizon_profile_from_array_or_set(
 
     Returns
     -------
-    numpy.ndarray
-        Direct horizontal irradiance time series as a 1D numpy array with the
-        specified dtype. Single scalar values are automatically converted to
-        1D arrays with one element.
+    DataArray | numpy.ndarray
+        The horizon profile of the location, or its row of heights at equally
+        spaced azimuths for a horizon table.
 
     Raises
     ------
@@ -77,12 +78,19 @@ def get_horizon_profile_from_array_or_set(
     with the underlying data. Scalar results are converted to 1D arrays for
     consistency in downstream processing.
     """
-    if isinstance(horizon_profile, DataArray | Dataset):
-        from pvgisprototype.api.utilities.conversions import (
-            convert_float_to_degrees_if_requested,
+    from pvgisprototype.api.utilities.conversions import (
+        convert_float_to_degrees_if_requested,
+    )
+    from pvgisprototype.constants import DEGREES
+
+    if isinstance(horizon_profile, HorizonTable):
+        horizon_profile_series = horizon_profile.select(
+            longitude=convert_float_to_degrees_if_requested(longitude, DEGREES),
+            latitude=convert_float_to_degrees_if_requested(latitude, DEGREES),
+            tolerance=tolerance,
         )
-        from pvgisprototype.constants import DEGREES
 
+    elif isinstance(horizon_profile, DataArray | Dataset):
         horizon_profile_series = select_time_series_from_array_or_set(
             data=horizon_profile,
             longitude=convert_float_to_degrees_if_requested(longitude, DEGREES),
@@ -0,0 +1,369 @@
+#
+# Copyright (C) 2025 European Union
+#
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Compact per-pixel horizon profiles
+
+A horizon profile is reduced to a fixed-size float32 table of horizon heights
+at equally spaced azimuths, starting from North and wrapping around at 2π.
+The tables of all pixels of a gridded horizon profile, e.g. the
+`horizon_profile_over_esti_jrc.zarr` store, are precomputed once into a flat
+`(pixel, azimuth)` array which is memory-mapped on reading. Selecting the
+profile of a location is then a row lookup and the horizon height for any
+solar azimuth series a periodic `numpy.interp()`, without creating any
+Xarray object per request.
+
+A horizon table is a directory holding :
+
+- `heights.npy` : the `(latitude * longitude, azimuth)` float32 table
+- `grid.npz` : the longitude and latitude axes in degrees
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+import numpy
+from numpy.lib.format import open_memmap
+from xarray import DataArray
+
+from pvgisprototype.constants import TOLERANCE_DEFAULT
+from pvgisprototype.log import logger
+
+HORIZON_TABLE_SIZE_DEFAULT = 360
+HORIZON_TABLE_SUFFIX = ".horizon"
+HORIZON_TABLE_HEIGHTS = "heights.npy"
+HORIZON_TABLE_GRID = "grid.npz"
+HORIZON_TABLE_CACHE_MAXSIZE = 4
+AZIMUTH_DIMENSION = "azimuth"
+FULL_CIRCLE = 2 * numpy.pi
+
+
+def generate_table_azimuths(size: int) -> numpy.ndarray:
+    """Equally spaced azimuths, in radians, starting from North"""
+    return numpy.arange(size) * (FULL_CIRCLE / size)
+
+
+def interpolate_horizon_height(
+    horizon_heights: numpy.ndarray,
+    azimuth: numpy.ndarray,
+    horizon_azimuths: numpy.ndarray | None = None,
+) -> numpy.ndarray:
+    """Interpolate horizon heights at azimuths with a periodic wrap at 2π
+
+    Parameters
+    ----------
+    horizon_heights : numpy.ndarray
+        Horizon heights of a horizon profile
+    azimuth : numpy.ndarray
+        Azimuths, in radians, to interpolate the horizon height at
+    horizon_azimuths : numpy.ndarray, optional
+        Azimuths of the horizon heights in radians. If None, the heights are a
+        horizon table of equally spaced azimuths starting from North.
+
+    Returns
+    -------
+    numpy.ndarray
+        The horizon height at each azimuth
+    """
+    if horizon_azimuths is None:
+        horizon_azimuths = generate_table_azimuths(horizon_heights.shape[-1])
+
+    return numpy.interp(
+        azimuth,
+        horizon_azimuths,
+        horizon_heights,
+        period=FULL_CIRCLE,
+    )
+
+
+def generate_periodic_interpolation_weights(
+    horizon_azimuths: numpy.ndarray,
+    azimuth: numpy.ndarray,
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Linear interpolation weights over azimuths wrapping around at 2π
+
+    Parameters
+    ----------
+    horizon_azimuths : numpy.ndarray
+        Sorted azimuths, in radians within [0, 2π), of a horizon profile
+    azimuth : numpy.ndarray
+        Azimuths, in radians, to interpolate at
+
+    Returns
+    -------
+    tuple
+        The indices of the horizon azimuths before and after each azimuth and
+        the weight of the latter, so that the interpolated height is
+        `heights[..., lower] * (1 - weights) + heights[..., upper] * weights`
+    """
+    size = horizon_azimuths.size
+    azimuth = numpy.mod(azimuth, FULL_CIRCLE)
+    upper = numpy.searchsorted(horizon_azimuths, azimuth, side="right")
+    lower = upper - 1
+    lower_azimuths = numpy.where(
+        lower < 0, horizon_azimuths[-1] - FULL_CIRCLE, horizon_azimuths[lower % size]
+    )
+    upper_azimuths = numpy.where(
+        upper >= size, horizon_azimuths[0] + FULL_CIRCLE, horizon_azimuths[upper % size]
+    )
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        weights = numpy.where(
+            upper_azimuths > lower_azimuths,
+            (azimuth - lower_azimuths) / (upper_azimuths - lower_azimuths),
+            0.0,
+        )
+
+    return lower % size, upper % size, weights
+
+
+def sort_horizon_azimuths(
+    horizon_heights: numpy.ndarray,
+    horizon_azimuths: numpy.ndarray | None = None,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Order horizon heights of shape `(..., azimuth)` by azimuth within [0, 2π)
+
+    If `horizon_azimuths` is None, the heights are at equally spaced azimuths
+    starting from North.
+    """
+    horizon_heights = numpy.asarray(horizon_heights)
+    if horizon_azimuths is None:
+        return horizon_heights, generate_table_azimuths(horizon_heights.shape[-1])
+
+    horizon_azimuths = numpy.mod(horizon_azimuths, FULL_CIRCLE)
+    order = numpy.argsort(horizon_azimuths)
+
+    return horizon_heights[..., order], horizon_azimuths[order]
+
+
+def interpolate_horizon_heights(
+    horizon_heights: numpy.ndarray,
+    azimuth: numpy.ndarray,
+    horizon_azimuths: numpy.ndarray | None = None,
+) -> numpy.ndarray:
+    """Interpolate many horizon profiles at the same azimuths at once
+
+    The azimuths are located once among the horizon azimuths and the weights
+    applied to all profiles.
+
+    Parameters
+    ----------
+    horizon_heights : numpy.ndarray
+        Horizon heights of shape `(..., azimuth)`, e.g. `(profile, azimuth)`
+    azimuth : numpy.ndarray
+        Azimuths, in radians, to interpolate the horizon heights at
+    horizon_azimuths : numpy.ndarray, optional
+        Azimuths of the horizon heights in radians. If None, equally spaced
+        azimuths starting from North.
+
+    Returns
+    -------
+    numpy.ndarray
+        Horizon heights of shape `(..., azimuth.size)`
+    """
+    horizon_heights, horizon_azimuths = sort_horizon_azimuths(
+        horizon_heights=horizon_heights,
+        horizon_azimuths=horizon_azimuths,
+    )
+    lower, upper, weights = generate_periodic_interpolation_weights(
+        horizon_azimuths=horizon_azimuths,
+        azimuth=numpy.ravel(azimuth),
+    )
+
+    return (
+        horizon_heights[..., lower] * (1 - weights)
+        + horizon_heights[..., upper] * weights
+    )
+
+
+def _location_dimensions(horizon_profile: DataArray) -> tuple[str, str]:
+    """Names of the longitude and latitude dimensions"""
+    if {"lon", "lat"} <= set(horizon_profile.dims):
+        return "lon", "lat"
+    if {"longitude", "latitude"} <= set(horizon_profile.dims):
+        return "longitude", "latitude"
+    raise ValueError(
+        f"No longitude and latitude dimensions in the horizon profile : {horizon_profile.dims}"
+    )
+
+
+def build_horizon_table(
+    horizon_profile: DataArray,
+    size: int | None = None,
+) -> numpy.ndarray:
+    """Resample a gridded horizon profile to a per-pixel horizon table
+
+    Parameters
+    ----------
+    horizon_profile : DataArray
+        Horizon heights with an `azimuth` dimension, in radians, and, for a
+        gridded profile, longitude and latitude dimensions
+    size : int, optional
+        Number of azimuths of the table. If None, equally spaced azimuths
+        starting from North are kept as they are, else resampled to
+        `HORIZON_TABLE_SIZE_DEFAULT` azimuths.
+
+    Returns
+    -------
+    numpy.ndarray
+        The float32 horizon table of shape `(..., size)`, with the azimuth as
+        the last axis and the remaining axes in the order of the profile
+    """
+    horizon_profile = horizon_profile.transpose(..., AZIMUTH_DIMENSION)
+    horizon_azimuths = numpy.mod(
+        horizon_profile[AZIMUTH_DIMENSION].values.astype(numpy.float64), FULL_CIRCLE
+    )
+    if size is None:
+        size = horizon_azimuths.size
+        if not numpy.allclose(horizon_azimuths, generate_table_azimuths(size)):
+            size = HORIZON_TABLE_SIZE_DEFAULT
+
+    table_azimuths = generate_table_azimuths(size)
+    if horizon_azimuths.size == size and numpy.allclose(horizon_azimuths, table_azimuths):
+        return horizon_profile.values.astype(numpy.float32)
+
+    # Linear interpolation weights are shared by all pixels
+    table = interpolate_horizon_heights(
+        horizon_heights=horizon_profile.values,
+        azimuth=table_azimuths,
+        horizon_azimuths=horizon_azimuths,
+    )
+
+    return table.astype(numpy.float32)
+
+
+def write_horizon_table(
+    horizon_profile: DataArray,
+    path: Path,
+    size: int | None = None,
+) -> Path:
+    """Precompute the horizon table of a gridded horizon profile
+
+    The table is written one latitude row at a time, so that the gridded
+    profile, e.g. a lazily opened Zarr store, need not fit in memory.
+
+    Parameters
+    ----------
+    horizon_profile : DataArray
+        Gridded horizon heights with longitude, latitude and azimuth dimensions
+    path : Path
+        Output directory, by convention with a `.horizon` suffix
+    size : int, optional
+        Number of azimuths of the table, see `build_horizon_table()`
+
+    Returns
+    -------
+    Path
+        The path to the horizon table
+    """
+    x, y = _location_dimensions(horizon_profile)
+    horizon_profile = horizon_profile.transpose(y, x, AZIMUTH_DIMENSION)
+    longitude = horizon_profile[x].values.astype(numpy.float64)
+    latitude = horizon_profile[y].values.astype(numpy.float64)
+    if size is None:
+        size = build_horizon_table(horizon_profile.isel({y: 0, x: 0})).shape[-1]
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    numpy.savez(path / HORIZON_TABLE_GRID, longitude=longitude, latitude=latitude)
+    heights = open_memmap(
+        path / HORIZON_TABLE_HEIGHTS,
+        mode="w+",
+        dtype=numpy.float32,
+        shape=(latitude.size * longitude.size, size),
+    )
+    for row in range(latitude.size):
+        heights[row * longitude.size : (row + 1) * longitude.size] = build_horizon_table(
+            horizon_profile.isel({y: row}).load(), size=size
+        )
+    heights.flush()
+    logger.debug(
+        lambda: f"Wrote a horizon table of {latitude.size} x {longitude.size} pixels and {size} azimuths to {path}",
+    )
+    del heights
+
+    return path
+
+
+def is_horizon_table(path: Path) -> bool:
+    """Whether a path is a precomputed horizon table"""
+    path = Path(path)
+    return (path / HORIZON_TABLE_HEIGHTS).is_file() and (
+        path / HORIZON_TABLE_GRID
+    ).is_file()
+
+
+def _nearest_index(axis: numpy.ndarray, value: float, tolerance: float | None) -> int:
+    index = int(numpy.abs(axis - value).argmin())
+    if tolerance is not None and abs(axis[index] - value) > tolerance:
+        raise ValueError(
+            f"No pixel within {tolerance} degrees of {value} : nearest is {axis[index]}"
+        )
+    return index
+
+
+@dataclass(frozen=True)
+class HorizonTable:
+    """Memory-mapped per-pixel horizon table"""
+
+    longitude: numpy.ndarray
+    latitude: numpy.ndarray
+    heights: numpy.ndarray  # (pixel, azimuth)
+
+    @property
+    def size(self) -> int:
+        """Number of azimuths per pixel"""
+        return self.heights.shape[-1]
+
+    def pixel(
+        self,
+        longitude: float,
+        latitude: float,
+        tolerance: float | None = TOLERANCE_DEFAULT,
+    ) -> int:
+        """Flat index of the pixel nearest to a location in degrees"""
+        return _nearest_index(
+            self.latitude, latitude, tolerance
+        ) * self.longitude.size + _nearest_index(self.longitude, longitude, tolerance)
+
+    def select(
+        self,
+        longitude: float,
+        latitude: float,
+        tolerance: float | None = TOLERANCE_DEFAULT,
+    ) -> numpy.ndarray:
+        """Horizon heights of the pixel nearest to a location in degrees"""
+        return numpy.asarray(
+            self.heights[self.pixel(longitude, latitude, tolerance)]
+        )
+
+
+@lru_cache(maxsize=HORIZON_TABLE_CACHE_MAXSIZE)
+def _open_horizon_table(path: Path, modification_time: int) -> HorizonTable:
+    grid = numpy.load(path / HORIZON_TABLE_GRID)
+    return HorizonTable(
+        longitude=grid["longitude"],
+        latitude=grid["latitude"],
+        heights=numpy.load(path / HORIZON_TABLE_HEIGHTS, mmap_mode="r"),
+    )
+
+
+def open_horizon_table(path: Path) -> HorizonTable:
+    """Memory-map a horizon table, once per modification of its heights"""
+    path = Path(path).resolve()
+    return _open_horizon_table(
+        path, (path / HORIZON_TABLE_HEIGHTS).stat().st_mtime_ns
+    )
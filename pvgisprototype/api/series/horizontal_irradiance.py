@@ -14,10 +14,12 @@
 # OF ANY KIND, either express or implied. See the Licence for the specific language
 # governing permissions and limitations under the Licence.
 #
+from functools import partial
 from pathlib import Path
 import numpy
 from pandas import DatetimeIndex, Timestamp
 
+from pvgisprototype.api.series.concurrent import read_concurrently
 from pvgisprototype.api.series.models import MethodForInexactMatches
 from pvgisprototype.api.series.select import select_time_series
 from pvgisprototype.constants import (
@@ -28,10 +30,77 @@ from pvgisprototype.constants import (
     NEIGHBOR_LOOKUP_DEFAULT,
     TOLERANCE_DEFAULT,
     VERBOSE_LEVEL_DEFAULT,
+    cPROFILE_FLAG_DEFAULT,
 )
 from pvgisprototype.log import log_function_call, logger
 
 
+GLOBAL_HORIZONTAL_IRRADIANCE_READER = "global_horizontal_irradiance"
+DIRECT_HORIZONTAL_IRRADIANCE_READER = "direct_horizontal_irradiance"
+
+
+def log_reading_horizontal_irradiance_components():
+    """Inform that the horizontal irradiance components are read from data"""
+    logger.info(
+        ":information: Reading the global and direct horizontal irradiance components from external data ...",
+        alt=f":information: [black on white][bold]Reading[/bold] the [orange]global[/orange] and [yellow]direct[/yellow] horizontal irradiance components [bold]from external data[/bold] ...[/black on white]",
+    )
+
+
+def horizontal_irradiance_readers(
+    shortwave: Path | None,
+    direct: Path | None,
+    longitude: float,
+    latitude: float,
+    timestamps: DatetimeIndex | None,
+    neighbor_lookup: MethodForInexactMatches = NEIGHBOR_LOOKUP_DEFAULT,
+    tolerance: float | None = TOLERANCE_DEFAULT,
+    mask_and_scale: bool = False,
+    in_memory: bool = False,
+    multi_thread: bool = MULTI_THREAD_FLAG_DEFAULT,
+    verbose: int = VERBOSE_LEVEL_DEFAULT,
+    log: int = LOG_LEVEL_DEFAULT,
+) -> dict:
+    """Readers of the global and direct horizontal irradiance time series,
+    keyed by name, for `read_concurrently()`.
+    """
+    selection_parameters = {
+        "longitude": longitude,
+        "latitude": latitude,
+        "timestamps": timestamps,
+        "neighbor_lookup": neighbor_lookup,
+        "tolerance": tolerance,
+        "mask_and_scale": mask_and_scale,
+        "in_memory": in_memory,
+        "verbose": 0 if multi_thread else verbose,
+        "log": log,
+    }
+    return {
+        GLOBAL_HORIZONTAL_IRRADIANCE_READER: partial(
+            select_time_series, time_series=shortwave, **selection_parameters
+        ),
+        DIRECT_HORIZONTAL_IRRADIANCE_READER: partial(
+            select_time_series, time_series=direct, **selection_parameters
+        ),
+    }
+
+
+def horizontal_irradiance_as_arrays(
+    horizontal_irradiance: dict,
+    dtype: str = DATA_TYPE_DEFAULT,
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Convert the time series read by `horizontal_irradiance_readers()` to
+    arrays of the requested data type.
+    """
+    return tuple(
+        horizontal_irradiance[name].to_numpy().astype(dtype=dtype)
+        for name in (
+            GLOBAL_HORIZONTAL_IRRADIANCE_READER,
+            DIRECT_HORIZONTAL_IRRADIANCE_READER,
+        )
+    )
+
+
 @log_function_call
 def read_horizontal_irradiance_components_from_sarah(
     shortwave: Path | None,
@@ -48,6 +117,7 @@ def read_horizontal_irradiance_components_from_sarah(
     multi_thread: bool = MULTI_THREAD_FLAG_DEFAULT,
     verbose: int = VERBOSE_LEVEL_DEFAULT,
     log: int = LOG_LEVEL_DEFAULT,
+    profile: bool = cPROFILE_FLAG_DEFAULT,
 ) -> tuple[numpy.ndarray, numpy.ndarray]:
     """Read horizontal irradiance components from SARAH time series.
 
@@ -68,82 +138,27 @@ def read_horizontal_irradiance_components_from_sarah(
 
     """
     if verbose > 0:
-        logger.info(
-            ":information: Reading the global and direct horizontal irradiance components from external data ...",
-            alt=f":information: [black on white][bold]Reading[/bold] the [orange]global[/orange] and [yellow]direct[/yellow] horizontal irradiance components [bold]from external data[/bold] ...[/black on white]",
-        )
-    if multi_thread:
-        from concurrent.futures import ThreadPoolExecutor
-
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            future_global_horizontal_irradiance_series = executor.submit(
-                select_time_series,
-                time_series=shortwave,
-                longitude=longitude,
-                latitude=latitude,
-                timestamps=timestamps,
-                neighbor_lookup=neighbor_lookup,
-                tolerance=tolerance,
-                mask_and_scale=mask_and_scale,
-                in_memory=in_memory,
-                verbose=0,
-                log=log,
-            )
-            future_direct_horizontal_irradiance_series = executor.submit(
-                select_time_series,
-                time_series=direct,
-                longitude=longitude,
-                latitude=latitude,
-                timestamps=timestamps,
-                neighbor_lookup=neighbor_lookup,
-                tolerance=tolerance,
-                mask_and_scale=mask_and_scale,
-                in_memory=in_memory,
-                verbose=0,
-                log=log,
-            )
-            global_horizontal_irradiance_series = (
-                future_global_horizontal_irradiance_series.result()
-                .to_numpy()
-                .astype(dtype=dtype)
-            )
-            direct_horizontal_irradiance_series = (
-                future_direct_horizontal_irradiance_series.result()
-                .to_numpy()
-                .astype(dtype=dtype)
-            )
-    else:
-        global_horizontal_irradiance_series = (
-            select_time_series(
-                time_series=shortwave,
-                longitude=longitude,
-                latitude=latitude,
-                timestamps=timestamps,
-                neighbor_lookup=neighbor_lookup,
-                tolerance=tolerance,
-                mask_and_scale=mask_and_scale,
-                in_memory=in_memory,
-                verbose=verbose,
-                log=log,
-            )
-            .to_numpy()
-            .astype(dtype=dtype)
-        )
-        direct_horizontal_irradiance_series = (
-            select_time_series(
-                time_series=direct,
-                longitude=longitude,
-                latitude=latitude,
-                timestamps=timestamps,
-                neighbor_lookup=neighbor_lookup,
-                tolerance=tolerance,
-                mask_and_scale=mask_and_scale,
-                in_memory=in_memory,
-                verbose=verbose,
-                log=log,
-            )
-            .to_numpy()
-            .astype(dtype=dtype)
-        )
+        log_reading_horizontal_irradiance_components()
+    horizontal_irradiance = read_concurrently(
+        readers=horizontal_irradiance_readers(
+            shortwave=shortwave,
+            direct=direct,
+            longitude=longitude,
+            latitude=latitude,
+            timestamps=timestamps,
+            neighbor_lookup=neighbor_lookup,
+            tolerance=tolerance,
+            mask_and_scale=mask_and_scale,
+            in_memory=in_memory,
+            multi_thread=multi_thread,
+            verbose=verbose,
+            log=log,
+        ),
+        multi_thread=multi_thread,
+        profile=profile,
+    )
+    global_horizontal_irradiance_series, direct_horizontal_irradiance_series = (
+        horizontal_irradiance_as_arrays(horizontal_irradiance, dtype=dtype)
+    )
 
     return global_horizontal_irradiance_series, direct_horizontal_irradiance_series
@@ -0,0 +1,198 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Gridded monthly Linke turbidity factor climatology
+
+A Linke turbidity climatology holds one Linke turbidity factor per month
+and pixel, i.e. a `month` dimension of length 12 next to the spatial
+dimensions. Once the climatology is open, the 12 monthly values of a
+location are selected like any other pre-opened dataset and the series for
+the requested timestamps is the plain integer indexing of these values by
+month.
+"""
+
+import numpy
+from pandas import DatetimeIndex
+from xarray import DataArray, Dataset
+
+from pvgisprototype import LinkeTurbidityFactor
+from pvgisprototype.api.irradiance.models import MethodForInexactMatches
+from pvgisprototype.api.series.select import select_time_series_from_array_or_set
+from pvgisprototype.constants import (
+    DATA_TYPE_DEFAULT,
+    DEGREES,
+    LOG_LEVEL_DEFAULT,
+    NEIGHBOR_LOOKUP_DEFAULT,
+    TOLERANCE_DEFAULT,
+)
+
+MONTHS_IN_A_YEAR = 12
+
+
+def expand_monthly_linke_turbidity(
+    monthly_linke_turbidity: numpy.ndarray,
+    timestamps: DatetimeIndex,
+    dtype: str = "float32",
+) -> LinkeTurbidityFactor:
+    """Linke turbidity factor series out of 12 monthly values"""
+    return LinkeTurbidityFactor(
+        value=numpy.asarray(monthly_linke_turbidity, dtype=dtype)[
+            timestamps.month.to_numpy() - 1
+        ],
+        unit=LinkeTurbidityFactor().unit,
+    )
+
+
+def get_monthly_linke_turbidity_from_array_or_set(
+    longitude: float,
+    latitude: float,
+    linke_turbidity_factor_series: DataArray | Dataset,
+    neighbor_lookup: MethodForInexactMatches | None = NEIGHBOR_LOOKUP_DEFAULT,
+    tolerance: float | None = TOLERANCE_DEFAULT,
+    dtype: str = DATA_TYPE_DEFAULT,
+    log: int = LOG_LEVEL_DEFAULT,
+) -> numpy.ndarray:
+    """Select the 12 monthly Linke turbidity factors of a location.
+
+    Parameters
+    ----------
+    longitude : float
+        Longitude coordinate for data extraction (in degrees or radians).
+        Will be converted to degrees internally if needed.
+    latitude : float
+        Latitude coordinate for data extraction (in degrees or radians).
+        Will be converted to degrees internally if needed.
+    linke_turbidity_factor_series : DataArray | Dataset
+        Input xarray DataArray or Dataset containing the monthly Linke
+        turbidity climatology with spatial (longitude, latitude) and `month`
+        dimensions.
+    neighbor_lookup : MethodForInexactMatches | None, optional
+        Method for spatial interpolation when exact coordinate matches are not found,
+        by default NEIGHBOR_LOOKUP_DEFAULT
+    tolerance : float | None, optional
+        Maximum distance tolerance for spatial interpolation,
+        by default TOLERANCE_DEFAULT
+    dtype : str, optional
+        Data type for the output numpy array,
+        by default DATA_TYPE_DEFAULT
+    log : int, optional
+        Logging level for debug output,
+        by default LOG_LEVEL_DEFAULT
+
+    Returns
+    -------
+    numpy.ndarray
+        The Linke turbidity factors of the location from January to December
+
+    Raises
+    ------
+    TypeError
+        If linke_turbidity_factor_series is not a DataArray or Dataset.
+    ValueError
+        If the selection does not hold exactly 12 monthly values.
+    """
+    if not isinstance(linke_turbidity_factor_series, DataArray | Dataset):
+        raise TypeError("Linke turbidity factor series must be a DataArray or Dataset.")
+
+    from pvgisprototype.api.utilities.conversions import (
+        convert_float_to_degrees_if_requested,
+    )
+
+    monthly_linke_turbidity = (
+        select_time_series_from_array_or_set(
+            data=linke_turbidity_factor_series,
+            longitude=convert_float_to_degrees_if_requested(longitude, DEGREES),
+            latitude=convert_float_to_degrees_if_requested(latitude, DEGREES),
+            timestamps=None,
+            neighbor_lookup=neighbor_lookup,
+            tolerance=tolerance,
+            verbose=0,  # no verbosity here by choice!
+            log=log,
+        )
+        .to_numpy()
+        .astype(dtype=dtype)
+    )
+    if monthly_linke_turbidity.size != MONTHS_IN_A_YEAR:
+        raise ValueError(
+            f"Expected {MONTHS_IN_A_YEAR} monthly Linke turbidity factors, "
+            f"got {monthly_linke_turbidity.size} from {linke_turbidity_factor_series.name}"
+        )
+
+    return monthly_linke_turbidity.ravel()
+
+
+def get_linke_turbidity_factor_series_from_array_or_set(
+    longitude: float,
+    latitude: float,
+    linke_turbidity_factor_series: DataArray | Dataset,
+    timestamps: DatetimeIndex,
+    neighbor_lookup: MethodForInexactMatches | None = NEIGHBOR_LOOKUP_DEFAULT,
+    tolerance: float | None = TOLERANCE_DEFAULT,
+    dtype: str = DATA_TYPE_DEFAULT,
+    log: int = LOG_LEVEL_DEFAULT,
+) -> LinkeTurbidityFactor:
+    """Extract a Linke turbidity factor series from a monthly climatology.
+
+    Selects the 12 monthly Linke turbidity factors of a location from an
+    xarray DataArray or Dataset and indexes them by the month of each
+    timestamp.
+
+    Parameters
+    ----------
+    longitude : float
+        Longitude coordinate for data extraction (in degrees or radians).
+        Will be converted to degrees internally if needed.
+    latitude : float
+        Latitude coordinate for data extraction (in degrees or radians).
+        Will be converted to degrees internally if needed.
+    linke_turbidity_factor_series : DataArray | Dataset
+        Input xarray DataArray or Dataset containing the monthly Linke
+        turbidity climatology.
+    timestamps : DatetimeIndex
+        Timestamps of the requested series
+    neighbor_lookup : MethodForInexactMatches | None, optional
+        Method for spatial interpolation when exact coordinate matches are not found,
+        by default NEIGHBOR_LOOKUP_DEFAULT
+    tolerance : float | None, optional
+        Maximum distance tolerance for spatial interpolation,
+        by default TOLERANCE_DEFAULT
+    dtype : str, optional
+        Data type for the output numpy array values,
+        by default DATA_TYPE_DEFAULT
+    log : int, optional
+        Logging level for debug output,
+        by default LOG_LEVEL_DEFAULT
+
+    Returns
+    -------
+    LinkeTurbidityFactor
+        The Linke turbidity factor of each timestamp
+    """
+    monthly_linke_turbidity = get_monthly_linke_turbidity_from_array_or_set(
+        longitude=longitude,
+        latitude=latitude,
+        linke_turbidity_factor_series=linke_turbidity_factor_series,
+        neighbor_lookup=neighbor_lookup,
+        tolerance=tolerance,
+        dtype=dtype,
+        log=log,
+    )
+    return expand_monthly_linke_turbidity(
+        monthly_linke_turbidity=monthly_linke_turbidity,
+        timestamps=DatetimeIndex(timestamps),
+        dtype=dtype,
+    )
@@ -20,6 +20,7 @@ import numpy
 import typer
 import xarray as xr
 from devtools import debug
+from pandas import Timestamp
 from rich import print
 from xarray.core.dataarray import DataArray
 from xarray.core.dataset import Dataset
@@ -27,6 +28,10 @@ from xarray.core.dataset import Dataset
 from pvgisprototype import Latitude, Longitude
 from pvgisprototype.api.series.hardcodings import check_mark, exclamation_mark, x_mark
 from pvgisprototype.api.series.models import MethodForInexactMatches
+from pvgisprototype.api.series.pool import (
+    get_dataset_handle,
+    read_pooled_data_array_or_set,
+)
 from pvgisprototype.cli.messages import ERROR_IN_SELECTING_DATA
 from pvgisprototype.constants import (
     DEBUG_AFTER_THIS_VERBOSITY_LEVEL,
@@ -100,7 +105,7 @@ def open_data_array(
     #         raise typer.Exit(code=33)
     if in_memory:
         if verbose > 0:
-            logger.debug(f"Loading data array '{input_data}' in memory...")
+            logger.debug(lambda: f"Loading data array '{input_data}' in memory...")
         return load_or_open_dataarray(
             function=xr.load_dataarray,
             filename_or_object=input_data,
@@ -108,7 +113,7 @@ def open_data_array(
         )
     else:
         if verbose > 0:
-            logger.debug(f"Opening data array '{input_data}'...")
+            logger.debug(lambda: f"Opening data array '{input_data}'...")
         return load_or_open_dataarray(
             function=xr.open_dataarray,
             filename_or_object=input_data,
@@ -125,7 +130,7 @@ def open_data_set(
     """Open or load a dataset based on the input flags."""
     if in_memory:
         if verbose > 0:
-            logger.debug(f"Loading dataset '{input_data}' in memory...")
+            logger.debug(lambda: f"Loading dataset '{input_data}' in memory...")
         return load_or_open_dataset(
             function=xr.load_dataset,
             filename_or_object=input_data,
@@ -133,7 +138,7 @@ def open_data_set(
         )
     else:
         if verbose > 0:
-            logger.debug(f"Opening dataset '{input_data}'...")
+            logger.debug(lambda: f"Opening dataset '{input_data}'...")
         return load_or_open_dataset(
             function=xr.open_dataset,
             filename_or_object=input_data,
@@ -233,7 +238,7 @@ def load_or_open_dataarray_from_dataset(
             raise typer.Exit(code=33)
 
     if verbose > 0:
-        logger.debug(f"Data successfully loaded for variable '{variable}'.")
+        logger.debug(lambda: f"Data successfully loaded for variable '{variable}'.")
 
     return data_array
 
@@ -244,89 +249,36 @@ def read_data_array_or_set(
     in_memory: bool = False,
     verbose: int = 0,
 ):
-    """Open the data and determine if it's a DataArray or Dataset."""
+    """Open the data and determine if it's a DataArray or Dataset.
 
-    # try reading an array
+    Data files are opened once and reused via the dataset handle pool, see
+    `pvgisprototype.api.series.pool`.
+    """
+    if verbose > 0:
+        action = "load into memory" if in_memory else "open"
+        logger.debug(
+            lambda: f"  - {exclamation_mark} Trying to {action} {input_data} ...",
+            alt=lambda: f"  - {exclamation_mark} [bold]Trying[/bold] to {action} {input_data} ...",
+        )
     try:
-        if in_memory:
-            if verbose > 0:
-                logger.debug(
-                    f"  - {exclamation_mark} Trying to load {input_data} into memory as a DataArray...",
-                    alt=f"  - {exclamation_mark} [bold]Trying[/bold] to load {input_data} into memory as a DataArray...",
-                )
-            return load_or_open_dataarray(
-                function=xr.load_dataarray,
-                filename_or_object=input_data,
-                mask_and_scale=mask_and_scale,
-            )
-        else:
-            if verbose > 0:
-                logger.debug(
-                    f"  - {exclamation_mark} Trying to open {input_data} as a DataArray...",
-                    alt=f"  - {exclamation_mark} [bold]Trying[/bold] to open {input_data} as a DataArray...",
-                )
-            return load_or_open_dataarray(
-                function=xr.open_dataarray,
-                filename_or_object=input_data,
-                mask_and_scale=mask_and_scale,
-            )
-
-    # or a set
-    except:
-        try:
-            if in_memory:
-                if verbose > 0:
-                    logger.debug(
-                        f"  - {exclamation_mark} Trying to load {input_data} into memory as a Dataset...",
-                        alt=f"  - {exclamation_mark} [bold]Trying[/bold] to load {input_data} into memory as a Dataset...",
-                    )
-                return load_or_open_dataset(
-                    function=xr.load_dataset,
-                    filename_or_object=input_data,
-                    mask_and_scale=mask_and_scale,
-                )
-            else:
-                if verbose > 0:
-                    logger.debug(
-                        f"  - {exclamation_mark} Trying to open {input_data} as a Dataset...",
-                        alt=f"  - {exclamation_mark} [bold]Trying[/bold] to open {input_data} as a Dataset...",
-                    )
-                return load_or_open_dataset(
-                    function=xr.open_dataset,
-                    filename_or_object=input_data,
-                    mask_and_scale=mask_and_scale,
-                )
-        except Exception as e:
-            logger.error(
-                f"Error loading or opening data: {str(e)}",
-                alt=f"Error loading or opening data: {str(e)}",
-            )
-            raise typer.Exit(code=33)
+        return read_pooled_data_array_or_set(
+            path=input_data,
+            mask_and_scale=mask_and_scale,
+            in_memory=in_memory,
+        )
+    except Exception as e:
+        logger.error(
+            f"Error loading or opening data: {str(e)}",
+            alt=f"Error loading or opening data: {str(e)}",
+        )
+        raise typer.Exit(code=33)
 
 
 def get_scale_and_offset(netcdf):
     """Get scale and offset values from a netCDF file using xarray"""
-    import xarray as xr
+    handle = get_dataset_handle(netcdf)
 
-    # Open the dataset using xarray
-    dataset = xr.open_dataset(netcdf)
-
-    # Get all dimensions
-    netcdf_dimensions = set(dataset.dims)
-    # Get all variables
-    netcdf_variables = set(dataset.data_vars)
-
-    # Assuming the first variable that is not a dimension is the target variable
-    variable = list(netcdf_variables.difference(netcdf_dimensions))[0]
-
-    # Get the variable's attributes
-    variable_attrs = dataset[variable].attrs
-
-    # Retrieve scale_factor and add_offset attributes if they exist
-    scale_factor = variable_attrs.get("scale_factor", None)
-    add_offset = variable_attrs.get("add_offset", None)
-
-    return (scale_factor, add_offset)
+    return (handle.scale_factor, handle.add_offset)
 
 
 def filter_xarray(
@@ -421,7 +373,7 @@ def set_location_indexers(
 
     if x and y:
         logger.debug(
-            f"  {check_mark} Location specific dimensions detected in '{data_array.name}' : {x}, {y}"
+            lambda: f"  {check_mark} Location specific dimensions detected in '{data_array.name}' : {x}, {y}"
         )
 
     if not (longitude and latitude):
@@ -491,6 +443,63 @@ def select_coordinates(
     return data_array
 
 
+def select_time_window(
+    data_array: DataArray,
+    start_time=None,
+    end_time=None,
+    pad: int = 0,
+) -> DataArray:
+    """Lazily restrict a data array to a time window before loading it
+
+    Parameters
+    ----------
+    data_array : DataArray
+        A (lazily opened) data array with a sorted `time` dimension
+    start_time, end_time : optional
+        Inclusive bounds of the time window. A missing bound leaves the window
+        open on that side.
+    pad : int
+        Number of time steps to keep beyond each bound, e.g. 1 for inexact
+        matches of timestamps to their nearest neighbor
+
+    Returns
+    -------
+    DataArray
+        A positional slice of `data_array` along time, so that only the chunks
+        covering the window are read once loaded. The input is returned as is
+        if there is no window or no sorted `time` dimension.
+    """
+    if (start_time is None and end_time is None) or "time" not in data_array.dims:
+        return data_array
+
+    time_index = data_array.indexes["time"]
+    if not time_index.is_monotonic_increasing:
+        return data_array
+
+    try:
+        start = (
+            time_index.searchsorted(Timestamp(start_time), side="left")
+            if start_time is not None
+            else 0
+        )
+        stop = (
+            time_index.searchsorted(Timestamp(end_time), side="right")
+            if end_time is not None
+            else time_index.size
+        )
+    except (TypeError, ValueError) as exception:
+        reason = str(exception)  # the name is unbound after the except block
+        logger.debug(lambda: f"Time window not applied : {reason}")
+        return data_array
+
+    time_window = slice(max(start - pad, 0), min(stop + pad, time_index.size))
+    logger.debug(
+        lambda: f"  {check_mark} Time window : {time_window.stop - time_window.start} of {time_index.size} time steps",
+    )
+
+    return data_array.isel(time=time_window)
+
+
 @log_function_call
 def select_location_time_series(
     time_series: Path,  # Is None required ?
@@ -503,13 +512,21 @@ def select_location_time_series(
     latitude: Latitude = None,
     neighbor_lookup: MethodForInexactMatches | None = MethodForInexactMatches.nearest,
     tolerance: float = 0.1,
+    start_time=None,
+    end_time=None,
+    time_window_padding: int = 0,
     mask_and_scale: bool = False,
     in_memory: bool = False,
     verbose: int = VERBOSE_LEVEL_DEFAULT,
     log: int = LOG_LEVEL_DEFAULT,
 ):
     """Select a location from a time series data format supported by
-    xarray"""
+    xarray
+
+    The time window from `start_time` to `end_time`, padded by
+    `time_window_padding` time steps, is selected along with the location
+    before loading, so that only the chunks of the requested period are read.
+    """
     context_message = (
         f"i Executing data selection function : select_location_time_series()"
     )
@@ -535,8 +552,8 @@ def select_location_time_series(
             raise ValueError(f"Variable '{variable}' not found in the Dataset.")
         data_array = data[variable]  # Extract the DataArray from the Dataset
         logger.debug(
-            f"  {check_mark} Successfully extracted '{variable}' from '{data_array.name}'.",
-            alt=f"  {check_mark} [green]Successfully[/green] extracted '{variable}' from '{data_array.name}'.",
+            lambda: f"  {check_mark} Successfully extracted '{variable}' from '{data_array.name}'.",
+            alt=lambda: f"  {check_mark} [green]Successfully[/green] extracted '{variable}' from '{data_array.name}'.",
         )
 
     elif isinstance(data, xr.DataArray):
@@ -566,9 +583,15 @@ def select_location_time_series(
             method=neighbor_lookup,
             tolerance=tolerance,
         )
+        location_time_series = select_time_window(
+            data_array=location_time_series,
+            start_time=start_time,
+            end_time=end_time,
+            pad=time_window_padding,
+        )
+        location_time_series.load()  # load into memory for fast processing
         if location_time_series.isnull().all():
             logger.warning("Selection returns an empty array or all NaNs.")
-        location_time_series.load()  # load into memory for fast processing
 
     except Exception as exception:
         # Print the error message directly to stderr to ensure it's always shown
@@ -587,8 +610,8 @@ def select_location_time_series(
         debug(locals())
 
     logger.debug(
-        f"  < Returning selected location from time series : {location_time_series}",
-        alt=f"  [green bold]<[/green bold] [bold]Returning[/bold] selected [brown]location[/brown] from time series : {location_time_series}",
+        lambda: f"  < Returning selected location from time series : {location_time_series}",
+        alt=lambda: f"  [green bold]<[/green bold] [bold]Returning[/bold] selected [brown]location[/brown] from time series : {location_time_series}",
     )
 
     return location_time_series
@@ -698,8 +721,8 @@ def select_location_time_series_from_array_or_set(
             raise ValueError(f"Variable '{variable}' not found in the Dataset.")
         data_array = data[variable]  # Extract the DataArray from the Dataset
         logger.debug(
-            f"  {check_mark} Successfully extracted '{variable}' from '{data_array.name}'.",
-            alt=f"  {check_mark} [green]Successfully[/green] extracted '{variable}' from '{data_array.name}'.",
+            lambda: f"  {check_mark} Successfully extracted '{variable}' from '{data_array.name}'.",
+            alt=lambda: f"  {check_mark} [green]Successfully[/green] extracted '{variable}' from '{data_array.name}'.",
         )
 
     elif isinstance(data, xr.DataArray):
@@ -729,9 +752,9 @@ def select_location_time_series_from_array_or_set(
             method=neighbor_lookup,
             tolerance=tolerance,
         )
+        location_time_series.load()  # load into memory for fast processing
         if location_time_series.isnull().all():
             logger.warning("Selection returns an empty array or all NaNs.")
-        location_time_series.load()  # load into memory for fast processing
 
     except Exception as exception:
         # Print the error message directly to stderr to ensure it's always shown
@@ -748,8 +771,8 @@ def select_location_time_series_from_array_or_set(
         debug(locals())
 
     logger.debug(
-        f"  < Returning selected location from time series : {location_time_series}",
-        alt=f"  [green bold]<[/green bold] [bold]Returning[/bold] selected [brown]location[/brown] from time series : {location_time_series}",
+        lambda: f"  < Returning selected location from time series : {location_time_series}",
+        alt=lambda: f"  [green bold]<[/green bold] [bold]Returning[/bold] selected [brown]location[/brown] from time series : {location_time_series}",
     )
 
     return location_time_series
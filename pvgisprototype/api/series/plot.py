@@ -42,7 +42,7 @@ def get_coordinates(data_array: xr.DataArray) -> tuple:
         x = "longitude"
         y = "latitude"
     if x and y:
-        logger.debug(f"Dimensions  : {x}, {y}")
+        logger.debug(lambda: f"Dimensions  : {x}, {y}")
     return x, y
 
 
@@ -82,13 +82,13 @@ def plot_series(
     # Plot data
     if resample_large_series:
         logger.debug(
-            f"Request for `--resample-large-series`",
-            alt=f"Request for `--resample-large-series`",
+            lambda: f"Request for `--resample-large-series`",
+            alt=lambda: f"Request for `--resample-large-series`",
         )
         data_array = data_array.resample(time="1D").mean()
         logger.debug(
-            f"Resampled data array : {data_array}",
-            alt=f"Resampled data array : {data_array}",
+            lambda: f"Resampled data array : {data_array}",
+            alt=lambda: f"Resampled data array : {data_array}",
         )
     dimensions = list(data_array.dims)
     num_dimensions = len(dimensions)
@@ -372,7 +372,7 @@ def plot_series(
     # Report
     number_of_values = int(data_array.count())
     logger.debug(
-        f"{check_mark} Time series plot of {number_of_values} values over ({float(data_array[x])}, {float(data_array[y])}) exported in {output_filename}!"
+        lambda: f"{check_mark} Time series plot of {number_of_values} values over ({float(data_array[x])}, {float(data_array[y])}) exported in {output_filename}!"
     )
     print(
         f"[green]{check_mark}[/green] Time series plot of {number_of_values} values over ({float(data_array[x])}, {float(data_array[y])}) exported in '{output_filename}'"
@@ -468,7 +468,7 @@ def plot_outliers(
 
     number_of_outliers = len(outliers_values)
     logger.debug(
-        f"{check_mark} Time series plot of {number_of_outliers} values over ({float(data_array[x])}, {float(data_array[y])}) exported in {output_filename}!"
+        lambda: f"{check_mark} Time series plot of {number_of_outliers} values over ({float(data_array[x])}, {float(data_array[y])}) exported in {output_filename}!"
     )
     print(
         f"{check_mark} Time series plot of {number_of_outliers} values over ({float(data_array[x])}, {float(data_array[y])}) exported in {output_filename}!"
@@ -0,0 +1,186 @@
+#
+# Copyright (C) 2025 European Union
+#
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Process-wide pool of opened dataset handles
+
+Each data file is opened once per `(path, modification time, mask_and_scale)`
+and its handle is reused by every selection function, e.g. in loops over
+multiple surfaces or by the optimiser. Along with the handle, the pool keeps
+what is otherwise derived by reopening the file : whether it holds a single
+variable (DataArray) or several (Dataset), the name of the target variable and
+its scale factor and offset. Coordinate indexes are built once with the handle.
+
+The least recently used handles are closed when the pool is full. A modified
+file gets a new modification time and is, thus, reopened.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+import xarray as xr
+from xarray import DataArray, Dataset
+
+from pvgisprototype.log import logger
+
+DATASET_HANDLE_POOL_MAXSIZE = 32
+UNNAMED_DATAARRAY_VARIABLE = "__xarray_dataarray_variable__"
+
+
+@dataclass
+class DatasetHandle:
+    """An opened data file and its metadata"""
+
+    dataset: Dataset
+    variable: str | None
+    is_data_array: bool
+    scale_factor: float | None
+    add_offset: float | None
+
+    @property
+    def data(self) -> DataArray | Dataset:
+        """A DataArray for single variable files, else the Dataset"""
+        if self.is_data_array:
+            data_array = self.dataset[self.variable]
+            if data_array.name == UNNAMED_DATAARRAY_VARIABLE:
+                data_array.name = None
+            return data_array
+
+        return self.dataset
+
+
+def select_data_variable(dataset: Dataset) -> str | None:
+    """The data variable of a dataset, i.e. the first one not named after a
+    dimension"""
+    dimensions = set(dataset.dims)
+    variables = [name for name in dataset.data_vars if name not in dimensions]
+    return variables[0] if variables else next(iter(dataset.data_vars), None)
+
+
+def open_dataset_handle(
+    path: Path,
+    mask_and_scale: bool = False,
+) -> DatasetHandle:
+    """Open a data file and derive its metadata once"""
+    dataset = xr.open_dataset(path, mask_and_scale=mask_and_scale)
+    variable = select_data_variable(dataset)
+    scale_factor = add_offset = None
+    if variable is not None:
+        attributes = dataset[variable].attrs
+        encoding = dataset[variable].encoding
+        scale_factor = attributes.get("scale_factor", encoding.get("scale_factor"))
+        add_offset = attributes.get("add_offset", encoding.get("add_offset"))
+
+    return DatasetHandle(
+        dataset=dataset,
+        variable=variable,
+        is_data_array=len(dataset.data_vars) == 1,
+        scale_factor=scale_factor,
+        add_offset=add_offset,
+    )
+
+
+class DatasetHandlePool:
+    """Least recently used pool of opened dataset handles"""
+
+    def __init__(self, maxsize: int = DATASET_HANDLE_POOL_MAXSIZE):
+        self.maxsize = maxsize
+        self._handles: OrderedDict[tuple, DatasetHandle] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    @staticmethod
+    def key(path: Path, mask_and_scale: bool = False) -> tuple:
+        path = Path(path).resolve()
+        return (path, path.stat().st_mtime_ns, mask_and_scale)
+
+    def get(self, path: Path, mask_and_scale: bool = False) -> DatasetHandle:
+        """Get the handle of a data file, opening it if not in the pool
+
+        Files are opened outside the lock so that concurrent readers of
+        different files do not wait for each other.
+        """
+        key = self.key(path, mask_and_scale)
+        with self._lock:
+            handle = self._handles.get(key)
+            if handle is not None:
+                self._handles.move_to_end(key)
+                return handle
+
+        opened = open_dataset_handle(path=key[0], mask_and_scale=mask_and_scale)
+        with self._lock:
+            handle = self._handles.get(key)
+            if handle is not None:  # opened meanwhile by another thread
+                opened.dataset.close()
+                self._handles.move_to_end(key)
+                return handle
+
+            for stale_key in [
+                pooled_key
+                for pooled_key in self._handles
+                if pooled_key[0] == key[0] and pooled_key[1] != key[1]
+            ]:  # the file was modified since it was opened
+                self._handles.pop(stale_key).dataset.close()
+
+            self._handles[key] = opened
+            logger.debug(
+                lambda: f"Opened {key[0]} in the dataset handle pool ({len(self._handles)}/{self.maxsize})",
+            )
+            while len(self._handles) > self.maxsize:
+                _, evicted = self._handles.popitem(last=False)
+                evicted.dataset.close()
+
+            return opened
+
+    def clear(self):
+        """Close and forget all handles"""
+        with self._lock:
+            while self._handles:
+                _, handle = self._handles.popitem()
+                handle.dataset.close()
+
+
+DATASET_HANDLE_POOL = DatasetHandlePool()
+
+
+def get_dataset_handle(
+    path: Path,
+    mask_and_scale: bool = False,
+) -> DatasetHandle:
+    """Get the pooled handle of a data file"""
+    return DATASET_HANDLE_POOL.get(path=path, mask_and_scale=mask_and_scale)
+
+
+def read_pooled_data_array_or_set(
+    path: Path,
+    mask_and_scale: bool = False,
+    in_memory: bool = False,
+) -> DataArray | Dataset:
+    """Read a DataArray or Dataset from the pool
+
+    A shallow copy is returned so that callers can modify attributes or
+    coordinates without affecting the pooled handle while sharing the
+    underlying, possibly loaded, data.
+    """
+    handle = get_dataset_handle(path=path, mask_and_scale=mask_and_scale)
+    if in_memory:
+        handle.dataset.load()  # once, in place, for all later reads
+
+    return handle.data.copy(deep=False)
@@ -121,8 +121,8 @@ def select_time_series(
     logger.debug(data_description, alt=data_description_alternative)
     scale_factor, add_offset = get_scale_and_offset(time_series)
     logger.debug(
-        f"Scale factor : {scale_factor}, Offset : {add_offset}",
-        alt=f"Scale factor : {scale_factor}, Offset : {add_offset}",
+        lambda: f"Scale factor : {scale_factor}, Offset : {add_offset}",
+        alt=lambda: f"Scale factor : {scale_factor}, Offset : {add_offset}",
     )
 
     if longitude and latitude:
@@ -132,6 +132,12 @@ def select_time_series(
         )
         logger.debug(coordinates, alt=coordinates_alternative)
 
+    # Push the requested period down to the selection before loading
+    window_start_time, window_end_time = start_time, end_time
+    if remap_to_month_start:  # remapped timestamps may lie anywhere in time
+        window_start_time = window_end_time = None
+    elif not (start_time or end_time) and timestamps is not None and not timestamps.empty:
+        window_start_time, window_end_time = timestamps.min(), timestamps.max()
     location_time_series = select_location_time_series(
         time_series=time_series,
         coordinate=coordinate,
@@ -143,14 +149,17 @@ def select_time_series(
         variable=variable,
         neighbor_lookup=neighbor_lookup,
         tolerance=tolerance,
+        start_time=window_start_time,
+        end_time=window_end_time,
+        time_window_padding=1 if neighbor_lookup else 0,
         mask_and_scale=mask_and_scale,
         in_memory=in_memory,
         verbose=verbose,
         # log=log,
     )
     logger.debug(
-        f"Selected location from time series : {location_time_series}",
-        alt=f"Selected [brown]location[/brown] from time series : {location_time_series}",
+        lambda: f"Selected location from time series : {location_time_series}",
+        alt=lambda: f"Selected [brown]location[/brown] from time series : {location_time_series}",
     )
     # ------------------------------------------------------------------------
     if (start_time or end_time) and not remap_to_month_start:
@@ -177,8 +186,8 @@ def select_time_series(
 
     if remap_to_month_start:
         logger.debug(
-            f"Remapping all timestaps for {time_series.name} to the reference year 2013",
-            alt=f"[bold]Remapping[/bold] all timestaps for {time_series.name} to the reference year 2013",
+            lambda: f"Remapping all timestaps for {time_series.name} to the reference year 2013",
+            alt=lambda: f"[bold]Remapping[/bold] all timestaps for {time_series.name} to the reference year 2013",
         )
         remapped_timestamps = timestamps.map(lambda ts: remap_to_2013(ts))
         if not remapped_timestamps.empty:
@@ -245,12 +254,12 @@ def select_time_series(
                     ):
                         raise ValueError("Duplicate timestaps detected!")
                 logger.debug(
-                    f"Selected timestamps from location time series : {location_time_series}",
-                    alt=f"[bold]Selected[/bold] [blue]timestamps[/blue] from [brown]location[/brown] time series : {location_time_series}",
+                    lambda: f"Selected timestamps from location time series : {location_time_series}",
+                    alt=lambda: f"[bold]Selected[/bold] [blue]timestamps[/blue] from [brown]location[/brown] time series : {location_time_series}",
                 )
             else:
                 logger.debug(
-                    f"Single timestamp selected: {location_time_series.time.values}"
+                    lambda: f"Single timestamp selected: {location_time_series.time.values}"
                 )
 
         except KeyError:
@@ -427,8 +436,8 @@ def select_time_series_from_array_or_set(
         # log=log,
     )
     logger.debug(
-        f"Selected location from time series : {location_time_series}",
-        alt=f"Selected [brown]location[/brown] from time series : {location_time_series}",
+        lambda: f"Selected location from time series : {location_time_series}",
+        alt=lambda: f"Selected [brown]location[/brown] from time series : {location_time_series}",
     )
     # ------------------------------------------------------------------------
     if (start_time or end_time) and not remap_to_month_start:
@@ -455,8 +464,8 @@ def select_time_series_from_array_or_set(
 
     if remap_to_month_start:
         logger.debug(
-            f"Remapping all timestaps for {data} to the reference year 2013",
-            alt=f"[bold]Remapping[/bold] all timestaps for {data} to the reference year 2013",
+            lambda: f"Remapping all timestaps for {data} to the reference year 2013",
+            alt=lambda: f"[bold]Remapping[/bold] all timestaps for {data} to the reference year 2013",
         )
         remapped_timestamps = timestamps.map(lambda ts: remap_to_2013(ts))
         if not remapped_timestamps.empty:
@@ -514,12 +523,12 @@ def select_time_series_from_array_or_set(
                     ):
                         raise ValueError("Duplicate timestaps detected!")
                 logger.debug(
-                    f"Selected timestamps from location time series : {location_time_series}",
-                    alt=f"[bold]Selected[/bold] [blue]timestamps[/blue] from [brown]location[/brown] time series : {location_time_series}",
+                    lambda: f"Selected timestamps from location time series : {location_time_series}",
+                    alt=lambda: f"[bold]Selected[/bold] [blue]timestamps[/blue] from [brown]location[/brown] time series : {location_time_series}",
                 )
             else:
                 logger.debug(
-                    f"Single timestamp selected: {location_time_series.time.values}"
+                    lambda: f"Single timestamp selected: {location_time_series.time.values}"
                 )
 
         except KeyError:
@@ -14,6 +14,7 @@
 # OF ANY KIND, either express or implied. See the Licence for the specific language
 # governing permissions and limitations under the Licence.
 #
+from dataclasses import dataclass
 from pathlib import Path
 
 from xarray import DataArray, Dataset
@@ -36,6 +37,113 @@ from pvgisprototype.api.irradiance.models import (
 import numpy
 from pandas import DatetimeIndex, Timestamp
 from pvgisprototype import SpectralFactorSeries
+from pvgisprototype.core.caching import custom_cached
+from pvgisprototype.log import logger
+
+MONTHS_IN_A_YEAR = 12
+
+
+def is_monthly_time_series(data: DataArray | Dataset) -> bool:
+    """Check whether a time series holds (at most) one value per calendar
+    month, time stamped at the start of the months of a single year, such as
+    the monthly spectral effect maps for the reference year 2013 by Thomas
+    Huld. These are the timestamps `select_time_series()` selects with
+    `remap_to_month_start`.
+    """
+    if "time" not in data.coords or data.time.size > MONTHS_IN_A_YEAR:
+        return False
+    time_index = data.indexes["time"]
+    if not isinstance(time_index, DatetimeIndex) or time_index.empty:
+        return False
+    months = time_index.month
+    return (
+        months.size == months.unique().size
+        and time_index.year.unique().size == 1
+        and time_index.is_month_start.all()
+        and (time_index == time_index.normalize()).all()
+    )
+
+
+@dataclass(frozen=True)
+class MonthlyLookupTable:
+    """Monthly values of a location indexed by `month - 1`"""
+
+    values: numpy.ndarray
+    available_months: numpy.ndarray  # bool, the months present in the data
+
+
+def build_monthly_lookup_table(location_time_series: DataArray) -> MonthlyLookupTable:
+    """Arrange the monthly values of a location time series in a lookup table
+    indexed by `month - 1`. Months missing from the data are marked as not
+    available, NaN values (e.g. masked pixels) are kept as they are.
+    """
+    month_indices = location_time_series.indexes["time"].month - 1
+    monthly_values = numpy.full(MONTHS_IN_A_YEAR, numpy.nan)
+    monthly_values[month_indices] = location_time_series.to_numpy()
+    available_months = numpy.zeros(MONTHS_IN_A_YEAR, dtype=bool)
+    available_months[month_indices] = True
+
+    return MonthlyLookupTable(
+        values=monthly_values,
+        available_months=available_months,
+    )
+
+
+def expand_monthly_values(
+    monthly_values: MonthlyLookupTable,
+    timestamps: DatetimeIndex,
+    dtype: str = DATA_TYPE_DEFAULT,
+) -> numpy.ndarray:
+    """Broadcast a monthly lookup table to the requested timestamps using
+    integer month indexing.
+    """
+    if not isinstance(timestamps, DatetimeIndex):
+        timestamps = DatetimeIndex([timestamps])
+    month_indices = timestamps.month.to_numpy() - 1
+    missing_months = numpy.unique(
+        month_indices[~monthly_values.available_months[month_indices]] + 1
+    )
+    if missing_months.size > 0:
+        error_message = f"No monthly values found for the month(s) {missing_months.tolist()}."
+        logger.error(error_message)
+        raise ValueError(error_message)
+
+    return monthly_values.values[month_indices].astype(dtype=dtype)
+
+
+@custom_cached
+def select_monthly_location_values(
+    time_series: Path,
+    longitude: float,
+    latitude: float,
+    neighbor_lookup: MethodForInexactMatches | None = NEIGHBOR_LOOKUP_DEFAULT,
+    tolerance: float | None = TOLERANCE_DEFAULT,
+    mask_and_scale: bool = MASK_AND_SCALE_FLAG_DEFAULT,
+    in_memory: bool = IN_MEMORY_FLAG_DEFAULT,
+) -> MonthlyLookupTable | None:
+    """Read the monthly values of a location from a monthly time series
+    file once. Return None if the data are not a monthly time series.
+    """
+    from pvgisprototype.api.series.open import select_location_time_series
+    from pvgisprototype.api.series.pool import get_dataset_handle
+
+    handle = get_dataset_handle(path=time_series, mask_and_scale=mask_and_scale)
+    if not is_monthly_time_series(handle.dataset):
+        return None
+
+    # Same selection as select_time_series(), i.e. of the target variable
+    location_time_series = select_location_time_series(
+        time_series=time_series,
+        variable=handle.variable,
+        longitude=longitude,
+        latitude=latitude,
+        neighbor_lookup=neighbor_lookup,
+        tolerance=tolerance,
+        mask_and_scale=mask_and_scale,
+        in_memory=in_memory,
+        verbose=0,
+    )
+    return build_monthly_lookup_table(location_time_series)
 
 
 def get_spectral_factor_series(
@@ -58,6 +166,27 @@ def get_spectral_factor_series(
     """ """
     if isinstance(spectral_factor_series, Path):
 
+        # Monthly maps : read 12 values once, then index by month
+        monthly_values = select_monthly_location_values(
+            time_series=spectral_factor_series,
+            longitude=longitude.degrees,
+            latitude=latitude.degrees,
+            neighbor_lookup=neighbor_lookup,
+            tolerance=tolerance,
+            mask_and_scale=mask_and_scale,
+            in_memory=in_memory,
+        )
+        if monthly_values is not None:
+            return SpectralFactorSeries(
+                value=expand_monthly_values(
+                    monthly_values=monthly_values,
+                    timestamps=timestamps,
+                    dtype=dtype,
+                ),
+                unit=UNITLESS,
+                data_source=spectral_factor_series.name,
+            )
+
         from pvgisprototype.api.series.select import select_time_series
         # from pvgisprototype.api.utilities.conversions import (
         #     convert_float_to_degrees_if_requested,
@@ -150,7 +279,39 @@ def get_spectral_factor_series_from_array_or_set(
     """
     from pvgisprototype.api.series.select import select_time_series_from_array_or_set
 
-    if isinstance(spectral_factor_series, DataArray | Dataset):
+    if isinstance(spectral_factor_series, DataArray | Dataset) and is_monthly_time_series(
+        spectral_factor_series
+    ):
+        from pvgisprototype.api.series.open import (
+            select_location_time_series_from_array_or_set,
+        )
+        from pvgisprototype.api.series.pool import select_data_variable
+        from pvgisprototype.api.utilities.conversions import (
+            convert_float_to_degrees_if_requested,
+        )
+        from pvgisprototype.constants import DEGREES
+
+        # Monthly maps : 12 values per location, indexed by month
+        location_time_series = select_location_time_series_from_array_or_set(
+            data=spectral_factor_series,
+            variable=(
+                select_data_variable(spectral_factor_series)
+                if isinstance(spectral_factor_series, Dataset)
+                else None
+            ),
+            longitude=convert_float_to_degrees_if_requested(longitude, DEGREES),
+            latitude=convert_float_to_degrees_if_requested(latitude, DEGREES),
+            neighbor_lookup=neighbor_lookup,
+            tolerance=tolerance,
+            verbose=0,
+        )
+        spectral_factor_time_series = expand_monthly_values(
+            monthly_values=build_monthly_lookup_table(location_time_series),
+            timestamps=timestamps,
+            dtype=dtype,
+        )
+
+    elif isinstance(spectral_factor_series, DataArray | Dataset):
         from pvgisprototype.api.utilities.conversions import (
             convert_float_to_degrees_if_requested,
         )
@@ -185,5 +346,5 @@ def get_spectral_factor_series_from_array_or_set(
     return SpectralFactorSeries(
         value=spectral_factor_time_series,
         unit=UNITLESS,
-        data_source=spectral_factor_series.name,
+        data_source=getattr(spectral_factor_series, "name", None),  # Datasets have none
     )
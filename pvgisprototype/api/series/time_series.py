@@ -14,20 +14,34 @@
 # OF ANY KIND, either express or implied. See the Licence for the specific language
 # governing permissions and limitations under the Licence.
 #
+from functools import partial
 from pathlib import Path
+from pvgisprototype.api.series.concurrent import read_concurrently
+from pvgisprototype.api.series.horizontal_irradiance import (
+    horizontal_irradiance_as_arrays,
+    horizontal_irradiance_readers,
+    log_reading_horizontal_irradiance_components,
+)
+from pvgisprototype.api.series.horizon_table import is_horizon_table, open_horizon_table
 from pvgisprototype.api.series.open import read_data_array_or_set
 from pvgisprototype.api.series.temperature import get_temperature_series
 from pvgisprototype.api.series.wind_speed import get_wind_speed_series
 from pvgisprototype.api.series.spectral_factor import get_spectral_factor_series
+from pvgisprototype.api.utilities.conversions import (
+    convert_float_to_degrees_if_requested,
+)
 from pvgisprototype.constants import (
+    DEGREES,
     IN_MEMORY_FLAG_DEFAULT,
     MASK_AND_SCALE_FLAG_DEFAULT,
+    RADIANS,
     VERBOSE_LEVEL_DEFAULT,
+    cPROFILE_FLAG_DEFAULT,
 )
 from pvgisprototype import Longitude, Latitude
 
 
-def get_time_series(
+def time_series_readers(
     temperature_series: Path,
     wind_speed_series: Path,
     spectral_factor_series: Path,
@@ -43,57 +57,208 @@ def get_time_series(
     multi_thread,
     verbose,
     log,
-):
+) -> dict:
+    """Readers of the temperature, wind speed and spectral factor time series
+    given as paths to data files, keyed by name, for `read_concurrently()`.
+    """
+    common_parameters = {
+        "longitude": longitude,
+        "latitude": latitude,
+        "timestamps": timestamps,
+        "neighbor_lookup": neighbor_lookup,
+        "tolerance": tolerance,
+        "mask_and_scale": mask_and_scale,
+        "in_memory": in_memory,
+        "dtype": dtype,
+        "array_backend": array_backend,
+        "multi_thread": multi_thread,
+        "verbose": verbose,
+        "log": log,
+    }
+    readers = {}
     if isinstance(temperature_series, Path):
-        temperature_series = get_temperature_series(
-                longitude=longitude,
-                latitude=latitude,
-                timestamps=timestamps,
-                temperature_series=temperature_series,
-                neighbor_lookup=neighbor_lookup,
-                tolerance=tolerance,
-                mask_and_scale=mask_and_scale,
-                in_memory=in_memory,
-                dtype=dtype,
-                array_backend=array_backend,
-                multi_thread=multi_thread,
-                verbose=verbose,
-                log=log,
-            )
+        readers["temperature_series"] = partial(
+            get_temperature_series,
+            temperature_series=temperature_series,
+            **common_parameters,
+        )
     if isinstance(wind_speed_series, Path):
-        wind_speed_series = get_wind_speed_series(
-                longitude=longitude,
-                latitude=latitude,
-                timestamps=timestamps,
-                wind_speed_series=wind_speed_series,
-                neighbor_lookup=neighbor_lookup,
-                tolerance=tolerance,
-                mask_and_scale=mask_and_scale,
-                in_memory=in_memory,
-                dtype=dtype,
-                array_backend=array_backend,
-                multi_thread=multi_thread,
-                verbose=verbose,
-                log=log,
-            )
+        readers["wind_speed_series"] = partial(
+            get_wind_speed_series,
+            wind_speed_series=wind_speed_series,
+            **common_parameters,
+        )
     if isinstance(spectral_factor_series, Path):
-        spectral_factor_series = get_spectral_factor_series(
-                longitude=longitude,
-                latitude=latitude,
-                timestamps=timestamps,
-                spectral_factor_series=spectral_factor_series,
-                neighbor_lookup=neighbor_lookup,
-                tolerance=tolerance,
-                mask_and_scale=mask_and_scale,
-                in_memory=in_memory,
-                dtype=dtype,
-                array_backend=array_backend,
-                multi_thread=multi_thread,
-                verbose=verbose,
-                log=log,
-            )
-
-    return temperature_series, wind_speed_series, spectral_factor_series
+        readers["spectral_factor_series"] = partial(
+            get_spectral_factor_series,
+            spectral_factor_series=spectral_factor_series,
+            **common_parameters,
+        )
+
+    return readers
+
+
+def get_time_series(
+    temperature_series: Path,
+    wind_speed_series: Path,
+    spectral_factor_series: Path,
+    longitude: Longitude,
+    latitude: Latitude,
+    timestamps,
+    neighbor_lookup,
+    tolerance,
+    mask_and_scale,
+    in_memory,
+    dtype,
+    array_backend,
+    multi_thread,
+    verbose,
+    log,
+    profile: bool = cPROFILE_FLAG_DEFAULT,
+):
+    """Read the temperature, wind speed and spectral factor time series
+    concurrently, for those given as paths to data files.
+    """
+    time_series = read_concurrently(
+        readers=time_series_readers(
+            temperature_series=temperature_series,
+            wind_speed_series=wind_speed_series,
+            spectral_factor_series=spectral_factor_series,
+            longitude=longitude,
+            latitude=latitude,
+            timestamps=timestamps,
+            neighbor_lookup=neighbor_lookup,
+            tolerance=tolerance,
+            mask_and_scale=mask_and_scale,
+            in_memory=in_memory,
+            dtype=dtype,
+            array_backend=array_backend,
+            multi_thread=multi_thread,
+            verbose=verbose,
+            log=log,
+        ),
+        multi_thread=multi_thread,
+        profile=profile,
+    )
+
+    return (
+        time_series.get("temperature_series", temperature_series),
+        time_series.get("wind_speed_series", wind_speed_series),
+        time_series.get("spectral_factor_series", spectral_factor_series),
+    )
+
+
+def read_external_time_series(
+    global_horizontal_irradiance: Path | None,
+    direct_horizontal_irradiance: Path | None,
+    temperature_series: Path,
+    wind_speed_series: Path,
+    spectral_factor_series: Path,
+    longitude: float,
+    latitude: float,
+    timestamps,
+    neighbor_lookup,
+    tolerance,
+    mask_and_scale,
+    in_memory,
+    dtype,
+    array_backend,
+    multi_thread,
+    verbose,
+    log,
+    profile: bool = cPROFILE_FLAG_DEFAULT,
+) -> dict:
+    """Read all external time series of a photovoltaic power calculation
+    concurrently, in a single pool of readers.
+
+    Parameters
+    ----------
+    global_horizontal_irradiance: Path | None
+        Global horizontal irradiance time series, read only along with the
+        `direct_horizontal_irradiance`
+    direct_horizontal_irradiance: Path | None
+        Direct horizontal irradiance time series
+    temperature_series: Path
+        Temperature time series, read if a path to a data file
+    wind_speed_series: Path
+        Wind speed time series, read if a path to a data file
+    spectral_factor_series: Path
+        Spectral factor time series, read if a path to a data file
+    longitude: float
+        Longitude of the location in radians
+    latitude: float
+        Latitude of the location in radians
+
+    Returns
+    -------
+    dict
+        The global and direct horizontal irradiance as arrays of `dtype`, the
+        temperature, wind speed and spectral factor time series, keyed by the
+        name of the input parameter. Inputs that are not read are returned as
+        given.
+
+    Notes
+    -----
+    With `profile`, the time to read each of the time series is reported
+    once, for all of them.
+
+    """
+    readers = time_series_readers(
+        temperature_series=temperature_series,
+        wind_speed_series=wind_speed_series,
+        spectral_factor_series=spectral_factor_series,
+        longitude=Longitude(value=longitude, unit=RADIANS),
+        latitude=Latitude(value=latitude, unit=RADIANS),
+        timestamps=timestamps,
+        neighbor_lookup=neighbor_lookup,
+        tolerance=tolerance,
+        mask_and_scale=mask_and_scale,
+        in_memory=in_memory,
+        dtype=dtype,
+        array_backend=array_backend,
+        multi_thread=multi_thread,
+        verbose=verbose,
+        log=log,
+    )
+    read_horizontal_irradiance = isinstance(
+        global_horizontal_irradiance, (str, Path)
+    ) and isinstance(direct_horizontal_irradiance, (str, Path))
+    if read_horizontal_irradiance:  # NOTE This is in the case everything is pathlike
+        if verbose > 0:
+            log_reading_horizontal_irradiance_components()
+        readers |= horizontal_irradiance_readers(
+            shortwave=global_horizontal_irradiance,
+            direct=direct_horizontal_irradiance,
+            longitude=convert_float_to_degrees_if_requested(longitude, DEGREES),
+            latitude=convert_float_to_degrees_if_requested(latitude, DEGREES),
+            timestamps=timestamps,
+            neighbor_lookup=neighbor_lookup,
+            tolerance=tolerance,
+            mask_and_scale=mask_and_scale,
+            in_memory=in_memory,
+            multi_thread=multi_thread,
+            verbose=verbose,
+            log=log,
+        )
+    time_series = read_concurrently(
+        readers=readers,
+        multi_thread=multi_thread,
+        profile=profile,
+    )
+    if read_horizontal_irradiance:
+        global_horizontal_irradiance, direct_horizontal_irradiance = (
+            horizontal_irradiance_as_arrays(time_series, dtype=dtype)
+        )
+
+    return {
+        "global_horizontal_irradiance": global_horizontal_irradiance,
+        "direct_horizontal_irradiance": direct_horizontal_irradiance,
+        "temperature_series": time_series.get("temperature_series", temperature_series),
+        "wind_speed_series": time_series.get("wind_speed_series", wind_speed_series),
+        "spectral_factor_series": time_series.get(
+            "spectral_factor_series", spectral_factor_series
+        ),
+    }
 
 
 def get_time_series_as_arrays_or_sets(
@@ -126,7 +291,8 @@ def get_time_series_as_arrays_or_sets(
     -------
     dict
         Dictionary mapping dataset names to opened (lazy loaded) xarray DataArrays or Datasets.
-        Keys match the input dataset names, values are the opened xarray objects.
+        Keys match the input dataset names, values are the opened xarray objects
+        or, for precomputed horizon tables, memory-mapped `HorizonTable`s.
 
     """
 
@@ -135,6 +301,9 @@ def get_time_series_as_arrays_or_sets(
         if path is None:
             opened_dataset[name] = None
             continue
+        if is_horizon_table(path):
+            opened_dataset[name] = open_horizon_table(path)
+            continue
         opened_dataset[name] = read_data_array_or_set(
             input_data=path,
             mask_and_scale=mask_and_scale,
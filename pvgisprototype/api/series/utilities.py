@@ -27,6 +27,10 @@ from xarray.core.dataset import Dataset
 from pvgisprototype import Latitude, Longitude
 from pvgisprototype.api.series.hardcodings import check_mark, exclamation_mark, x_mark
 from pvgisprototype.api.series.models import MethodForInexactMatches
+from pvgisprototype.api.series.pool import (
+    get_dataset_handle,
+    read_pooled_data_array_or_set,
+)
 from pvgisprototype.cli.messages import ERROR_IN_SELECTING_DATA
 from pvgisprototype.constants import (
     DEBUG_AFTER_THIS_VERBOSITY_LEVEL,
@@ -88,7 +92,7 @@ def open_data_array(
     #         raise typer.Exit(code=33)
     if in_memory:
         if verbose > 0:
-            logger.debug(f"Loading data array '{input_data}' in memory...")
+            logger.debug(lambda: f"Loading data array '{input_data}' in memory...")
         return load_or_open_dataarray(
             function=xr.load_dataarray,
             filename_or_object=input_data,
@@ -96,7 +100,7 @@ def open_data_array(
         )
     else:
         if verbose > 0:
-            logger.debug(f"Opening data array '{input_data}'...")
+            logger.debug(lambda: f"Opening data array '{input_data}'...")
         return load_or_open_dataarray(
             function=xr.open_dataarray,
             filename_or_object=input_data,
@@ -113,7 +117,7 @@ def open_data_set(
     """Open or load a dataset based on the input flags."""
     if in_memory:
         if verbose > 0:
-            logger.debug(f"Loading dataset '{input_data}' in memory...")
+            logger.debug(lambda: f"Loading dataset '{input_data}' in memory...")
         return load_or_open_dataset(
             function=xr.load_dataset,
             filename_or_object=input_data,
@@ -121,7 +125,7 @@ def open_data_set(
         )
     else:
         if verbose > 0:
-            logger.debug(f"Opening dataset '{input_data}'...")
+            logger.debug(lambda: f"Opening dataset '{input_data}'...")
         return load_or_open_dataset(
             function=xr.open_dataset,
             filename_or_object=input_data,
@@ -221,7 +225,7 @@ def load_or_open_dataarray_from_dataset(
             raise typer.Exit(code=33)
 
     if verbose > 0:
-        logger.debug(f"Data successfully loaded for variable '{variable}'.")
+        logger.debug(lambda: f"Data successfully loaded for variable '{variable}'.")
 
     return data_array
 
@@ -232,90 +236,36 @@ def read_data_array_or_set(
     in_memory: bool = False,
     verbose: int = 0,
 ):
-    """Open the data and determine if it's a DataArray or Dataset."""
+    """Open the data and determine if it's a DataArray or Dataset.
 
-    # try reading an array
+    Data files are opened once and reused via the dataset handle pool, see
+    `pvgisprototype.api.series.pool`.
+    """
+    if verbose > 0:
+        action = "load into memory" if in_memory else "open"
+        logger.debug(
+            lambda: f"  - {exclamation_mark} Trying to {action} {input_data} ...",
+            alt=lambda: f"  - {exclamation_mark} [bold]Trying[/bold] to {action} {input_data} ...",
+        )
     try:
-        if in_memory:
-            if verbose > 0:
-                logger.debug(
-                    f"  - {exclamation_mark} Trying to load {input_data} into memory as a DataArray...",
-                    alt=f"  - {exclamation_mark} [bold]Trying[/bold] to load {input_data} into memory as a DataArray...",
-                )
-            return load_or_open_dataarray(
-                function=xr.load_dataarray,
-                filename_or_object=input_data,
-                mask_and_scale=mask_and_scale,
-            )
-        else:
-            if verbose > 0:
-                logger.debug(
-                    f"  - {exclamation_mark} Trying to open {input_data} as a DataArray...",
-                    alt=f"  - {exclamation_mark} [bold]Trying[/bold] to open {input_data} as a DataArray...",
-                )
-            return load_or_open_dataarray(
-                function=xr.open_dataarray,
-                filename_or_object=input_data,
-                mask_and_scale=mask_and_scale,
-            )
-
-    # or a set
-    except:
-        try:
-            if in_memory:
-                if verbose > 0:
-                    logger.debug(
-                        f"  - {exclamation_mark} Trying to load {input_data} into memory as a Dataset...",
-                        alt=f"  - {exclamation_mark} [bold]Trying[/bold] to load {input_data} into memory as a Dataset...",
-                    )
-                return load_or_open_dataset(
-                    function=xr.load_dataset,
-                    filename_or_object=input_data,
-                    mask_and_scale=mask_and_scale,
-                )
-            else:
-                if verbose > 0:
-                    logger.debug(
-                        f"  - {exclamation_mark} Trying to open {input_data} as a Dataset...",
-                        alt=f"  - {exclamation_mark} [bold]Trying[/bold] to open {input_data} as a Dataset...",
-                    )
-                return load_or_open_dataset(
-                    function=xr.open_dataset,
-                    filename_or_object=input_data,
-                    mask_and_scale=mask_and_scale,
-                )
-        except Exception as e:
-            logger.error(
-                f"Error loading or opening data: {str(e)}",
-                alt=f"Error loading or opening data: {str(e)}",
-            )
-            raise typer.Exit(code=33)
+        return read_pooled_data_array_or_set(
+            path=input_data,
+            mask_and_scale=mask_and_scale,
+            in_memory=in_memory,
+        )
+    except Exception as e:
+        logger.error(
+            f"Error loading or opening data: {str(e)}",
+            alt=f"Error loading or opening data: {str(e)}",
+        )
+        raise typer.Exit(code=33)
 
 
 def get_scale_and_offset(netcdf):
     """Get scale and offset values from a netCDF file using xarray"""
-    import xarray as xr
-
-    # Open the dataset using xarray
-    dataset = xr.open_dataset(netcdf)
-
-    # Get all dimensions
-    netcdf_dimensions = set(dataset.dims)
-
-    # Get all variables
-    netcdf_variables = set(dataset.data_vars)
-
-    # Assuming the first variable that is not a dimension is the target variable
-    variable = list(netcdf_variables.difference(netcdf_dimensions))[0]
-
-    # Get the variable's attributes
-    variable_attrs = dataset[variable].attrs
-
-    # Retrieve scale_factor and add_offset attributes if they exist
-    scale_factor = variable_attrs.get("scale_factor", None)
-    add_offset = variable_attrs.get("add_offset", None)
+    handle = get_dataset_handle(netcdf)
 
-    return (scale_factor, add_offset)
+    return (handle.scale_factor, handle.add_offset)
 
 
 def filter_xarray(
@@ -410,7 +360,7 @@ def set_location_indexers(
 
     if x and y:
         logger.debug(
-            f"  {check_mark} Location specific dimensions detected in '{data_array.name}' : {x}, {y}"
+            lambda: f"  {check_mark} Location specific dimensions detected in '{data_array.name}' : {x}, {y}"
         )
 
     if not (longitude and latitude):
@@ -523,8 +473,8 @@ def select_location_time_series(
             raise ValueError(f"Variable '{variable}' not found in the Dataset.")
         data_array = data[variable]  # Extract the DataArray from the Dataset
         logger.debug(
-            f"  {check_mark} Successfully extracted '{variable}' from '{data_array.name}'.",
-            alt=f"  {check_mark} [green]Successfully[/green] extracted '{variable}' from '{data_array.name}'.",
+            lambda: f"  {check_mark} Successfully extracted '{variable}' from '{data_array.name}'.",
+            alt=lambda: f"  {check_mark} [green]Successfully[/green] extracted '{variable}' from '{data_array.name}'.",
         )
 
     elif isinstance(data, xr.DataArray):
@@ -575,8 +525,8 @@ def select_location_time_series(
         debug(locals())
 
     logger.debug(
-        f"  < Returning selected location from time series : {location_time_series}",
-        alt=f"  [green bold]<[/green bold] [bold]Returning[/bold] selected [brown]location[/brown] from time series : {location_time_series}",
+        lambda: f"  < Returning selected location from time series : {location_time_series}",
+        alt=lambda: f"  [green bold]<[/green bold] [bold]Returning[/bold] selected [brown]location[/brown] from time series : {location_time_series}",
     )
 
     return location_time_series
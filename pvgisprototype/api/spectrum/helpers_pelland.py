@@ -14,10 +14,17 @@
 # OF ANY KIND, either express or implied. See the Licence for the specific language
 # governing permissions and limitations under the Licence.
 #
+from functools import lru_cache
+from typing import Tuple
+
 from pandas import concat, Series, to_numeric, DataFrame
+from scipy.sparse import csr_matrix
 from pvgisprototype.constants import DATA_TYPE_DEFAULT
 import numpy
 
+BAND_INTEGRATION_MATRIX_CACHE_MAXSIZE = 32
+BANDED_DATA_TYPES = ("responsivity", "spectrum")
+
 
 def integrate(e):
     # print(f'Input to integrate : {e}')
@@ -60,19 +67,132 @@ def adjust_band_limits(
     return bands
 
 
-def generate_banded_data(
+@lru_cache(maxsize=BAND_INTEGRATION_MATRIX_CACHE_MAXSIZE)
+def _build_band_integration_matrix(
+    wavelengths: Tuple[float, ...],
+    lower_band_limits: Tuple[float, ...],
+    upper_band_limits: Tuple[float, ...],
+    average: bool,
+) -> csr_matrix:
+    """Cached builder, see `build_band_integration_matrix()`"""
+    wavelengths = numpy.asarray(wavelengths, dtype=float)
+    lower_band_limits = numpy.asarray(lower_band_limits, dtype=float)
+    upper_band_limits = numpy.asarray(upper_band_limits, dtype=float)
+
+    # Augmented grid : input wavelengths plus any missing band edge, i.e. the
+    # lower limit of each band and the upper limit of the last one
+    band_edges = numpy.union1d(lower_band_limits, upper_band_limits[-1:])
+    augmented_wavelengths = numpy.union1d(wavelengths, band_edges)
+
+    # Interpolation weights : augmented grid <- input grid, linear
+    right = numpy.clip(
+        numpy.searchsorted(wavelengths, augmented_wavelengths, side="left"),
+        1,
+        len(wavelengths) - 1,
+    )
+    left = right - 1
+    weight_right = (augmented_wavelengths - wavelengths[left]) / (
+        wavelengths[right] - wavelengths[left]
+    )
+    weight_right = numpy.clip(weight_right, 0, 1)  # constant beyond the ends
+    interpolation = csr_matrix(
+        (
+            numpy.concatenate([1 - weight_right, weight_right]),
+            (
+                numpy.tile(numpy.arange(len(augmented_wavelengths)), 2),
+                numpy.concatenate([left, right]),
+            ),
+        ),
+        shape=(len(augmented_wavelengths), len(wavelengths)),
+    )
+
+    # Trapezoidal weights per band over the augmented grid
+    rows, columns, weights = [], [], []
+    for band, (lower, upper) in enumerate(zip(lower_band_limits, upper_band_limits)):
+        indices = numpy.flatnonzero(
+            (augmented_wavelengths >= lower) & (augmented_wavelengths <= upper)
+        )
+        steps = numpy.diff(augmented_wavelengths[indices])
+        band_weights = numpy.zeros(len(indices))
+        band_weights[:-1] += steps / 2
+        band_weights[1:] += steps / 2
+        if average:
+            band_weights /= upper - lower
+        rows.append(numpy.full(len(indices), band))
+        columns.append(indices)
+        weights.append(band_weights)
+    trapezoidal = csr_matrix(
+        (numpy.concatenate(weights), (numpy.concatenate(rows), numpy.concatenate(columns))),
+        shape=(len(lower_band_limits), len(augmented_wavelengths)),
+    )
+
+    band_integration_matrix = (trapezoidal @ interpolation).tocsr()
+    band_integration_matrix.eliminate_zeros()
+
+    return band_integration_matrix
+
+
+def build_band_integration_matrix(
+    wavelengths,
+    reference_bands: DataFrame,
+    data_type: str,
+    lower_band_wavelength_limit_name: str = "Lower limit [nm]",
+    upper_band_wavelength_limit_name: str = "Upper limit [nm]",
+) -> csr_matrix:
+    """Build a sparse (band, wavelength) matrix that integrates spectral data
+    over reference bands.
+
+    The matrix combines the linear interpolation of the input data at the band
+    edges, i.e. the lower limit of each band and the upper limit of the last
+    one, with the trapezoidal rule over each band. Hence, the banded data of
+    a (time, wavelength) spectral series are the product `data @ matrix.T`.
+    Matrices are cached per input wavelength grid and band table.
+
+    Parameters
+    ----------
+    wavelengths: array-like
+        Ascending wavelengths of the input spectral data
+    reference_bands: DataFrame
+        Reference band table with lower and upper wavelength limits
+    data_type: str
+        'responsivity' to average over each band or 'spectrum' to integrate
+
+    Returns
+    -------
+    csr_matrix
+        Sparse matrix of shape (number of bands, number of wavelengths)
+
+    """
+    return _build_band_integration_matrix(
+        wavelengths=tuple(numpy.asarray(wavelengths, dtype=float).tolist()),
+        lower_band_limits=tuple(
+            reference_bands[lower_band_wavelength_limit_name].astype(float).tolist()
+        ),
+        upper_band_limits=tuple(
+            reference_bands[upper_band_wavelength_limit_name].astype(float).tolist()
+        ),
+        average=data_type == "responsivity",
+    )
+
+
+def _generate_banded_data_by_interpolation(
     reference_bands,
-    spectral_data,
+    data,
     data_type,
     lower_band_wavelength_limit_name: str = 'Lower limit [nm]',
     center_band_wavelength_name: str = 'Center [nm]',
     upper_band_wavelength_limit_name: str = 'Upper limit [nm]',
     dtype: str = DATA_TYPE_DEFAULT,
 ):
-    """
+    """Integrate spectral data over reference bands one band at a time, after
+    interpolating the data along the wavelengths.
+
+    The interpolation fills missing (NaN) values too, which the band
+    integration matrix cannot express. Hence, `generate_banded_data()` bands
+    the spectra with missing values this way.
     """
     # Make a copy of original data to keep it unmodified
-    data = spectral_data.copy()
+    data = data.copy()
 
     # Add missing reference band edges in the data
     for band_edge in reference_bands[lower_band_wavelength_limit_name].tolist() + [
@@ -117,16 +237,78 @@ def generate_banded_data(
                 - reference_bands[lower_band_wavelength_limit_name][col]
             )
 
-            # Rename columns !  Ugly Hacks ---------------------------------------
-            if (
-                banded_data.columns.name == center_band_wavelength_name
-                or banded_data.columns.name == "Wavelength"
-            ):
-                banded_data.columns.name = "center_wavelength"
-
         elif data_type == "spectrum":
             banded_data[reference_bands[center_band_wavelength_name][col]] = integrate(
                 data.iloc[:, col_list]
             )
 
     return banded_data
+
+
+def generate_banded_data(
+    reference_bands,
+    spectral_data,
+    data_type,
+    lower_band_wavelength_limit_name: str = 'Lower limit [nm]',
+    center_band_wavelength_name: str = 'Center [nm]',
+    upper_band_wavelength_limit_name: str = 'Upper limit [nm]',
+    dtype: str = DATA_TYPE_DEFAULT,
+):
+    """Integrate spectral data over reference bands.
+
+    Notes
+    -----
+    Band edges missing from the input wavelengths are linearly interpolated
+    and each band is integrated with the trapezoidal rule. Both steps are
+    expressed as one precomputed sparse matrix (see
+    `build_band_integration_matrix()`), thus long spectral series are banded
+    in a single sparse-dense product.
+
+    Spectra with missing (NaN) values are interpolated along the wavelengths
+    first, see `_generate_banded_data_by_interpolation()`. Data types other
+    than 'responsivity' or 'spectrum' are not integrated, i.e. banded to NaN.
+
+    """
+    data = spectral_data.apply(to_numeric)
+    banded_data = DataFrame(
+        data=numpy.nan,
+        index=data.index,
+        columns=reference_bands[center_band_wavelength_name],
+        dtype=dtype,
+    )
+    if data_type not in BANDED_DATA_TYPES:
+        return banded_data
+
+    values = data.to_numpy(dtype=float)
+    missing = numpy.isnan(values).any(axis=1)
+    if not missing.all():
+        band_integration_matrix = build_band_integration_matrix(
+            wavelengths=data.columns.to_numpy(dtype=float),
+            reference_bands=reference_bands,
+            data_type=data_type,
+            lower_band_wavelength_limit_name=lower_band_wavelength_limit_name,
+            upper_band_wavelength_limit_name=upper_band_wavelength_limit_name,
+        )
+        banded_data.iloc[~missing, :] = (
+            band_integration_matrix @ values[~missing].T
+        ).T  # (time, band)
+    if missing.any():
+        banded_data.iloc[missing, :] = _generate_banded_data_by_interpolation(
+            reference_bands=reference_bands,
+            data=data[missing],
+            data_type=data_type,
+            lower_band_wavelength_limit_name=lower_band_wavelength_limit_name,
+            center_band_wavelength_name=center_band_wavelength_name,
+            upper_band_wavelength_limit_name=upper_band_wavelength_limit_name,
+            dtype=dtype,
+        ).to_numpy()
+
+    if data_type == "responsivity":
+        # Rename columns !  Ugly Hacks ---------------------------------------
+        if (
+            banded_data.columns.name == center_band_wavelength_name
+            or banded_data.columns.name == "Wavelength"
+        ):
+            banded_data.columns.name = "center_wavelength"
+
+    return banded_data
@@ -15,7 +15,10 @@
 # governing permissions and limitations under the Licence.
 #
 from xarray import DataArray
-from pvgisprototype.algorithms.pelland.spectral_effect import calculate_spectral_factor_pelland
+from pvgisprototype.algorithms.pelland.spectral_effect import (
+    calculate_spectral_factor_pelland,
+    calculate_spectral_factors_pelland,
+)
 from pvgisprototype import Latitude, Longitude, Elevation
 from pvgisprototype.log import log_function_call, log_data_fingerprint
 from devtools import debug
@@ -166,24 +169,42 @@ def calculate_spectral_factor(
 
             model_results = {}  # store model output
 
-            for module_type in photovoltaic_module_types:
-                selected_responsivity = responsivity[module_type.value]
-                spectral_factor_series = model_spectral_factor(
-                    # longitude=longitude,
-                    # latitude=latitude,
-                    timestamps=timestamps,
-                    timezone=timezone,
-                    spectral_factor_model=spectral_factor_model,
-                    responsivity=selected_responsivity,
-                    # responsivity=responsivity,
-                    irradiance=irradiance,
-                    average_irradiance_density=average_irradiance_density,
-                    reference_spectrum=reference_spectrum,
-                    # dtype=dtype,
-                    # array_backend=array_backend,
-                    verbose=verbose,
-                    log=log,
+            if spectral_factor_model == SpectralMismatchModel.pelland:
+                # all module types in one pass over the irradiance
+                spectral_factor_series_per_module_type = (
+                    calculate_spectral_factors_pelland(
+                        irradiance=irradiance,
+                        responsivities={
+                            module_type: responsivity[module_type.value]
+                            for module_type in photovoltaic_module_types
+                        },
+                        reference_spectrum=reference_spectrum,
+                    )
                 )
+            else:
+                spectral_factor_series_per_module_type = {
+                    module_type: model_spectral_factor(
+                        # longitude=longitude,
+                        # latitude=latitude,
+                        timestamps=timestamps,
+                        timezone=timezone,
+                        spectral_factor_model=spectral_factor_model,
+                        responsivity=responsivity[module_type.value],
+                        irradiance=irradiance,
+                        average_irradiance_density=average_irradiance_density,
+                        reference_spectrum=reference_spectrum,
+                        # dtype=dtype,
+                        # array_backend=array_backend,
+                        verbose=verbose,
+                        log=log,
+                    )
+                    for module_type in photovoltaic_module_types
+                }
+
+            for (
+                module_type,
+                spectral_factor_series,
+            ) in spectral_factor_series_per_module_type.items():
                 components_container = {
                     "Metadata": lambda: {
                         RESPONSIVITY_COLUMN_NAME: responsivity[module_type.value],
@@ -0,0 +1,311 @@
+#
+# Copyright (C) 2025 European Union
+#
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Grouped reductions of time series
+
+Time series are grouped by integer codes derived once from the timestamps.
+All quantities sharing the same timestamps are then reduced in a single pass
+over a (quantity, time) array, instead of grouping each quantity separately
+with pandas, Polars or Xarray.
+"""
+
+import calendar
+from typing import Dict, Tuple
+
+import numpy
+from pandas import DatetimeIndex, Period, Timestamp
+from pandas.tseries.frequencies import to_offset
+
+from pvgisprototype.api.utilities.conversions import round_float_values
+from pvgisprototype.constants import DATA_TYPE_DEFAULT
+from pvgisprototype.log import logger
+
+SINGLE_FREQUENCY = "Single"
+SEASONAL_FREQUENCY = "S"
+YEARLY_GROUPING = "year"
+SEASONAL_GROUPING = "season"
+MONTHLY_GROUPING = "month"
+
+# Ordered alphabetically as Xarray's `time.season` groups
+SEASONS = ("DJF", "JJA", "MAM", "SON")
+MONTH_TO_SEASON_CODE = numpy.array([0, 0, 2, 2, 2, 1, 1, 1, 3, 3, 3, 0])
+
+CALENDAR_PERIODS = {
+    "YE": "Y",
+    "ME": "M",
+    "W": "W",
+}
+
+
+def _local_timestamps(timestamps: DatetimeIndex | Timestamp) -> DatetimeIndex:
+    """Drop time zone information keeping the local wall time"""
+    if isinstance(timestamps, Timestamp):
+        timestamps = DatetimeIndex([timestamps])
+    if timestamps.tz is not None:
+        return timestamps.tz_localize(None)
+    return timestamps
+
+
+def generate_group_keys(
+    timestamps: DatetimeIndex | Timestamp,
+    frequency: str,
+) -> numpy.ndarray:
+    """Generate an integer group key per timestamp for a time frequency.
+
+    Parameters
+    ----------
+    timestamps : DatetimeIndex
+        Timestamps of the time series to group
+    frequency : str
+        One of 'Single', 'S' (seasons across years), 'year', 'season', 'month'
+        (months across years) or a pandas frequency alias such as 'YE', 'ME',
+        'W', 'D', '3h', 'h' or '8min' for calendar periods and fixed windows
+
+    Returns
+    -------
+    numpy.ndarray
+        Integer group key per timestamp
+
+    Notes
+    -----
+    Fixed windows, i.e. days, hours and minutes, are counted from the Unix
+    epoch in local wall time, as done by Polars' `group_by_dynamic`.
+    """
+    timestamps = _local_timestamps(timestamps)
+
+    if frequency == SINGLE_FREQUENCY:
+        return numpy.zeros(len(timestamps), dtype=numpy.int64)
+
+    if frequency == YEARLY_GROUPING:
+        return timestamps.year.to_numpy(dtype=numpy.int64)
+
+    if frequency in (SEASONAL_FREQUENCY, SEASONAL_GROUPING):
+        return MONTH_TO_SEASON_CODE[timestamps.month.to_numpy() - 1]
+
+    if frequency == MONTHLY_GROUPING:
+        return timestamps.month.to_numpy(dtype=numpy.int64)
+
+    if frequency in CALENDAR_PERIODS:
+        return timestamps.to_period(CALENDAR_PERIODS[frequency]).asi8
+
+    try:
+        window = to_offset(frequency).nanos
+    except ValueError:  # non-fixed calendar periods, e.g. 'QE'
+        return timestamps.to_period(frequency).asi8
+
+    return timestamps.as_unit("ns").asi8 // window
+
+
+def label_group_key(key: int, frequency: str) -> str:
+    """Label a group key of `generate_group_keys()`, i.e. 'Jan' or '2020'"""
+    if frequency == SINGLE_FREQUENCY:
+        return SINGLE_FREQUENCY
+    if frequency == YEARLY_GROUPING:
+        return str(key)
+    if frequency in (SEASONAL_FREQUENCY, SEASONAL_GROUPING):
+        return SEASONS[key]
+    if frequency == MONTHLY_GROUPING:
+        return calendar.month_abbr[key]
+    if frequency in CALENDAR_PERIODS:
+        return str(Period(ordinal=key, freq=CALENDAR_PERIODS[frequency]))
+
+    try:
+        window = to_offset(frequency).nanos
+    except ValueError:  # non-fixed calendar periods, e.g. 'QE'
+        return str(Period(ordinal=key, freq=frequency))
+
+    return str(Timestamp(key * window))
+
+
+def generate_group_codes(
+    timestamps: DatetimeIndex | Timestamp,
+    frequency: str,
+) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Generate dense integer group codes `0, ..., number of groups - 1`
+
+    Returns
+    -------
+    Tuple[numpy.ndarray, numpy.ndarray]
+        The group code per timestamp and the sorted unique group keys
+    """
+    group_keys = generate_group_keys(timestamps=timestamps, frequency=frequency)
+    unique_group_keys, group_codes = numpy.unique(group_keys, return_inverse=True)
+
+    return group_codes, unique_group_keys
+
+
+def reduce_groups(
+    quantities: Dict[str, numpy.ndarray],
+    group_codes: numpy.ndarray,
+) -> Dict[str, Dict[str, numpy.ndarray]]:
+    """Reduce multiple quantities per group in one pass.
+
+    Parameters
+    ----------
+    quantities : dict
+        Series or scalars, the latter broadcasted to the length of `group_codes`
+    group_codes : numpy.ndarray
+        Dense integer group codes as returned by `generate_group_codes()`
+
+    Returns
+    -------
+    dict
+        Per quantity, the 'count', 'sum', 'mean' and 'std' (with one degree of
+        freedom, NaN for groups of less than 2 values) per group
+
+    Notes
+    -----
+    NaN values are ignored. The sum of a group without valid values is 0 and
+    its mean NaN, as in Polars' aggregations after `fill_nan(None)`.
+    """
+    names = list(quantities)
+    values = numpy.vstack(
+        [
+            numpy.broadcast_to(
+                numpy.asarray(quantities[name], dtype=numpy.float64),
+                group_codes.shape,
+            )
+            for name in names
+        ]
+    )  # (quantity, time)
+
+    if numpy.any(numpy.diff(group_codes) < 0):
+        order = numpy.argsort(group_codes, kind="stable")
+        values = values[:, order]
+        group_codes = group_codes[order]
+
+    group_starts = numpy.flatnonzero(
+        numpy.concatenate(([True], group_codes[1:] != group_codes[:-1]))
+    )
+    valid = ~numpy.isnan(values)
+    values = numpy.where(valid, values, 0)
+
+    counts = numpy.add.reduceat(valid, group_starts, axis=1)
+    sums = numpy.add.reduceat(values, group_starts, axis=1)
+    with numpy.errstate(divide="ignore", invalid="ignore"):
+        means = sums / counts
+        deviations = numpy.where(valid, values - means[:, group_codes], 0)
+        squared_deviations = numpy.add.reduceat(
+            deviations**2, group_starts, axis=1
+        )
+        standard_deviations = numpy.where(
+            counts > 1, numpy.sqrt(squared_deviations / (counts - 1)), numpy.nan
+        )
+    logger.debug(
+        lambda: f"Reduced {len(names)} quantities over {group_starts.size} groups",
+    )
+
+    return {
+        name: {
+            "count": counts[index],
+            "sum": sums[index],
+            "mean": means[index],
+            "std": standard_deviations[index],
+        }
+        for index, name in enumerate(names)
+    }
+
+
+def calculate_grouped_statistics(
+    quantities: Dict[str, numpy.ndarray],
+    timestamps: DatetimeIndex | Timestamp,
+    frequency: str,
+) -> Dict[str, Dict[str, numpy.ndarray]]:
+    """Group all quantities by a time frequency and reduce them in one pass.
+
+    See `reduce_groups()` for the returned statistics.
+    """
+    group_codes, _ = generate_group_codes(timestamps=timestamps, frequency=frequency)
+
+    return reduce_groups(quantities=quantities, group_codes=group_codes)
+
+
+def _nanmean(array: numpy.ndarray) -> float:
+    """Mean ignoring NaN, NaN if there is no valid value"""
+    valid = array[~numpy.isnan(array)]
+    return valid.mean().item() if valid.size > 0 else numpy.nan
+
+
+def summarise_group_statistics(
+    group_statistics: Dict[str, numpy.ndarray],
+    frequency: str,
+    reference_series=1,
+    rounding_places: int | None = None,
+    dtype: str = DATA_TYPE_DEFAULT,
+) -> Tuple[float, float, float, float]:
+    """Summarise the statistics of one quantity over all groups.
+
+    Parameters
+    ----------
+    group_statistics : dict
+        Statistics per group of one quantity as returned by `reduce_groups()`
+    frequency : str
+        The frequency the quantity was grouped by
+    reference_series : float
+        Reference value for the percentage of the total
+    rounding_places : int, optional
+        Number of decimal places to round the results to
+    dtype : str
+        Data type of the results
+
+    Returns
+    -------
+    tuple
+        The total sum, the mean of the group means, the mean of the group
+        standard deviations and the percentage of the total relative to the
+        reference, as returned by `polars.calculate_statistics()`
+    """
+    total = numpy.array(group_statistics["sum"].sum(), dtype=dtype).item()
+    percentage = (
+        numpy.array(total / reference_series * 100, dtype=dtype).item()
+        if reference_series != 0
+        else numpy.array(0, dtype=dtype).item()
+    )
+    if frequency == SINGLE_FREQUENCY:
+        mean = total
+        standard_deviation = numpy.array(0, dtype=dtype).item()
+    else:
+        mean = numpy.array(_nanmean(group_statistics["mean"]), dtype=dtype).item()
+        standard_deviation = numpy.array(
+            _nanmean(group_statistics["std"]), dtype=dtype
+        ).item()
+
+    if rounding_places is not None:
+        total = round_float_values(total, rounding_places)
+        percentage = round_float_values(percentage, rounding_places)
+        if frequency != SINGLE_FREQUENCY:
+            mean = round_float_values(mean, rounding_places)
+            standard_deviation = round_float_values(
+                standard_deviation, rounding_places
+            )
+
+    return total, mean, standard_deviation, percentage
+
+
+def calculate_mean_of_group_sums(
+    group_statistics: Dict[str, numpy.ndarray],
+    frequency: str,
+) -> float:
+    """Mean of the sums per group of one quantity
+
+    As with `polars.calculate_mean_of_series_per_time_unit()`, the 'Single'
+    frequency returns the plain mean of the series.
+    """
+    if frequency == SINGLE_FREQUENCY:
+        return _nanmean(group_statistics["mean"])
+
+    return group_statistics["sum"].mean().item()
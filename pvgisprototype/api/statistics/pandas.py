@@ -15,9 +15,14 @@
 # governing permissions and limitations under the Licence.
 #
 import numpy
-import pandas
 from pandas import DatetimeIndex
 
+from pvgisprototype.api.statistics.grouped import (
+    SINGLE_FREQUENCY,
+    calculate_grouped_statistics,
+    calculate_mean_of_group_sums,
+    summarise_group_statistics,
+)
 from pvgisprototype.api.utilities.conversions import round_float_values
 
 from pvgisprototype.constants import (
@@ -66,34 +71,24 @@ def calculate_statistics(
 ):
     """Calculate the sum, mean, standard deviation of a series based on a
     specified frequency and its percentage relative to a reference series.
+
+    The series is grouped and reduced by `grouped.calculate_grouped_statistics()`
+    like the Polars and Xarray statistics. Time periods without any timestamp
+    form no group, unlike empty bins of `pandas.Series.resample()`.
     """
-    if frequency == "Single":
-        total = series.item()  # total is the single value in the series
-        mean = total  # For a single value, the mean is the value itself
-        std_dev = 0  # Standard deviation is 0 for a single value
-        percentage = (total / reference_series * 100) if reference_series != 0 else 0
-
-        if rounding_places is not None:
-            total = round_float_values(total, rounding_places)
-            percentage = round_float_values(percentage, rounding_places)
-
-        return total, mean, std_dev, percentage
-
-    pandas_series = pandas.Series(series, timestamps)
-    resampled = pandas_series.resample(frequency)
-    total = resampled.sum().sum().item()  # convert to Python float
-    # if isinstance(total, numpy.ndarray):
-    #     total = total.astype(dtype)
-    percentage = (total / reference_series * 100) if reference_series != 0 else 0
-    # if isinstance(percentage, numpy.ndarray):
-    #     percentage.astype(dtype)
-    if rounding_places is not None:
-        total = round_float_values(total, rounding_places)
-        percentage = round_float_values(percentage, rounding_places)
-    mean = resampled.mean().mean().item()  # convert to Python float
-    std_dev = resampled.std().mean()  # Mean of standard deviations over the period
+    statistics = calculate_grouped_statistics(
+        quantities={"series": series},
+        timestamps=timestamps,
+        frequency=frequency,
+    )
 
-    return total, mean, std_dev, percentage
+    return summarise_group_statistics(
+        statistics["series"],
+        frequency=frequency,
+        reference_series=reference_series,
+        rounding_places=rounding_places,
+        dtype=dtype,
+    )
 
 
 def calculate_mean_of_series_per_time_unit(
@@ -101,14 +96,16 @@ def calculate_mean_of_series_per_time_unit(
     timestamps: DatetimeIndex,
     frequency: str,
 ):
-    """ """
-    # from devtools import debug
-
-    # debug(locals())
-    if frequency == "Single" or len(timestamps) == 1:
+    """Calculate the mean of the sums of a series per time unit, see
+    `grouped.calculate_mean_of_group_sums()`
+    """
+    if frequency == SINGLE_FREQUENCY or len(timestamps) == 1:
         return series.mean().item()  # Direct mean for a single value
 
-    pandas_series = pandas.Series(series, index=timestamps)
-    mean = pandas_series.resample(frequency).sum().mean().item()  # convert to float
+    statistics = calculate_grouped_statistics(
+        quantities={"series": series},
+        timestamps=timestamps,
+        frequency=frequency,
+    )
 
-    return mean
+    return calculate_mean_of_group_sums(statistics["series"], frequency=frequency)
@@ -17,6 +17,7 @@
 from pvgisprototype.log import log_function_call, logger
 from pandas import DatetimeIndex
 from pvgisprototype.api.utilities.conversions import round_float_values
+from pvgisprototype.api.statistics.grouped import generate_group_keys
 import polars
 import numpy
 from pvgisprototype.constants import (
@@ -156,8 +157,8 @@ def calculate_statistics(
     logger.debug("Calculate statistics")
     # Ensure initial inputs are in the specified dtype
     logger.debug(
-        f"The input series {series} of shape {series.shape} is of type {type(series)} while the requested type is {dtype}.",
-        alt=f"The input series {series} of shape {series.shape} is of type {type(series)} while the requested type is {dtype}.",
+        lambda: f"The input series {series} of shape {series.shape} is of type {type(series)} while the requested type is {dtype}.",
+        alt=lambda: f"The input series {series} of shape {series.shape} is of type {type(series)} while the requested type is {dtype}.",
     )
     series = numpy.asarray(series, dtype=dtype) if series.dtype != dtype else series
     reference_series = (
@@ -169,8 +170,8 @@ def calculate_statistics(
 
     if frequency == "Single":
         logger.debug(
-            f"The requested frequency is {frequency}.",
-            alt=f"The requested frequency is [code]{frequency}[/code].",
+            lambda: f"The requested frequency is {frequency}.",
+            alt=lambda: f"The requested frequency is [code]{frequency}[/code].",
         )
         # total = series.sum()
         total = numpy.nansum(series, dtype=dtype)
@@ -197,13 +198,16 @@ def calculate_statistics(
     # Seasonal grouping
     if frequency == "S":
         logger.debug(
-            f"The requested frequency is {frequency} meaning seasonal.",
-            alt=f"The requested frequency is {frequency} meaning [italic]seasonal[/italic].",
+            lambda: f"The requested frequency is {frequency} meaning seasonal.",
+            alt=lambda: f"The requested frequency is {frequency} meaning [italic]seasonal[/italic].",
         )
 
-        # Add a season column based on month
+        # Add an integer season code column based on month
         data = data.with_columns(
-            polars.col("timestamps").dt.month().apply(get_season).alias("season")
+            polars.Series(
+                "season",
+                generate_group_keys(timestamps=timestamps, frequency=frequency),
+            )
         )
 
         # Group by season
@@ -220,8 +224,8 @@ def calculate_statistics(
         # Convert Pandas to Polars frequency strings
         polars_frequency = FREQUENCY_PANDAS_TO_POLARS.get(frequency, frequency)
         logger.debug(
-            f"The requested frequency is {frequency} (Polars : {polars_frequency}).",
-            alt=f"The requested frequency is [code]{frequency}[/code] (Polars : {polars_frequency}).",
+            lambda: f"The requested frequency is {frequency} (Polars : {polars_frequency}).",
+            alt=lambda: f"The requested frequency is [code]{frequency}[/code] (Polars : {polars_frequency}).",
         )
 
         resampled = (
@@ -249,8 +253,8 @@ def calculate_statistics(
     # Apply rounding if needed
     if rounding_places is not None:
         logger.debug(
-            f"Rounding values total : {total}, mean : {mean}, std_dev : {std_dev} and percentage : {percentage}",
-            alt=f"Rounding values total : {total}, mean : {mean}, std_dev : {std_dev} and percentage : {percentage}",
+            lambda: f"Rounding values total : {total}, mean : {mean}, std_dev : {std_dev} and percentage : {percentage}",
+            alt=lambda: f"Rounding values total : {total}, mean : {mean}, std_dev : {std_dev} and percentage : {percentage}",
         )
         total = round_float_values(total, rounding_places)
         mean = round_float_values(mean, rounding_places)
@@ -277,8 +281,8 @@ def calculate_mean_of_series_per_time_unit(
 ) -> numpy.ScalarType:
     """Calculate the mean of a series resampled to a specified time frequency using Polars."""
     logger.debug(
-        f"The series input {series} is of type {type(series)}.",
-        alt=f"The series input {series} is of type {type(series)}.",
+        lambda: f"The series input {series} is of type {type(series)}.",
+        alt=lambda: f"The series input {series} is of type {type(series)}.",
     )
     if numpy.isscalar(
         series
@@ -288,8 +292,8 @@ def calculate_mean_of_series_per_time_unit(
     # Handle the case for a single timestamp or "Single" frequency
     if frequency == "Single" or len(timestamps) == 1:
         logger.debug(
-            f"The requested frequency is {frequency} or the input DatetimeIndex is a single timestamp.",
-            alt=f"The requested frequency is [code]{frequency}[/code] or the DatetimeIndex is a single timestamp.",
+            lambda: f"The requested frequency is {frequency} or the input DatetimeIndex is a single timestamp.",
+            alt=lambda: f"The requested frequency is [code]{frequency}[/code] or the DatetimeIndex is a single timestamp.",
         )
         return series.mean().item()  # Direct mean for a single value
 
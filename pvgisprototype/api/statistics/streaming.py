@@ -0,0 +1,290 @@
+#
+# Copyright (C) 2025 European Union
+#
+#
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Streaming statistics of time series
+
+Summary statistics per time group are accumulated chunk by chunk so that long
+time series need not be kept in memory. Accumulators are mergeable : the
+statistics of two accumulators fed with different chunks equal the statistics
+of one accumulator fed with both.
+
+Means and variances are combined with the parallel algorithm of Chan, Golub
+and LeVeque, a generalisation of Welford's online algorithm. Percentiles are
+approximated by a logarithmic histogram of relative accuracy `alpha`, as in
+the DDSketch algorithm (Masson, Rim and Lee, 2019).
+"""
+
+from typing import Dict, Sequence
+
+import numpy
+from pandas import DatetimeIndex
+
+from pvgisprototype.api.statistics.grouped import generate_group_keys, reduce_groups
+from pvgisprototype.log import logger
+
+RELATIVE_ACCURACY_DEFAULT = 0.01
+QUANTILES_DEFAULT = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+class LogarithmicHistogram:
+    """Mergeable histogram of values in logarithmically growing buckets
+
+    The bucket of a positive value `x` is `ceil(log(x) / log(gamma))` with
+    `gamma = (1 + alpha) / (1 - alpha)`. Negative values are counted
+    in mirrored buckets and zeros separately. Any quantile is then estimated
+    within a relative error `alpha`.
+    """
+
+    def __init__(self, alpha: float = RELATIVE_ACCURACY_DEFAULT):
+        self.alpha = alpha
+        self.gamma = (1 + alpha) / (1 - alpha)
+        self.log_gamma = numpy.log(self.gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zeros = 0
+
+    @property
+    def count(self) -> int:
+        return (
+            self.zeros + sum(self.positive.values()) + sum(self.negative.values())
+        )
+
+    def _add_buckets(self, buckets: Dict[int, int], magnitudes: numpy.ndarray):
+        indices, counts = numpy.unique(
+            numpy.ceil(numpy.log(magnitudes) / self.log_gamma).astype(numpy.int64),
+            return_counts=True,
+        )
+        for index, count in zip(indices.tolist(), counts.tolist()):
+            buckets[index] = buckets.get(index, 0) + count
+
+    def update(self, values: numpy.ndarray):
+        values = values[~numpy.isnan(values)]
+        self.zeros += int(numpy.count_nonzero(values == 0))
+        self._add_buckets(self.positive, values[values > 0])
+        self._add_buckets(self.negative, -values[values < 0])
+
+    def merge(self, other: "LogarithmicHistogram"):
+        if other.alpha != self.alpha:
+            raise ValueError(
+                f"Cannot merge histograms of relative accuracy {self.alpha} and {other.alpha}"
+            )
+        for buckets, other_buckets in (
+            (self.positive, other.positive),
+            (self.negative, other.negative),
+        ):
+            for index, count in other_buckets.items():
+                buckets[index] = buckets.get(index, 0) + count
+        self.zeros += other.zeros
+
+    def quantile(self, quantile: float) -> float:
+        """Estimate the value at `quantile`, a fraction between 0 and 1"""
+        count = self.count
+        if count == 0:
+            return numpy.nan
+
+        # Buckets in ascending order of their values
+        values = numpy.array(
+            [
+                -2 * self.gamma**index / (self.gamma + 1)
+                for index in sorted(self.negative, reverse=True)
+            ]
+            + [0.0]
+            + [
+                2 * self.gamma**index / (self.gamma + 1)
+                for index in sorted(self.positive)
+            ]
+        )
+        counts = numpy.array(
+            [self.negative[index] for index in sorted(self.negative, reverse=True)]
+            + [self.zeros]
+            + [self.positive[index] for index in sorted(self.positive)]
+        )
+        rank = quantile * (count - 1)
+        position = numpy.searchsorted(numpy.cumsum(counts), rank, side="right")
+
+        return values[min(position, values.size - 1)].item()
+
+
+class StreamingStatistics:
+    """Accumulate summary statistics per time group chunk by chunk
+
+    Parameters
+    ----------
+    frequency : str
+        Grouping of the timestamps, see `grouped.generate_group_keys()`.
+        Group keys are independent of the chunks, e.g. 'month' groups the
+        months across years while 'ME' groups each month of each year.
+    percentiles : bool
+        Whether to estimate percentiles per group
+    alpha : float
+        Relative accuracy of the estimated percentiles
+
+    Examples
+    --------
+    >>> from numpy import arange
+    >>> from pandas import date_range
+    >>> timestamps = date_range("2020-01-01", "2021-12-31 23:00", freq="h")
+    >>> statistics = StreamingStatistics(frequency="month")
+    >>> for year in (2020, 2021):
+    ...     chunk = timestamps[timestamps.year == year]
+    ...     statistics.update(arange(chunk.size, dtype=float), chunk)
+    >>> statistics.keys.tolist()
+    [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
+    """
+
+    def __init__(
+        self,
+        frequency: str,
+        percentiles: bool = True,
+        alpha: float = RELATIVE_ACCURACY_DEFAULT,
+    ):
+        self.frequency = frequency
+        self.percentiles = percentiles
+        self.alpha = alpha
+        self.keys = numpy.empty(0, dtype=numpy.int64)
+        self.counts = numpy.empty(0, dtype=numpy.int64)
+        self.sums = numpy.empty(0)
+        self.means = numpy.empty(0)
+        self.squared_deviations = numpy.empty(0)  # M2
+        self.histograms: Dict[int, LogarithmicHistogram] = {}
+
+    def _combine(
+        self,
+        keys: numpy.ndarray,
+        counts: numpy.ndarray,
+        sums: numpy.ndarray,
+        means: numpy.ndarray,
+        squared_deviations: numpy.ndarray,
+    ):
+        """Combine per group statistics, e.g. of a new chunk, in the current state"""
+        all_keys = numpy.union1d(self.keys, keys)
+        size = all_keys.size
+
+        def expand(target_keys, values, fill):
+            expanded = numpy.full(size, fill, dtype=values.dtype)
+            expanded[numpy.searchsorted(all_keys, target_keys)] = values
+            return expanded
+
+        count_a = expand(self.keys, self.counts, 0)
+        count_b = expand(keys, counts, 0)
+        mean_a = expand(self.keys, numpy.nan_to_num(self.means), 0.0)
+        mean_b = expand(keys, means, 0.0)
+        count = count_a + count_b
+        delta = mean_b - mean_a
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            weight = numpy.where(count > 0, count_b / count, 0.0)
+        self.means = numpy.where(count > 0, mean_a + delta * weight, numpy.nan)
+        self.squared_deviations = (
+            expand(self.keys, self.squared_deviations, 0.0)
+            + expand(keys, squared_deviations, 0.0)
+            + delta**2 * count_a * weight
+        )
+        self.sums = expand(self.keys, self.sums, 0.0) + expand(keys, sums, 0.0)
+        self.counts = count
+        self.keys = all_keys
+
+    def update(self, values: numpy.ndarray, timestamps: DatetimeIndex):
+        """Feed a chunk of a series and its timestamps"""
+        values = numpy.asarray(values, dtype=numpy.float64)
+        group_keys = generate_group_keys(timestamps=timestamps, frequency=self.frequency)
+        keys, group_codes = numpy.unique(group_keys, return_inverse=True)
+        statistics = reduce_groups({"values": values}, group_codes)["values"]
+        counts = statistics["count"]
+        squared_deviations = numpy.where(
+            counts > 1, statistics["std"] ** 2 * (counts - 1), 0.0
+        )
+        self._combine(
+            keys=keys,
+            counts=counts,
+            sums=statistics["sum"],
+            means=numpy.where(counts > 0, statistics["mean"], 0.0),
+            squared_deviations=squared_deviations,
+        )
+        if self.percentiles:
+            order = numpy.argsort(group_codes, kind="stable")
+            chunks = numpy.split(
+                values[order], numpy.cumsum(numpy.bincount(group_codes))[:-1]
+            )
+            for key, chunk in zip(keys.tolist(), chunks):
+                self.histograms.setdefault(
+                    key, LogarithmicHistogram(alpha=self.alpha)
+                ).update(chunk)
+        logger.debug(
+            lambda: f"Accumulated {values.size} values in {keys.size} groups of frequency {self.frequency}",
+        )
+
+    def merge(self, other: "StreamingStatistics"):
+        """Merge the state of another accumulator of the same frequency"""
+        if other.frequency != self.frequency:
+            raise ValueError(
+                f"Cannot merge statistics of frequency {self.frequency} and {other.frequency}"
+            )
+        self._combine(
+            keys=other.keys,
+            counts=other.counts,
+            sums=other.sums,
+            means=numpy.nan_to_num(other.means),
+            squared_deviations=other.squared_deviations,
+        )
+        for key, histogram in other.histograms.items():
+            self.histograms.setdefault(
+                key, LogarithmicHistogram(alpha=self.alpha)
+            ).merge(histogram)
+
+    @property
+    def variances(self) -> numpy.ndarray:
+        """Sample variances, with one degree of freedom, per group"""
+        with numpy.errstate(divide="ignore", invalid="ignore"):
+            return numpy.where(
+                self.counts > 1, self.squared_deviations / (self.counts - 1), numpy.nan
+            )
+
+    @property
+    def standard_deviations(self) -> numpy.ndarray:
+        return numpy.sqrt(self.variances)
+
+    def quantiles(
+        self,
+        quantiles: Sequence[float] = QUANTILES_DEFAULT,
+    ) -> numpy.ndarray:
+        """Estimated quantiles per group, of shape (group, quantile)"""
+        if not self.percentiles:
+            raise ValueError("Percentiles are not accumulated")
+        return numpy.array(
+            [
+                [self.histograms[key].quantile(quantile) for quantile in quantiles]
+                for key in self.keys.tolist()
+            ]
+        ).reshape(self.keys.size, len(quantiles))
+
+    def to_dictionary(
+        self,
+        quantiles: Sequence[float] = QUANTILES_DEFAULT,
+    ) -> dict:
+        """Statistics per group as a dictionary of arrays"""
+        statistics = {
+            "Group": self.keys,
+            "Count": self.counts,
+            "Sum": self.sums,
+            "Mean": self.means,
+            "Standard deviation": self.standard_deviations,
+        }
+        if self.percentiles:
+            for quantile, values in zip(quantiles, self.quantiles(quantiles).T):
+                statistics[f"{quantile * 100:g}th Percentile"] = values
+
+        return statistics
@@ -19,6 +19,7 @@ from pandas import DatetimeIndex
 from xarray import DataArray
 from scipy.stats import mode
 import numpy
+from pvgisprototype.api.statistics.grouped import calculate_grouped_statistics
 from pvgisprototype.constants import (
     GLOBAL_INCLINED_IRRADIANCE_COLUMN_NAME,
     PHOTOVOLTAIC_POWER_COLUMN_NAME,
@@ -90,10 +91,19 @@ def group_series_statistics(
     if groupby in TIME_GROUPINGS:
         freq, label = TIME_GROUPINGS[groupby]
         if groupby in ["Y", "M", "S"]:
-            statistics[label] = data_xarray.groupby(f"time.{freq}").mean().values
+            quantities = {label: data_xarray.values}
             if irradiance_xarray is not None:
-                statistics[GLOBAL_INCLINED_IRRADIANCE_COLUMN_NAME] = (
-                    irradiance_xarray.groupby(f"time.{freq}").mean().values
+                quantities[GLOBAL_INCLINED_IRRADIANCE_COLUMN_NAME] = (
+                    irradiance_xarray.values
+                )
+            group_statistics = calculate_grouped_statistics(
+                quantities=quantities,
+                timestamps=data_xarray.time.to_index(),
+                frequency=freq,
+            )
+            for name, values in quantities.items():
+                statistics[name] = group_statistics[name]["mean"].astype(
+                    values.dtype
                 )
         else:
             statistics[label] = data_xarray.resample(time=freq).mean().values
@@ -62,8 +62,8 @@ def optimizer(
     optimal_position = OptimizeResult()
     if verbose > HASH_AFTER_THIS_VERBOSITY_LEVEL:
         logger.debug(
-            f"i Estimate optimal positioning",
-            alt=f"i [bold]Estimate[/bold] the [magenta]optimal positioning[/magenta]",
+            lambda: f"i Estimate optimal positioning",
+            alt=lambda: f"i [bold]Estimate[/bold] the [magenta]optimal positioning[/magenta]",
         )
     try:
         if method == SurfacePositionOptimizerMethod.shgo:
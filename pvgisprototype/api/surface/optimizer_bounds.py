@@ -86,8 +86,8 @@ def define_optimiser_bounds(
 
     if verbose > HASH_AFTER_THIS_VERBOSITY_LEVEL:
         logger.debug(
-            f"i Define bounds for the '{method}' optimiser ..",
-            alt=f"i [bold]Define[/bold] bounds for the [magenta]{method}[/magenta] optimiser ..",
+            lambda: f"i Define bounds for the '{method}' optimiser ..",
+            alt=lambda: f"i [bold]Define[/bold] bounds for the [magenta]{method}[/magenta] optimiser ..",
         )
 
     if method == SurfacePositionOptimizerMethod.brute:
@@ -91,8 +91,8 @@ def build_optimiser_output(
     """
     if verbose > HASH_AFTER_THIS_VERBOSITY_LEVEL:
         logger.debug(
-            f"i Build the output dictionary",
-            alt=f"i [bold]Build[/bold] the [magenta]output dictionary[/magenta]",
+            lambda: f"i Build the output dictionary",
+            alt=lambda: f"i [bold]Build[/bold] the [magenta]output dictionary[/magenta]",
         )
 
     optimal_surface_position = {
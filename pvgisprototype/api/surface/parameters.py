@@ -60,8 +60,8 @@ def build_location_dictionary(
     """
     if verbose > HASH_AFTER_THIS_VERBOSITY_LEVEL:
         logger.debug(
-            f"i Collect location arguments",
-            alt=f"i [bold]Collect[/bold] the [magenta]location arguments[/magenta]",
+            lambda: f"i Collect location arguments",
+            alt=lambda: f"i [bold]Collect[/bold] the [magenta]location arguments[/magenta]",
         )
     location_arguments = {
         "longitude": longitude,
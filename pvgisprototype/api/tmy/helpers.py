@@ -63,17 +63,17 @@ def retrieve_nested_value(
     if isinstance(dictionary, dict):
         # Direct key match
         if key in dictionary:
-            logger.debug(f"Found key '{key}' at current level")
+            logger.debug(lambda: f"Found key '{key}' at current level")
             return dictionary[key]
 
         # Recursively search each value
         for _, value in dictionary.items():
             result = retrieve_nested_value(value, key, default=None)
             if result is not None:
-                logger.debug(f"Found key '{key}' in nested structure")
+                logger.debug(lambda: f"Found key '{key}' in nested structure")
                 return result
 
-    logger.debug(f"Key '{key}' not found in structure")
+    logger.debug(lambda: f"Key '{key}' not found in structure")
 
     return default
 
@@ -27,36 +27,17 @@ from rich import print
 from rich.panel import Panel
 from typer._completion_shared import Shells
 
+from pvgisprototype.cli.print.citation import print_citation_text
 from pvgisprototype.cli.print.conventions import print_pvgis_conventions
 from pvgisprototype.cli.print.symbols import print_pvgis_symbols
-from pvgisprototype.cli.print.citation import print_citation_text
-from pvgisprototype.cli.typer.group import OrderCommands
-from pvgisprototype.cli.typer.verbosity import typer_option_verbose
-from pvgisprototype.cli.typer.version import typer_option_version
-from pvgisprototype.cli.rich_help_panel_names import rich_help_panel_performance
-from pvgisprototype.cli.rich_help_panel_names import rich_help_panel_series
-from pvgisprototype.cli.rich_help_panel_names import rich_help_panel_position
-from pvgisprototype.cli.rich_help_panel_names import rich_help_panel_data_model
-from pvgisprototype.cli.rich_help_panel_names import rich_help_panel_reference
-
-from pvgisprototype.cli import manual
-from pvgisprototype.cli.series import series
-from pvgisprototype.cli.surface import surface
-from pvgisprototype.cli import time
-from pvgisprototype.cli.power import power
-from pvgisprototype.cli.irradiance import irradiance
-from pvgisprototype.cli.meteo import meteo
-from pvgisprototype.cli.position import position
-from pvgisprototype.cli.power import power
-from pvgisprototype.cli.performance import performance
-from pvgisprototype.cli.data_model import data_model
 from pvgisprototype.cli.rich_help_panel_names import (
+    rich_help_panel_data_model,
     rich_help_panel_performance,
     rich_help_panel_position,
     rich_help_panel_reference,
     rich_help_panel_series,
 )
-from pvgisprototype.cli.typer.group import OrderCommands
+from pvgisprototype.cli.typer.group import LazyOrderCommands, LazySubcommand
 from pvgisprototype.cli.typer.log import (
     typer_option_log,
     typer_option_log_rich_handler,
@@ -64,6 +45,15 @@ from pvgisprototype.cli.typer.log import (
 )
 from pvgisprototype.cli.typer.verbosity import typer_option_verbose
 from pvgisprototype.cli.typer.version import typer_option_version
+from pvgisprototype.constants import (
+    SOLAR_IRRADIANCE_TYPER_HELP,
+    SYMBOL_CHART_CURVE,
+    SYMBOL_DATA_MODEL,
+    SYMBOL_EFFICIENCY,
+    SYMBOL_HOUR_ANGLE,
+    SYMBOL_POWER,
+    SYMBOL_SUNFACE,
+)
 
 state = {"verbose": False}
 
@@ -82,9 +72,74 @@ def install(
     typer.completion.install_callback(ctx, None, shell)
 
 
+# Sub-commands are imported only when run, their help is listed statically
+
+LAZY_SUBCOMMANDS = {
+    # Photovoltaic performance
+    "performance": LazySubcommand(
+        import_path="pvgisprototype.cli.performance.performance:app",
+        help=f"{SYMBOL_EFFICIENCY} Estimate the performance of a photovoltaic system over a time series",
+        rich_help_panel=rich_help_panel_performance,
+    ),
+    "power": LazySubcommand(
+        import_path="pvgisprototype.cli.power.power:app",
+        help=f"{SYMBOL_POWER} Estimate the photovoltaic power over a time series",
+        rich_help_panel=rich_help_panel_performance,
+    ),
+    # Time series
+    "irradiance": LazySubcommand(
+        import_path="pvgisprototype.cli.irradiance.irradiance:app",
+        help=SOLAR_IRRADIANCE_TYPER_HELP,
+        rich_help_panel=rich_help_panel_series,
+    ),
+    "meteo": LazySubcommand(
+        import_path="pvgisprototype.cli.meteo.meteo:app",
+        help=":sun_behind_rain_cloud: Meteorology & Typical Meteorological Year",
+        rich_help_panel=rich_help_panel_series,
+    ),
+    "series": LazySubcommand(
+        import_path="pvgisprototype.cli.series.series:app",
+        help=f"{SYMBOL_CHART_CURVE} Work with time series",
+        rich_help_panel=rich_help_panel_series,
+    ),
+    # Solar position
+    "time": LazySubcommand(
+        import_path="pvgisprototype.cli.time:app",
+        help=f"{SYMBOL_HOUR_ANGLE} Calculate the solar time for a location and moment",
+        rich_help_panel=rich_help_panel_position,
+    ),
+    "position": LazySubcommand(
+        import_path="pvgisprototype.cli.position.position:app",
+        help=f"{SYMBOL_SUNFACE} Calculate solar position parameters for a location and moment in time",
+        rich_help_panel=rich_help_panel_position,
+    ),
+    "surface": LazySubcommand(
+        import_path="pvgisprototype.cli.surface.surface:app",
+        help="󰶛  Calculate solar surface geometry parameters for a location and moment in time",
+        rich_help_panel=rich_help_panel_position,
+    ),
+    # Data model
+    "data-model": LazySubcommand(
+        import_path="pvgisprototype.cli.data_model.data_model:app",
+        help=f"{SYMBOL_DATA_MODEL} Tooling for PVGIS' Data Model",
+        rich_help_panel=rich_help_panel_data_model,
+    ),
+    # Reference
+    "manual": LazySubcommand(
+        import_path="pvgisprototype.cli.manual:app",
+        help=":book: Manual for solar radiation terms",
+        rich_help_panel=rich_help_panel_reference,
+    ),
+}
+
+
+class PVGISCommands(LazyOrderCommands):
+    lazy_subcommands = LAZY_SUBCOMMANDS
+
+
 typer.rich_utils.Panel = Panel.fit
 app = typer.Typer(
-    cls=OrderCommands,
+    cls=PVGISCommands,
     add_completion=False,
     add_help_option=True,
     rich_markup_mode="rich",
@@ -108,70 +163,6 @@ app_completion.command(
     help="Install completion for the specified shell.",
 )(install)
 
-# Photovoltaic performance
-
-app.add_typer(
-    performance.app,
-    name="performance",
-    no_args_is_help=True,
-    rich_help_panel=rich_help_panel_performance,
-)
-app.add_typer(
-    power.app,
-    name="power",
-    no_args_is_help=True,
-    rich_help_panel=rich_help_panel_performance,
-)
-# app.add_typer(
-#     uniplot.app,
-#     name="uniplot",
-#     no_args_is_help=True,
-#     rich_help_panel=rich_help_panel_series,
-# )
-app.add_typer(
-    irradiance.app,
-    name="irradiance",
-    no_args_is_help=True,
-    rich_help_panel=rich_help_panel_series,
-)
-app.add_typer(
-    meteo.app,
-    name="meteo",
-    no_args_is_help=True,
-    rich_help_panel=rich_help_panel_series,
-)
-app.add_typer(
-    series.app,
-    name="series",
-    no_args_is_help=True,
-    rich_help_panel=rich_help_panel_series,
-)
-app.add_typer(
-    time.app,
-    name="time",
-    no_args_is_help=True,
-    rich_help_panel=rich_help_panel_position,
-)
-app.add_typer(
-    position.app,
-    name="position",
-    no_args_is_help=True,
-    rich_help_panel=rich_help_panel_position,
-)
-app.add_typer(
-    surface.app,
-    name="surface",
-    no_args_is_help=True,
-    rich_help_panel=rich_help_panel_position,
-)
-app.add_typer(
-    data_model.app,
-    name="data-model",
-    no_args_is_help=True,
-    rich_help_panel=rich_help_panel_data_model,
-)
-
-
 # Reference
 
 app.command(
@@ -187,12 +178,6 @@ app.command(
     no_args_is_help=False,
     rich_help_panel=rich_help_panel_reference,
 )(print_pvgis_symbols)
-app.add_typer(
-    manual.app,
-    name="manual",
-    no_args_is_help=True,
-    rich_help_panel=rich_help_panel_reference,
-)
 app.command(
     name="cite",
     help="📄 Generate citation text for PVGIS",
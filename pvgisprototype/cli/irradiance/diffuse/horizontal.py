@@ -57,7 +57,9 @@ from pvgisprototype.cli.typer.earth_orbit import (
     typer_option_eccentricity_amplitude,
     typer_option_eccentricity_phase_offset,
 )
+from pvgisprototype.api.irradiance.clear_sky_table import ClearSkyTable
 from pvgisprototype.cli.typer.irradiance import (
+    typer_option_clear_sky_table,
     typer_option_direct_horizontal_irradiance,
     typer_option_global_horizontal_irradiance,
 )
@@ -192,6 +194,9 @@ def get_diffuse_horizontal_irradiance_series(
     eccentricity_amplitude: Annotated[
         float, typer_option_eccentricity_amplitude
     ] = EccentricityAmplitude().value,
+    clear_sky_table: Annotated[
+        ClearSkyTable | None, typer_option_clear_sky_table
+    ] = None,
     #
     neighbor_lookup: Annotated[
         MethodForInexactMatches, typer_option_nearest_neighbor_lookup
@@ -302,6 +307,7 @@ def get_diffuse_horizontal_irradiance_series(
                 solar_constant=solar_constant,
                 eccentricity_phase_offset=eccentricity_phase_offset,
                 eccentricity_amplitude=eccentricity_amplitude,
+                clear_sky_table=clear_sky_table,
                 # angle_output_units=angle_output_units,
                 dtype=dtype,
                 array_backend=array_backend,
@@ -34,6 +34,7 @@ from pvgisprototype import (
     LinkeTurbidityFactor,
 )
 from pvgisprototype.api.datetime.now import now_utc_datetimezone
+from pvgisprototype.api.irradiance.clear_sky_table import ClearSkyTable
 from pvgisprototype.api.irradiance.direct.horizontal import (
     calculate_clear_sky_direct_horizontal_irradiance_series,
 )
@@ -49,6 +50,7 @@ from pvgisprototype.cli.typer.data_processing import (
     typer_option_array_backend,
     typer_option_dtype,
 )
+from pvgisprototype.cli.typer.irradiance import typer_option_clear_sky_table
 from pvgisprototype.cli.typer.earth_orbit import (
     typer_option_eccentricity_amplitude,
     typer_option_eccentricity_phase_offset,
@@ -167,6 +169,9 @@ def get_direct_horizontal_irradiance_series(
     horizon_profile: Annotated[DataArray | None, typer_option_horizon_profile] = None,
     shading_model: Annotated[
         ShadingModel, typer_option_shading_model] = ShadingModel.pvgis,  # for performance analysis : should be one !
+    clear_sky_table: Annotated[
+        ClearSkyTable | None, typer_option_clear_sky_table
+    ] = None,
     #
     angle_output_units: Annotated[str, typer_option_angle_output_units] = RADIANS,
     dtype: Annotated[str, typer_option_dtype] = DATA_TYPE_DEFAULT,
@@ -218,6 +223,7 @@ def get_direct_horizontal_irradiance_series(
         eccentricity_amplitude=eccentricity_amplitude,
         horizon_profile=horizon_profile,
         shading_model=shading_model,
+        clear_sky_table=clear_sky_table,
         # angle_output_units=angle_output_units,
         dtype=dtype,
         array_backend=array_backend,
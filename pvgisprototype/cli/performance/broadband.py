@@ -30,8 +30,6 @@ from rich import print
 from xarray import DataArray
 
 from pvgisprototype import (
-    Longitude,
-    Latitude,
     EccentricityPhaseOffset,
     EccentricityAmplitude,
     LinkeTurbidityFactor,
@@ -39,7 +37,6 @@ from pvgisprototype import (
     TemperatureSeries,
     WindSpeedSeries,
 )
-from pvgisprototype.api.series.horizontal_irradiance import read_horizontal_irradiance_components_from_sarah
 from pvgisprototype.api.irradiance.models import (
     MethodForInexactMatches,
     ModuleTemperatureAlgorithm,
@@ -58,7 +55,7 @@ from pvgisprototype.api.power.broadband import (
     calculate_photovoltaic_power_output_series,
 )
 from pvgisprototype.algorithms.huld.photovoltaic_module import PhotovoltaicModuleModel
-from pvgisprototype.api.series.time_series import get_time_series
+from pvgisprototype.api.series.time_series import read_external_time_series
 from pvgisprototype.api.utilities.conversions import (
     convert_float_to_degrees_if_requested,
     round_float_values,
@@ -169,7 +166,6 @@ from pvgisprototype.constants import (
     ATMOSPHERIC_REFRACTION_FLAG_DEFAULT,
     CSV_PATH_DEFAULT,
     DATA_TYPE_DEFAULT,
-    DEGREES,
     DIRECT_HORIZONTAL_IRRADIANCE_COLUMN_NAME,
     EFFICIENCY_FACTOR_DEFAULT,
     FINGERPRINT_FLAG_DEFAULT,
@@ -381,37 +377,16 @@ def photovoltaic_power_output_series(
         transient=True,
     ) as progress:
         progress.add_task(description="Calculating photovoltaic power output...", total=None)
-        if isinstance(global_horizontal_irradiance, (str, Path)) and isinstance(
-            direct_horizontal_irradiance, (str, Path)
-        ):  # NOTE This is in the case everything is pathlike
-            global_horizontal_irradiance_array, direct_horizontal_irradiance_array = (
-                read_horizontal_irradiance_components_from_sarah(
-                    shortwave=global_horizontal_irradiance,
-                    direct=direct_horizontal_irradiance,
-                    longitude=convert_float_to_degrees_if_requested(longitude, DEGREES),
-                    latitude=convert_float_to_degrees_if_requested(latitude, DEGREES),
-                    timestamps=timestamps,
-                    neighbor_lookup=neighbor_lookup,
-                    tolerance=tolerance,
-                    mask_and_scale=mask_and_scale,
-                    in_memory=in_memory,
-                    multi_thread=multi_thread,
-                    # multi_thread=False,
-                    verbose=verbose,
-                    log=log,
-                )
-            )
-        else:  # Ensure the calculate() function below receices an array or None !
-            global_horizontal_irradiance_array = None
-            direct_horizontal_irradiance_array = None
-
-        temperature_series, wind_speed_series, spectral_factor_series = get_time_series(
+        # Read all external time series concurrently
+        external_time_series = read_external_time_series(
+            global_horizontal_irradiance=global_horizontal_irradiance,
+            direct_horizontal_irradiance=direct_horizontal_irradiance,
             temperature_series=temperature_series,
             wind_speed_series=wind_speed_series,
             spectral_factor_series=spectral_factor_series,
+            longitude=longitude,
+            latitude=latitude,
             timestamps=timestamps,
-            longitude=Longitude(value=longitude, unit='radians'),
-            latitude=Latitude(values=latitude, units='radians'),
             neighbor_lookup=neighbor_lookup,
             tolerance=tolerance,
             mask_and_scale=mask_and_scale,
@@ -421,7 +396,14 @@ def photovoltaic_power_output_series(
             multi_thread=multi_thread,
             verbose=verbose,
             log=log,
+            profile=profile,
         )
+        # Ensure the calculate() function below receices an array or None !
+        global_horizontal_irradiance_array = external_time_series["global_horizontal_irradiance"]
+        direct_horizontal_irradiance_array = external_time_series["direct_horizontal_irradiance"]
+        temperature_series = external_time_series["temperature_series"]
+        wind_speed_series = external_time_series["wind_speed_series"]
+        spectral_factor_series = external_time_series["spectral_factor_series"]
         photovoltaic_power_output_series = calculate_photovoltaic_power_output_series(
             longitude=longitude,
             latitude=latitude,
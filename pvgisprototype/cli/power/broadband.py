@@ -29,8 +29,6 @@ from pandas import DatetimeIndex, Timestamp
 from xarray import DataArray
 
 from pvgisprototype import (
-    Longitude,
-    Latitude,
     EccentricityPhaseOffset,
     EccentricityAmplitude,
     LinkeTurbidityFactor,
@@ -38,7 +36,6 @@ from pvgisprototype import (
     TemperatureSeries,
     WindSpeedSeries,
 )
-from pvgisprototype.api.series.horizontal_irradiance import read_horizontal_irradiance_components_from_sarah
 from pvgisprototype.api.irradiance.models import (
     MethodForInexactMatches,
     ModuleTemperatureAlgorithm,
@@ -63,7 +60,7 @@ from pvgisprototype.algorithms.huld.photovoltaic_module import (
     PhotovoltaicModuleType,
     PhotovoltaicModuleModel,
 )
-from pvgisprototype.api.series.time_series import get_time_series
+from pvgisprototype.api.series.time_series import read_external_time_series
 from pvgisprototype.api.utilities.conversions import (
     convert_float_to_degrees_if_requested,
     round_float_values,
@@ -144,6 +141,7 @@ from pvgisprototype.cli.typer.statistics import (
     typer_option_groupby,
     typer_option_nomenclature,
     typer_option_statistics,
+    typer_option_streaming_statistics,
 )
 from pvgisprototype.cli.typer.temperature import typer_option_temperature_series
 from pvgisprototype.cli.typer.time_series import (
@@ -173,7 +171,6 @@ from pvgisprototype.constants import (
     ATMOSPHERIC_REFRACTION_FLAG_DEFAULT,
     CSV_PATH_DEFAULT,
     DATA_TYPE_DEFAULT,
-    DEGREES,
     EFFICIENCY_FACTOR_DEFAULT,
     FINGERPRINT_FLAG_DEFAULT,
     GROUPBY_DEFAULT,
@@ -334,6 +331,9 @@ def photovoltaic_power_output_series(
     ] = ROUNDING_PLACES_DEFAULT,
     statistics: Annotated[bool, typer_option_statistics] = STATISTICS_FLAG_DEFAULT,
     groupby: Annotated[str | None, typer_option_groupby] = GROUPBY_DEFAULT,
+    streaming_statistics: Annotated[
+        str | None, typer_option_streaming_statistics
+    ] = None,
     nomenclature: Annotated[
         bool, typer_option_nomenclature
     ] = NOMENCLATURE_FLAG_DEFAULT,
@@ -383,33 +383,15 @@ def photovoltaic_power_output_series(
     `select_time_series()` function.
 
     """
-    # if global_horizontal_irradiance + direct_horizontal_irradiance are Path objects:
-    if isinstance(global_horizontal_irradiance, (str, Path)) and isinstance(
-        direct_horizontal_irradiance, (str, Path)
-    ):  # NOTE This is in the case everything is pathlike
-        global_horizontal_irradiance, direct_horizontal_irradiance = (
-            read_horizontal_irradiance_components_from_sarah(
-                shortwave=global_horizontal_irradiance,
-                direct=direct_horizontal_irradiance,
-                longitude=convert_float_to_degrees_if_requested(longitude, DEGREES),
-                latitude=convert_float_to_degrees_if_requested(latitude, DEGREES),
-                timestamps=timestamps,
-                neighbor_lookup=neighbor_lookup,
-                tolerance=tolerance,
-                mask_and_scale=mask_and_scale,
-                in_memory=in_memory,
-                multi_thread=multi_thread,
-                # multi_thread=False,
-                verbose=verbose,
-                log=log,
-            )
-        )
-    temperature_series, wind_speed_series, spectral_factor_series = get_time_series(
+    # Read all external time series concurrently
+    external_time_series = read_external_time_series(
+        global_horizontal_irradiance=global_horizontal_irradiance,
+        direct_horizontal_irradiance=direct_horizontal_irradiance,
         temperature_series=temperature_series,
         wind_speed_series=wind_speed_series,
         spectral_factor_series=spectral_factor_series,
-        longitude=Longitude(value=longitude, unit='radians'),
-        latitude=Latitude(values=latitude, units='radians'),
+        longitude=longitude,
+        latitude=latitude,
         timestamps=timestamps,
         neighbor_lookup=neighbor_lookup,
         tolerance=tolerance,
@@ -420,52 +402,79 @@ def photovoltaic_power_output_series(
         multi_thread=multi_thread,
         verbose=verbose,
         log=log,
+        profile=profile,
     )
+    global_horizontal_irradiance = external_time_series["global_horizontal_irradiance"]
+    direct_horizontal_irradiance = external_time_series["direct_horizontal_irradiance"]
+    temperature_series = external_time_series["temperature_series"]
+    wind_speed_series = external_time_series["wind_speed_series"]
+    spectral_factor_series = external_time_series["spectral_factor_series"]
+    parameters = {
+        "longitude": longitude,
+        "latitude": latitude,
+        "elevation": elevation,
+        "surface_orientation": surface_orientation,
+        "surface_tilt": surface_tilt,
+        "timezone": timezone,
+        "global_horizontal_irradiance": global_horizontal_irradiance,
+        "direct_horizontal_irradiance": direct_horizontal_irradiance,
+        "spectral_factor_series": spectral_factor_series,
+        "temperature_series": temperature_series,
+        "wind_speed_series": wind_speed_series,
+        "linke_turbidity_factor_series": linke_turbidity_factor_series,
+        "adjust_for_atmospheric_refraction": adjust_for_atmospheric_refraction,
+        # "unrefracted_solar_zenith": unrefracted_solar_zenith,
+        "albedo": albedo,
+        "apply_reflectivity_factor": apply_reflectivity_factor,
+        "solar_position_model": solar_position_model,
+        "sun_horizon_position": sun_horizon_position,
+        "solar_incidence_model": solar_incidence_model,
+        "zero_negative_solar_incidence_angle": zero_negative_solar_incidence_angle,
+        "solar_time_model": solar_time_model,
+        "solar_constant": solar_constant,
+        "eccentricity_phase_offset": eccentricity_phase_offset,
+        "eccentricity_amplitude": eccentricity_amplitude,
+        "horizon_profile": horizon_profile,  # Review naming please ?
+        "shading_model": shading_model,
+        "shading_states": shading_states,
+        # "angle_output_units": angle_output_units,
+        "photovoltaic_module_type": photovoltaic_module_type,
+        "photovoltaic_module": photovoltaic_module,
+        "peak_power": peak_power,
+        "system_efficiency": system_efficiency,
+        "power_model": power_model,
+        "temperature_model": temperature_model,
+        "efficiency": efficiency,
+        "dtype": dtype,
+        "array_backend": array_backend,
+        # "multi_thread": multi_thread,
+        "verbose": verbose,
+        "log": log,
+        "fingerprint": fingerprint,
+        "profile": profile,
+        "validate_output": validate_output,
+    }
+    if streaming_statistics:
+        from pvgisprototype.api.power.streaming import (
+            STREAMING_STATISTICS_FREQUENCY_DEFAULT,
+            calculate_photovoltaic_power_output_statistics,
+        )
+        from pvgisprototype.cli.print.series import print_streaming_statistics
+
+        print_streaming_statistics(
+            statistics=calculate_photovoltaic_power_output_statistics(
+                timestamps=timestamps,
+                chunk_frequency=streaming_statistics,
+                frequency=groupby or STREAMING_STATISTICS_FREQUENCY_DEFAULT,
+                **parameters,
+            ),
+            rounding_places=rounding_places,
+        )
+        return
+
     photovoltaic_power_output_series = calculate_photovoltaic_power_output_series(
-        longitude=longitude,
-        latitude=latitude,
-        elevation=elevation,
-        surface_orientation=surface_orientation,
-        surface_tilt=surface_tilt,
         timestamps=timestamps,
-        timezone=timezone,
-        global_horizontal_irradiance=global_horizontal_irradiance,
-        direct_horizontal_irradiance=direct_horizontal_irradiance,
-        spectral_factor_series=spectral_factor_series,
-        temperature_series=temperature_series,
-        wind_speed_series=wind_speed_series,
-        linke_turbidity_factor_series=linke_turbidity_factor_series,
-        adjust_for_atmospheric_refraction=adjust_for_atmospheric_refraction,
-        # unrefracted_solar_zenith=unrefracted_solar_zenith,
-        albedo=albedo,
-        apply_reflectivity_factor=apply_reflectivity_factor,
-        solar_position_model=solar_position_model,
-        sun_horizon_position=sun_horizon_position,
-        solar_incidence_model=solar_incidence_model,
-        zero_negative_solar_incidence_angle=zero_negative_solar_incidence_angle,
-        solar_time_model=solar_time_model,
-        solar_constant=solar_constant,
-        eccentricity_phase_offset=eccentricity_phase_offset,
-        eccentricity_amplitude=eccentricity_amplitude,
-        horizon_profile=horizon_profile,  # Review naming please ?
-        shading_model=shading_model,
-        shading_states=shading_states,
-        # angle_output_units=angle_output_units,
-        photovoltaic_module_type=photovoltaic_module_type,
-        photovoltaic_module=photovoltaic_module,
-        peak_power=peak_power,
-        system_efficiency=system_efficiency,
-        power_model=power_model,
-        temperature_model=temperature_model,
-        efficiency=efficiency,
-        dtype=dtype,
-        array_backend=array_backend,
-        # multi_thread=multi_thread,
-        verbose=verbose,
-        log=log,
-        fingerprint=fingerprint,
-        profile=profile,
-        validate_output=validate_output,
+        **parameters,
     )  # Re-Design Me ! ------------------------------------------------
 
     longitude = convert_float_to_degrees_if_requested(longitude, angle_output_units)
@@ -390,6 +390,7 @@ def rear_side_photovoltaic_power_output_series(
         multi_thread=multi_thread,
         verbose=verbose,
         log=log,
+        profile=profile,
     )
     rear_side_photovoltaic_power_output_series = calculate_rear_side_photovoltaic_power_output_series(
         longitude=longitude,
@@ -21,6 +21,7 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 import calendar
+from pvgisprototype.api.statistics.grouped import label_group_key
 from pvgisprototype.api.statistics.xarray import calculate_series_statistics
 from pvgisprototype.constants import VERBOSE_LEVEL_DEFAULT
 
@@ -211,3 +212,55 @@ def print_series_statistics(
     panel = Panel(table, title="Statistics", expand=False)
     console = Console()
     console.print(panel)
+
+
+def format_statistic_header(column: str) -> str:
+    """Shorten the name of a statistic to fit a table header"""
+    if column.endswith("th Percentile"):
+        return f"P{column.removesuffix('th Percentile')}"
+    return {"Standard deviation": "Std"}.get(column, column)
+
+
+def print_streaming_statistics(
+    statistics: dict,
+    rounding_places: int | None = None,
+) -> None:
+    """Print the statistics accumulated one time chunk at a time
+
+    Parameters
+    ----------
+    statistics: dict
+        A `StreamingStatistics` per quantity, see
+        `calculate_photovoltaic_power_output_statistics()`
+    rounding_places: int
+        Number of decimal places of the values
+    """
+    console = Console()
+    for quantity, accumulator in statistics.items():
+        table = Table(
+            title=f"{quantity} statistics",
+            show_header=True,
+            header_style="bold magenta",
+            row_styles=["none", "dim"],
+            box=SIMPLE_HEAD,
+            highlight=True,
+        )
+        columns = accumulator.to_dictionary()
+        for column in columns:
+            table.add_column(
+                format_statistic_header(column),
+                justify="right",
+                style="magenta" if column == "Group" else "cyan",
+            )
+        for row, key in enumerate(columns.pop("Group").tolist()):
+            values = [
+                round(value, rounding_places)
+                if rounding_places is not None and isinstance(value, float)
+                else value
+                for value in (column[row].item() for column in columns.values())
+            ]
+            table.add_row(
+                label_group_key(key, accumulator.frequency),
+                *(str(value) for value in values),
+            )
+        console.print(table)
@@ -0,0 +1,91 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+from pathlib import Path
+
+import typer
+from typing_extensions import Annotated
+from xarray import DataArray, Dataset
+
+from pvgisprototype import LinkeTurbidityFactor
+from pvgisprototype.api.irradiance.clear_sky_table import (
+    CLEAR_SKY_TABLE_DAY_STEP_DEFAULT,
+    CLEAR_SKY_TABLE_SUFFIX,
+    CLEAR_SKY_TABLE_TIME_STEP_DEFAULT,
+    write_clear_sky_table,
+)
+from pvgisprototype.api.series.open import read_data_array_or_set
+from pvgisprototype.cli.typer.time_series import typer_argument_time_series
+from pvgisprototype.cli.typer.verbosity import typer_option_verbose
+from pvgisprototype.constants import VERBOSE_LEVEL_DEFAULT
+
+
+def _read_data_array(path: Path, verbose: int) -> DataArray:
+    data = read_data_array_or_set(input_data=path, verbose=verbose)
+    if isinstance(data, Dataset):
+        data = data[next(iter(data.data_vars))]
+    if {"longitude", "latitude"} <= set(data.dims):
+        data = data.rename({"longitude": "lon", "latitude": "lat"})
+    return data
+
+
+def write_clear_sky_table_from_elevation(
+    elevation: Annotated[Path, typer_argument_time_series],
+    linke_turbidity: Annotated[
+        Path | None,
+        typer.Option(help="Gridded monthly Linke turbidity factors, 12 along the non-spatial dimension"),
+    ] = None,
+    linke_turbidity_factor: Annotated[
+        float,
+        typer.Option(help="Linke turbidity factor for all pixels and months, if no gridded factors are given"),
+    ] = LinkeTurbidityFactor().value,
+    output: Annotated[
+        Path | None,
+        typer.Option(help=f"Output directory, by default the input with a `{CLEAR_SKY_TABLE_SUFFIX}` suffix"),
+    ] = None,
+    time_step: Annotated[
+        int, typer.Option(help="Minutes between the samples of a day")
+    ] = CLEAR_SKY_TABLE_TIME_STEP_DEFAULT,
+    day_step: Annotated[
+        int, typer.Option(help="Days between the sampled days of the year")
+    ] = CLEAR_SKY_TABLE_DAY_STEP_DEFAULT,
+    verbose: Annotated[int, typer_option_verbose] = VERBOSE_LEVEL_DEFAULT,
+):
+    """Precompute a memory-mapped per-pixel clear-sky irradiance table from a gridded elevation"""
+    elevation_data = _read_data_array(elevation, verbose=verbose).transpose("lat", "lon")
+    monthly_linke_turbidity = linke_turbidity_factor
+    if linke_turbidity:
+        linke_turbidity_data = _read_data_array(linke_turbidity, verbose=verbose)
+        (month,) = set(linke_turbidity_data.dims) - {"lon", "lat"}
+        monthly_linke_turbidity = (
+            linke_turbidity_data.sel(
+                lon=elevation_data.lon, lat=elevation_data.lat, method="nearest"
+            )
+            .transpose("lat", "lon", month)
+            .values
+        )
+    output = output or elevation.with_suffix(CLEAR_SKY_TABLE_SUFFIX)
+    write_clear_sky_table(
+        longitude=elevation_data.lon.values,
+        latitude=elevation_data.lat.values,
+        elevation=elevation_data.values,
+        path=output,
+        monthly_linke_turbidity=monthly_linke_turbidity,
+        time_step=time_step,
+        day_step=day_step,
+    )
+    if verbose > 0:
+        print(f"Clear-sky table written to {output}")
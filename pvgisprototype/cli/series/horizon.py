@@ -0,0 +1,55 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+from pathlib import Path
+
+import typer
+from typing_extensions import Annotated
+from xarray import Dataset
+
+from pvgisprototype.api.series.horizon_table import (
+    HORIZON_TABLE_SUFFIX,
+    write_horizon_table,
+)
+from pvgisprototype.api.series.open import read_data_array_or_set
+from pvgisprototype.cli.typer.time_series import typer_argument_time_series
+from pvgisprototype.cli.typer.verbosity import typer_option_verbose
+from pvgisprototype.constants import VERBOSE_LEVEL_DEFAULT
+
+
+def write_horizon_table_from_profile(
+    horizon_profile: Annotated[Path, typer_argument_time_series],
+    output: Annotated[
+        Path | None,
+        typer.Option(help=f"Output directory, by default the input with a `{HORIZON_TABLE_SUFFIX}` suffix"),
+    ] = None,
+    size: Annotated[
+        int | None,
+        typer.Option(help="Number of azimuths per pixel, by default those of the input if equally spaced"),
+    ] = None,
+    variable: Annotated[
+        str | None, typer.Option(help="Variable of the horizon heights in a Dataset")
+    ] = None,
+    verbose: Annotated[int, typer_option_verbose] = VERBOSE_LEVEL_DEFAULT,
+):
+    """Precompute a memory-mapped per-pixel horizon table from a gridded horizon profile"""
+    data = read_data_array_or_set(input_data=horizon_profile, verbose=verbose)
+    if isinstance(data, Dataset):
+        data = data[variable] if variable else data[next(iter(data.data_vars))]
+    output = output or horizon_profile.with_suffix(HORIZON_TABLE_SUFFIX)
+    write_horizon_table(horizon_profile=data, path=output, size=size)
+    if verbose > 0:
+        print(f"Horizon table written to {output}")
@@ -19,6 +19,8 @@ from pvgisprototype.cli.messages import NOT_IMPLEMENTED_CLI
 from pvgisprototype.cli.typer.group import OrderCommands
 from pvgisprototype.cli.series.introduction import series_introduction
 from pvgisprototype.cli.series.inspect import inspect_xarray_supported_data
+from pvgisprototype.cli.series.clear_sky import write_clear_sky_table_from_elevation
+from pvgisprototype.cli.series.horizon import write_horizon_table_from_profile
 from pvgisprototype.cli.series.select import select, select_fast, select_sarah
 from pvgisprototype.cli.series.resample import resample
 from pvgisprototype.cli.series.plot import plot
@@ -78,6 +80,18 @@ app.command(
     help=f"{SYMBOL_SELECT} Fast-Select time series over a location",
     rich_help_panel=rich_help_panel_series,
 )(select_fast)
+app.command(
+    name="horizon-table",
+    no_args_is_help=True,
+    help=f"{SYMBOL_SELECT} Precompute a per-pixel horizon table from a horizon profile",
+    rich_help_panel=rich_help_panel_series,
+)(write_horizon_table_from_profile)
+app.command(
+    name="clear-sky-table",
+    no_args_is_help=True,
+    help=f"{SYMBOL_SELECT} Precompute a per-pixel clear-sky irradiance table from a gridded elevation",
+    rich_help_panel=rich_help_panel_series,
+)(write_clear_sky_table_from_elevation)
 app.command(
     name="resample",
     no_args_is_help=True,
@@ -32,8 +32,7 @@ from pvgisprototype import (
     TemperatureSeries,
     WindSpeedSeries,
 )
-from pvgisprototype.api.series.horizontal_irradiance import read_horizontal_irradiance_components_from_sarah
-from pvgisprototype.api.series.time_series import get_time_series
+from pvgisprototype.api.series.time_series import read_external_time_series
 from pvgisprototype.api.utilities.conversions import convert_float_to_degrees_if_requested
 from pvgisprototype.api.irradiance.models import (
     MethodForInexactMatches,
@@ -178,7 +177,6 @@ from pvgisprototype.constants import (
     ATMOSPHERIC_REFRACTION_FLAG_DEFAULT,
     CSV_PATH_DEFAULT,
     DATA_TYPE_DEFAULT,
-    DEGREES,
     EFFICIENCY_FACTOR_DEFAULT,
     FINGERPRINT_FLAG_DEFAULT,
     IN_MEMORY_FLAG_DEFAULT,
@@ -384,28 +382,10 @@ def optimal_surface_position(
         QuickResponseCode, typer_option_quick_response
     ] = QuickResponseCode.NoneValue,
 ):
-    if isinstance(global_horizontal_irradiance, (str, Path)) and isinstance(
-        direct_horizontal_irradiance, (str, Path)
-    ):  # NOTE This is in the case everything is pathlike
-        global_horizontal_irradiance, direct_horizontal_irradiance = (
-            read_horizontal_irradiance_components_from_sarah(
-                shortwave=global_horizontal_irradiance,
-                direct=direct_horizontal_irradiance,
-                longitude=convert_float_to_degrees_if_requested(longitude, DEGREES),
-                latitude=convert_float_to_degrees_if_requested(latitude, DEGREES),
-                timestamps=timestamps,
-                neighbor_lookup=neighbor_lookup,
-                tolerance=tolerance,
-                mask_and_scale=mask_and_scale,
-                in_memory=in_memory,
-                multi_thread=multi_thread,
-                # multi_thread=False,
-                verbose=verbose,
-                log=log,
-            )
-        )
-
-    temperature_series, wind_speed_series, spectral_factor_series = get_time_series(
+    # Read all external time series concurrently
+    external_time_series = read_external_time_series(
+        global_horizontal_irradiance=global_horizontal_irradiance,
+        direct_horizontal_irradiance=direct_horizontal_irradiance,
         temperature_series=temperature_series,
         wind_speed_series=wind_speed_series,
         spectral_factor_series=spectral_factor_series,
@@ -421,7 +401,13 @@ def optimal_surface_position(
         multi_thread=multi_thread,
         verbose=verbose,
         log=log,
+        profile=profile,
     )
+    global_horizontal_irradiance = external_time_series["global_horizontal_irradiance"]
+    direct_horizontal_irradiance = external_time_series["direct_horizontal_irradiance"]
+    temperature_series = external_time_series["temperature_series"]
+    wind_speed_series = external_time_series["wind_speed_series"]
+    spectral_factor_series = external_time_series["spectral_factor_series"]
     optimal_surface_position, _optimal_surface_position = optimise_surface_position(
         longitude=longitude,
         latitude=latitude,
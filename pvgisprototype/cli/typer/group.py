@@ -14,8 +14,13 @@
 # OF ANY KIND, either express or implied. See the Licence for the specific language
 # governing permissions and limitations under the Licence.
 #
-from click import Context
+from dataclasses import dataclass
+from importlib import import_module
+
+from click import Command, Context
+from typer import Typer
 from typer.core import TyperGroup
+from typer.main import get_group
 
 
 class OrderCommands(TyperGroup):
@@ -37,3 +42,81 @@ class OrderCommands(TyperGroup):
         ]
 
         return ordered_commands + additional_commands
+
+
+@dataclass(frozen=True)
+class LazySubcommand:
+    """A Typer sub-application imported only when one of its commands runs
+
+    The name of the sub-command and its help text are registered statically,
+    so listing them, i.e. in `--help`, does not import the implementing module.
+    """
+
+    import_path: str  # i.e. 'pvgisprototype.cli.power.power:app'
+    help: str
+    rich_help_panel: str | None = None
+    no_args_is_help: bool = True
+
+    def typer_instance(self) -> Typer:
+        """Import the implementing module and return its Typer application"""
+        module_name, _, attribute = self.import_path.partition(":")
+        return getattr(import_module(module_name), attribute)
+
+    def placeholder(self, name: str, rich_markup_mode=None) -> TyperGroup:
+        """A command that only describes the sub-command, for listing it"""
+        return TyperGroup(
+            name=name,
+            rich_markup_mode=rich_markup_mode,
+            help=self.help,
+            rich_help_panel=self.rich_help_panel,
+            no_args_is_help=self.no_args_is_help,
+        )
+
+    def load(self, name: str, rich_markup_mode=None) -> Command:
+        """Build the sub-command exactly as `Typer.add_typer()` would"""
+        application = Typer(rich_markup_mode=rich_markup_mode)
+        application.add_typer(
+            self.typer_instance(),
+            name=name,
+            no_args_is_help=self.no_args_is_help,
+            rich_help_panel=self.rich_help_panel,
+        )
+        return get_group(application).commands[name]
+
+
+class LazyOrderCommands(OrderCommands):
+    """Ordered commands, extended by the sub-commands in `lazy_subcommands`"""
+
+    lazy_subcommands: dict[str, LazySubcommand] = {}
+
+    def list_commands(self, ctx: Context):
+        commands = [
+            command
+            for command in super().list_commands(ctx)
+            if command not in self.lazy_subcommands
+        ]
+        return commands + list(self.lazy_subcommands)
+
+    def get_command(self, ctx: Context, cmd_name: str):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            return self.lazy_subcommands[cmd_name].placeholder(
+                cmd_name, rich_markup_mode=self.rich_markup_mode
+            )
+        return super().get_command(ctx, cmd_name)
+
+    def resolve_command(self, ctx: Context, args):
+        cmd_name, command, args = super().resolve_command(ctx, args)
+        if cmd_name in self.lazy_subcommands:
+            command = self.load_command(cmd_name)
+        return cmd_name, command, args
+
+    def load_command(self, cmd_name: str) -> Command:
+        """Import and register a lazy sub-command, once"""
+        if cmd_name not in self.commands:
+            self.add_command(
+                self.lazy_subcommands[cmd_name].load(
+                    cmd_name, rich_markup_mode=self.rich_markup_mode
+                ),
+                cmd_name,
+            )
+        return self.commands[cmd_name]
@@ -23,6 +23,11 @@ from numpy.typing import NDArray
 import typer
 from pathlib import Path
 from pandas import Series, DataFrame, read_csv
+from pvgisprototype.api.irradiance.clear_sky_table import (
+    ClearSkyTable,
+    is_clear_sky_table,
+    open_clear_sky_table,
+)
 from pvgisprototype.cli.rich_help_panel_names import (
     rich_help_panel_advanced_options,
     rich_help_panel_irradiance_series,
@@ -132,6 +137,14 @@ def callback_irradiance_data(
     raise ValueError("Unsupported input type for irradiance data.")
 
 
+def parse_clear_sky_table(clear_sky_table: str | Path) -> ClearSkyTable:
+    """Memory-map a precomputed clear-sky table"""
+    if not is_clear_sky_table(clear_sky_table):
+        raise typer.BadParameter(f"{clear_sky_table} is not a clear-sky table")
+
+    return open_clear_sky_table(Path(clear_sky_table))
+
+
 spectral_irradiance_wavelength_limit_typer_help = (
     "wavelength for spectral irradiance range"
 )
@@ -198,3 +211,8 @@ typer_option_extraterrestrial_normal_irradiance = typer.Option(
     rich_help_panel=rich_help_panel_spectrum,
     is_eager=True,
 )
+typer_option_clear_sky_table = typer.Option(
+    help="Precomputed per-pixel clear-sky table to look the clear-sky irradiance up in, see `series clear-sky-table`",
+    parser=parse_clear_sky_table,
+    rich_help_panel=rich_help_panel_advanced_options,
+)
@@ -30,6 +30,10 @@ typer_option_groupby = typer.Option(
     help="Group statistics, ex. M or 3h. A number and date/time unit : (Y)ear, (S)eason, (M)onth, (D)ay, (W)eek, (h)our. See Xarray's group-by operations.",
     rich_help_panel=rich_help_panel_statistics,
 )
+typer_option_streaming_statistics = typer.Option(
+    help="Estimate statistics one time chunk at a time, ex. YE for one year at a time, without keeping the full series in memory. Grouped by --groupby, or by month.",
+    rich_help_panel=rich_help_panel_statistics,
+)
 typer_option_analysis = typer.Option(
     # see also : `typer_option_verbosity` in verosity.py
     help="Analysis of performance. Will force verbose=9 (for detailed calculations) and quiet=True.",
@@ -85,6 +85,8 @@ class NDArrayBackend(enum.Enum):
             module = numpy
             linalg_module = module.linalg
         elif self == NDArrayBackend.DASK:
+            import dask.array
+
             module = dask.array
             linalg_module = module.linalg
         elif self == NDArrayBackend.CUPY and CUPY_ENABLED:
@@ -98,6 +100,7 @@ class NDArrayBackend(enum.Enum):
 class ArrayDType(enum.Enum):
     FLOAT32 = numpy.float32
     FLOAT64 = numpy.float64
+    INT8 = numpy.int8
     INT32 = numpy.int32
     INT64 = numpy.int64
     BOOL = numpy.bool_
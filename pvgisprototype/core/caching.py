@@ -31,16 +31,15 @@ CACHE_MAXSIZE = 24
 DEFAULT_TTL_SECONDS = int(os.getenv("PVGIS_CACHE_TTL_SECONDS", "30"))
 
 
-def _ttl_hash_gen(seconds: int):
-    """Generate TTL hash that changes every 'seconds' interval"""
-    start_time = time.time()
-    while True:
-        yield floor((time.time() - start_time) / seconds)
-
-
 # Thread-local storage for per-request cache registries
 _thread_local_storage = threading.local()
 
+# Guards cache memories shared by the threads of a request
+_cache_lock = threading.RLock()
+
+# Per-request state handed over to worker threads, see share_request_caches()
+REQUEST_STATE = ("caches", "cache_registry", "request_id")
+
 
 def generate_request_id():
     return str(os.getpid()) + "-" + str(threading.get_ident())
@@ -55,10 +54,47 @@ def get_request_cache_registry():
     if not hasattr(_thread_local_storage, 'cache_registry'):
         _thread_local_storage.cache_registry = []
         _thread_local_storage.request_id = generate_request_id()
-        logger.debug(f"Created new request cache registry for {_thread_local_storage.request_id}")
+        logger.debug(lambda: f"Created new request cache registry for {_thread_local_storage.request_id}")
     return _thread_local_storage.cache_registry
 
 
+def get_request_caches() -> dict:
+    """Get or create the cache memories of the current request, by function"""
+    if not hasattr(_thread_local_storage, 'caches'):
+        _thread_local_storage.caches = {}
+    return _thread_local_storage.caches
+
+
+def share_request_caches(function):
+    """Bind a function to the caches of the current request
+
+    Worker threads, i.e. of a `ThreadPoolExecutor`, have their own thread-local
+    storage. The returned callable runs `function` with the cache memories and
+    registry of the calling thread instead, so that the results cached in a
+    worker outlive it.
+    """
+    get_request_caches()
+    if not hasattr(_thread_local_storage, 'cache_registry'):
+        _thread_local_storage.cache_registry = []
+    request_state = {
+        name: getattr(_thread_local_storage, name)
+        for name in REQUEST_STATE
+        if hasattr(_thread_local_storage, name)
+    }
+
+    @wraps(function)
+    def wrapper(*args, **kwargs):
+        for name, value in request_state.items():
+            setattr(_thread_local_storage, name, value)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            for name in request_state:
+                delattr(_thread_local_storage, name)
+
+    return wrapper
+
+
 def register_cache(cache, registry=None):
     """Register a cache memory in the thread-local cache registry"""
     if registry is None:
@@ -67,7 +103,7 @@ def register_cache(cache, registry=None):
     if cache not in registry:
         registry.append(cache)
         request_id = get_request_id()
-        logger.debug(f"Cache registered for request {request_id} (registry size: {len(registry)})")
+        logger.debug(lambda: f"Cache registered for request {request_id} (registry size: {len(registry)})")
     return cache
 
 
@@ -130,6 +166,7 @@ def clear_request_caches():
             
         # Clear the registry
         _thread_local_storage.cache_registry = []
+        _thread_local_storage.caches = {}
         _thread_local_storage.request_id = 'unknown'
 
 
@@ -141,11 +178,11 @@ def make_object_hashable(object):
     try:
         # Try to hash the object directly first
         hash(object)
-        logger.debug(f"Object {object} is hashable.")
+        logger.debug(lambda: f"Object {object} is hashable.")
         return object
     except TypeError:
         # If it's unhashable, use our custom generate_hash function
-        logger.debug(f"Object {object} is unhashable.")
+        logger.debug(lambda: f"Object {object} is unhashable.")
         return generate_hash(object)
 
 
@@ -171,34 +208,37 @@ def custom_cached(func):
     TTL is internally configurable via 'PVGIS_CACHE_TTL_SECONDS' env variable (default 300s).
     """
     ttl = DEFAULT_TTL_SECONDS
-    ttl_hash_gen = _ttl_hash_gen(ttl)
+    start_time = time.time()
     
     def get_or_create_cache():
         cache_attr = f"_cache_{func.__name__}_{id(func)}"
-        
-        if not hasattr(_thread_local_storage, cache_attr):
-            # LRUCache as backing cache store
-            cache_memory = LRUCache(maxsize=CACHE_MAXSIZE)
-            setattr(_thread_local_storage, cache_attr, cache_memory)
-            # Register cache for per-request cleanup
-            registry = getattr(_thread_local_storage, 'cache_registry', None)
-            if registry is None:
-                registry = []
-                setattr(_thread_local_storage, 'cache_registry', registry)
-            if cache_memory not in registry:
-                registry.append(cache_memory)
-            
-            request_id = getattr(_thread_local_storage, 'request_id', 'unknown')
-            logger.debug(f"Created cache for {func.__name__} in request {request_id}, TTL={ttl}s, maxsize={CACHE_MAXSIZE}")
-        
-        return getattr(_thread_local_storage, cache_attr)
-    
+        caches = get_request_caches()
+
+        with _cache_lock:
+            if cache_attr not in caches:
+                # LRUCache as backing cache store
+                cache_memory = LRUCache(maxsize=CACHE_MAXSIZE)
+                caches[cache_attr] = cache_memory
+                # Register cache for per-request cleanup
+                registry = getattr(_thread_local_storage, 'cache_registry', None)
+                if registry is None:
+                    registry = []
+                    setattr(_thread_local_storage, 'cache_registry', registry)
+                if cache_memory not in registry:
+                    registry.append(cache_memory)
+
+                request_id = getattr(_thread_local_storage, 'request_id', 'unknown')
+                logger.debug(lambda: f"Created cache for {func.__name__} in request {request_id}, TTL={ttl}s, maxsize={CACHE_MAXSIZE}")
+
+            return caches[cache_attr]
+
     @wraps(func)
     def wrapper(*args, **kwargs):
         cache_memory = get_or_create_cache()
         
-        # Compute TTL hash to invalidate cache every ttl seconds
-        ttl_hash = next(ttl_hash_gen)
+        # Compute TTL hash to invalidate cache every ttl seconds, statelessly
+        # so that worker threads of a request may call the wrapper at once
+        ttl_hash = floor((time.time() - start_time) / ttl)
         
         # Generate composite key: (ttl_hash, your original key)
         # Use your existing generate_custom_hashkey to maintain compatible key hashing
@@ -206,17 +246,22 @@ def custom_cached(func):
         key_inner = generate_custom_hashkey(*args, **kwargs)
         key = (ttl_hash, key_inner)
         
-        if key in cache_memory:
+        with _cache_lock:
+            hit = key in cache_memory
+            if hit:
+                result = cache_memory[key]
+        if hit:
             request_id = getattr(_thread_local_storage, 'request_id', 'unknown')
-            logger.debug(f"Cache HIT for {func.__name__} in request {request_id} (ttl_hash={ttl_hash})")
-            return cache_memory[key]
+            logger.debug(lambda: f"Cache HIT for {func.__name__} in request {request_id} (ttl_hash={ttl_hash})")
+            return result
         
         # Cache miss: call function and store result
         result = func(*args, **kwargs)
-        cache_memory[key] = result
+        with _cache_lock:
+            cache_memory[key] = result
         
         request_id = getattr(_thread_local_storage, 'request_id', 'unknown')
-        logger.debug(f"Cache MISS for {func.__name__} in request {request_id} (ttl_hash={ttl_hash})")
+        logger.debug(lambda: f"Cache MISS for {func.__name__} in request {request_id} (ttl_hash={ttl_hash})")
         
         return result
     
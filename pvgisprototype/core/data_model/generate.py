@@ -18,7 +18,7 @@ from typing import Annotated, List
 import typer
 from pathlib import Path
 from pvgisprototype.core.factory.definition.build import build_python_data_models
-from pvgisprototype.core.factory.definition.write import reset_python_data_model_definitions, write_to_python_module
+from pvgisprototype.core.factory.definition.write import reset_python_data_model_definitions, write_to_python_module, write_data_model_module
 from yaml_definition_files import PVGIS_DATA_MODEL_YAML_DEFINITION_FILES
 
 from pvgisprototype.core.factory.log import logger
@@ -72,6 +72,7 @@ def main(
     source_path: Annotated[Path, typer.Option(help="Source directory with YAML data model descriptions")] = Path("definitions.yaml"),
     definitions: Annotated[List[str], typer_list_of_yaml_files] = PVGIS_DATA_MODEL_YAML_DEFINITION_FILES,
     output_file: Annotated[Path, typer.Option(help='Output file', is_eager=True)] = Path("definitions.py"),
+    models_output_file: Annotated[Path | None, typer.Option(help='Output file for the ahead-of-time generated data models')] = Path("models.py"),
     verbose: Annotated[bool, typer.Option(help="Verbose")] = False,
     log_file: Annotated[str | None, typer.Option("--log-file", "-l",help="Log file")] = LOG_FILE,
     log_level: str = LOG_LEVEL,
@@ -97,6 +98,12 @@ def main(
             verbose=verbose,
         )
         write_to_python_module(models=pvgis_data_models, output_file=output_file, verbose=verbose)
+        if models_output_file:
+            write_data_model_module(
+                definitions=pvgis_data_models,
+                output_file=models_output_file,
+                verbose=verbose,
+            )
     except Exception as e:
         logger.exception(f"An error occurred: {e}")
     else:
@@ -0,0 +1,4374 @@
+# Ahead-of-time generated data models : do not edit, see core/data_model/generate.py
+"""
+PVGIS-native data model classes generated ahead of time
+
+The field types and initial values of each data model definition are resolved
+when generating this module. A class is created on first access only, without
+walking the definitions, along with the classes its fields depend on. Building
+its Pydantic validation schema is further deferred until the first validation.
+"""
+
+from threading import RLock
+from typing import Optional, Union
+
+import numpy
+
+from pvgisprototype.core.factory.data_model import DataModelFactory
+from pvgisprototype.core.factory.type_mapping import TYPE_MAPPING
+
+create_data_model = DataModelFactory.create_data_model
+register_data_model = DataModelFactory.register_data_model
+
+# Re-entrant : building a class builds the classes its fields depend on
+_data_model_lock = RLock()
+
+
+def data_model(data_model_name: str):
+    """Create and register a data model class on first access, once across
+    threads"""
+    model = globals().get(data_model_name)
+    if model is None:
+        with _data_model_lock:
+            model = globals().get(data_model_name)
+            if model is None:
+                model = globals()[data_model_name] = register_data_model(
+                    data_model_name,
+                    DATA_MODEL_BUILDERS[data_model_name](),
+                )
+    return model
+
+
+def __getattr__(name: str):
+    if name in DATA_MODEL_BUILDERS:
+        return data_model(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *DATA_MODELS})
+
+
+def _build_FingerprintFlag():
+    return create_data_model(
+        data_model_name='FingerprintFlag',
+        annotations={
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+        },
+        default_values={
+            'fingerprint': False,
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_Longitude():
+    return create_data_model(
+        data_model_name='Longitude',
+        annotations={
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+        },
+        default_values={
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': None,
+            'symbol': 'Λ',
+            'description': "The angle between a point on the Earth's surface and the meridian plane, with its value ranging from 0° at the Prime Meridian in Greenwich, England, to 180° east or west.",
+            'label': 'Longitude',
+            'title': 'Longitude',
+            'supertitle': 'Longitude data',
+            'shortname': 'Longitude',
+            'name': 'Longitude',
+            'min_radians': -3.141592653589793,
+            'max_radians': 3.141592653589793,
+            'min_degrees': -180,
+            'max_degrees': 180,
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_RelativeLongitude():
+    return create_data_model(
+        data_model_name='RelativeLongitude',
+        annotations={
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': 'Λ',
+            'description': None,
+            'label': 'Relative Longitude',
+            'title': 'Relative Longitude',
+            'supertitle': 'Relative Longitude data',
+            'shortname': 'Relative Longitude',
+            'name': 'Relative Longitude',
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_Latitude():
+    return create_data_model(
+        data_model_name='Latitude',
+        annotations={
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['float']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+        },
+        default_values={
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': None,
+            'symbol': 'Φ',
+            'description': "The angle between a point on the Earth's surface and the equatorial plane. It indicates a location's distance north or south of the equator, ranging from 0° at the Equator to 90° North or South at the poles.",
+            'label': 'Latitude',
+            'title': 'Latitude',
+            'supertitle': 'Latitude data',
+            'shortname': 'Latitude',
+            'name': 'Latitude',
+            'min_radians': -1.5707963267948966,
+            'max_radians': 1.5707963267948966,
+            'min_degrees': -90,
+            'max_degrees': 90,
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_Elevation():
+    return create_data_model(
+        data_model_name='Elevation',
+        annotations={
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': 'meters',
+            'value': None,
+            'symbol': '🏔',
+            'description': 'The height of a geographic point above a fixed reference point, commonly the mean sea level.',
+            'label': 'Elevation',
+            'title': 'Elevation',
+            'supertitle': 'Elevation data',
+            'shortname': 'Elevation',
+            'name': 'Elevation',
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_HorizonHeight():
+    return create_data_model(
+        data_model_name='HorizonHeight',
+        annotations={
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': 'radians',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '🏔',
+            'description': 'The horizon height angle from of a geographic point of observation, a solar surface in the context of solar positioning.',
+            'label': 'Horizon Height',
+            'title': 'Horizon Height',
+            'supertitle': 'Horizon Height data',
+            'shortname': 'Horizon',
+            'name': 'Horizon Height',
+            'min_radians': -1.5707963267948966,
+            'max_radians': 1.5707963267948966,
+            'min_degrees': -90,
+            'max_degrees': 90,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_LocationShading():
+    return create_data_model(
+        data_model_name='LocationShading',
+        annotations={
+            'horizon_height': Optional[data_model('HorizonHeight')],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'solar_azimuth': Optional[TYPE_MAPPING['SolarAzimuth']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'horizon_height': None,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'solar_azimuth': None,
+            'solar_altitude': None,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': 'unitless',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '🮞',
+            'description': None,
+            'label': 'Location Shading',
+            'title': 'Location Shading',
+            'supertitle': 'Location Shading',
+            'shortname': 'Shading',
+            'name': 'Location Shading',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SurfaceOrientation():
+    return create_data_model(
+        data_model_name='SurfaceOrientation',
+        annotations={
+            'optimal': Optional[TYPE_MAPPING['bool']],
+            'optimiser': Optional[TYPE_MAPPING['str']],
+            'optimization_mode': Optional[TYPE_MAPPING['str']],
+            'success': Optional[TYPE_MAPPING['bool']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+        },
+        default_values={
+            'optimal': False,
+            'optimiser': None,
+            'optimization_mode': None,
+            'success': None,
+            'min_degrees': 0,
+            'min_radians': 0,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': 180.0,
+            'symbol': '⯐ ⎄',
+            'description': None,
+            'label': 'Surface Position',
+            'title': 'Surface Position',
+            'supertitle': 'Surface Position data',
+            'shortname': 'Surface Position',
+            'name': 'Surface Position',
+            'max_radians': 6.283185307179586,
+            'max_degrees': 360,
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_SurfaceTilt():
+    return create_data_model(
+        data_model_name='SurfaceTilt',
+        annotations={
+            'optimal': Optional[TYPE_MAPPING['bool']],
+            'optimiser': Optional[TYPE_MAPPING['str']],
+            'optimization_mode': Optional[TYPE_MAPPING['str']],
+            'success': Optional[TYPE_MAPPING['bool']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+        },
+        default_values={
+            'optimal': False,
+            'optimiser': None,
+            'optimization_mode': None,
+            'success': None,
+            'min_degrees': 0,
+            'min_radians': 0,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': 45,
+            'symbol': '⯐ ⎄',
+            'description': None,
+            'label': 'Surface Position',
+            'title': 'Surface Position',
+            'supertitle': 'Surface Position data',
+            'shortname': 'Surface Position',
+            'name': 'Surface Position',
+            'max_radians': 3.141592653589793,
+            'max_degrees': 180,
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_OptimalSurfacePosition():
+    return create_data_model(
+        data_model_name='OptimalSurfacePosition',
+        annotations={
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'horizon_height': Optional[data_model('HorizonHeight')],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'sun_horizon_positions': Optional[TYPE_MAPPING['set']],
+            'sun_horizon_position': Optional[TYPE_MAPPING['array']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'optimal': Optional[TYPE_MAPPING['bool']],
+            'photovoltaic_power': Optional[TYPE_MAPPING['array']],
+            'mean_photovoltaic_power': Optional[TYPE_MAPPING['float']],
+            'optimiser': Optional[TYPE_MAPPING['str']],
+            'optimization_mode': Optional[TYPE_MAPPING['str']],
+            'success': Optional[TYPE_MAPPING['bool']],
+            'surface_tilt_threshold': Optional[TYPE_MAPPING['float']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'angle_output_units': None,
+            'adjusted_for_atmospheric_refraction': None,
+            'horizon_height': None,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'sun_horizon_positions': 'all',
+            'sun_horizon_position': numpy.array([], dtype='float64'),
+            'elevation': 0,
+            'location': None,
+            'solar_timing_algorithm': None,
+            'optimal': False,
+            'photovoltaic_power': numpy.array([], dtype='float64'),
+            'mean_photovoltaic_power': None,
+            'optimiser': None,
+            'optimization_mode': None,
+            'success': None,
+            'surface_tilt_threshold': 0.0001,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⊙',
+            'description': 'The optimal orientation and tilt angles that maximize mean photovoltaic power output for a given location, time period, and system configuration.',
+            'label': 'Optimal Surface Position',
+            'title': 'Optimal Surface Position',
+            'supertitle': 'Optimized Surface Position',
+            'shortname': 'Optimal Position',
+            'name': 'Optimal Surface Position',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_EccentricityPhaseOffset():
+    return create_data_model(
+        data_model_name='EccentricityPhaseOffset',
+        annotations={
+            'name': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['float']],
+            'unit': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'name': 'Eccentricity Phase Offset',
+            'shortname': 'Eccentricity Offset',
+            'title': 'Eccentricity Phase Offset ⋅⬭ ±',
+            'description': "Phase offset for the Earth's orbital eccentricity correction term in solar position and irradiance calculations",
+            'symbol': '⋅⬭ ±',
+            'value': 0.048869,
+            'unit': 'radians',
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_EccentricityAmplitude():
+    return create_data_model(
+        data_model_name='EccentricityAmplitude',
+        annotations={
+            'name': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['float']],
+            'unit': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'name': 'Eccentricity',
+            'shortname': 'Eccentricity',
+            'title': 'Eccentricity Amplitude ⋅⬭',
+            'description': "Amplitude of the Earth's orbital eccentricity correction term in solar position and irradiance calculations.",
+            'symbol': '⋅⬭',
+            'value': 0.03344,
+            'unit': 'unitless',
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_TemperatureSeries():
+    return create_data_model(
+        data_model_name='TemperatureSeries',
+        annotations={
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'average_air_temperature': Optional[TYPE_MAPPING['float']],
+            'standard_test_temperature': Optional[TYPE_MAPPING['int']],
+        },
+        default_values={
+            'value': numpy.array([], dtype='float64'),
+            'unit': '℃',
+            'symbol': '🌡',
+            'description': None,
+            'data_source': None,
+            'average_air_temperature': 14,
+            'standard_test_temperature': 25,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_RelativeHumiditySeries():
+    return create_data_model(
+        data_model_name='RelativeHumiditySeries',
+        annotations={
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'average_relative_humidity': Optional[TYPE_MAPPING['float']],
+        },
+        default_values={
+            'value': numpy.array([], dtype='float64'),
+            'unit': '%',
+            'symbol': '💧',
+            'description': None,
+            'data_source': None,
+            'average_relative_humidity': 70,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_WindSpeedSeries():
+    return create_data_model(
+        data_model_name='WindSpeedSeries',
+        annotations={
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'average_wind_speed': Optional[TYPE_MAPPING['float']],
+        },
+        default_values={
+            'value': numpy.array([], dtype='float64'),
+            'unit': '㎧',
+            'symbol': '🌬',
+            'description': None,
+            'data_source': None,
+            'average_wind_speed': 1,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_TypicalMeteorologicalVariableYear():
+    return create_data_model(
+        data_model_name='TypicalMeteorologicalVariableYear',
+        annotations={
+            'weighting_scheme': Optional[TYPE_MAPPING['str']],
+            'finkelstein_schafer_statistics': Optional[TYPE_MAPPING['dict']],
+            'wind_speed': Optional[Union[data_model('WindSpeedSeries'), TYPE_MAPPING['xarray']]],
+            'temperature': Optional[Union[data_model('TemperatureSeries'), TYPE_MAPPING['xarray']]],
+            'meteorological_variable': Optional[TYPE_MAPPING['str']],
+            'typical_months': Optional[TYPE_MAPPING['xarray']],
+            'tmy': Optional[TYPE_MAPPING['xarray']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'weighting_scheme': 'ISO15927-4',
+            'finkelstein_schafer_statistics': None,
+            'wind_speed': 1,
+            'temperature': 14,
+            'meteorological_variable': None,
+            'typical_months': None,
+            'tmy': None,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': 'TMY',
+            'description': 'Typical Meteorological Year for a single meteorological variable using ISO 15927-4 or other methods',
+            'label': None,
+            'title': 'TMY (Single)',
+            'supertitle': 'Typical Meteorological Variable',
+            'shortname': 'TMY x1',
+            'name': 'Typical Meteorological Variable Year',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_AtmosphericRefraction():
+    return create_data_model(
+        data_model_name='AtmosphericRefraction',
+        annotations={
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'symbol': '⦧',
+            'value': None,
+            'unit': None,
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_LinkeTurbidityFactor():
+    return create_data_model(
+        data_model_name='LinkeTurbidityFactor',
+        annotations={
+            'name': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'minimum': Optional[TYPE_MAPPING['float']],
+            'maximum': Optional[TYPE_MAPPING['float']],
+        },
+        default_values={
+            'name': None,
+            'title': 'Linke Turbidity',
+            'description': 'The Linke Turbidity Factor describes the attenuation of the extraterrestrial solar radiation by solid and liquid particles under cloudless sky conditions. It indicates the optical density of hazy and humid atmosphere in relation to a clean and dry atmosphere. In other words TLK is the number of clean dry air masses that would result in the same extinction then real hazy and humid air. Due to a dynamic nature of the turbidity factor, its calculation and subsequent averaging leads to a certain degree of generalisation. There are clear seasonal changes of the turbidity (lowest values in winter, highest in summer), the values of turbidity factor always differ from place to place in a similar degree of magnitude and these differences are also correlated with the terrain elevation. It increases with an intensity of industrialisation and urbanisation. The values of Linke turbidity for different landscapes or world regions can be found in literature [e.g. 16, 19, 30] or in http://www.soda-is.com/ [20]).',
+            'symbol': '⋅',
+            'value': 2,
+            'unit': 'unitless',
+            'minimum': 0,
+            'maximum': 8,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_OpticalAirMass():
+    return create_data_model(
+        data_model_name='OpticalAirMass',
+        annotations={
+            'name': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'references': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'name': 'Relative optical air mass',
+            'title': 'Optical Air Mass',
+            'description': 'The relative optical air mass',
+            'value': numpy.array([], dtype='float64'),
+            'unit': 'unitless',
+            'algorithm': None,
+            'equation': 'm = (p/p0)/(sin h0 ref + 0.50572 (h0 ref + 6.07995)-1.6364)',
+            'references': 'Kasten, F., Young, A.T., 1989, Revised optical air mass tables and approximation formula. Applied Optics, 28: 4735-4738.',
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_RayleighThickness():
+    return create_data_model(
+        data_model_name='RayleighThickness',
+        annotations={
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'value': numpy.array([], dtype='float64'),
+            'unit': 'unitless',
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SolarPosition():
+    return create_data_model(
+        data_model_name='SolarPosition',
+        annotations={
+            'value': Optional[Union[TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'value': None,
+            'unit': None,
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_EquationOfTime():
+    return create_data_model(
+        data_model_name='EquationOfTime',
+        annotations={
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'min_minutes': Optional[TYPE_MAPPING['float']],
+            'max_minutes': Optional[TYPE_MAPPING['float']],
+        },
+        default_values={
+            'value': numpy.array([], dtype='float64'),
+            'unit': 'minutes',
+            'min_minutes': -20,
+            'max_minutes': 20,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_TimeOffset():
+    return create_data_model(
+        data_model_name='TimeOffset',
+        annotations={
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'min_minutes': Optional[TYPE_MAPPING['float']],
+            'max_minutes': Optional[TYPE_MAPPING['float']],
+        },
+        default_values={
+            'value': numpy.array([], dtype='float64'),
+            'unit': 'minutes',
+            'min_minutes': -790,
+            'max_minutes': 790,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_TrueSolarTime():
+    return create_data_model(
+        data_model_name='TrueSolarTime',
+        annotations={
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'min_minutes': Optional[TYPE_MAPPING['float']],
+            'max_minutes': Optional[TYPE_MAPPING['float']],
+            'timing_algorithm': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'value': numpy.array([], dtype='float64'),
+            'unit': None,
+            'min_minutes': -1580,
+            'max_minutes': 1580,
+            'timing_algorithm': None,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SolarHourAngle():
+    return create_data_model(
+        data_model_name='SolarHourAngle',
+        annotations={
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '\U000f1a77',
+            'description': 'Solar hour angle data for a location and period in time',
+            'label': None,
+            'title': 'Hour Angle',
+            'supertitle': 'Solar Irradiance',
+            'shortname': 'Hour Angle',
+            'name': 'Solar Hour Angle',
+            'min_radians': -3.141592653589793,
+            'max_radians': 3.141592653589793,
+            'min_degrees': -180,
+            'max_degrees': 180,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_EventHourAngle():
+    return create_data_model(
+        data_model_name='EventHourAngle',
+        annotations={
+            'title': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'unit': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'title': None,
+            'value': numpy.array([], dtype='float64'),
+            'unit': None,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_EventType():
+    return create_data_model(
+        data_model_name='EventType',
+        annotations={
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': None,
+            'description': 'Solar event type for a location and a moment in time',
+            'label': None,
+            'title': 'Event',
+            'supertitle': 'Solar Irradiance',
+            'shortname': 'Event',
+            'name': 'Solar Event Type',
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_EventTime():
+    return create_data_model(
+        data_model_name='EventTime',
+        annotations={
+            'event_time': Optional[TYPE_MAPPING['array']],
+            'event_type': Optional[TYPE_MAPPING['array']],
+            'event': Optional[TYPE_MAPPING['SolarEvent']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'hour_angle': Optional[data_model('EventHourAngle')],
+            'equation_of_time': Optional[data_model('EquationOfTime')],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'event_time': numpy.array([], dtype='float64'),
+            'event_type': numpy.array([], dtype='float64'),
+            'event': None,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': None,
+            'description': 'Time of a solar event observed from a location',
+            'label': None,
+            'title': 'Event Time',
+            'supertitle': 'Solar Irradiance',
+            'shortname': 'Event Time',
+            'name': 'Solar Event Time',
+            'hour_angle': None,
+            'equation_of_time': None,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_HourAngleSunrise():
+    return create_data_model(
+        data_model_name='HourAngleSunrise',
+        annotations={
+            'value': Optional[Union[TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'value': None,
+            'unit': None,
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_FractionalYear():
+    return create_data_model(
+        data_model_name='FractionalYear',
+        annotations={
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+            'position_algorithm': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'solar_positioning_algorithm': None,
+            'min_degrees': 0,
+            'min_radians': 0,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': None,
+            'description': '[Description of the data model]',
+            'label': None,
+            'title': '[Data Model Title]',
+            'supertitle': 'Solar Irradiance',
+            'shortname': None,
+            'name': None,
+            'max_radians': 6.283185307179586,
+            'max_degrees': 360,
+            'position_algorithm': None,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SolarDeclination():
+    return create_data_model(
+        data_model_name='SolarDeclination',
+        annotations={
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '∢',
+            'description': "Solar declination is the angle between the rays of the Sun and the plane of the Earth's equator.",
+            'label': None,
+            'title': 'Solar Declination',
+            'supertitle': 'Solar Irradiance',
+            'shortname': 'Declination',
+            'name': 'Solar Declination',
+            'min_radians': -0.4094542425178697,
+            'max_radians': 0.4094542425178697,
+            'min_degrees': -23.46,
+            'max_degrees': 23.46,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SolarZenith():
+    return create_data_model(
+        data_model_name='SolarZenith',
+        annotations={
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'low_angle_threshold_radians': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+            'low_angle_threshold_degrees': Optional[TYPE_MAPPING['float']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'adjusted_for_atmospheric_refraction': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'min_degrees': 0,
+            'min_radians': 0,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⦭',
+            'description': 'Solar zenith angle data for a location and period in time',
+            'label': None,
+            'title': 'Solar Zenith',
+            'supertitle': 'Solar Irradiance',
+            'shortname': 'Zenith',
+            'name': 'Solar Zenith',
+            'max_radians': 3.1561926535897933,
+            'low_angle_threshold_radians': 1.5307963267948965,
+            'max_degrees': 180.83651838089102,
+            'low_angle_threshold_degrees': 87.70816881947671,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_UnrefractedSolarZenith():
+    return create_data_model(
+        data_model_name='UnrefractedSolarZenith',
+        annotations={
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['float']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'refracted_value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+        },
+        default_values={
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': 'radians',
+            'value': 1.5853349194640094,
+            'symbol': '⌮ ⦭',
+            'description': 'UnrefractedSolarZenith, optional The zenith of the sun, adjusted for atmospheric refraction. Defaults to 1.5853349194640094 radians, which corresponds to 90.833 degrees. This is the zenith at sunrise or sunset, adjusted for the approximate correction for atmospheric refraction at those times, and the size of the solar disk.',
+            'label': None,
+            'title': 'Unrefracted Solar Zenith',
+            'supertitle': 'Solar Irradiance',
+            'shortname': 'Unrefracted Zenith',
+            'name': 'Unrefracted Solar Zenith',
+            'refracted_value': numpy.array([], dtype='float64'),
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SolarAltitude():
+    return create_data_model(
+        data_model_name='SolarAltitude',
+        annotations={
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'refracted_value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'low_angle_threshold_radians': Optional[TYPE_MAPPING['float']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+            'low_angle_threshold_degrees': Optional[TYPE_MAPPING['float']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'adjusted_for_atmospheric_refraction': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': 'radians',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⦩',
+            'description': 'Solar altitude data for a location and period in time',
+            'label': None,
+            'title': 'Solar Altitude',
+            'supertitle': 'Solar Irradiance',
+            'shortname': 'Altitude',
+            'name': 'Solar Altitude',
+            'refracted_value': numpy.array([], dtype='float64'),
+            'min_radians': -1.5707963267948966,
+            'max_radians': 1.5707963267948966,
+            'low_angle_threshold_radians': 0.04,
+            'min_degrees': -90,
+            'max_degrees': 90,
+            'low_angle_threshold_degrees': 2.291831180523293,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_RefractedSolarAltitude():
+    return create_data_model(
+        data_model_name='RefractedSolarAltitude',
+        annotations={
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'refracted_value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+        },
+        default_values={
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': 'radians',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⦩',
+            'description': 'Solar altitude data for a location and period in time',
+            'label': None,
+            'title': 'Refracted Solar Altitude',
+            'supertitle': 'Solar Irradiance',
+            'shortname': 'Altitude',
+            'name': 'Refracted Solar Altitude',
+            'refracted_value': numpy.array([], dtype='float64'),
+            'min_radians': -1.5707963267948966,
+            'max_radians': 1.5707963267948966,
+            'min_degrees': -90,
+            'max_degrees': 90,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SolarAzimuth():
+    return create_data_model(
+        data_model_name='SolarAzimuth',
+        annotations={
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'min_degrees': Optional[TYPE_MAPPING['float']],
+            'min_radians': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'max_radians': Optional[TYPE_MAPPING['float']],
+            'max_degrees': Optional[TYPE_MAPPING['float']],
+            'definition': Optional[TYPE_MAPPING['str']],
+            'origin': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'min_degrees': 0,
+            'min_radians': 0,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '\U000f19a5',
+            'description': 'Solar azimuth angle data for a location and period in time',
+            'label': None,
+            'title': 'Solar Azimuth',
+            'supertitle': 'Solar Irradiance',
+            'shortname': 'Azimuth',
+            'name': 'Solar Azimuth',
+            'max_radians': 6.283185307179586,
+            'max_degrees': 360,
+            'definition': 'Solar azimuth angle',
+            'origin': '-',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_CompassSolarAzimuth():
+    return create_data_model(
+        data_model_name='CompassSolarAzimuth',
+        annotations={
+            'value': Optional[Union[TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'value': None,
+            'unit': None,
+        },
+        use_numpy_model=False,
+        defer_build=True,
+    )
+
+
+def _build_SolarIncidence():
+    return create_data_model(
+        data_model_name='SolarIncidence',
+        annotations={
+            'solar_azimuth_origin': Optional[TYPE_MAPPING['str']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'description_typical': Optional[TYPE_MAPPING['str']],
+            'description_complementary': Optional[TYPE_MAPPING['str']],
+            'sun_horizon_position': Optional[TYPE_MAPPING['array']],
+            'definition': Optional[TYPE_MAPPING['str']],
+            'definition_typical': Optional[TYPE_MAPPING['str']],
+            'definition_complementary': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'solar_azimuth_origin': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': 'radians',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⭸',
+            'description': "The 'typical' solar incidence angle",
+            'label': 'Solar incidence angle',
+            'title': 'Solar Incidence',
+            'supertitle': 'Solar Incidence Angle',
+            'shortname': 'Incidence',
+            'name': 'Solar Incidence',
+            'description_typical': "The 'typical' definition of the solar incidence is the angle between the position of the sun (sun-vector) and the normal to the surface (surface-normal). An alternative definition measures the complementary angle between the sun (sun-vector) and the inclination of the surface (surface-plane) in question.",
+            'description_complementary': "The 'complementary' definition of the incidence incidence is the angle between the position of the sun in the sky (sun-vector) and the inclination of the surface (surface-plane) in question.",
+            'sun_horizon_position': numpy.array([], dtype='float64'),
+            'definition': 'Typical',
+            'definition_typical': 'Sun-Vector-to-Surface-Normal',
+            'definition_complementary': 'Sun-Vector-to-Surface-Plane',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SunHorizonPosition():
+    return create_data_model(
+        data_model_name='SunHorizonPosition',
+        annotations={
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⛰',
+            'description': 'Sun-to-Horizon positions relative to a location on the surface of the earth and a period or moment in time',
+            'label': None,
+            'title': 'Sun-to-Horizon',
+            'supertitle': 'Solar Irradiance',
+            'shortname': 'Sun-Horizon',
+            'name': 'Sun-to-Horizon',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SolarPositionOverview():
+    return create_data_model(
+        data_model_name='SolarPositionOverview',
+        annotations={
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'references': Optional[TYPE_MAPPING['str']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'horizon_height': Optional[data_model('HorizonHeight')],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'sun_horizon_positions': Optional[TYPE_MAPPING['set']],
+            'sun_horizon_position': Optional[TYPE_MAPPING['array']],
+            'optimal': Optional[TYPE_MAPPING['bool']],
+            'optimiser': Optional[TYPE_MAPPING['str']],
+            'optimization_mode': Optional[TYPE_MAPPING['str']],
+            'success': Optional[TYPE_MAPPING['bool']],
+            'surface_tilt_threshold': Optional[TYPE_MAPPING['float']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'event_time': Optional[TYPE_MAPPING['array']],
+            'event_type': Optional[TYPE_MAPPING['array']],
+            'event': Optional[TYPE_MAPPING['SolarEvent']],
+            'solar_incidence_definition': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_model': Optional[TYPE_MAPPING['str']],
+            'solar_incidence': Optional[TYPE_MAPPING['SolarIncidence']],
+            'solar_azimuth_origin': Optional[TYPE_MAPPING['str']],
+            'azimuth_difference': Optional[TYPE_MAPPING['array']],
+            'solar_azimuth': Optional[TYPE_MAPPING['SolarAzimuth']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'solar_zenith': Optional[TYPE_MAPPING['SolarZenith']],
+            'solar_hour_angle': Optional[TYPE_MAPPING['SolarHourAngle']],
+            'solar_declination': Optional[TYPE_MAPPING['SolarDeclination']],
+            'unrefracted_solar_zenith': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'fingerprint': False,
+            'references': None,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'angle_output_units': None,
+            'adjusted_for_atmospheric_refraction': None,
+            'horizon_height': None,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'sun_horizon_positions': 'all',
+            'sun_horizon_position': numpy.array([], dtype='float64'),
+            'optimal': False,
+            'optimiser': None,
+            'optimization_mode': None,
+            'success': None,
+            'surface_tilt_threshold': 0.0001,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'elevation': 0,
+            'location': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'event_time': numpy.array([], dtype='float64'),
+            'event_type': numpy.array([], dtype='float64'),
+            'event': None,
+            'solar_incidence_definition': None,
+            'solar_incidence_model': None,
+            'solar_incidence': None,
+            'solar_azimuth_origin': None,
+            'azimuth_difference': numpy.array([], dtype='float64'),
+            'solar_azimuth': None,
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'solar_zenith': None,
+            'solar_hour_angle': None,
+            'solar_declination': None,
+            'unrefracted_solar_zenith': None,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': None,
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '☀',
+            'description': 'Solar position overview providing comprehensive solar geometry parameters \nfor a time series at a given geographic location and surface orientation.\n',
+            'label': 'Solar Position Overview',
+            'title': 'Solar Position Overview',
+            'supertitle': 'Solar Irradiance',
+            'shortname': 'Position Overview',
+            'name': 'Solar Position Overview Data',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SolarIrradianceSpectrum():
+    return create_data_model(
+        data_model_name='SolarIrradianceSpectrum',
+        annotations={
+            'value': Optional[TYPE_MAPPING['array']],
+            'wavelengths': Optional[TYPE_MAPPING['array']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'reference_plane': Optional[TYPE_MAPPING['str']],
+            'tilt_angle': Optional[TYPE_MAPPING['float']],
+            'azimuth_angle': Optional[TYPE_MAPPING['float']],
+        },
+        default_values={
+            'value': numpy.array([], dtype='float64'),
+            'unit': 'W/m^2/nm',
+            'symbol': None,
+            'description': 'A solar spectrum used in photovoltaic system analysis, such as the AM1.5G reference spectrum from IEC 60904-3.',
+            'data_source': 'IEC 60904-3 ed.4',
+            'reference_plane': 'Global Tilt',
+            'tilt_angle': 37.0,
+            'azimuth_angle': 180.0,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SpectralResponsivity():
+    return create_data_model(
+        data_model_name='SpectralResponsivity',
+        annotations={
+            'value': Optional[TYPE_MAPPING['array']],
+            'wavelengths': Optional[TYPE_MAPPING['array']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'value': numpy.array([], dtype='float64'),
+            'unit': 'A/W',
+            'symbol': None,
+            'description': 'Spectral responsivity of a photovoltaic device expressed in units A/W (amperes per watt) is the electrical current (in amperes) per unit of incident optical power (in watts) at specific wavelengths',
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_SpectralFactorSeries():
+    return create_data_model(
+        data_model_name='SpectralFactorSeries',
+        annotations={
+            'value': Optional[Union[TYPE_MAPPING['array'], TYPE_MAPPING['float']]],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'spectral_factor_algorithm': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'value': numpy.array([], dtype='float64'),
+            'unit': 'unitless',
+            'symbol': None,
+            'description': "The spectral effect in photovoltaic (PV) systems refers to how the wavelength composition of sunlight affects the efficiency of a PV cell, as different wavelengths are converted into electrical current with varying efficiencies depending on the cell's spectral response. This effect is quantified by integrating the product of the spectral response and the light intensity over relevant wavelengths, impacting the cell's short-circuit current and overall power output.",
+            'data_source': None,
+            'spectral_factor_algorithm': None,
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_IrradianceSeries():
+    return create_data_model(
+        data_model_name='IrradianceSeries',
+        annotations={
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⸾',
+            'description': 'A solar irradiance component such as global, direct, diffuse sky-reflected, diffuse ground-reflected or extraterrestrial and any of normal, horizontal or inclined, is a solar power component received per unit area at a given moment, expressed in watts per square meter (W/m²). Except for the extraterrestrial and direct normal components, the values concern a specific location and a moment or period in time.',
+            'label': 'Solar Irradiance',
+            'title': '[Data Model Title]',
+            'supertitle': 'Solar Irradiance',
+            'shortname': None,
+            'name': 'Irradiance Data',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_ExtraterrestrialNormalIrradiance():
+    return create_data_model(
+        data_model_name='ExtraterrestrialNormalIrradiance',
+        annotations={
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'day_of_year': Optional[TYPE_MAPPING['array']],
+            'day_angle': Optional[TYPE_MAPPING['array']],
+            'distance_correction_factor': Optional[TYPE_MAPPING['array']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': None,
+            'equation': 'Extraterrestrial Normal Irradiance = Solar Constant * Eccentricity Correction Factor',
+            'algorithm': 'The beam irradiance (solar energy) outside the atmosphere and at mean solar distance, is roughly constant at is 1367 W.m-2. However, the orbit of the earth around the sun is lightly eccentric hence its distance to the sun varies slightly across the year.  In order to take into account the varying solar distance, the calculation of the extraterrestrial irradiance normal to the solar beam, considers an "eccentricity correction factor" ε.',
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⍖ ⦜',
+            'description': 'Extraterrestrial irradiance',
+            'label': '⍖ ⦜ Extraterrestrial Normal Irradiance',
+            'title': 'Extraterrestrial Normal Irradiance',
+            'supertitle': 'Simulated Extraterrestrial Normal Irradiance Series',
+            'shortname': 'Extra',
+            'name': 'Extraterrestrial Normal Irradiance',
+            'day_of_year': numpy.array([], dtype='float64'),
+            'day_angle': numpy.array([], dtype='float64'),
+            'distance_correction_factor': numpy.array([], dtype='float64'),
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_ExtraterrestrialHorizontalIrradiance():
+    return create_data_model(
+        data_model_name='ExtraterrestrialHorizontalIrradiance',
+        annotations={
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'normal': Optional[data_model('ExtraterrestrialNormalIrradiance')],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': None,
+            'equation': 'G0 horizontal = G0 normal ⋅ sin(solar altitude)',
+            'algorithm': None,
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⍖ ⭳',
+            'description': 'Extraterrestrial irradiance',
+            'label': '⍖ ⭳ Extraterrestrial Horizontal Irradiance',
+            'title': 'Extraterrestrial Horizontal',
+            'supertitle': 'Extraterrestrial Horizontal Irradiance Series',
+            'shortname': 'Extra',
+            'name': 'Extraterrestrial Horizontal Irradiance Data',
+            'normal': None,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_DirectNormalIrradiance():
+    return create_data_model(
+        data_model_name='DirectNormalIrradiance',
+        annotations={
+            'optical_air_mass': Optional[data_model('OpticalAirMass')],
+            'rayleigh_optical_thickness': Optional[data_model('RayleighThickness')],
+            'linke_turbidity_factor_adjusted': Optional[data_model('LinkeTurbidityFactor')],
+            'linke_turbidity_factor': Optional[data_model('LinkeTurbidityFactor')],
+            'extraterrestrial_normal_irradiance': Optional[data_model('ExtraterrestrialNormalIrradiance')],
+            'direct_horizontal_irradiance': Optional[TYPE_MAPPING['array']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'optical_air_mass': None,
+            'rayleigh_optical_thickness': None,
+            'linke_turbidity_factor_adjusted': None,
+            'linke_turbidity_factor': 2,
+            'extraterrestrial_normal_irradiance': None,
+            'direct_horizontal_irradiance': numpy.array([], dtype='float64'),
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': '[Source of the direct normal irradiance data]',
+            'equation': 'B0c = G0 exp {-0.8662 TLK m δR(m)}',
+            'algorithm': 'The direct (beam) irradiance normal to the solar beam B0c [W.m-2], attenuated by the cloudless atmosphere, is calculated as follows: B0c = G0 exp {-0.8662 TLK m δR(m)}.',
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⇣ ⦜',
+            'description': 'Direct Normal Irradiance data model',
+            'label': '⇣ ⦜ Simulated Direct Normal Irradiance',
+            'title': 'Normal Irradiance',
+            'supertitle': 'Direct Normal Irradiance',
+            'shortname': 'Normal',
+            'name': 'Direct Normal Irradiance Data',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_DirectNormalFromHorizontalIrradiance():
+    return create_data_model(
+        data_model_name='DirectNormalFromHorizontalIrradiance',
+        annotations={
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'adjust_for_atmospheric_refraction': Optional[Union[TYPE_MAPPING['bool'], TYPE_MAPPING['None']]],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'direct_horizontal_irradiance': Optional[TYPE_MAPPING['array']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'angle_output_units': None,
+            'adjust_for_atmospheric_refraction': False,
+            'solar_altitude': None,
+            'solar_positioning_algorithm': None,
+            'direct_horizontal_irradiance': numpy.array([], dtype='float64'),
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': '[Source of the direct normal from horizontal irradiance data]',
+            'equation': None,
+            'algorithm': None,
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⦜',
+            'description': 'Direct Normal from Horizontal Irradiance data model',
+            'label': '⇣ ⦜ Direct Normal Irradiance from external Horizontal data',
+            'title': 'Normal Irradiance',
+            'supertitle': 'Direct Normal Irradiance',
+            'shortname': 'Normal',
+            'name': 'Direct Normal from Horizontal Irradiance Data',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_DirectHorizontalIrradiance():
+    return create_data_model(
+        data_model_name='DirectHorizontalIrradiance',
+        annotations={
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'references': Optional[TYPE_MAPPING['str']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'rayleigh_optical_thickness': Optional[data_model('RayleighThickness')],
+            'optical_air_mass': Optional[data_model('OpticalAirMass')],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'direct_normal_irradiance': Optional[data_model('DirectNormalIrradiance')],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'elevation': 0,
+            'references': "Scharmer, K., Greif, J., eds., 2000, The European solar radiation atlas. Vol. 2: Database and exploitation software. Paris (Les Presses de l'École des Mines).",
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'rayleigh_optical_thickness': None,
+            'optical_air_mass': None,
+            'adjusted_for_atmospheric_refraction': None,
+            'direct_normal_irradiance': None,
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': '[Source of the direct horizontal solar radiation data]',
+            'equation': 'Direct Horizontal = Direct Normal * Solar Altitude',
+            'algorithm': 'The direct (beam) irradiance on a horizontal surface is calculated as Direct horizontal irradiance = Direct normal irradiance * sin (solar altitude).',
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⇣ ⭳',
+            'description': 'Direct horizontal irradiance',
+            'label': '⇣ ⭳ Simulated Direct Horizontal Irradiance',
+            'title': 'Direct Horizontal Irradiance',
+            'supertitle': 'Clear-Sky Direct Horizontal Irradiance',
+            'shortname': 'Direct Horizontal',
+            'name': 'Direct Horizontal Irradiance Data',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_DirectHorizontalIrradianceFromExternalData():
+    return create_data_model(
+        data_model_name='DirectHorizontalIrradianceFromExternalData',
+        annotations={
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'references': Optional[TYPE_MAPPING['str']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'rayleigh_optical_thickness': Optional[data_model('RayleighThickness')],
+            'optical_air_mass': Optional[data_model('OpticalAirMass')],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'direct_normal_irradiance': Optional[data_model('DirectNormalIrradiance')],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'angle_output_units': None,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'references': "Scharmer, K., Greif, J., eds., 2000, The European solar radiation atlas. Vol. 2: Database and exploitation software. Paris (Les Presses de l'École des Mines).",
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'rayleigh_optical_thickness': None,
+            'optical_air_mass': None,
+            'adjusted_for_atmospheric_refraction': None,
+            'direct_normal_irradiance': None,
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': '[Source of the direct horizontal solar radiation data]',
+            'equation': None,
+            'algorithm': None,
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⇣ ⭳',
+            'description': 'Direct horizontal irradiance',
+            'label': '⇣ ⭳ Direct Horizontal Irradiance from external data',
+            'title': 'Direct Horizontal Irradiance',
+            'supertitle': 'Direct Horizontal Irradiance Series',
+            'shortname': 'Direct Horizontal',
+            'name': 'Direct Horizontal Irradiance Data',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_DirectInclinedIrradiance():
+    return create_data_model(
+        data_model_name='DirectInclinedIrradiance',
+        annotations={
+            'linke_turbidity_factor': Optional[data_model('LinkeTurbidityFactor')],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradiance')],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'solar_incidence_definition': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_model': Optional[TYPE_MAPPING['str']],
+            'solar_incidence': Optional[TYPE_MAPPING['SolarIncidence']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'value_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'reflected': Optional[TYPE_MAPPING['array']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'adjust_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'linke_turbidity_factor': 2,
+            'direct_horizontal_irradiance': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'angle_output_units': None,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'elevation': 0,
+            'solar_incidence_definition': None,
+            'solar_incidence_model': None,
+            'solar_incidence': None,
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'value_before_reflectivity': numpy.array([], dtype='float64'),
+            'reflectivity_factor': numpy.array([], dtype='float64'),
+            'reflected_percentage': numpy.array([], dtype='float64'),
+            'reflected': numpy.array([], dtype='float64'),
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': ['Source of the direct inclined solar radiation data'],
+            'equation': 'Bic = Bhc sin δexp/sin h0',
+            'algorithm': 'The direct (beam) irradiance on an inclined surface is calculated as Direct inclined irradiance = Direct horizontal irradiance * sin( solar incidence) where solar incidence is the angle between the sun and an inclined surface.',
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⇣ ∡',
+            'description': 'Direct inclined irradiance',
+            'label': '⇣ ∡ Simulated Direct Inclined Irradiance',
+            'title': 'Direct Inclined Irradiance',
+            'supertitle': 'Direct Inclined Irradiance',
+            'shortname': 'Direct Inclined',
+            'name': 'Direct Inclined Irradiance Data',
+            'adjust_for_atmospheric_refraction': False,
+            'adjusted_for_atmospheric_refraction': True,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_DirectInclinedIrradianceFromExternalData():
+    return create_data_model(
+        data_model_name='DirectInclinedIrradianceFromExternalData',
+        annotations={
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradianceFromExternalData')],
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'solar_incidence_definition': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_model': Optional[TYPE_MAPPING['str']],
+            'solar_incidence': Optional[TYPE_MAPPING['SolarIncidence']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'value_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'reflected': Optional[TYPE_MAPPING['array']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'adjust_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'unrefracted_solar_zenith': Optional[TYPE_MAPPING['array']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'direct_horizontal_irradiance': None,
+            'angle_output_units': None,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'elevation': 0,
+            'solar_incidence_definition': None,
+            'solar_incidence_model': None,
+            'solar_incidence': None,
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'value_before_reflectivity': numpy.array([], dtype='float64'),
+            'reflectivity_factor': numpy.array([], dtype='float64'),
+            'reflected_percentage': numpy.array([], dtype='float64'),
+            'reflected': numpy.array([], dtype='float64'),
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⇣ ∡',
+            'description': 'Direct inclined irradiance from external data',
+            'label': '⇣ ∡ Direct Inclined Irradiance',
+            'title': 'Direct Inclined Irradiance',
+            'supertitle': 'Direct Inclined Irradiance',
+            'shortname': 'Direct Inclined',
+            'name': 'Direct Inclined Irradiance Data from external data',
+            'adjust_for_atmospheric_refraction': False,
+            'adjusted_for_atmospheric_refraction': True,
+            'unrefracted_solar_zenith': numpy.array([], dtype='float64'),
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_DiffuseSkyReflectedHorizontalIrradiance():
+    return create_data_model(
+        data_model_name='DiffuseSkyReflectedHorizontalIrradiance',
+        annotations={
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'linke_turbidity_factor': Optional[data_model('LinkeTurbidityFactor')],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'adjust_for_atmospheric_refraction': Optional[Union[TYPE_MAPPING['bool'], TYPE_MAPPING['None']]],
+            'solar_incidence_definition': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_model': Optional[TYPE_MAPPING['str']],
+            'solar_incidence': Optional[TYPE_MAPPING['SolarIncidence']],
+            'azimuth_difference': Optional[TYPE_MAPPING['array']],
+            'solar_azimuth': Optional[TYPE_MAPPING['SolarAzimuth']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'extraterrestrial_normal_irradiance': Optional[data_model('ExtraterrestrialNormalIrradiance')],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradiance')],
+            'global_horizontal_irradiance': Optional[TYPE_MAPPING['array']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'angle_output_units': None,
+            'linke_turbidity_factor': 2,
+            'adjusted_for_atmospheric_refraction': None,
+            'adjust_for_atmospheric_refraction': False,
+            'solar_incidence_definition': None,
+            'solar_incidence_model': None,
+            'solar_incidence': None,
+            'azimuth_difference': numpy.array([], dtype='float64'),
+            'solar_azimuth': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'location': None,
+            'extraterrestrial_normal_irradiance': None,
+            'direct_horizontal_irradiance': None,
+            'global_horizontal_irradiance': numpy.array([], dtype='float64'),
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': 'PVGIS',
+            'equation': 'Dₕc = G₀ ⋅ Tₙ(Tₗₖ) ⋅ F_d(h₀)',
+            'algorithm': 'The estimate of the clear-sky diffuse sky-reflected horizontal irradiance is the product of the normal extraterrestrial irradiance G0, a diffuse transmission function Tn dependent only on the Linke turbidity factor TLK, and a diffuse solar altitude function Fd dependent only on the solar altitude.',
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '🗤⭳',
+            'description': 'Clear-sky diffuse sky-reflected horizontal irradiance is a solar power component received per unit area at a given moment, expressed in watts per square meter (W/m²). The values concern a specific location and a moment or period in time.',
+            'label': '🗤⭳ Clear-Sky Diffuse Sky-Reflected Horizontal Irradiance',
+            'title': 'Sky-Diffuse Horizontal',
+            'supertitle': 'Sky-Diffuse Horizontal Irradiance',
+            'shortname': 'Clear-Sky-Diffuse Horizontal',
+            'name': 'Clear-Sky Diffuse Sky-Reflected Horizontal Irradiance Data',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_DiffuseSkyReflectedHorizontalIrradianceFromExternalData():
+    return create_data_model(
+        data_model_name='DiffuseSkyReflectedHorizontalIrradianceFromExternalData',
+        annotations={
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'direct_horizontal_irradiance': Optional[TYPE_MAPPING['array']],
+            'global_horizontal_irradiance': Optional[TYPE_MAPPING['array']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'location': None,
+            'direct_horizontal_irradiance': numpy.array([], dtype='float64'),
+            'global_horizontal_irradiance': numpy.array([], dtype='float64'),
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': 'External global and direct horizontal irradiance data',
+            'equation': 'Diffuse 🗤 ⭳ = Global ⤋ ⭳ - Direct ⇣ ⭳',
+            'algorithm': None,
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '🗤 ⭳',
+            'description': 'Diffuse sky-reflected horizontal irradiance is a solar power component received per unit area at a given moment, expressed in watts per square meter (W/m²). The values concern a specific location and a moment or period in time.',
+            'label': '🗤 ⭳ Sky-Diffuse Horizontal Irradiance',
+            'title': 'Sky-Diffuse',
+            'supertitle': 'Sky-Diffuse Horizontal Irradiance Series',
+            'shortname': 'Sky-Diffuse',
+            'name': 'Sky-Diffuse Horizontal Irradiance Data',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_DiffuseSkyReflectedInclinedIrradiance():
+    return create_data_model(
+        data_model_name='DiffuseSkyReflectedInclinedIrradiance',
+        annotations={
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'extraterrestrial_normal_irradiance': Optional[data_model('ExtraterrestrialNormalIrradiance')],
+            'extraterrestrial_horizontal_irradiance': Optional[data_model('ExtraterrestrialHorizontalIrradiance')],
+            'diffuse_sky_irradiance': Optional[TYPE_MAPPING['array']],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradiance')],
+            'global_horizontal_irradiance': Optional[TYPE_MAPPING['array']],
+            'reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'reflected': Optional[TYPE_MAPPING['array']],
+            'reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'reflectivity_coefficient': Optional[TYPE_MAPPING['float']],
+            'value_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'term_n': Optional[TYPE_MAPPING['array']],
+            'kb_ratio': Optional[TYPE_MAPPING['array']],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_definition': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_model': Optional[TYPE_MAPPING['str']],
+            'solar_incidence': Optional[TYPE_MAPPING['SolarIncidence']],
+            'surface_tilt_threshold': Optional[TYPE_MAPPING['float']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'azimuth_difference': Optional[TYPE_MAPPING['array']],
+            'solar_azimuth_origin': Optional[TYPE_MAPPING['str']],
+            'solar_azimuth': Optional[TYPE_MAPPING['SolarAzimuth']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'diffuse_horizontal_irradiance': Optional[data_model('DiffuseSkyReflectedHorizontalIrradiance')],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'angle_output_units': None,
+            'elevation': 0,
+            'extraterrestrial_normal_irradiance': None,
+            'extraterrestrial_horizontal_irradiance': None,
+            'diffuse_sky_irradiance': numpy.array([], dtype='float64'),
+            'direct_horizontal_irradiance': None,
+            'global_horizontal_irradiance': numpy.array([], dtype='float64'),
+            'reflected_percentage': numpy.array([], dtype='float64'),
+            'reflected': numpy.array([], dtype='float64'),
+            'reflectivity_factor': numpy.array([], dtype='float64'),
+            'reflectivity_coefficient': None,
+            'value_before_reflectivity': numpy.array([], dtype='float64'),
+            'term_n': numpy.array([], dtype='float64'),
+            'kb_ratio': numpy.array([], dtype='float64'),
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'solar_incidence_definition': None,
+            'solar_incidence_model': None,
+            'solar_incidence': None,
+            'surface_tilt_threshold': 0.0001,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'azimuth_difference': numpy.array([], dtype='float64'),
+            'solar_azimuth_origin': None,
+            'solar_azimuth': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': None,
+            'equation': 'Diffuse 🗤 ∡ = Diffuse 🗤 ⭳ * F{Diffuse sky irradiance, ground-view fraction, Kₑ, solar_incidence, solar_altitude, ...}',
+            'algorithm': 'The diffuse inclined irradiance equals to : 1. for sunlit surfaces and non-overcast sky: a) if solar_altitude >= 5.7° then : Diffuse horizontal * {Diffuse sky irradiance(ground view fraction) * (1 - Kₑ) + Kₑ * sin(solar_incidence) / sin(solar_altitude)}, b) if solar_altitude < 5.7° then : Diffuse horizontal * {Diffuse sky irradiance(ground view fraction) * (1 - Kₑ) + Kₑ * sin(ground-view fraction) * cos(ALN)/(0.1 - 0.008 * solar_altitude)}. 2) for surfaces in shade (solar_incidence < 0 and solar_altitude >= 0) : Diffuse horizontal * Diffuse sky irradiance(ground-view fraction).',
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '🗤∡',
+            'description': 'Diffuse sky-reflected inclined irradiance is a solar power component received per unit area at a given moment, expressed in watts per square meter (W/m²). The values concern a specific location and a moment or period in time.',
+            'label': '🗤 ∡ Clear-Sky-Diffuse Inclined Irradiance',
+            'title': 'Clear-Sky-Diffuse Inclined',
+            'supertitle': 'Clear-Sky-Diffuse Horizontal Irradiance Series',
+            'shortname': 'Sky-Diffuse',
+            'name': 'Diffuse Sky-Reflected Inclined Irradiance Data',
+            'diffuse_horizontal_irradiance': None,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_DiffuseSkyReflectedInclinedIrradianceFromExternalData():
+    return create_data_model(
+        data_model_name='DiffuseSkyReflectedInclinedIrradianceFromExternalData',
+        annotations={
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'diffuse_horizontal_irradiance': Optional[data_model('DiffuseSkyReflectedHorizontalIrradianceFromExternalData')],
+            'extraterrestrial_normal_irradiance': Optional[data_model('ExtraterrestrialNormalIrradiance')],
+            'extraterrestrial_horizontal_irradiance': Optional[data_model('ExtraterrestrialHorizontalIrradiance')],
+            'diffuse_sky_irradiance': Optional[TYPE_MAPPING['array']],
+            'direct_horizontal_irradiance': Optional[TYPE_MAPPING['array']],
+            'global_horizontal_irradiance': Optional[TYPE_MAPPING['array']],
+            'reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'reflected': Optional[TYPE_MAPPING['array']],
+            'reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'reflectivity_coefficient': Optional[TYPE_MAPPING['float']],
+            'value_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'term_n': Optional[TYPE_MAPPING['array']],
+            'kb_ratio': Optional[TYPE_MAPPING['array']],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_definition': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_model': Optional[TYPE_MAPPING['str']],
+            'solar_incidence': Optional[TYPE_MAPPING['SolarIncidence']],
+            'surface_tilt_threshold': Optional[TYPE_MAPPING['float']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'azimuth_difference': Optional[TYPE_MAPPING['array']],
+            'solar_azimuth_origin': Optional[TYPE_MAPPING['str']],
+            'solar_azimuth': Optional[TYPE_MAPPING['SolarAzimuth']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'location': None,
+            'diffuse_horizontal_irradiance': None,
+            'extraterrestrial_normal_irradiance': None,
+            'extraterrestrial_horizontal_irradiance': None,
+            'diffuse_sky_irradiance': numpy.array([], dtype='float64'),
+            'direct_horizontal_irradiance': numpy.array([], dtype='float64'),
+            'global_horizontal_irradiance': numpy.array([], dtype='float64'),
+            'reflected_percentage': numpy.array([], dtype='float64'),
+            'reflected': numpy.array([], dtype='float64'),
+            'reflectivity_factor': numpy.array([], dtype='float64'),
+            'reflectivity_coefficient': None,
+            'value_before_reflectivity': numpy.array([], dtype='float64'),
+            'term_n': numpy.array([], dtype='float64'),
+            'kb_ratio': numpy.array([], dtype='float64'),
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'solar_incidence_definition': None,
+            'solar_incidence_model': None,
+            'solar_incidence': None,
+            'surface_tilt_threshold': 0.0001,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'azimuth_difference': numpy.array([], dtype='float64'),
+            'solar_azimuth_origin': None,
+            'solar_azimuth': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': 'External global and direct horizontal irradiance data',
+            'equation': 'Diffuse 🗤 ∡ = Diffuse 🗤 ⭳ * F{Diffuse sky irradiance, ground-view fraction, Kₑ, solar_incidence, solar_altitude, ...}',
+            'algorithm': 'The diffuse inclined irradiance equals to : 1. for sunlit surfaces and non-overcast sky: a) if solar_altitude >= 5.7° then : Diffuse horizontal * {Diffuse sky irradiance(ground view fraction) * (1 - Kₑ) + Kₑ * sin(solar_incidence) / sin(solar_altitude)}, b) if solar_altitude < 5.7° then : Diffuse horizontal * {Diffuse sky irradiance(ground view fraction) * (1 - Kₑ) + Kₑ * sin(ground-view fraction) * cos(ALN)/(0.1 - 0.008 * solar_altitude)}. 2) for surfaces in shade (solar_incidence < 0 and solar_altitude >= 0) : Diffuse horizontal * Diffuse sky irradiance(ground-view fraction).',
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '🗤∡',
+            'description': 'Diffuse sky-reflected inclined irradiance is a solar power component received per unit area at a given moment, expressed in watts per square meter (W/m²). The values are calculated from external data and concern a specific location and a moment or period in time.',
+            'label': '🗤 ∡ Sky-Diffuse Inclined Irradiance from external data',
+            'title': 'Sky-Diffuse Inclined Irradiance from external data',
+            'supertitle': 'Sky-Diffuse Horizontal Irradiance Series',
+            'shortname': 'Sky-Diffuse',
+            'name': 'Diffuse Sky-Reflected Inclined Irradiance from external data',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_GlobalHorizontalIrradiance():
+    return create_data_model(
+        data_model_name='GlobalHorizontalIrradiance',
+        annotations={
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'linke_turbidity_factor': Optional[data_model('LinkeTurbidityFactor')],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'extraterrestrial_normal_irradiance': Optional[data_model('ExtraterrestrialNormalIrradiance')],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradiance')],
+            'diffuse_horizontal_irradiance': Optional[data_model('DiffuseSkyReflectedHorizontalIrradiance')],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'angle_output_units': None,
+            'linke_turbidity_factor': 2,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'elevation': 0,
+            'location': None,
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': 'PVGIS',
+            'equation': 'Direct ⇣⭳ + Diffuse 🗤⭳',
+            'algorithm': None,
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⤋ ⭳',
+            'description': 'Global horizontal irradiance is a solar power component received per unit area at a given moment, expressed in watts per square meter (W/m²). The values concern a specific location and a moment or period in time.',
+            'label': '⤋ ⭳ Simulated Global Horizontal Irradiance',
+            'title': 'Global Horizontal Irradiance',
+            'supertitle': 'Global Horizontal Irradiance',
+            'shortname': 'Global Horizontal',
+            'name': 'Global Horizontal Irradiance Data',
+            'extraterrestrial_normal_irradiance': None,
+            'adjusted_for_atmospheric_refraction': True,
+            'direct_horizontal_irradiance': None,
+            'diffuse_horizontal_irradiance': None,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_ClearSkyDiffuseGroundReflectedInclinedIrradiance():
+    return create_data_model(
+        data_model_name='ClearSkyDiffuseGroundReflectedInclinedIrradiance',
+        annotations={
+            'timestamps': Optional[TYPE_MAPPING['DatetimeIndex']],
+            'diffuse_horizontal_irradiance': Optional[data_model('DiffuseSkyReflectedHorizontalIrradiance')],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradiance')],
+            'global_horizontal_irradiance': Optional[TYPE_MAPPING['array']],
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'reflected': Optional[TYPE_MAPPING['array']],
+            'reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'value_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'albedo': Optional[TYPE_MAPPING['float']],
+            'ground_view_fraction': Optional[TYPE_MAPPING['float']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'surface_tilt_threshold': Optional[TYPE_MAPPING['float']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'timestamps': None,
+            'diffuse_horizontal_irradiance': None,
+            'direct_horizontal_irradiance': None,
+            'global_horizontal_irradiance': numpy.array([], dtype='float64'),
+            'angle_output_units': None,
+            'reflected_percentage': numpy.array([], dtype='float64'),
+            'reflected': numpy.array([], dtype='float64'),
+            'reflectivity_factor': numpy.array([], dtype='float64'),
+            'value_before_reflectivity': numpy.array([], dtype='float64'),
+            'albedo': 0.2,
+            'ground_view_fraction': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'surface_tilt_threshold': 0.0001,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'elevation': 0,
+            'location': None,
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': None,
+            'equation': 'Global ⤋ ⭳ ∙ Ground-View % ∙ Albedo ⌰',
+            'algorithm': 'The clear-sky diffuse ground-reflected irradiance [⭞] on an inclined surface is simulated as a fraction of the global horizontal [⭳] irradiance modulated by the ground-view fraction and the albedo [⌰] of the terrain surrounding the surface. If the global horizontal irradiance is not retrieved from external data, it is simulated internally by estimating the direct and diffuse sky-reflected irradiance components.',
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⭞',
+            'description': 'Clear-sky ground-reflected irradiance time series',
+            'label': '⭞ ∡ Simulated Ground-Diffuse Inclined Irradiance',
+            'title': 'Ground-Diffuse Inclined Irradiance',
+            'supertitle': 'Ground-Diffuse Inclined Irradiance',
+            'shortname': 'Simulated Ground-Diffuse',
+            'name': 'Simulated Diffuse Ground-Reflected Irradiance Data',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_DiffuseGroundReflectedInclinedIrradiance():
+    return create_data_model(
+        data_model_name='DiffuseGroundReflectedInclinedIrradiance',
+        annotations={
+            'diffuse_horizontal_irradiance': Optional[data_model('DiffuseSkyReflectedHorizontalIrradiance')],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradiance')],
+            'global_horizontal_irradiance': Optional[TYPE_MAPPING['array']],
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'reflected': Optional[TYPE_MAPPING['array']],
+            'reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'value_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'albedo': Optional[TYPE_MAPPING['float']],
+            'ground_view_fraction': Optional[TYPE_MAPPING['float']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'surface_tilt_threshold': Optional[TYPE_MAPPING['float']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'diffuse_horizontal_irradiance': None,
+            'direct_horizontal_irradiance': None,
+            'global_horizontal_irradiance': numpy.array([], dtype='float64'),
+            'angle_output_units': None,
+            'reflected_percentage': numpy.array([], dtype='float64'),
+            'reflected': numpy.array([], dtype='float64'),
+            'reflectivity_factor': numpy.array([], dtype='float64'),
+            'value_before_reflectivity': numpy.array([], dtype='float64'),
+            'albedo': 0.2,
+            'ground_view_fraction': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'surface_tilt_threshold': 0.0001,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'elevation': 0,
+            'location': None,
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': None,
+            'equation': 'Global ⤋ ⭳ ∙ Ground-View % ∙ Albedo ⌰',
+            'algorithm': 'The calculation relies on an isotropic assumption. The ground-reflected clear-sky irradiance received on an inclined surface [W.m-2] is proportional to the global horizontal irradiance, to the mean ground albedo and a fraction of the ground viewed by an inclined surface.',
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⭞ ∡',
+            'description': 'Diffuse ground-reflected inclined irradiance data',
+            'label': '⭞ ∡ Ground-Diffuse Inclined Irradiance',
+            'title': 'Ground-Diffuse Inclined Irradiance',
+            'supertitle': 'Ground-Diffuse Inclined Irradiance',
+            'shortname': 'Ground-Diffuse',
+            'name': 'Diffuse Ground-Reflected Inclined Irradiance Data',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_GlobalInclinedIrradiance():
+    return create_data_model(
+        data_model_name='GlobalInclinedIrradiance',
+        annotations={
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'linke_turbidity_factor': Optional[data_model('LinkeTurbidityFactor')],
+            'horizon_height': Optional[data_model('HorizonHeight')],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_definition': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_model': Optional[TYPE_MAPPING['str']],
+            'solar_incidence': Optional[TYPE_MAPPING['SolarIncidence']],
+            'solar_azimuth_origin': Optional[TYPE_MAPPING['str']],
+            'solar_azimuth': Optional[TYPE_MAPPING['SolarAzimuth']],
+            'sun_horizon_positions': Optional[TYPE_MAPPING['set']],
+            'sun_horizon_position': Optional[TYPE_MAPPING['array']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'diffuse_horizontal_irradiance': Optional[data_model('DiffuseSkyReflectedHorizontalIrradiance')],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradiance')],
+            'extraterrestrial_normal_irradiance': Optional[data_model('ExtraterrestrialNormalIrradiance')],
+            'extraterrestrial_horizontal_irradiance': Optional[data_model('ExtraterrestrialHorizontalIrradiance')],
+            'ground_reflected_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'value_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflectivity_coefficient': Optional[TYPE_MAPPING['float']],
+            'diffuse_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'reflected': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'angle_output_units': None,
+            'linke_turbidity_factor': 2,
+            'horizon_height': None,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'solar_incidence_definition': None,
+            'solar_incidence_model': None,
+            'solar_incidence': None,
+            'solar_azimuth_origin': None,
+            'solar_azimuth': None,
+            'sun_horizon_positions': 'all',
+            'sun_horizon_position': numpy.array([], dtype='float64'),
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'elevation': 0,
+            'location': None,
+            'diffuse_horizontal_irradiance': None,
+            'direct_horizontal_irradiance': None,
+            'extraterrestrial_normal_irradiance': None,
+            'extraterrestrial_horizontal_irradiance': None,
+            'ground_reflected_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'diffuse_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'direct_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'value_before_reflectivity': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflectivity_coefficient': None,
+            'diffuse_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'direct_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'direct_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'reflected_percentage': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflected': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflected': numpy.array([], dtype='float64'),
+            'direct_inclined_reflected': numpy.array([], dtype='float64'),
+            'reflected': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_irradiance': numpy.array([], dtype='float64'),
+            'diffuse_inclined_irradiance': numpy.array([], dtype='float64'),
+            'direct_inclined_irradiance': numpy.array([], dtype='float64'),
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': 'Based on Simulated solar irradiance data',
+            'equation': 'Direct ⇣∡ + Sky-Diffuse 🗤∡ + Ground-Diffuse ⭞∡',
+            'algorithm': None,
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⤋ ∡',
+            'description': 'Global (also referred to as Shortwave) inclined irradiance is a solar power component received per unit area at a given moment, expressed in watts per square meter (W/m²). The values concern a specific location and a moment or period in time.',
+            'label': '⤋ ∡ Simulated Global Inclined Irradiance',
+            'title': 'Global Inclined Irradiance',
+            'supertitle': 'Global Inclined Irradiance',
+            'shortname': 'Global',
+            'name': 'Global Inclined Irradiance Data',
+            'adjusted_for_atmospheric_refraction': True,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_GlobalInclinedIrradianceFromExternalData():
+    return create_data_model(
+        data_model_name='GlobalInclinedIrradianceFromExternalData',
+        annotations={
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'linke_turbidity_factor': Optional[data_model('LinkeTurbidityFactor')],
+            'horizon_height': Optional[data_model('HorizonHeight')],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_definition': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_model': Optional[TYPE_MAPPING['str']],
+            'solar_incidence': Optional[TYPE_MAPPING['SolarIncidence']],
+            'solar_azimuth_origin': Optional[TYPE_MAPPING['str']],
+            'solar_azimuth': Optional[TYPE_MAPPING['SolarAzimuth']],
+            'sun_horizon_positions': Optional[TYPE_MAPPING['set']],
+            'sun_horizon_position': Optional[TYPE_MAPPING['array']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'diffuse_horizontal_irradiance': Optional[data_model('DiffuseSkyReflectedHorizontalIrradianceFromExternalData')],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradianceFromExternalData')],
+            'extraterrestrial_normal_irradiance': Optional[data_model('ExtraterrestrialNormalIrradiance')],
+            'extraterrestrial_horizontal_irradiance': Optional[data_model('ExtraterrestrialHorizontalIrradiance')],
+            'ground_reflected_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'value_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflectivity_coefficient': Optional[TYPE_MAPPING['float']],
+            'diffuse_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'reflected': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'angle_output_units': None,
+            'linke_turbidity_factor': 2,
+            'horizon_height': None,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'solar_incidence_definition': None,
+            'solar_incidence_model': None,
+            'solar_incidence': None,
+            'solar_azimuth_origin': None,
+            'solar_azimuth': None,
+            'sun_horizon_positions': 'all',
+            'sun_horizon_position': numpy.array([], dtype='float64'),
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'elevation': 0,
+            'location': None,
+            'diffuse_horizontal_irradiance': None,
+            'direct_horizontal_irradiance': None,
+            'extraterrestrial_normal_irradiance': None,
+            'extraterrestrial_horizontal_irradiance': None,
+            'ground_reflected_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'diffuse_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'direct_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'value_before_reflectivity': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflectivity_coefficient': None,
+            'diffuse_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'direct_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'direct_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'reflected_percentage': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflected': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflected': numpy.array([], dtype='float64'),
+            'direct_inclined_reflected': numpy.array([], dtype='float64'),
+            'reflected': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_irradiance': numpy.array([], dtype='float64'),
+            'diffuse_inclined_irradiance': numpy.array([], dtype='float64'),
+            'direct_inclined_irradiance': numpy.array([], dtype='float64'),
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': 'Based on external data solar irradiance data',
+            'equation': 'Direct ⇣∡ + Sky-Diffuse 🗤∡ + Ground-Diffuse ⭞∡',
+            'algorithm': None,
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⤋ ∡',
+            'description': 'Global (also referred to as Shortwave) inclined irradiance is a solar power component received per unit area at a given moment, expressed in watts per square meter (W/m²). The values concern a specific location and a moment or period in time based on external solar irradiance data.',
+            'label': '⤋ ∡ Global Inclined Irradiance from external data',
+            'title': 'Global Inclined Irradiance from external data',
+            'supertitle': 'Global Inclined Irradiance',
+            'shortname': 'Global',
+            'name': 'Global Inclined Irradiance Data',
+            'adjusted_for_atmospheric_refraction': True,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_InclinedIrradiance():
+    return create_data_model(
+        data_model_name='InclinedIrradiance',
+        annotations={
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'timestamps': Optional[TYPE_MAPPING['DatetimeIndex']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'surface_tilt_threshold': Optional[TYPE_MAPPING['float']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'diffuse_horizontal_irradiance': Optional[data_model('DiffuseSkyReflectedHorizontalIrradiance')],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradiance')],
+            'global_horizontal_irradiance': Optional[TYPE_MAPPING['array']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'angle_output_units': None,
+            'timestamps': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'surface_tilt_threshold': 0.0001,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'elevation': 0,
+            'location': None,
+            'diffuse_horizontal_irradiance': None,
+            'direct_horizontal_irradiance': None,
+            'global_horizontal_irradiance': numpy.array([], dtype='float64'),
+            'fingerprint': False,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'solar_constant': 1367.0,
+            'data_source': None,
+            'equation': None,
+            'algorithm': None,
+            'unit': 'W/m²',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⭞',
+            'description': 'Inclined irradiance time series',
+            'label': '⭞ ∡ Inclined Irradiance',
+            'title': 'Inclined Irradiance',
+            'supertitle': 'Inclined Irradiance',
+            'shortname': 'Inclined',
+            'name': 'Inclined Irradiance Data',
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_EffectiveIrradiance():
+    return create_data_model(
+        data_model_name='EffectiveIrradiance',
+        annotations={
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'spectral_factor_algorithm': Optional[TYPE_MAPPING['str']],
+            'spectral_effect_percentage': Optional[TYPE_MAPPING['array']],
+            'spectral_effect': Optional[TYPE_MAPPING['array']],
+            'spectral_factor': Optional[data_model('SpectralFactorSeries')],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+        },
+        default_values={
+            'data_source': None,
+            'fingerprint': False,
+            'spectral_factor_algorithm': None,
+            'spectral_effect_percentage': numpy.array([], dtype='float64'),
+            'spectral_effect': numpy.array([], dtype='float64'),
+            'spectral_factor': None,
+            'location': None,
+            'value': numpy.array([], dtype='float64'),
+            'title': 'Effective irradiance',
+            'unit': 'W/m^2',
+            'symbol': None,
+            'description': 'A solar irradiance component such as global, direct, diffuse, reflected or extraterrestrial and any of normal, horizontal or inclined, is a solar power component received per unit area at a given moment, expressed in watts per square meter (W/m²). Except for the extraterrestrial and direct normal components, the values concern a specicif location and a moment or period in time.',
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_PhotovoltaicEfficiencyFactor():
+    return create_data_model(
+        data_model_name='PhotovoltaicEfficiencyFactor',
+        annotations={
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'wind_speed': Optional[Union[data_model('WindSpeedSeries'), TYPE_MAPPING['xarray']]],
+            'temperature': Optional[Union[data_model('TemperatureSeries'), TYPE_MAPPING['xarray']]],
+            'temperature_adjusted_series': Optional[data_model('TemperatureSeries')],
+            'standard_test_temperature': Optional[TYPE_MAPPING['float']],
+            'temperature_model': Optional[TYPE_MAPPING['str']],
+            'spectral_factor_algorithm': Optional[TYPE_MAPPING['str']],
+            'spectral_factor': Optional[data_model('SpectralFactorSeries')],
+            'radiation_cutoff_threshold': Optional[TYPE_MAPPING['float']],
+            'photovoltaic_module_efficiency_coefficients': Optional[TYPE_MAPPING['list']],
+            'photovoltaic_module_type': Optional[TYPE_MAPPING['str']],
+            'power_model': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'dtype': Optional[TYPE_MAPPING['str']],
+            'array_backend': Optional[TYPE_MAPPING['str']],
+            'log_relative_irradiance': Optional[TYPE_MAPPING['array']],
+            'temperature_deviation': Optional[TYPE_MAPPING['array']],
+            'relative_irradiance': Optional[TYPE_MAPPING['array']],
+            'low_irradiance': Optional[TYPE_MAPPING['array']],
+            'radiation_cutoff_loss_percentage': Optional[TYPE_MAPPING['array']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'fingerprint': False,
+            'wind_speed': 1,
+            'temperature': 14,
+            'temperature_adjusted_series': None,
+            'standard_test_temperature': 'TEMPERATURE_DEFAULT',
+            'temperature_model': 'Faiman',
+            'spectral_factor_algorithm': None,
+            'spectral_factor': None,
+            'radiation_cutoff_threshold': 30,
+            'photovoltaic_module_efficiency_coefficients': '[]',
+            'photovoltaic_module_type': 'cSi Free standing',
+            'power_model': 'King',
+            'data_source': None,
+            'equation': 'P(G0, T0) = G0(PSTC, m + k1 G0) + k2 G0)^2 + k3 T0 + k4 T0 G0 + k5 T0 G0^2 + k6 T0^2',
+            'algorithm': None,
+            'unit': 'unitless',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': None,
+            'description': "The photovoltaic efficiency factor series for a solar irradiance component specific to the photovoltaic module technology, the photovoltaic power rating model and the (adjusted) temperature series. The implemented power rating model [0] is a variant of King's model (1998, 2004).",
+            'label': '⌁ Photovoltaic Efficiency',
+            'title': 'Photovoltaic Efficiency',
+            'supertitle': 'Photovoltaic Power Efficiency',
+            'shortname': 'Efficiency',
+            'name': 'Photovoltaic Power Efficiency data model',
+            'dtype': 'float32',
+            'array_backend': 'NUMPY',
+            'log_relative_irradiance': numpy.array([], dtype='float64'),
+            'temperature_deviation': numpy.array([], dtype='float64'),
+            'relative_irradiance': numpy.array([], dtype='float64'),
+            'low_irradiance': numpy.array([], dtype='float64'),
+            'radiation_cutoff_loss_percentage': numpy.array([], dtype='float64'),
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_PhotovoltaicModuleEfficiency():
+    return create_data_model(
+        data_model_name='PhotovoltaicModuleEfficiency',
+        annotations={
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'temperature_adjusted_series': Optional[data_model('TemperatureSeries')],
+            'photovoltaic_module_type': Optional[TYPE_MAPPING['str']],
+            'power_model': Optional[TYPE_MAPPING['str']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'dtype': Optional[TYPE_MAPPING['str']],
+            'array_backend': Optional[TYPE_MAPPING['str']],
+            'effective_irradiance': Optional[data_model('EffectiveIrradiance')],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'fingerprint': False,
+            'temperature_adjusted_series': None,
+            'photovoltaic_module_type': 'cSi Free standing',
+            'power_model': 'King',
+            'data_source': 'Huld (2011), King (2009), Faiman',
+            'equation': 'P(G0, T0) = G0(PSTC, m + k1 G0) + k2 G0)^2 + k3 T0 + k4 T0 G0 + k5 T0 G0^2 + k6 T0^2.',
+            'algorithm': "The photovoltaic module efficiency model bases upon a variant of King's model to describe the power output of photovoltaic modules as a function of irradiance (G) and temperature (T) including empirically fitted coefficients and a normalization/pooling approach to enable comparison across modules of different ratings. The procedure involves : 1. Fitting the model to indoor data for various monocrystalline and polycrystalline photovoltaic modules, 2. Rescaling the coefficients to normalize the nominal power, 3. Pooling the rescaled data from multiple modules, 4. Fitting a _combined_ model to the pooled data, 5. Applying the combined model and individual module models to outdoor data for comparison.",
+            'unit': 'unitless',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '％',
+            'description': "Photovoltaic module efficiency based on solar irradiance and PV technology-specific efficiency coefficients, the spectral effect factor, temperature and wind speed. Photovoltaic Power based on a variant of King's model (1998, 2004).",
+            'label': '⌁ Photovoltaic Efficiency',
+            'title': 'Photovoltaic Efficiency',
+            'supertitle': 'Photovoltaic Power Efficiency',
+            'shortname': 'Efficiency',
+            'name': 'Photovoltaic Power Efficiency data model',
+            'dtype': 'float32',
+            'array_backend': 'NUMPY',
+            'effective_irradiance': None,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_PhotovoltaicPower():
+    return create_data_model(
+        data_model_name='PhotovoltaicPower',
+        annotations={
+            'diffuse_horizontal_irradiance': Optional[data_model('DiffuseSkyReflectedHorizontalIrradiance')],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradiance')],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'references': Optional[TYPE_MAPPING['str']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'wind_speed': Optional[Union[data_model('WindSpeedSeries'), TYPE_MAPPING['xarray']]],
+            'temperature': Optional[Union[data_model('TemperatureSeries'), TYPE_MAPPING['xarray']]],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'solar_incidence_definition': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_model': Optional[TYPE_MAPPING['str']],
+            'solar_incidence': Optional[TYPE_MAPPING['SolarIncidence']],
+            'solar_azimuth_origin': Optional[TYPE_MAPPING['str']],
+            'solar_azimuth': Optional[TYPE_MAPPING['SolarAzimuth']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'linke_turbidity_factor': Optional[data_model('LinkeTurbidityFactor')],
+            'horizon_height': Optional[data_model('HorizonHeight')],
+            'sun_horizon_positions': Optional[TYPE_MAPPING['set']],
+            'sun_horizon_position': Optional[TYPE_MAPPING['array']],
+            'optimal': Optional[TYPE_MAPPING['bool']],
+            'optimiser': Optional[TYPE_MAPPING['str']],
+            'optimization_mode': Optional[TYPE_MAPPING['str']],
+            'success': Optional[TYPE_MAPPING['bool']],
+            'surface_tilt_threshold': Optional[TYPE_MAPPING['float']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'ground_reflected_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'global_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflectivity_coefficient': Optional[TYPE_MAPPING['float']],
+            'diffuse_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'global_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'extraterrestrial_normal_irradiance': Optional[data_model('ExtraterrestrialNormalIrradiance')],
+            'extraterrestrial_horizontal_irradiance': Optional[data_model('ExtraterrestrialHorizontalIrradiance')],
+            'rear_side_ground_reflected_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'rear_side_diffuse_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'rear_side_direct_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'rear_side_global_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'global_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'spectral_factor_algorithm': Optional[TYPE_MAPPING['str']],
+            'spectral_factor': Optional[data_model('SpectralFactorSeries')],
+            'spectral_effect_percentage': Optional[TYPE_MAPPING['array']],
+            'spectral_effect': Optional[TYPE_MAPPING['array']],
+            'effective_ground_reflected_irradiance': Optional[TYPE_MAPPING['array']],
+            'effective_diffuse_irradiance': Optional[TYPE_MAPPING['array']],
+            'effective_direct_irradiance': Optional[TYPE_MAPPING['array']],
+            'effective_global_irradiance': Optional[TYPE_MAPPING['array']],
+            'system_loss': Optional[Union[TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'system_efficiency': Optional[TYPE_MAPPING['float']],
+            'efficiency_factor': Optional[TYPE_MAPPING['array']],
+            'power_model': Optional[TYPE_MAPPING['str']],
+            'peak_power': Optional[TYPE_MAPPING['float']],
+            'peak_power_unit': Optional[TYPE_MAPPING['str']],
+            'technology': Optional[TYPE_MAPPING['str']],
+            'photovoltaic_module_type': Optional[TYPE_MAPPING['str']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'photovoltaic_power_without_system_loss': Optional[TYPE_MAPPING['array']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'diffuse_horizontal_irradiance': None,
+            'direct_horizontal_irradiance': None,
+            'fingerprint': False,
+            'references': 'D.L. King, J.A. Kratochvil, W.E. Boyson, W.I. Bower, Field experience with a new performance characterization procedure for photovoltaic arrays, in: Proceedings of the second World Conference and Exhibition on Photovoltaic Solar Energy Conversion, Vienna, 1998, pp. 1947–1952.. D.L. King, W.E. Boyson, J.A. Kratochvil, Photovoltaic Array Performance Model, SAND2004-3535, Sandia National Laboratories, 2004.',
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'solar_constant': 1367.0,
+            'angle_output_units': None,
+            'wind_speed': 1,
+            'temperature': 14,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'solar_incidence_definition': None,
+            'solar_incidence_model': None,
+            'solar_incidence': None,
+            'solar_azimuth_origin': None,
+            'solar_azimuth': None,
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'adjusted_for_atmospheric_refraction': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'linke_turbidity_factor': 2,
+            'horizon_height': None,
+            'sun_horizon_positions': 'all',
+            'sun_horizon_position': numpy.array([], dtype='float64'),
+            'optimal': False,
+            'optimiser': None,
+            'optimization_mode': None,
+            'success': None,
+            'surface_tilt_threshold': 0.0001,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'elevation': 0,
+            'location': None,
+            'ground_reflected_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'diffuse_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'direct_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'global_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflectivity_coefficient': None,
+            'diffuse_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'direct_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'direct_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'reflected_percentage': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflected': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflected': numpy.array([], dtype='float64'),
+            'direct_inclined_reflected': numpy.array([], dtype='float64'),
+            'global_inclined_reflected': numpy.array([], dtype='float64'),
+            'extraterrestrial_normal_irradiance': None,
+            'extraterrestrial_horizontal_irradiance': None,
+            'rear_side_ground_reflected_inclined_irradiance': numpy.array([], dtype='float64'),
+            'rear_side_diffuse_inclined_irradiance': numpy.array([], dtype='float64'),
+            'rear_side_direct_inclined_irradiance': numpy.array([], dtype='float64'),
+            'rear_side_global_inclined_irradiance': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_irradiance': numpy.array([], dtype='float64'),
+            'diffuse_inclined_irradiance': numpy.array([], dtype='float64'),
+            'direct_inclined_irradiance': numpy.array([], dtype='float64'),
+            'global_inclined_irradiance': numpy.array([], dtype='float64'),
+            'spectral_factor_algorithm': None,
+            'spectral_factor': None,
+            'spectral_effect_percentage': numpy.array([], dtype='float64'),
+            'spectral_effect': numpy.array([], dtype='float64'),
+            'effective_ground_reflected_irradiance': numpy.array([], dtype='float64'),
+            'effective_diffuse_irradiance': numpy.array([], dtype='float64'),
+            'effective_direct_irradiance': numpy.array([], dtype='float64'),
+            'effective_global_irradiance': numpy.array([], dtype='float64'),
+            'system_loss': numpy.array([], dtype='float64'),
+            'system_efficiency': None,
+            'efficiency_factor': numpy.array([], dtype='float64'),
+            'power_model': 'King',
+            'peak_power': None,
+            'peak_power_unit': 'kWp',
+            'technology': None,
+            'photovoltaic_module_type': 'cSi Free standing',
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'photovoltaic_power_without_system_loss': numpy.array([], dtype='float64'),
+            'data_source': None,
+            'equation': 'P(G₀, T₀) = G₀(P₀ₛₜ₃, m + k₁G₀) + k₂G₀)² + k₃T₀ + k₄T₀G₀ + k₅T₀G₀² + k₆T₀²',
+            'algorithm': None,
+            'unit': 'W',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⌁',
+            'description': 'Photovoltaic Power based on a variant of King0s model (1998, 2004)',
+            'label': '⌁ Simulated Photovoltaic Power',
+            'title': 'Power',
+            'supertitle': 'Photovoltaic Power',
+            'shortname': 'Power',
+            'name': 'Photovoltaic Power data model',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_PhotovoltaicPowerFromExternalData():
+    return create_data_model(
+        data_model_name='PhotovoltaicPowerFromExternalData',
+        annotations={
+            'diffuse_horizontal_irradiance': Optional[data_model('DiffuseSkyReflectedHorizontalIrradianceFromExternalData')],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradianceFromExternalData')],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'references': Optional[TYPE_MAPPING['str']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'wind_speed': Optional[Union[data_model('WindSpeedSeries'), TYPE_MAPPING['xarray']]],
+            'temperature': Optional[Union[data_model('TemperatureSeries'), TYPE_MAPPING['xarray']]],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'solar_incidence_definition': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_model': Optional[TYPE_MAPPING['str']],
+            'solar_incidence': Optional[TYPE_MAPPING['SolarIncidence']],
+            'solar_azimuth_origin': Optional[TYPE_MAPPING['str']],
+            'solar_azimuth': Optional[TYPE_MAPPING['SolarAzimuth']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'linke_turbidity_factor': Optional[data_model('LinkeTurbidityFactor')],
+            'horizon_height': Optional[data_model('HorizonHeight')],
+            'sun_horizon_positions': Optional[TYPE_MAPPING['set']],
+            'sun_horizon_position': Optional[TYPE_MAPPING['array']],
+            'optimal': Optional[TYPE_MAPPING['bool']],
+            'optimiser': Optional[TYPE_MAPPING['str']],
+            'optimization_mode': Optional[TYPE_MAPPING['str']],
+            'success': Optional[TYPE_MAPPING['bool']],
+            'surface_tilt_threshold': Optional[TYPE_MAPPING['float']],
+            'surface_tilt': Optional[TYPE_MAPPING['SurfaceTilt']],
+            'surface_orientation': Optional[TYPE_MAPPING['SurfaceOrientation']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'ground_reflected_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'global_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflectivity_coefficient': Optional[TYPE_MAPPING['float']],
+            'diffuse_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'global_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'extraterrestrial_normal_irradiance': Optional[data_model('ExtraterrestrialNormalIrradiance')],
+            'extraterrestrial_horizontal_irradiance': Optional[data_model('ExtraterrestrialHorizontalIrradiance')],
+            'rear_side_ground_reflected_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'rear_side_diffuse_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'rear_side_direct_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'rear_side_global_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'global_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'spectral_factor_algorithm': Optional[TYPE_MAPPING['str']],
+            'spectral_factor': Optional[data_model('SpectralFactorSeries')],
+            'spectral_effect_percentage': Optional[TYPE_MAPPING['array']],
+            'spectral_effect': Optional[TYPE_MAPPING['array']],
+            'effective_ground_reflected_irradiance': Optional[TYPE_MAPPING['array']],
+            'effective_diffuse_irradiance': Optional[TYPE_MAPPING['array']],
+            'effective_direct_irradiance': Optional[TYPE_MAPPING['array']],
+            'effective_global_irradiance': Optional[TYPE_MAPPING['array']],
+            'system_loss': Optional[Union[TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'system_efficiency': Optional[TYPE_MAPPING['float']],
+            'efficiency_factor': Optional[TYPE_MAPPING['array']],
+            'power_model': Optional[TYPE_MAPPING['str']],
+            'peak_power': Optional[TYPE_MAPPING['float']],
+            'peak_power_unit': Optional[TYPE_MAPPING['str']],
+            'technology': Optional[TYPE_MAPPING['str']],
+            'photovoltaic_module_type': Optional[TYPE_MAPPING['str']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'photovoltaic_power_without_system_loss': Optional[TYPE_MAPPING['array']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'diffuse_horizontal_irradiance': None,
+            'direct_horizontal_irradiance': None,
+            'fingerprint': False,
+            'references': 'D.L. King, J.A. Kratochvil, W.E. Boyson, W.I. Bower, Field experience with a new performance characterization procedure for photovoltaic arrays, in: Proceedings of the second World Conference and Exhibition on Photovoltaic Solar Energy Conversion, Vienna, 1998, pp. 1947–1952.. D.L. King, W.E. Boyson, J.A. Kratochvil, Photovoltaic Array Performance Model, SAND2004-3535, Sandia National Laboratories, 2004.',
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'solar_constant': 1367.0,
+            'angle_output_units': None,
+            'wind_speed': 1,
+            'temperature': 14,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'solar_incidence_definition': None,
+            'solar_incidence_model': None,
+            'solar_incidence': None,
+            'solar_azimuth_origin': None,
+            'solar_azimuth': None,
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_altitude': None,
+            'adjusted_for_atmospheric_refraction': None,
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'linke_turbidity_factor': 2,
+            'horizon_height': None,
+            'sun_horizon_positions': 'all',
+            'sun_horizon_position': numpy.array([], dtype='float64'),
+            'optimal': False,
+            'optimiser': None,
+            'optimization_mode': None,
+            'success': None,
+            'surface_tilt_threshold': 0.0001,
+            'surface_tilt': None,
+            'surface_orientation': None,
+            'elevation': 0,
+            'location': None,
+            'ground_reflected_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'diffuse_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'direct_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'global_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflectivity_coefficient': None,
+            'diffuse_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'direct_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'direct_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'reflected_percentage': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflected': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflected': numpy.array([], dtype='float64'),
+            'direct_inclined_reflected': numpy.array([], dtype='float64'),
+            'global_inclined_reflected': numpy.array([], dtype='float64'),
+            'extraterrestrial_normal_irradiance': None,
+            'extraterrestrial_horizontal_irradiance': None,
+            'rear_side_ground_reflected_inclined_irradiance': numpy.array([], dtype='float64'),
+            'rear_side_diffuse_inclined_irradiance': numpy.array([], dtype='float64'),
+            'rear_side_direct_inclined_irradiance': numpy.array([], dtype='float64'),
+            'rear_side_global_inclined_irradiance': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_irradiance': numpy.array([], dtype='float64'),
+            'diffuse_inclined_irradiance': numpy.array([], dtype='float64'),
+            'direct_inclined_irradiance': numpy.array([], dtype='float64'),
+            'global_inclined_irradiance': numpy.array([], dtype='float64'),
+            'spectral_factor_algorithm': None,
+            'spectral_factor': None,
+            'spectral_effect_percentage': numpy.array([], dtype='float64'),
+            'spectral_effect': numpy.array([], dtype='float64'),
+            'effective_ground_reflected_irradiance': numpy.array([], dtype='float64'),
+            'effective_diffuse_irradiance': numpy.array([], dtype='float64'),
+            'effective_direct_irradiance': numpy.array([], dtype='float64'),
+            'effective_global_irradiance': numpy.array([], dtype='float64'),
+            'system_loss': numpy.array([], dtype='float64'),
+            'system_efficiency': None,
+            'efficiency_factor': numpy.array([], dtype='float64'),
+            'power_model': 'King',
+            'peak_power': None,
+            'peak_power_unit': 'kWp',
+            'technology': None,
+            'photovoltaic_module_type': 'cSi Free standing',
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'photovoltaic_power_without_system_loss': numpy.array([], dtype='float64'),
+            'data_source': None,
+            'equation': 'P(G₀, T₀) = G₀(P₀ₛₜ₃, m + k₁G₀) + k₂G₀)² + k₃T₀ + k₄T₀G₀ + k₅T₀G₀² + k₆T₀²',
+            'algorithm': None,
+            'unit': 'W',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⌁',
+            'description': 'Photovoltaic Power based on a variant of King0s model (1998, 2004)',
+            'label': '⌁ Photovoltaic Power',
+            'title': 'Power',
+            'supertitle': 'Photovoltaic Power',
+            'shortname': 'Power',
+            'name': 'Photovoltaic Power data model (based on external data)',
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+def _build_PhotovoltaicPowerMultipleModules():
+    return create_data_model(
+        data_model_name='PhotovoltaicPowerMultipleModules',
+        annotations={
+            'diffuse_horizontal_irradiance': Optional[data_model('DiffuseSkyReflectedHorizontalIrradiance')],
+            'direct_horizontal_irradiance': Optional[data_model('DirectHorizontalIrradiance')],
+            'fingerprint': Optional[TYPE_MAPPING['bool']],
+            'references': Optional[TYPE_MAPPING['str']],
+            'quality': Optional[TYPE_MAPPING['str']],
+            'solar_radiation_model': Optional[TYPE_MAPPING['str']],
+            'angle_output_units': Optional[TYPE_MAPPING['str']],
+            'wind_speed': Optional[Union[data_model('WindSpeedSeries'), TYPE_MAPPING['xarray']]],
+            'temperature': Optional[Union[data_model('TemperatureSeries'), TYPE_MAPPING['xarray']]],
+            'visible': Optional[TYPE_MAPPING['array']],
+            'surface_in_shade': Optional[TYPE_MAPPING['LocationShading']],
+            'shading_state': Optional[TYPE_MAPPING['array']],
+            'shading_states': Optional[TYPE_MAPPING['set']],
+            'shading_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_definition': Optional[TYPE_MAPPING['str']],
+            'solar_incidence_model': Optional[TYPE_MAPPING['str']],
+            'solar_incidence': Optional[TYPE_MAPPING['SolarIncidence']],
+            'solar_azimuth_origin': Optional[TYPE_MAPPING['str']],
+            'solar_azimuth': Optional[TYPE_MAPPING['SolarAzimuth']],
+            'solar_altitude': Optional[TYPE_MAPPING['SolarAltitude']],
+            'adjusted_for_atmospheric_refraction': Optional[TYPE_MAPPING['bool']],
+            'linke_turbidity_factor': Optional[data_model('LinkeTurbidityFactor')],
+            'eccentricity_amplitude': Optional[TYPE_MAPPING['float']],
+            'eccentricity_phase_offset': Optional[TYPE_MAPPING['float']],
+            'refracted_solar_altitude': Optional[TYPE_MAPPING['array']],
+            'solar_timing_algorithm': Optional[TYPE_MAPPING['str']],
+            'solar_positioning_algorithm': Optional[TYPE_MAPPING['str']],
+            'horizon_height': Optional[data_model('HorizonHeight')],
+            'sun_horizon_positions': Optional[TYPE_MAPPING['set']],
+            'sun_horizon_position': Optional[TYPE_MAPPING['array']],
+            'optimal': Optional[TYPE_MAPPING['bool']],
+            'optimiser': Optional[TYPE_MAPPING['str']],
+            'optimization_mode': Optional[TYPE_MAPPING['str']],
+            'success': Optional[TYPE_MAPPING['bool']],
+            'surface_tilt_threshold': Optional[TYPE_MAPPING['float']],
+            'surface_tilts': Optional[TYPE_MAPPING['list']],
+            'surface_orientations': Optional[TYPE_MAPPING['list']],
+            'elevation': Optional[TYPE_MAPPING['Elevation']],
+            'location': Optional[TYPE_MAPPING['Tuple[Longitude, Latitude]']],
+            'solar_constant': Optional[TYPE_MAPPING['float']],
+            'extraterrestrial_normal_irradiance': Optional[data_model('ExtraterrestrialNormalIrradiance')],
+            'extraterrestrial_horizontal_irradiance': Optional[data_model('ExtraterrestrialHorizontalIrradiance')],
+            'ground_reflected_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'global_inclined_before_reflectivity': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflectivity_coefficient': Optional[TYPE_MAPPING['float']],
+            'diffuse_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflectivity_factor': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'reflected_percentage': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'global_inclined_reflected': Optional[TYPE_MAPPING['array']],
+            'rear_side_ground_reflected_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'rear_side_diffuse_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'rear_side_direct_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'rear_side_global_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'ground_reflected_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'diffuse_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'direct_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'global_inclined_irradiance': Optional[TYPE_MAPPING['array']],
+            'spectral_factor_algorithm': Optional[TYPE_MAPPING['str']],
+            'spectral_factor': Optional[data_model('SpectralFactorSeries')],
+            'spectral_effect_percentage': Optional[TYPE_MAPPING['array']],
+            'spectral_effect': Optional[TYPE_MAPPING['array']],
+            'effective_ground_reflected_irradiance': Optional[TYPE_MAPPING['array']],
+            'effective_diffuse_irradiance': Optional[TYPE_MAPPING['array']],
+            'effective_direct_irradiance': Optional[TYPE_MAPPING['array']],
+            'effective_global_irradiance': Optional[TYPE_MAPPING['array']],
+            'system_loss': Optional[Union[TYPE_MAPPING['float'], TYPE_MAPPING['None']]],
+            'system_efficiency': Optional[TYPE_MAPPING['float']],
+            'efficiency_factor': Optional[TYPE_MAPPING['array']],
+            'power_model': Optional[TYPE_MAPPING['str']],
+            'peak_power': Optional[TYPE_MAPPING['float']],
+            'peak_power_unit': Optional[TYPE_MAPPING['str']],
+            'technology': Optional[TYPE_MAPPING['str']],
+            'photovoltaic_module_type': Optional[TYPE_MAPPING['str']],
+            'out_of_range_index': Optional[TYPE_MAPPING['array']],
+            'out_of_range': Optional[TYPE_MAPPING['array']],
+            'upper_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'lower_physically_possible_limit': Optional[TYPE_MAPPING['float']],
+            'photovoltaic_power_without_system_loss': Optional[TYPE_MAPPING['array']],
+            'data_source': Optional[TYPE_MAPPING['str']],
+            'equation': Optional[TYPE_MAPPING['str']],
+            'algorithm': Optional[TYPE_MAPPING['str']],
+            'unit': Optional[TYPE_MAPPING['str']],
+            'value': Optional[TYPE_MAPPING['array']],
+            'symbol': Optional[TYPE_MAPPING['str']],
+            'description': Optional[TYPE_MAPPING['str']],
+            'label': Optional[TYPE_MAPPING['str']],
+            'title': Optional[TYPE_MAPPING['str']],
+            'supertitle': Optional[TYPE_MAPPING['str']],
+            'shortname': Optional[TYPE_MAPPING['str']],
+            'name': Optional[TYPE_MAPPING['str']],
+            'surface_position_angle_pairs': Optional[TYPE_MAPPING['list']],
+            'individual_series': Optional[TYPE_MAPPING['list']],
+            'output': Optional[TYPE_MAPPING['dict']],
+        },
+        default_values={
+            'diffuse_horizontal_irradiance': None,
+            'direct_horizontal_irradiance': None,
+            'fingerprint': False,
+            'references': None,
+            'quality': None,
+            'solar_radiation_model': 'Hofierka 2002',
+            'angle_output_units': None,
+            'wind_speed': 1,
+            'temperature': 14,
+            'visible': numpy.array([], dtype='float64'),
+            'surface_in_shade': None,
+            'shading_state': numpy.array([], dtype='float64'),
+            'shading_states': 'all',
+            'shading_algorithm': 'PVGIS',
+            'solar_incidence_definition': None,
+            'solar_incidence_model': None,
+            'solar_incidence': None,
+            'solar_azimuth_origin': None,
+            'solar_azimuth': None,
+            'solar_altitude': None,
+            'adjusted_for_atmospheric_refraction': None,
+            'linke_turbidity_factor': 2,
+            'eccentricity_amplitude': 0.03344,
+            'eccentricity_phase_offset': 0.048869,
+            'refracted_solar_altitude': numpy.array([], dtype='float64'),
+            'solar_timing_algorithm': None,
+            'solar_positioning_algorithm': None,
+            'horizon_height': None,
+            'sun_horizon_positions': 'all',
+            'sun_horizon_position': numpy.array([], dtype='float64'),
+            'optimal': False,
+            'optimiser': None,
+            'optimization_mode': None,
+            'success': None,
+            'surface_tilt_threshold': 0.0001,
+            'surface_tilts': None,
+            'surface_orientations': None,
+            'elevation': None,
+            'location': None,
+            'solar_constant': 1367.0,
+            'extraterrestrial_normal_irradiance': None,
+            'extraterrestrial_horizontal_irradiance': None,
+            'ground_reflected_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'diffuse_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'direct_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'global_inclined_before_reflectivity': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflectivity_coefficient': None,
+            'diffuse_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'direct_inclined_reflectivity_factor': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'direct_inclined_reflected_percentage': numpy.array([], dtype='float64'),
+            'reflected_percentage': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_reflected': numpy.array([], dtype='float64'),
+            'diffuse_inclined_reflected': numpy.array([], dtype='float64'),
+            'direct_inclined_reflected': numpy.array([], dtype='float64'),
+            'global_inclined_reflected': numpy.array([], dtype='float64'),
+            'rear_side_ground_reflected_inclined_irradiance': numpy.array([], dtype='float64'),
+            'rear_side_diffuse_inclined_irradiance': numpy.array([], dtype='float64'),
+            'rear_side_direct_inclined_irradiance': numpy.array([], dtype='float64'),
+            'rear_side_global_inclined_irradiance': numpy.array([], dtype='float64'),
+            'ground_reflected_inclined_irradiance': numpy.array([], dtype='float64'),
+            'diffuse_inclined_irradiance': numpy.array([], dtype='float64'),
+            'direct_inclined_irradiance': numpy.array([], dtype='float64'),
+            'global_inclined_irradiance': numpy.array([], dtype='float64'),
+            'spectral_factor_algorithm': None,
+            'spectral_factor': None,
+            'spectral_effect_percentage': numpy.array([], dtype='float64'),
+            'spectral_effect': numpy.array([], dtype='float64'),
+            'effective_ground_reflected_irradiance': numpy.array([], dtype='float64'),
+            'effective_diffuse_irradiance': numpy.array([], dtype='float64'),
+            'effective_direct_irradiance': numpy.array([], dtype='float64'),
+            'effective_global_irradiance': numpy.array([], dtype='float64'),
+            'system_loss': numpy.array([], dtype='float64'),
+            'system_efficiency': None,
+            'efficiency_factor': numpy.array([], dtype='float64'),
+            'power_model': 'King',
+            'peak_power': None,
+            'peak_power_unit': 'kWp',
+            'technology': None,
+            'photovoltaic_module_type': 'cSi Free standing',
+            'out_of_range_index': numpy.array([], dtype='float64'),
+            'out_of_range': numpy.array([], dtype='float64'),
+            'upper_physically_possible_limit': 2000,
+            'lower_physically_possible_limit': -4,
+            'photovoltaic_power_without_system_loss': numpy.array([], dtype='float64'),
+            'data_source': None,
+            'equation': 'Σ [P(G₀, T₀)] = Σ [G₀(P₀ₛₜ₃, m + k₁G₀) + k₂G₀)² + k₃T₀ + k₄T₀G₀ + k₅T₀G₀² + k₆T₀²]',
+            'algorithm': None,
+            'unit': 'W',
+            'value': numpy.array([], dtype='float64'),
+            'symbol': '⌁⌁⌁',
+            'description': 'Photovoltaic Power based on a variant of King0s model (1998, 2004)',
+            'label': '\\[⌁] Simulated Photovoltaic Power from multiple surfaces',
+            'title': 'Power',
+            'supertitle': 'Photovoltaic Power from Multiple Solar Surfaces',
+            'shortname': 'Power',
+            'name': 'Photovoltaic Power from Multiple Surfaces data model',
+            'individual_series': None,
+            'output': {},
+        },
+        use_numpy_model=True,
+        defer_build=True,
+    )
+
+
+DATA_MODEL_BUILDERS = {
+    'FingerprintFlag': _build_FingerprintFlag,
+    'Longitude': _build_Longitude,
+    'RelativeLongitude': _build_RelativeLongitude,
+    'Latitude': _build_Latitude,
+    'Elevation': _build_Elevation,
+    'HorizonHeight': _build_HorizonHeight,
+    'LocationShading': _build_LocationShading,
+    'SurfaceOrientation': _build_SurfaceOrientation,
+    'SurfaceTilt': _build_SurfaceTilt,
+    'OptimalSurfacePosition': _build_OptimalSurfacePosition,
+    'EccentricityPhaseOffset': _build_EccentricityPhaseOffset,
+    'EccentricityAmplitude': _build_EccentricityAmplitude,
+    'TemperatureSeries': _build_TemperatureSeries,
+    'RelativeHumiditySeries': _build_RelativeHumiditySeries,
+    'WindSpeedSeries': _build_WindSpeedSeries,
+    'TypicalMeteorologicalVariableYear': _build_TypicalMeteorologicalVariableYear,
+    'AtmosphericRefraction': _build_AtmosphericRefraction,
+    'LinkeTurbidityFactor': _build_LinkeTurbidityFactor,
+    'OpticalAirMass': _build_OpticalAirMass,
+    'RayleighThickness': _build_RayleighThickness,
+    'SolarPosition': _build_SolarPosition,
+    'EquationOfTime': _build_EquationOfTime,
+    'TimeOffset': _build_TimeOffset,
+    'TrueSolarTime': _build_TrueSolarTime,
+    'SolarHourAngle': _build_SolarHourAngle,
+    'EventHourAngle': _build_EventHourAngle,
+    'EventType': _build_EventType,
+    'EventTime': _build_EventTime,
+    'HourAngleSunrise': _build_HourAngleSunrise,
+    'FractionalYear': _build_FractionalYear,
+    'SolarDeclination': _build_SolarDeclination,
+    'SolarZenith': _build_SolarZenith,
+    'UnrefractedSolarZenith': _build_UnrefractedSolarZenith,
+    'SolarAltitude': _build_SolarAltitude,
+    'RefractedSolarAltitude': _build_RefractedSolarAltitude,
+    'SolarAzimuth': _build_SolarAzimuth,
+    'CompassSolarAzimuth': _build_CompassSolarAzimuth,
+    'SolarIncidence': _build_SolarIncidence,
+    'SunHorizonPosition': _build_SunHorizonPosition,
+    'SolarPositionOverview': _build_SolarPositionOverview,
+    'SolarIrradianceSpectrum': _build_SolarIrradianceSpectrum,
+    'SpectralResponsivity': _build_SpectralResponsivity,
+    'SpectralFactorSeries': _build_SpectralFactorSeries,
+    'IrradianceSeries': _build_IrradianceSeries,
+    'ExtraterrestrialNormalIrradiance': _build_ExtraterrestrialNormalIrradiance,
+    'ExtraterrestrialHorizontalIrradiance': _build_ExtraterrestrialHorizontalIrradiance,
+    'DirectNormalIrradiance': _build_DirectNormalIrradiance,
+    'DirectNormalFromHorizontalIrradiance': _build_DirectNormalFromHorizontalIrradiance,
+    'DirectHorizontalIrradiance': _build_DirectHorizontalIrradiance,
+    'DirectHorizontalIrradianceFromExternalData': _build_DirectHorizontalIrradianceFromExternalData,
+    'DirectInclinedIrradiance': _build_DirectInclinedIrradiance,
+    'DirectInclinedIrradianceFromExternalData': _build_DirectInclinedIrradianceFromExternalData,
+    'DiffuseSkyReflectedHorizontalIrradiance': _build_DiffuseSkyReflectedHorizontalIrradiance,
+    'DiffuseSkyReflectedHorizontalIrradianceFromExternalData': _build_DiffuseSkyReflectedHorizontalIrradianceFromExternalData,
+    'DiffuseSkyReflectedInclinedIrradiance': _build_DiffuseSkyReflectedInclinedIrradiance,
+    'DiffuseSkyReflectedInclinedIrradianceFromExternalData': _build_DiffuseSkyReflectedInclinedIrradianceFromExternalData,
+    'GlobalHorizontalIrradiance': _build_GlobalHorizontalIrradiance,
+    'ClearSkyDiffuseGroundReflectedInclinedIrradiance': _build_ClearSkyDiffuseGroundReflectedInclinedIrradiance,
+    'DiffuseGroundReflectedInclinedIrradiance': _build_DiffuseGroundReflectedInclinedIrradiance,
+    'GlobalInclinedIrradiance': _build_GlobalInclinedIrradiance,
+    'GlobalInclinedIrradianceFromExternalData': _build_GlobalInclinedIrradianceFromExternalData,
+    'InclinedIrradiance': _build_InclinedIrradiance,
+    'EffectiveIrradiance': _build_EffectiveIrradiance,
+    'PhotovoltaicEfficiencyFactor': _build_PhotovoltaicEfficiencyFactor,
+    'PhotovoltaicModuleEfficiency': _build_PhotovoltaicModuleEfficiency,
+    'PhotovoltaicPower': _build_PhotovoltaicPower,
+    'PhotovoltaicPowerFromExternalData': _build_PhotovoltaicPowerFromExternalData,
+    'PhotovoltaicPowerMultipleModules': _build_PhotovoltaicPowerMultipleModules,
+}
+DATA_MODELS = tuple(DATA_MODEL_BUILDERS)
@@ -14,18 +14,151 @@
 # OF ANY KIND, either express or implied. See the Licence for the specific language
 # governing permissions and limitations under the Licence.
 #
-from pvgisprototype.core.hashing import generate_hash
-from simpleeval import simple_eval
+from ast import AST
 from collections import OrderedDict
+from dataclasses import dataclass
+from functools import cache
+
 from numpy import array as numpy_array
-from pvgisprototype.constants import RADIANS
+from simpleeval import SimpleEval
+
+from pvgisprototype.api.position.categorical import decode_categorical_field
 from pvgisprototype.api.position.models import SolarPositionParameterColumnName
+from pvgisprototype.constants import RADIANS
+from pvgisprototype.core.data_model.definitions import PVGIS_DATA_MODEL_DEFINITIONS
+from pvgisprototype.core.hashing import generate_hash
+
+
+# All solar position parameter field names
+SOLAR_POSITION_PARAMETERS = frozenset(
+    SolarPositionParameterColumnName.__members__.values()
+)
+
+
+@dataclass(frozen=True)
+class OutputField:
+    """A data model field as it appears in the output"""
+
+    field: str
+    title: str
+    is_solar_position_parameter: bool = False
+
+
+@dataclass(frozen=True)
+class OutputSection:
+    """A (sub)section of the output structure of a data model"""
+
+    name: str
+    condition: str | None = None
+    parsed_condition: AST | None = None
+    fields: tuple[OutputField, ...] = ()
+    subsections: tuple["OutputSection", ...] | None = None
+
+
+def compile_fields(
+    model_definition: dict,
+    fields: list | None,
+) -> tuple[OutputField, ...]:
+    """Resolve the output title of each field from the model definition"""
+    output_fields = []
+    for field in fields or ():
+        field_definition = model_definition.get(field, {})
+        title = field_definition.get("title", field)
+        if field == "fingerprint":
+            symbol = field_definition.get("symbol", field)
+            title = f"{title} {symbol}"
+        output_fields.append(
+            OutputField(
+                field=field,
+                title=title,
+                is_solar_position_parameter=(
+                    field_definition.get("title", None) in SOLAR_POSITION_PARAMETERS
+                ),
+            )
+        )
+
+    return tuple(output_fields)
+
+
+def compile_section(
+    model_definition: dict,
+    section_definition: dict,
+    key: str = "section",
+) -> OutputSection:
+    """Compile a (sub)section definition, parsing its condition once"""
+    condition = section_definition.get("condition")
+    subsections = section_definition.get("subsections")
+    if subsections is not None:
+        subsections = tuple(
+            compile_section(
+                model_definition=model_definition,
+                section_definition=subsection_definition,
+                key="subsection",
+            )
+            for subsection_definition in subsections
+        )
+
+    return OutputSection(
+        name=section_definition.get(key),
+        condition=condition,
+        parsed_condition=(
+            SimpleEval().parse(condition) if condition is not None else None
+        ),
+        fields=compile_fields(
+            model_definition=model_definition,
+            fields=section_definition.get("fields"),
+        ),
+        subsections=subsections,
+    )
+
+
+@cache
+def compile_output_structure(data_model_name: str) -> tuple[OutputSection, ...]:
+    """Compile the output structure of a data model, once per data model
+
+    Parameters
+    ----------
+    data_model_name: str
+        Name of a data model defined in `PVGIS_DATA_MODEL_DEFINITIONS`
+
+    Returns
+    -------
+    tuple[OutputSection, ...]
+        The sections of the output, in the order of the YAML definition, with
+        titles resolved and conditions parsed
+
+    """
+    if data_model_name not in PVGIS_DATA_MODEL_DEFINITIONS:
+        raise ValueError(f"No definition found for model: {data_model_name}")
+    model_definition = PVGIS_DATA_MODEL_DEFINITIONS[data_model_name]
+    structure = model_definition.get("output", {}).get("structure")
+
+    return tuple(
+        compile_section(
+            model_definition=model_definition,
+            section_definition=section_definition,
+        )
+        for section_definition in structure or ()
+    )
+
+
+def convert_value_to_output_units(
+    data_model,
+    angle_output_units: str = RADIANS,
+) -> None:
+    """Convert the value of a solar position parameter to the requested
+    angular unit, in place"""
+    # First, in case the data model is a simple one (i.e. not a nested one)
+    if hasattr(data_model, 'value'):
+        data_model_shortname_and_symbol = f"{data_model.shortname} {data_model.symbol}"
+        if data_model_shortname_and_symbol in SOLAR_POSITION_PARAMETERS:
+            # angular value : convert using the requested `angle_output_units` method
+            data_model.value = getattr(data_model, angle_output_units)
 
 
 def parse_fields(
     data_model,
-    model_definition,
-    fields: list,
+    fields: tuple[OutputField, ...],
     angle_output_units: str = RADIANS,
 ) -> dict:
     """
@@ -49,37 +182,29 @@ def parse_fields(
     - the output field title (or name) is composed by the `shortname` and the
     `symbol`
 
-    """
-    # Get all solar position parameter field names
-    solar_position_parameters = set(
-        SolarPositionParameterColumnName.__members__.values()
-    )
+    The titles of the `fields` are resolved beforehand, see
+    `compile_output_structure()`. The value of the data model itself is
+    converted beforehand, see `convert_value_to_output_units()`.
 
+    """
     data_container = OrderedDict()
     data_model_shortname_and_symbol = f"{data_model.shortname} {data_model.symbol}"
 
-    # First, in case the data model is a simple one (i.e. not a nested one)
-    if hasattr(data_model, 'value'):
-        if data_model_shortname_and_symbol in solar_position_parameters:
-            # angular value : convert using the requested `angle_output_units` method
-            data_model.value = getattr(data_model, angle_output_units)
+    for output_field in fields:
+        field = output_field.field
 
-    field_value = None
-    for field in fields:
+        if field == "fingerprint":
+            data_container[output_field.title] = generate_hash(data_model.value)
+            continue
 
         try:
             field_object = getattr(data_model, field)
-            field_definition = model_definition.get(field, {})
-            # Check if this field is a solar position parameter
-            is_solar_position_parameter = (
-                field_definition.get("title", None) in solar_position_parameters
-            )
 
             # for all fields, use .value if available
             if hasattr(field_object, "value"):
                 field_value = field_object.value
 
-                if is_solar_position_parameter:
+                if output_field.is_solar_position_parameter:
                     # if the _object_ has .radians or .degrees implied is an angular quantity
                     attribute = getattr(field_object, angle_output_units)
 
@@ -92,31 +217,19 @@ def parse_fields(
                     else:
                         field_value = attribute
 
-                else:
-                    field_value = field_object.value
-
             else:
-                field_value = field_object
+                # categorical series are decoded to labels only for the output
+                field_value = decode_categorical_field(field, field_object)
 
         except AttributeError:
             field_value = None
 
-        field_title = str()
+        field_title = output_field.title
         if field == "value":
             # If shortname + symbol exist, use'm !
+            field_title = str()
             if hasattr(data_model, "shortname") and hasattr(data_model, "symbol"):
-                field_title = f"{data_model.shortname} {data_model.symbol}"
-                # field_title = f"{data_model.shortname}"
-
-        elif field == "fingerprint":
-            field_name = model_definition.get(field, {}).get("title", field)
-            field_symbol = model_definition.get(field, {}).get("symbol", field)
-            field_title = f"{field_name} {field_symbol}"
-            field_value = generate_hash(data_model.value)
-
-        else:
-            # Get the title for the field from the model definition
-            field_title = model_definition.get(field, {}).get("title", field)
+                field_title = data_model_shortname_and_symbol
 
         # Add to component content with title as key
         data_container[field_title] = field_value
@@ -130,6 +243,7 @@ def populate_context(
     fingerprint: bool = True,
     angle_output_units: str = RADIANS,
     locals: dict = {},
+    value_in_output_units: bool = False,
 ):
     """Populate the context of an existing object
 
@@ -151,91 +265,81 @@ def populate_context(
         Angular unit for the output data can be either 'radians' (default) or
         'degrees'.
 
+    value_in_output_units: bool
+        True if the value is already converted to the `angle_output_units`,
+        e.g. by `build_output()`.
+
     Notes
     -----
     See also: data model definitions in YAML syntax under `definitions.yaml`.
 
     An example for the input `self` data model is the `SolarAltitude`.
 
+    The output structure of each data model is compiled once, see
+    `compile_output_structure()`.
+
     """
-    # Get the definition of the data model, originally defined in YAML syntex
-    model_definition = self.model_definition
+    if not value_in_output_units:
+        convert_value_to_output_units(self, angle_output_units=angle_output_units)
 
     # Ensure order of data model fields as they appear in a YAML definition
     output = OrderedDict()
 
-    # Check if there is an 'output' definition in the YAML for that Model
-    if "output" in model_definition:
-
-        # Read the structure definitions
-        structure = model_definition['output'].get("structure")
-
-        # Iterate the sections, if they exist
-        if structure:
-
-            for section_definition in structure:
-                section = section_definition.get("section")
-                condition = section_definition.get("condition")
-                output[section] = {}
-
-                if "subsections" in section_definition:
-                    subsection = ""
-                    subsections = section_definition.get("subsections")
-                    subsection_content = {}
-
-                    for subsection_definition in subsections:
-                        subsection = subsection_definition.get("subsection")
-                        subsection_condition = subsection_definition.get("condition")
-
-                        # Build a `names` dictionary dynamically 
-                        names = {
-                            'verbose': verbose,
-                            'reflectivity_factor': getattr(self, 'reflectivity_factor', numpy_array([])),
-                            # other attributes ?
-                        }
-                        
-                        if subsection_condition is None or simple_eval(
-                            subsection_condition,
-                            names=names,
-                        ):
-                            subsection_content = {}
-
-                            fields = subsection_definition.get("fields")
-                            if fields:
-                                subsection_content = parse_fields(
-                                    data_model=self,
-                                    model_definition=model_definition,
-                                    fields=fields,
-                                    angle_output_units=angle_output_units,
-                                )
-                            output[section][subsection] = subsection_content
-
-                else:
-
-                    # Build names dictionary - include self so conditions can access attributes
-                    names = {
-                        "verbose": verbose,
-                        "fingerprint": fingerprint,
-                        "out_of_range": getattr(self, "out_of_range", numpy_array([])),
+    # One evaluator for all conditions, each parsed once per data model
+    evaluator = None
+    section_names = None
+    subsection_names = None
+
+    def condition_holds(section: OutputSection, names: dict) -> bool:
+        nonlocal evaluator
+        if section.condition is None:
+            return True
+        if evaluator is None:
+            evaluator = SimpleEval()
+        evaluator.names = names
+        return evaluator.eval(
+            section.condition,
+            previously_parsed=section.parsed_condition,
+        )
+
+    for section in compile_output_structure(self.data_model_name):
+        output[section.name] = {}
+
+        if section.subsections is not None:
+            for subsection in section.subsections:
+                if subsection_names is None and subsection.condition is not None:
+                    subsection_names = {
+                        'verbose': verbose,
+                        'reflectivity_factor': getattr(self, 'reflectivity_factor', numpy_array([])),
+                        # other attributes ?
                     }
+                if condition_holds(subsection, subsection_names):
+                    subsection_content = {}
+                    if subsection.fields:
+                        subsection_content = parse_fields(
+                            data_model=self,
+                            fields=subsection.fields,
+                            angle_output_units=angle_output_units,
+                        )
+                    output[section.name][subsection.name] = subsection_content
 
-                    # Does the condition evaluate to true ?
-                    if condition is None or simple_eval(
-                        condition,
-                        names=names,
-                    ):
-                        section_content = {}  # Dictionary for that component
-
-                        fields = section_definition.get("fields")
-                        if fields:
-                            section_content = parse_fields(
-                                data_model=self,
-                                model_definition=model_definition,
-                                fields=fields,
-                                angle_output_units=angle_output_units,
-                            )
-                        output[section] = section_content
-
+        else:
+            if section_names is None and section.condition is not None:
+                section_names = {
+                    "verbose": verbose,
+                    "fingerprint": fingerprint,
+                    "out_of_range": getattr(self, "out_of_range", numpy_array([])),
+                }
+            # Does the condition evaluate to true ?
+            if condition_holds(section, section_names):
+                section_content = {}  # Dictionary for that component
+                if section.fields:
+                    section_content = parse_fields(
+                        data_model=self,
+                        fields=section.fields,
+                        angle_output_units=angle_output_units,
+                    )
+                output[section.name] = section_content
 
     # Feed output to .output
     self.output = output
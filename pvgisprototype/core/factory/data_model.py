@@ -31,24 +31,45 @@ Key Features
 """
 
 from typing import Optional, Dict, Type, Any, Union
+from zlib import crc32
 import numpy
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from pydantic_numpy import NpNDArray
 from pydantic_numpy.model import NumpyModel
 from pvgisprototype.core.array_methods import create_array_method, fill_array_method
-from pvgisprototype.core.factory.property_functions import PROPERTY_FUNCTIONS
-from pvgisprototype.core.factory.extra_methods import EXTRA_METHODS
+from pvgisprototype.constants import DEGREES, RADIANS
+from pvgisprototype.core.factory.property_functions import (
+    MEMOISED_PROPERTY_FUNCTIONS,
+    PROPERTY_FUNCTIONS,
+)
+from pvgisprototype.core.factory.extra_methods import (
+    EXTRA_METHODS,
+    PENDING_OUTPUT,
+    LazyOutput,
+    build_output_first,
+)
 from pvgisprototype.core.factory.type_mapping import TYPE_MAPPING
 from rich.console import Console
 
 
 console = Console()
+CONTENT_HASH = "_content_hash"
+CONVERSIONS = "_conversions"
+OUTPUT_READING_METHODS = (
+    "model_dump",
+    "model_dump_json",
+    "__repr_args__",
+    "__iter__",
+    "__getstate__",
+)
 
 
 def _custom_getattr(self, attribute_name):
     """Optimized custom getattr function with pre-cached property functions."""
     value = PROPERTY_FUNCTIONS.get(attribute_name)
     if value:
+        if attribute_name in MEMOISED_PROPERTY_FUNCTIONS:
+            return _memoised_conversion(self, attribute_name, value)
         return value(self)
     else:
         raise AttributeError(
@@ -56,6 +77,60 @@ def _custom_getattr(self, attribute_name):
         )
 
 
+def _memoised_conversion(self, attribute_name, property_function):
+    """Convert the value once per instance, as a read-only array"""
+    private = self.__pydantic_private__
+    if private is None:  # not initialised, e.g. while copying
+        return property_function(self)
+
+    conversions = private.get(CONVERSIONS)
+    if conversions is None:
+        conversions = private[CONVERSIONS] = {}
+    if attribute_name not in conversions:
+        converted = property_function(self)
+        if isinstance(converted, numpy.ndarray) and converted is not self.value:
+            converted.flags.writeable = False
+        conversions[attribute_name] = converted
+
+    return conversions[attribute_name]
+
+
+def invalidate_memoised_values(self):
+    """Forget the memoised content hash and unit conversions, e.g. after
+    modifying an array in place"""
+    private = self.__pydantic_private__
+    if private:
+        private[CONTENT_HASH] = None
+        private[CONVERSIONS] = None
+
+
+def convert_to(self, unit: str, out: numpy.ndarray | None = None):
+    """
+    Convert the value to another unit, optionally into a preallocated array
+
+    Parameters
+    ----------
+    unit: str
+        The unit to convert to, e.g. `degrees` or `radians`
+    out: numpy.ndarray, optional
+        Array to write the converted value/s into, e.g. a buffer reused across
+        calls. Without it, the conversion is memoised per instance.
+    """
+    if out is None or not isinstance(self.value, numpy.ndarray):
+        return getattr(self, unit)
+
+    if unit == self.unit:
+        numpy.copyto(out, self.value)
+    elif (self.unit, unit) == (RADIANS, DEGREES):
+        numpy.degrees(self.value, out=out)
+    elif (self.unit, unit) == (DEGREES, RADIANS):
+        numpy.radians(self.value, out=out)
+    else:
+        numpy.copyto(out, getattr(self, unit))
+
+    return out
+
+
 class DataModelFactory:
     _cache = {}
 
@@ -72,10 +147,28 @@ class DataModelFactory:
         model.data_model_name = data_model_name  # Assign data_model_name here
         return model
 
+    @staticmethod
+    def register_data_model(data_model_name: str, model: Type[BaseModel]):
+        """Cache a data model class built elsewhere, e.g. ahead of time"""
+        DataModelFactory._cache[data_model_name] = model
+        model.data_model_name = data_model_name
+        return model
+
     @staticmethod
     def _hashable_array(array):
         try:
-            # Assume a NumPy array and convert it to bytes for hashing
+            # Stream the buffer of a NumPy array through the hasher, no copy
+            array = numpy.ascontiguousarray(array)
+            return hash(
+                (
+                    array.dtype.str,
+                    array.shape,
+                    crc32(array.reshape(-1).view(numpy.uint8)),
+                )
+            )
+
+        except (TypeError, ValueError):
+            # Object arrays do not expose their items as bytes
             return hash(array.tobytes())
 
         except AttributeError:
@@ -86,7 +179,16 @@ class DataModelFactory:
     def _generate_hash_function(fields, annotations):
         import orjson
 
+        # The output derives from the other fields : hashing it would build it
+        fields = [field for field in fields if field != "output"]
+
         def hash_model(self):
+            """Content hash, computed once and forgotten on field assignment"""
+            private = self.__pydantic_private__
+            content_hash = private.get(CONTENT_HASH) if private else None
+            if content_hash is not None:
+                return content_hash
+
             hash_values = tuple(
                 (
                     DataModelFactory._hashable_array(value)
@@ -105,10 +207,39 @@ class DataModelFactory:
                 for field in fields
                 for value in [getattr(self, field)]
             )
-            return hash(hash_values)
+            content_hash = hash(hash_values)
+            if private is not None:
+                private[CONTENT_HASH] = content_hash
+
+            return content_hash
 
         return hash_model
 
+    @staticmethod
+    def _generate_setattr_method(base_model, fields):
+        fields = frozenset(fields)
+
+        def setattr_model(self, name, value):
+            base_model.__setattr__(self, name, value)
+            if name in fields:
+                private = self.__pydantic_private__
+                if private:
+                    private[CONTENT_HASH] = None
+                    if name in ("value", "unit"):
+                        private[CONVERSIONS] = None
+
+        return setattr_model
+
+    @staticmethod
+    def _generate_copy_method(base_model):
+        def copy_model(self, *, update=None, deep=False):
+            copied_model = base_model.model_copy(self, update=update, deep=deep)
+            if update:  # fields set bypassing __setattr__
+                invalidate_memoised_values(copied_model)
+            return copied_model
+
+        return copy_model
+
     @staticmethod
     def _is_np_ndarray_type(field_type):
         """Utility function to check if a field type is or involves NpNDArray."""
@@ -127,6 +258,9 @@ class DataModelFactory:
 
     @staticmethod
     def _generate_alternative_eq_method(fields):
+        # The output derives from the other fields : comparing it would build it
+        fields = [field for field in fields if field != "output"]
+
         def eq_model(self, other):
             if not isinstance(other, self.__class__):
                 return False
@@ -135,18 +269,28 @@ class DataModelFactory:
                 self_value = getattr(self, field)
                 other_value = getattr(other, field)
 
-                if isinstance(self_value, numpy.ndarray) and isinstance(
-                    other_value, numpy.ndarray
-                ):
-                    if not numpy.array_equal(self_value, other_value):
-                        return False
-                else:
-                    if self_value != other_value:
-                        return False
+                if not DataModelFactory._values_equal(self_value, other_value):
+                    return False
             return True
 
         return eq_model
 
+    @staticmethod
+    def _values_equal(self_value, other_value) -> bool:
+        """Compare field values, including dictionaries of arrays"""
+        if isinstance(self_value, numpy.ndarray) or isinstance(
+            other_value, numpy.ndarray
+        ):
+            return numpy.array_equal(self_value, other_value)
+
+        if isinstance(self_value, dict) and isinstance(other_value, dict):
+            return self_value.keys() == other_value.keys() and all(
+                DataModelFactory._values_equal(value, other_value[key])
+                for key, value in self_value.items()
+            )
+
+        return bool(self_value == other_value)
+
     @staticmethod
     def _is_simple_model(fields: Dict[str, Any]) -> bool:
         """
@@ -189,8 +333,34 @@ class DataModelFactory:
         -------
 
         """
-        fields = []
+        annotations, default_values, use_numpy_model, _ = (
+            DataModelFactory._resolve_data_model_fields(
+                data_model_name, data_model_definitions
+            )
+        )
+        return DataModelFactory.create_data_model(
+            data_model_name=data_model_name,
+            annotations=annotations,
+            default_values=default_values,
+            use_numpy_model=use_numpy_model,
+        )
+
+    @staticmethod
+    def _resolve_data_model_fields(
+        data_model_name: str, data_model_definitions: Dict
+    ) -> tuple[Dict[str, Any], Dict[str, Any], bool, Dict[str, list]]:
+        """
+        Resolve the field types and initial values of a data model definition.
+
+        Returns
+        -------
+        tuple
+            The annotations and the default values by field name, whether the
+            data model is a `NumpyModel` and the type names each annotation
+            resolves, e.g. `['array', 'SolarAltitude']` for a union type.
+        """
         annotations = {}
+        type_names = {}
         default_values = {}
         use_numpy_model = False
 
@@ -227,9 +397,14 @@ class DataModelFactory:
                     if type_option in TYPE_MAPPING:
                         # Standard type (array, float, str, etc.)
                         resolved_type = TYPE_MAPPING[type_option]
-                    elif type_option in DataModelFactory._cache:
-                        # Custom type already generated
-                        resolved_type = DataModelFactory._cache[type_option]
+                    elif (
+                        type_option in DataModelFactory._cache
+                        or type_option in data_model_definitions
+                    ):
+                        # Custom type, generated first if required
+                        resolved_type = DataModelFactory.get_data_model(
+                            type_option, data_model_definitions
+                        )
                     else:
                         # Unknown type
                         console.print(
@@ -249,6 +424,7 @@ class DataModelFactory:
 
                 # Create Union annotation with Optional wrapper
                 field_annotation = Optional[Union[tuple(resolved_types)]]
+                type_names[field_name] = type_options
 
                 # Handle initial values for union types
                 if "initial" in field_data:
@@ -262,6 +438,7 @@ class DataModelFactory:
                 # Field type is in TYPE_MAPPING, e.g. 'array', 'float', 'str'
                 # annotations[field_name] = TYPE_MAPPING[field_type]
                 field_annotation = Optional[TYPE_MAPPING[field_type]]
+                type_names[field_name] = [field_type]
 
                 if DataModelFactory._is_np_ndarray_type(TYPE_MAPPING[field_type]):
                     use_numpy_model = True
@@ -271,10 +448,15 @@ class DataModelFactory:
 
             # Cached type ====================================================
 
-            elif field_type in DataModelFactory._cache:
-                # If an existing complex type, use it
-                # annotations[field_name] = DataModelFactory._cache[field_type]
-                field_annotation = Optional[DataModelFactory._cache[field_type]]
+            elif (
+                field_type in DataModelFactory._cache
+                or field_type in data_model_definitions
+            ):
+                # If an existing complex type, use it, else generate it first
+                field_annotation = Optional[
+                    DataModelFactory.get_data_model(field_type, data_model_definitions)
+                ]
+                type_names[field_name] = [field_type]
 
             else:
                 console.print(
@@ -285,17 +467,45 @@ class DataModelFactory:
                 )
 
             annotations[field_name] = field_annotation
-            fields.append(field_name)
 
             if "initial" in field_data:
                 default_values[field_name] = field_data["initial"]
 
+        return annotations, default_values, use_numpy_model, type_names
+
+    @staticmethod
+    def create_data_model(
+        data_model_name: str,
+        annotations: Dict[str, Any],
+        default_values: Dict[str, Any],
+        use_numpy_model: bool = False,
+        defer_build: bool = False,
+    ) -> Type[BaseModel]:
+        """
+        Create a data model class out of resolved annotations and default values.
+
+        Parameters
+        ----------
+        data_model_name: str
+        annotations: Dict[str, Any]
+            Field annotations by field name
+        default_values: Dict[str, Any]
+            Default value by field name
+        use_numpy_model: bool
+            Base the data model on `NumpyModel` rather than `BaseModel`
+        defer_build: bool
+            Defer building the Pydantic validation schema until the first
+            validation, e.g. the first instantiation of the data model
+        """
+        fields = list(annotations)
+
         # Define additional model properties
         base_model = NumpyModel if use_numpy_model else BaseModel
 
+        extra_methods = dict(EXTRA_METHODS)
         if use_numpy_model:
-            EXTRA_METHODS["create_array"] = classmethod(create_array_method)
-            EXTRA_METHODS["fill_array"] = fill_array_method
+            extra_methods["create_array"] = classmethod(create_array_method)
+            extra_methods["fill_array"] = fill_array_method
 
         model_attributes = {
             "__getattr__": _custom_getattr,  # How to select properties ?
@@ -303,10 +513,33 @@ class DataModelFactory:
             "__module__": __package__.split(".")[0],
             "__qualname__": data_model_name,
             "__hash__": DataModelFactory._generate_hash_function(fields, annotations),
-            "model_config": ConfigDict(arbitrary_types_allowed=True),
+            "__setattr__": DataModelFactory._generate_setattr_method(base_model, fields),
+            "model_copy": DataModelFactory._generate_copy_method(base_model),
+            CONTENT_HASH: PrivateAttr(default=None),
+            CONVERSIONS: PrivateAttr(default=None),
+            PENDING_OUTPUT: PrivateAttr(default=None),
+            "invalidate_memoised_values": invalidate_memoised_values,
+            "convert_to": convert_to,
+            "model_config": ConfigDict(
+                arbitrary_types_allowed=True,
+                defer_build=defer_build,
+            ),
             "__eq__": DataModelFactory._generate_alternative_eq_method(fields),
             **default_values,
-            **EXTRA_METHODS,
+            **extra_methods,
         }
         
-        return base_model.__class__(data_model_name, (base_model,), model_attributes)
+        if "output" in annotations:
+            # Build a pending output before serialising the data model
+            for method_name in OUTPUT_READING_METHODS:
+                model_attributes[method_name] = build_output_first(
+                    getattr(base_model, method_name)
+                )
+
+        data_model = base_model.__class__(
+            data_model_name, (base_model,), model_attributes
+        )
+        if "output" in annotations:
+            data_model.output = LazyOutput()  # populated once read
+
+        return data_model
@@ -14,9 +14,12 @@
 # OF ANY KIND, either express or implied. See the Licence for the specific language
 # governing permissions and limitations under the Licence.
 #
+from ast import literal_eval
 from pathlib import Path
 from pvgisprototype.core.factory.log import logger
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+import numpy
 
 
 def write_to_python_module(
@@ -50,3 +53,138 @@ def reset_python_data_model_definitions(
     if verbose:
         logger.info("", alt=f"[bold]Reseting[/bold] [code]{output_file}[/code] to an empty dictionary")
     write_to_python_module(models={}, output_file=output_file)
+
+
+DATA_MODEL_MODULE_HEADER = '''# Ahead-of-time generated data models : do not edit, see core/data_model/generate.py
+"""
+PVGIS-native data model classes generated ahead of time
+
+The field types and initial values of each data model definition are resolved
+when generating this module. A class is created on first access only, without
+walking the definitions, along with the classes its fields depend on. Building
+its Pydantic validation schema is further deferred until the first validation.
+"""
+
+from threading import RLock
+from typing import Optional, Union
+
+import numpy
+
+from pvgisprototype.core.factory.data_model import DataModelFactory
+from pvgisprototype.core.factory.type_mapping import TYPE_MAPPING
+
+create_data_model = DataModelFactory.create_data_model
+register_data_model = DataModelFactory.register_data_model
+
+# Re-entrant : building a class builds the classes its fields depend on
+_data_model_lock = RLock()
+
+
+def data_model(data_model_name: str):
+    """Create and register a data model class on first access, once across
+    threads"""
+    model = globals().get(data_model_name)
+    if model is None:
+        with _data_model_lock:
+            model = globals().get(data_model_name)
+            if model is None:
+                model = globals()[data_model_name] = register_data_model(
+                    data_model_name,
+                    DATA_MODEL_BUILDERS[data_model_name](),
+                )
+    return model
+
+
+def __getattr__(name: str):
+    if name in DATA_MODEL_BUILDERS:
+        return data_model(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted({*globals(), *DATA_MODELS})
+'''
+
+
+def _render_annotation(type_names: List[str]) -> str:
+    """Source of the annotation of a field out of the type names it resolves"""
+    from pvgisprototype.core.factory.type_mapping import TYPE_MAPPING
+
+    types = [
+        (
+            f"TYPE_MAPPING[{type_name!r}]"
+            if type_name in TYPE_MAPPING
+            else f"data_model({type_name!r})"
+        )
+        for type_name in type_names
+    ]
+    if len(types) > 1:
+        return f"Optional[Union[{', '.join(types)}]]"
+    return f"Optional[{types[0]}]"
+
+
+def _render_value(value: Any) -> str:
+    """Source of an initial value"""
+    if isinstance(value, numpy.ndarray):
+        return f"numpy.array({value.tolist()!r}, dtype={str(value.dtype)!r})"
+
+    source = repr(value)
+    try:
+        if literal_eval(source) != value:
+            raise ValueError
+    except (ValueError, SyntaxError):
+        raise ValueError(f"Cannot write the initial value {source} as a literal")
+
+    return source
+
+
+def render_data_model_module(definitions: Dict[str, Any]) -> str:
+    """Render the Python source of the data models out of their definitions"""
+    from pvgisprototype.core.factory.data_model import DataModelFactory
+
+    blocks = [DATA_MODEL_MODULE_HEADER]
+    for data_model_name in definitions:
+        annotations, default_values, use_numpy_model, type_names = (
+            DataModelFactory._resolve_data_model_fields(data_model_name, definitions)
+        )
+        rendered_annotations = "".join(
+            f"            {field!r}: {_render_annotation(type_names[field])},\n"
+            for field in annotations
+        )
+        rendered_default_values = "".join(
+            f"            {field!r}: {_render_value(value)},\n"
+            for field, value in default_values.items()
+        )
+        blocks.append(
+            f"\n\ndef _build_{data_model_name}():\n"
+            f"    return create_data_model(\n"
+            f"        data_model_name={data_model_name!r},\n"
+            f"        annotations={{\n{rendered_annotations}        }},\n"
+            f"        default_values={{\n{rendered_default_values}        }},\n"
+            f"        use_numpy_model={use_numpy_model},\n"
+            f"        defer_build=True,\n"
+            f"    )\n"
+        )
+    data_model_builders = "".join(
+        f"    {name!r}: _build_{name},\n" for name in definitions
+    )
+    blocks.append(f"\n\nDATA_MODEL_BUILDERS = {{\n{data_model_builders}}}\n")
+    blocks.append("DATA_MODELS = tuple(DATA_MODEL_BUILDERS)\n")
+
+    return "".join(blocks)
+
+
+def write_data_model_module(
+    definitions: Dict[str, Any],
+    output_file: Path,
+    verbose: bool = False,
+) -> None:
+    """Write the data model classes to a Python module ahead of time."""
+    content = render_data_model_module(definitions)
+    if verbose:
+        logger.info("", alt=f"[bold]Writing[/bold] data models to [code]{output_file}[/code]")
+
+    with open(output_file, "w") as python_module:
+        python_module.write(content)
+
+    logger.debug("", alt=f"Python data models written to [code]{output_file}[/code]")
@@ -15,7 +15,11 @@
 # governing permissions and limitations under the Licence.
 #
 from pvgisprototype.constants import RADIANS
-from pvgisprototype.core.factory.context import populate_context
+from pvgisprototype.core.factory.context import (
+    convert_value_to_output_units,
+    populate_context,
+)
+from pvgisprototype.core.factory.series import series
 
 
 def to_dictionary(self):
@@ -26,21 +30,75 @@ def to_dictionary(self):
     }
 
 
+PENDING_OUTPUT = "_pending_output"
+
+
 def build_output(
     self,
     verbose: int = 0,
     fingerprint: bool = False,
     angle_output_units: str = RADIANS
 ):
-    return populate_context(
+    """Convert the value to the output units, populate the output once read"""
+    private = self.__pydantic_private__
+    if private is None:  # not initialised, build it straight away
+        return populate_context(
             self=self,
             verbose=verbose,
             fingerprint=fingerprint,
             angle_output_units=angle_output_units,
-            )
+        )
+
+    convert_value_to_output_units(self, angle_output_units=angle_output_units)
+    private[PENDING_OUTPUT] = {
+        "verbose": verbose,
+        "fingerprint": fingerprint,
+        "angle_output_units": angle_output_units,
+    }
+
+
+def build_pending_output(self):
+    """Populate the output as requested by the last call to build_output()"""
+    private = self.__pydantic_private__
+    output_parameters = private.get(PENDING_OUTPUT) if private else None
+    if output_parameters is not None:
+        private[PENDING_OUTPUT] = None
+        populate_context(
+            self=self,
+            value_in_output_units=True,
+            **output_parameters,
+        )
+
+
+class LazyOutput:
+    """The `output` field, populated on first read after `build_output()`
+
+    The field stays in the instance `__dict__`, hence `model_dump()`,
+    `repr()` or `model_copy()` find it, see also `build_output_first()`.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        build_pending_output(instance)
+        return instance.__dict__["output"]
+
+    def __set__(self, instance, value):
+        instance.__dict__["output"] = value
+
+
+def build_output_first(base_method):
+    """Populate a pending output before e.g. serialising the data model"""
+
+    def method(self, *args, **kwargs):
+        build_pending_output(self)
+        return base_method(self, *args, **kwargs)
+
+    return method
 
 
 EXTRA_METHODS = {
     "to_dictionary": to_dictionary,
     "build_output": build_output,
+    "series": classmethod(series),
 }
@@ -247,3 +247,7 @@ PROPERTY_FUNCTIONS = {
     "as_hours": as_hours_property,
     "model_definition": get_model_definition,
 }
+# Conversions of the value, memoised per data model instance
+MEMOISED_PROPERTY_FUNCTIONS = frozenset(
+    {"radians", "degrees", "timedelta", "as_minutes", "as_hours"}
+)
@@ -0,0 +1,161 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Lightweight series containers for internal pipeline use
+
+A `DataModelSeries` stands for a data model instance while a calculation is in
+progress : it holds the value of a series, its unit and a reference to the data
+model class. Fields not set explicitly fall back to the initial values of the
+data model class, read once and shared by all containers of that class. Unit
+conversions go through the same property functions as the data models, hence
+return the value itself, without a copy, when the unit matches.
+
+The full Pydantic data model is created only when building the output, printing
+or serialising. As for fields assigned to a data model instance, the fields of a
+container are not validated.
+"""
+from copy import copy
+from functools import cache
+from typing import Any, Dict, Type
+
+from pydantic import BaseModel
+
+from pvgisprototype.core.factory.property_functions import PROPERTY_FUNCTIONS
+
+
+@cache
+def data_model_defaults(data_model: Type[BaseModel]) -> Dict[str, Any]:
+    """Initial values of the fields of a data model class"""
+    return {
+        name: field.default
+        for name, field in data_model.model_fields.items()
+        if not field.is_required()
+    }
+
+
+class DataModelSeries:
+    """
+    A slotted stand-in of a data model instance
+
+    Parameters
+    ----------
+    data_model: Type[BaseModel]
+        The data model class the series stands for
+    value:
+        The value/s of the series
+    unit: str
+        The unit of the value/s, by default the one of the data model
+    **fields:
+        Other fields of the data model
+
+    Examples
+    --------
+    >>> import numpy
+    >>> from pvgisprototype import SolarAltitude
+    >>> solar_altitude_series = SolarAltitude.series(value=numpy.zeros(3), unit="radians")
+    >>> solar_altitude_series.radians is solar_altitude_series.value
+    True
+    >>> solar_altitude = solar_altitude_series.to_model()
+    >>> type(solar_altitude).__name__, solar_altitude.unit
+    ('SolarAltitude', 'radians')
+    """
+
+    __slots__ = ("data_model", "value", "unit", "fields", "pending_output")
+
+    def __init__(
+        self,
+        data_model: Type[BaseModel],
+        value: Any = None,
+        unit: str | None = None,
+        **fields,
+    ):
+        object.__setattr__(self, "data_model", data_model)
+        object.__setattr__(self, "value", value)
+        if unit is None:
+            unit = data_model_defaults(data_model).get("unit")
+        object.__setattr__(self, "unit", unit)
+        object.__setattr__(self, "fields", fields)
+        object.__setattr__(self, "pending_output", None)
+
+    @property
+    def data_model_name(self) -> str:
+        return self.data_model.data_model_name
+
+    def __getattr__(self, name: str):
+        """Look up a field, then an initial value, then a unit conversion"""
+        if name in DataModelSeries.__slots__:  # unset slot, e.g. while copying
+            raise AttributeError(name)
+
+        fields = self.fields
+        if name in fields:
+            return fields[name]
+
+        if name == "output" and self.pending_output is not None:
+            fields["output"] = self.pending_output.output
+            self.pending_output = None
+            return fields["output"]
+
+        defaults = data_model_defaults(self.data_model)
+        if name in defaults:
+            default = defaults[name]
+            if isinstance(default, (list, dict, set)) or hasattr(default, "__array__"):
+                # Do not share mutable initial values across containers
+                default = fields[name] = copy(default)
+            return default
+
+        property_function = PROPERTY_FUNCTIONS.get(name)
+        if property_function:
+            return property_function(self)
+
+        raise AttributeError(
+            f"'{self.data_model.__name__}' series has no attribute '{name}'"
+        )
+
+    def __setattr__(self, name: str, value: Any):
+        if name in DataModelSeries.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            self.fields[name] = value
+
+    def to_model(self) -> BaseModel:
+        """Create the full data model out of the series"""
+        if self.pending_output is not None:
+            self.output  # build a pending output first
+        return self.data_model.model_construct(
+            value=self.value, unit=self.unit, **self.fields
+        )
+
+    def build_output(self, *args, **kwargs):
+        data_model = self.to_model()
+        data_model.build_output(*args, **kwargs)
+        self.value = data_model.value  # converted to the output units
+        self.fields.pop("output", None)
+        self.pending_output = data_model  # built once read
+
+    def to_dictionary(self) -> Dict[str, Any]:
+        return self.to_model().to_dictionary()
+
+    def model_dump(self, *args, **kwargs) -> Dict[str, Any]:
+        return self.to_model().model_dump(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return repr(self.to_model())
+
+
+def series(cls, value: Any = None, unit: str | None = None, **fields) -> DataModelSeries:
+    """Create a lightweight series container for this data model"""
+    return DataModelSeries(cls, value=value, unit=unit, **fields)
@@ -28,6 +28,7 @@ or both and integrates popular web servers like Uvicorn, Gunicorn, and FastAPI.
 - Classic Python logging integration are supported
 - Easy initialization of logging output and verbosity via Typer CLI Context
 - Safe and consistent log message formatting by escaping curly braces.
+- Lazy log messages, formatted only if their level is enabled
 - Web server logging redirection and duplicate prevention
 - Readable logs in both CLI and web environments
 - Functions, classes and decorators to facilitate tracing and data fingerprinting
@@ -39,8 +40,11 @@ FastAPI web services requiring well-managed log output.
 """
 
 import logging
+import os
+import sys
 from datetime import time, timedelta
 from functools import wraps
+from math import ceil
 
 from loguru import logger
 from typer import Context
@@ -49,7 +53,11 @@ from pvgisprototype.constants import (
     DEBUG_AFTER_THIS_VERBOSITY_LEVEL,
     HASH_AFTER_THIS_VERBOSITY_LEVEL,
 )
-from pvgisprototype.core.hashing import generate_hash
+
+# Instrumentation, function calls are logged also with `--log` above
+# HASH_AFTER_THIS_VERBOSITY_LEVEL, see initialize_logger()
+LOG_FUNCTION_CALLS = os.getenv("PVGIS_LOG_FUNCTION_CALLS", "false").lower() == "true"
+FINGERPRINT_BUDGET_BYTES = int(os.getenv("PVGIS_FINGERPRINT_BUDGET_BYTES", 1 << 20))
 
 WEB_SERVER_LOGGERS_LIST = [
     "uvicorn",
@@ -73,10 +81,25 @@ def _safe_message(message: str):
         return message.replace("{", "{{").replace("}", "}}")
 
 
-def _safe_log(func):
-    """Decorator to securely format log messages for logger methods"""
+def _safe_log(func, level: str):
+    """Decorator to securely and lazily format log messages for logger methods
+
+    Messages for a disabled level are dropped before any formatting. The
+    message and its `alt` rendering may be callables, i.e.
+    `logger.debug(lambda: f"Data : {data}")`, which are called only if the
+    level is enabled.
+    """
+    level_number = _loguru_logger.level(level).no
 
+    @wraps(func)
     def wrapper(message, *args, **kwargs):
+        if not is_enabled_for(level_number):
+            return None
+        if callable(message):
+            message = message()
+        alternative = kwargs.get("alt")
+        if callable(alternative):
+            kwargs["alt"] = alternative()
         return func(_safe_message(message), *args, **kwargs)
 
     return wrapper
@@ -84,8 +107,29 @@ def _safe_log(func):
 
 from loguru import logger as _loguru_logger
 
+
+def is_enabled_for(level: str | int = "DEBUG") -> bool:
+    """Whether any handler would emit a message of the given level
+
+    Guards building log messages or data that are expensive to produce, i.e. :
+
+        if is_enabled_for("DEBUG"):
+            logger.debug(describe(data))
+    """
+    if isinstance(level, str):
+        level = _loguru_logger.level(level).no
+    return level >= _loguru_logger._core.min_level
+
+
 for level in ("debug", "info", "warning", "error", "critical", "exception"):
-    setattr(_loguru_logger, level, _safe_log(getattr(_loguru_logger, level)))
+    setattr(
+        _loguru_logger,
+        level,
+        _safe_log(
+            getattr(_loguru_logger, level),
+            level="ERROR" if level == "exception" else level.upper(),
+        ),
+    )
 
 logger = _loguru_logger
 logger.remove()
@@ -114,7 +158,11 @@ def initialize_logger(
     Attention : This function is used in `typer_option_log` !
 
     """
+    global LOG_FUNCTION_CALLS
+
     suppress_noisy_loggers()
+    if log_level and log_level > HASH_AFTER_THIS_VERBOSITY_LEVEL:
+        LOG_FUNCTION_CALLS = True
 
     LOGURU_LEVELS = {
         0: "WARNING",  # Only show warnings and errors
@@ -443,39 +491,76 @@ def initialize_web_api_logger(
 
 
 def log_function_call(function):
-    """Decorator to log function calls and verbosity"""
+    """Decorator to log function calls and verbosity
+
+    Function calls are logged only if enabled, via the environment variable
+    `PVGIS_LOG_FUNCTION_CALLS=true` or by `initialize_logger()` for `--log`
+    above `HASH_AFTER_THIS_VERBOSITY_LEVEL`. Otherwise, a call costs a single
+    check of the module-level flag.
+    """
 
     @wraps(function)
     def wrapper(*args, **kwargs):
+        if not LOG_FUNCTION_CALLS:
+            return function(*args, **kwargs)
         verbosity_level = kwargs.get("log", 0) or 0
-        if verbosity_level > HASH_AFTER_THIS_VERBOSITY_LEVEL:
+        if verbosity_level > HASH_AFTER_THIS_VERBOSITY_LEVEL and is_enabled_for(
+            "DEBUG"
+        ):
             data_type = kwargs.get("dtype", None)
-            import inspect
-
-            parent_frame = inspect.stack()[1]
+            parent_frame = sys._getframe(1)
+            caller = parent_frame.f_code.co_name
+            filename = parent_frame.f_code.co_filename
+            line_number = parent_frame.f_lineno
             logger.debug(
-                f"> Call : {function.__name__}() from {parent_frame.function}() in {parent_frame.filename}:{parent_frame.lineno}, Requested : {data_type}",
-                alt=f"> Call {function.__name__}() from [reverse]{parent_frame.function}()[/reverse] in {parent_frame.filename}:{parent_frame.lineno}, Requested : [reverse]{data_type}[/reverse]",
+                f"> Call : {function.__name__}() from {caller}() in {filename}:{line_number}, Requested : {data_type}",
+                alt=f"> Call {function.__name__}() from [reverse]{caller}()[/reverse] in {filename}:{line_number}, Requested : [reverse]{data_type}[/reverse]",
             )
         return function(*args, **kwargs)
 
     return wrapper
 
 
+def sample_data(data, budget: int | None = FINGERPRINT_BUDGET_BYTES):
+    """Sample large arrays evenly down to a budget of bytes for hashing
+
+    Returns
+    -------
+    tuple
+        The (sampled) data and the step of the sampling, 1 if not sampled
+    """
+    from numpy import ascontiguousarray, ndarray
+
+    if not isinstance(data, ndarray) or not budget or data.nbytes <= budget:
+        return data, 1
+
+    step = ceil(data.size / max(budget // data.itemsize, 1))
+    return ascontiguousarray(data.reshape(-1)[::step]), step
+
+
 def log_data_fingerprint(
     data,
     log_level,
     hash_after_this_verbosity_level=2,
     output=None,
+    budget: int | None = FINGERPRINT_BUDGET_BYTES,
 ):
-    """Log a fingerprint and optionally a hash of data objects for traceability."""
+    """Log a fingerprint and optionally a hash of data objects for traceability.
+
+    Arrays larger than `budget` bytes, configurable via the environment
+    variable `PVGIS_FINGERPRINT_BUDGET_BYTES`, are hashed over an even sample
+    of their elements. A budget of 0 hashes all of the data.
+    """
     if output:
         print(type(output))
-    if log_level > hash_after_this_verbosity_level:
-        import inspect
-
-        caller_name = inspect.stack()[1].function
-        data_hash = generate_hash(data)
+    if log_level > hash_after_this_verbosity_level and is_enabled_for("DEBUG"):
+        from pvgisprototype.core.hashing import generate_hash
+
+        caller_name = sys._getframe(1).f_code.co_name
+        sample, step = sample_data(data, budget=budget)
+        data_hash = generate_hash(sample)
+        if step > 1:
+            data_hash = f"{data_hash} (sampled every {step} elements)"
         logger.debug(
             f"< Output {caller_name}() : {type(data)}, {data.dtype}, Hash {data_hash}",
             alt=f"< [bold]Output[/bold] of {caller_name}() : {type(data)}, [reverse]{data.dtype}[/reverse], Hash [code]{data_hash}[/code]",
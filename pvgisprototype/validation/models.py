@@ -19,7 +19,7 @@ from math import pi
 from typing import Tuple, List
 from zoneinfo import ZoneInfo
 
-from numpy import datetime64 as numpy_datetime64
+from numpy import datetime64 as numpy_datetime64, ndarray
 from pandas import DatetimeIndex, Timestamp
 from pydantic import BaseModel, ConfigDict, confloat, field_validator
 from xarray import DataArray
@@ -447,13 +447,13 @@ class SurfaceOrientationModel(BaseModel):
 
 
 class HorizonProfileModel(BaseModel):
-    horizon_profile: DataArray | None = None
+    horizon_profile: DataArray | ndarray | None = None  # ndarray : a horizon table
     model_config = ConfigDict(
         arbitrary_types_allowed=True,
     )
     @field_validator("horizon_profile")
-    def validate_horizon_profile(cls, input) -> DataArray:
-        if isinstance(input, (DataArray | None)):
+    def validate_horizon_profile(cls, input) -> DataArray | ndarray:
+        if isinstance(input, (DataArray | ndarray | None)):
             return input
         else:
             raise ValueError(f"{MESSAGE_UNSUPPORTED_TYPE} `horizon_profile`")
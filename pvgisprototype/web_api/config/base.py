@@ -21,6 +21,10 @@ from pvgisprototype.web_api.config.settings import (
     LOG_FORMAT_DEFAULT,
     LOG_LEVEL_DEFAULT,
     PROFILING_ENABLED_PRODUCTION_DEFAULT,
+    WARM_UP_ENABLED_DEFAULT,
+    WARM_UP_ENDPOINTS_DEFAULT,
+    WARM_UP_PAGE_CACHE_DEFAULT,
+    WARM_UP_QUERY_PARAMETERS_DEFAULT,
 )
 
 
@@ -47,6 +51,12 @@ class CommonSettings(BaseSettings):
     REDIS_DB: int = 0
     REDIS_TTL: int = 3600
 
+    # Warm-up at startup, before the worker accepts requests
+    WARM_UP_ENABLED: bool = WARM_UP_ENABLED_DEFAULT
+    WARM_UP_PAGE_CACHE: bool = WARM_UP_PAGE_CACHE_DEFAULT
+    WARM_UP_ENDPOINTS: list[str] = WARM_UP_ENDPOINTS_DEFAULT
+    WARM_UP_QUERY_PARAMETERS: dict[str, str] = WARM_UP_QUERY_PARAMETERS_DEFAULT
+
     class Config:
         # mapping, example : PVGIS_WEBAPI_REDIS_ENABLED -> REDIS_ENABLED
         env_prefix = "PVGIS_WEBAPI_"
@@ -18,6 +18,7 @@ from pydantic import Field
 from pvgisprototype.web_api.config.base import CommonSettings
 from pvgisprototype.web_api.config.settings import (
     MEASURE_REQUEST_TIME_PRODUCTION_DEFAULT,
+    WARM_UP_ENABLED_PRODUCTION_DEFAULT,
 )
 from pvgisprototype.web_api.config.options import DataReadMode
 
@@ -33,6 +34,7 @@ class ProductionSettings(CommonSettings):
         default=DataReadMode.ASYNC, env="PVGIS_WEB_API_DATA_READ_MODE"
     )
     LOG_DIAGNOSE: bool = False
+    WARM_UP_ENABLED: bool = WARM_UP_ENABLED_PRODUCTION_DEFAULT
 
     class Config:
         env_prefix = "PVGIS_WEB_API_"
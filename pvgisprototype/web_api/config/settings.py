@@ -25,6 +25,17 @@ from pvgisprototype.web_api.config.options import (
 LOG_LEVEL_DEFAULT = LogLevel.info
 PROFILING_ENABLED_PRODUCTION_DEFAULT = False
 LOG_FORMAT_DEFAULT = LogFormat.uvicorn
+WARM_UP_ENABLED_DEFAULT = False
+WARM_UP_PAGE_CACHE_DEFAULT = False
+WARM_UP_ENDPOINTS_DEFAULT = [
+    "/power/broadband",
+    "/performance/broadband",
+    "/solar-position/overview",
+]
+WARM_UP_QUERY_PARAMETERS_DEFAULT = {
+    "start_time": "2013-06-01 00:00:00",
+    "end_time": "2013-06-01 23:00:00",
+}
 
 # Development default settings
 LOG_LEVEL_DEVELOPMENT_DEFAULT = LogLevel.debug
@@ -35,3 +46,4 @@ MEASURE_REQUEST_TIME_DEVELOPMENT_DEFAULT = True
 
 # Production default settings
 MEASURE_REQUEST_TIME_PRODUCTION_DEFAULT = False
+WARM_UP_ENABLED_PRODUCTION_DEFAULT = True
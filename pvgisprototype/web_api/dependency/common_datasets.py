@@ -16,6 +16,7 @@ from pvgisprototype.api.series.wind_speed import get_wind_speed_series_from_arra
 from pvgisprototype.api.series.horizon_profile import (
     get_horizon_profile_from_array_or_set,
 )
+from pvgisprototype.api.series.horizon_table import HorizonTable
 from pvgisprototype.constants import (
     ARRAY_BACKEND_DEFAULT,
     DATA_TYPE_DEFAULT,
@@ -44,6 +45,7 @@ from pvgisprototype.web_api.fastapi.parameters import (
     fastapi_query_direct_horizontal_irradiance,
     fastapi_query_global_horizontal_irradiance,
     fastapi_query_horizon_profile_series,
+    fastapi_query_linke_turbidity_factor_climatology,
     fastapi_query_spectral_effect_series,
     fastapi_query_temperature_series,
     fastapi_query_verbose,
@@ -97,6 +99,9 @@ async def _provide_common_datasets(
         str, fastapi_query_horizon_profile_series
     ] = "horizon_profile_over_esti_jrc.zarr",
     time_offset: Annotated[str | None, fastapi_query_time_offset] = None,
+    linke_turbidity_factor_series: Annotated[
+        str | None, fastapi_query_linke_turbidity_factor_climatology
+    ] = None,
 ):
     """
     This is a helper function for providing the SIS, SID, temperature, wind
@@ -122,6 +127,9 @@ async def _provide_common_datasets(
         "PVGIS_WEB_API_HORIZON_PROFILE_PATH", horizon_profile_series
     )
     time_offset = environ.get("PVGIS_WEB_API_TIME_OFFSET_PATH", time_offset)
+    linke_turbidity_factor_series = environ.get(
+        "PVGIS_WEB_API_LINKE_TURBIDITY_FACTOR_PATH", linke_turbidity_factor_series
+    )
 
     return {
         "global_horizontal_irradiance_series": Path(
@@ -135,6 +143,11 @@ async def _provide_common_datasets(
         "spectral_factor_series": Path(spectral_factor_series).resolve(strict=True),
         "horizon_profile_series": Path(horizon_profile_series).resolve(strict=True),
         "time_offset": Path(time_offset).resolve(strict=True) if time_offset else None,
+        "linke_turbidity_factor_series": (
+            Path(linke_turbidity_factor_series).resolve(strict=True)
+            if linke_turbidity_factor_series
+            else None
+        ),
     }
 
 
@@ -668,23 +681,36 @@ async def _read_datasets(
                         convert_float_to_degrees_if_requested,
                     )
 
-                    horizon_profile_task = task_group.create_task(
-                        asyncio.to_thread(
-                            select_location_time_series,
-                            time_series=dataset_sources["horizon_profile_series"],
-                            variable=None,
-                            coordinate=None,
-                            minimum=None,
-                            maximum=None,
-                            longitude=convert_float_to_degrees_if_requested(
-                                longitude, DEGREES
-                            ),
-                            latitude=convert_float_to_degrees_if_requested(
-                                latitude, DEGREES
-                            ),
-                            verbose=verbose,
+                    if isinstance(
+                        dataset_sources["horizon_profile_series"], HorizonTable
+                    ):
+                        horizon_profile_task = task_group.create_task(
+                            asyncio.to_thread(
+                                get_horizon_profile_from_array_or_set,
+                                longitude=longitude,
+                                latitude=latitude,
+                                horizon_profile=dataset_sources["horizon_profile_series"],
+                                **other_kwargs,  # type: ignore
+                            )
+                        )
+                    else:
+                        horizon_profile_task = task_group.create_task(
+                            asyncio.to_thread(
+                                select_location_time_series,
+                                time_series=dataset_sources["horizon_profile_series"],
+                                variable=None,
+                                coordinate=None,
+                                minimum=None,
+                                maximum=None,
+                                longitude=convert_float_to_degrees_if_requested(
+                                    longitude, DEGREES
+                                ),
+                                latitude=convert_float_to_degrees_if_requested(
+                                    latitude, DEGREES
+                                ),
+                                verbose=verbose,
+                            )
                         )
-                    )
 
         return {
             "global_horizontal_irradiance_series": global_horizontal_irradiance_task.result(),
@@ -753,16 +779,24 @@ async def _read_datasets(
                     convert_float_to_degrees_if_requested,
                 )
 
-                horizon_profile = select_location_time_series(
-                    time_series=dataset_sources["horizon_profile_series"],
-                    variable=None,
-                    coordinate=None,
-                    minimum=None,
-                    maximum=None,
-                    longitude=convert_float_to_degrees_if_requested(longitude, DEGREES),
-                    latitude=convert_float_to_degrees_if_requested(latitude, DEGREES),
-                    verbose=verbose,
-                )
+                if isinstance(dataset_sources["horizon_profile_series"], HorizonTable):
+                    horizon_profile = get_horizon_profile_from_array_or_set(
+                        longitude=longitude,
+                        latitude=latitude,
+                        horizon_profile=dataset_sources["horizon_profile_series"],
+                        **other_kwargs,  # type: ignore
+                    )
+                else:
+                    horizon_profile = select_location_time_series(
+                        time_series=dataset_sources["horizon_profile_series"],
+                        variable=None,
+                        coordinate=None,
+                        minimum=None,
+                        maximum=None,
+                        longitude=convert_float_to_degrees_if_requested(longitude, DEGREES),
+                        latitude=convert_float_to_degrees_if_requested(latitude, DEGREES),
+                        verbose=verbose,
+                    )
 
         return {
             "global_horizontal_irradiance_series": global_horizontal_irradiance_series,
@@ -1,5 +1,7 @@
 from typing import Annotated
 import numpy as np
+from fastapi import Depends, HTTPException
+from pandas import DatetimeIndex
 from pvgisprototype import (
     LinkeTurbidityFactor,
     TemperatureSeries,
@@ -11,6 +13,14 @@ from pvgisprototype.constants import (
     TEMPERATURE_DEFAULT,
     WIND_SPEED_DEFAULT,
 )
+from pvgisprototype.web_api.dependency.common_datasets import (
+    _get_preopened_datasets,
+    process_timestamps,
+)
+from pvgisprototype.web_api.dependency.location import (
+    process_latitude,
+    process_longitude,
+)
 from pvgisprototype.web_api.fastapi.parameters import (
     fastapi_query_linke_turbidity_factor_series,
 )
@@ -47,9 +57,45 @@ async def create_wind_speed_series(
 
 
 async def process_linke_turbidity_factor_series(
+    preopened_datasets: Annotated[dict | None, Depends(_get_preopened_datasets)],
+    longitude: Annotated[float, Depends(process_longitude)] = 8.628,
+    latitude: Annotated[float, Depends(process_latitude)] = 45.812,
+    timestamps: Annotated[DatetimeIndex | None, Depends(process_timestamps)] = None,
     linke_turbidity_factor_series: Annotated[
-        float, fastapi_query_linke_turbidity_factor_series
-    ] = LinkeTurbidityFactor(),
+        float | None, fastapi_query_linke_turbidity_factor_series
+    ] = None,
 ) -> LinkeTurbidityFactor:
-    """ """
-    return LinkeTurbidityFactor(value=linke_turbidity_factor_series)
+    """Linke turbidity factor of the request.
+
+    A user-provided value is used as is. Otherwise, if a gridded monthly Linke
+    turbidity climatology is pre-opened, the monthly values of the location
+    are indexed by the month of each timestamp. Otherwise the default Linke
+    turbidity factor applies.
+    """
+    if linke_turbidity_factor_series is not None:
+        return LinkeTurbidityFactor(value=linke_turbidity_factor_series)
+
+    linke_turbidity_climatology = (
+        preopened_datasets.get("linke_turbidity_factor_series")
+        if preopened_datasets
+        else None
+    )
+    if linke_turbidity_climatology is None or timestamps is None:
+        return LinkeTurbidityFactor()
+
+    from pvgisprototype.api.series.linke_turbidity import (
+        get_linke_turbidity_factor_series_from_array_or_set,
+    )
+
+    try:
+        return get_linke_turbidity_factor_series_from_array_or_set(
+            longitude=longitude,
+            latitude=latitude,
+            linke_turbidity_factor_series=linke_turbidity_climatology,
+            timestamps=timestamps,
+        )
+    except Exception as exception:
+        raise HTTPException(
+            status_code=400,
+            detail=str(exception),
+        )
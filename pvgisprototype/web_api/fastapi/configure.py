@@ -1,5 +1,6 @@
 from pvgisprototype.log import logger
 from contextlib import asynccontextmanager
+from time import perf_counter
 from pvgisprototype.log import initialize_web_api_logger
 
 from pvgisprototype.web_api.cache.caching import set_cache_backend
@@ -7,6 +8,7 @@ from aiocache import Cache
 import traceback
 
 from pvgisprototype.web_api.fastapi.extended import ExtendedFastAPI
+from pvgisprototype.web_api.fastapi.warm_up import warm_up_application
 
 from pvgisprototype.web_api.dependency.common_datasets import _provide_common_datasets
 from pvgisprototype.constants import (
@@ -98,6 +100,8 @@ async def configure_application(app: ExtendedFastAPI):
         set_cache_backend(use_redis=False)
 
     # Pre-open datasets at startup
+    common_datasets = {}
+    start = perf_counter()
     try:
         common_datasets = await _provide_common_datasets()
         # app.state.preopened_datasets = get_time_series_as_arrays_or_sets(common_datasets)
@@ -114,6 +118,11 @@ async def configure_application(app: ExtendedFastAPI):
     except Exception as e:
         logger.warning(f"⚠️ Failed to open datasets: {e}")
         app.state.preopened_datasets = None
+    logger.info(f"⏱️ Pre-opening datasets took {perf_counter() - start:.3f} s")
+
+    # Warm-up before the worker accepts requests
+    if app.settings.WARM_UP_ENABLED:
+        app.state.warm_up_timings = await warm_up_application(app, common_datasets)
 
     yield  # Application runs here
 
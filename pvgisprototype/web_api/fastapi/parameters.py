@@ -433,3 +433,7 @@ fastapi_query_time_offset_variable = Query(
     description="Variable name of the time offset",
     include_in_schema=False,
 )
+fastapi_query_linke_turbidity_factor_climatology = Query(
+    description="Gridded monthly Linke turbidity factor climatology",
+    include_in_schema=False,
+)
@@ -0,0 +1,168 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Warm-up of the Web API at startup
+
+Datasets are pre-opened lazily at startup. Without a warm-up, the first
+requests after a deploy pay the cold-read latency of the coordinate arrays,
+the HDF5 metadata and chunk indexes and of the data chunks themselves. The
+warm-up runs, in order, before the worker accepts requests :
+
+1. `indexes` : load the coordinates of the pre-opened datasets into memory
+   and read one value of each data variable, which reads the metadata and
+   the chunk index of the variable
+2. `page cache` : optionally, ask the kernel to read the dataset files ahead
+   into the page cache via `posix_fadvise(POSIX_FADV_WILLNEED)`
+3. `requests` : send one synthetic request to each configured endpoint, with
+   the configured query parameters on top of the defaults of the endpoint
+
+The time each phase took is logged and kept in `app.state.warm_up_timings`.
+"""
+
+import os
+from inspect import isawaitable
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, Iterable
+
+from xarray import DataArray, Dataset
+
+from pvgisprototype.log import logger
+from pvgisprototype.web_api.config.settings import WARM_UP_QUERY_PARAMETERS_DEFAULT
+
+WARM_UP_BASE_URL = "http://warm-up"
+
+
+async def _time_phase(name: str, phase: Callable, timings: Dict[str, float]):
+    """Run and time a warm-up phase, which never fails the startup"""
+    start = perf_counter()
+    try:
+        summary = phase()
+        if isawaitable(summary):
+            summary = await summary
+    except (Exception, SystemExit) as exception:  # selections exit on errors
+        summary = f"failed : {exception!r}"
+        logger.warning(f"⚠️ Warm-up phase '{name}' {summary}")
+    timings[name] = perf_counter() - start
+    logger.info(f"⏱️ Warm-up phase '{name}' took {timings[name]:.3f} s : {summary}")
+
+
+def load_coordinate_indexes(preopened_datasets: dict) -> str:
+    """Load coordinates and touch each data variable of pre-opened datasets"""
+    count = 0
+    for data in preopened_datasets.values():
+        if isinstance(data, DataArray):
+            data_variables = [data.variable]
+        elif isinstance(data, Dataset):
+            data_variables = [data.variables[name] for name in data.data_vars]
+        else:
+            continue
+        for coordinate in data.coords.variables.values():
+            coordinate.load()
+        for variable in data_variables:
+            if variable.ndim > 0:
+                variable[(0,) * variable.ndim].values
+        count += 1
+
+    return f"loaded the coordinates of {count} datasets"
+
+
+def _dataset_files(paths: Iterable[Path | None]) -> Iterable[Path]:
+    """Files of datasets, including the files inside directory stores"""
+    for path in paths:
+        if path is None:
+            continue
+        path = Path(path)
+        if path.is_dir():
+            yield from (child for child in path.rglob("*") if child.is_file())
+        elif path.is_file():
+            yield path
+
+
+def preload_page_cache(paths: Iterable[Path | None]) -> str:
+    """Advise the kernel to read dataset files ahead into the page cache"""
+    if not hasattr(os, "posix_fadvise"):
+        return "skipped, posix_fadvise is not available on this platform"
+
+    count = 0
+    size = 0
+    for path in _dataset_files(paths):
+        file_descriptor = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(file_descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(file_descriptor)
+        count += 1
+        size += path.stat().st_size
+
+    return f"advised read-ahead of {count} files, {size / 2**20:.1f} MiB"
+
+
+async def send_synthetic_requests(
+    app,
+    endpoints: Iterable[str],
+    query_parameters: dict = WARM_UP_QUERY_PARAMETERS_DEFAULT,
+) -> str:
+    """Send one request with default parameters to each endpoint"""
+    from httpx import ASGITransport, AsyncClient
+
+    statuses = {}
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url=WARM_UP_BASE_URL
+    ) as client:
+        for endpoint in endpoints:
+            start = perf_counter()
+            response = await client.get(endpoint, params=query_parameters)
+            statuses[endpoint] = response.status_code
+            elapsed = perf_counter() - start
+            logger.debug(
+                lambda: f"  Warm-up request {endpoint} : {response.status_code} in {elapsed:.3f} s"
+            )
+
+    return ", ".join(f"{endpoint} {status}" for endpoint, status in statuses.items())
+
+
+async def warm_up_application(app, common_datasets: dict) -> Dict[str, float]:
+    """Run the configured warm-up phases and return the time each took"""
+    settings = app.settings
+    timings: Dict[str, float] = {}
+    preopened_datasets = getattr(app.state, "preopened_datasets", None)
+    if preopened_datasets:
+        await _time_phase(
+            "indexes",
+            lambda: load_coordinate_indexes(preopened_datasets),
+            timings,
+        )
+    if settings.WARM_UP_PAGE_CACHE:
+        await _time_phase(
+            "page cache",
+            lambda: preload_page_cache(common_datasets.values()),
+            timings,
+        )
+    if settings.WARM_UP_ENDPOINTS and preopened_datasets:
+        await _time_phase(
+            "requests",
+            lambda: send_synthetic_requests(
+                app,
+                endpoints=settings.WARM_UP_ENDPOINTS,
+                query_parameters=settings.WARM_UP_QUERY_PARAMETERS,
+            ),
+            timings,
+        )
+
+    logger.info(f"✅ Warm-up took {sum(timings.values()):.3f} s")
+    return timings
@@ -0,0 +1,84 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+from xarray import DataArray
+
+from pvgisprototype import SolarAltitude, SolarAzimuth
+from pvgisprototype.algorithms.hofierka.position.shading import (
+    calculate_surface_in_shade_series_for_horizon_profiles_pvgis,
+    calculate_surface_in_shade_series_pvgis,
+)
+from pvgisprototype.api.series.horizon_table import generate_table_azimuths
+from pvgisprototype.constants import RADIANS
+
+PROFILES = 20
+AZIMUTHS = 36
+TIMESTAMPS = 500
+
+
+def generate_solar_position(random):
+    solar_altitude_series = SolarAltitude(
+        value=random.uniform(-0.2, 1.2, TIMESTAMPS), unit=RADIANS
+    )
+    solar_azimuth_series = SolarAzimuth(
+        value=random.uniform(0, 2 * numpy.pi, TIMESTAMPS), unit=RADIANS
+    )
+    return solar_altitude_series, solar_azimuth_series
+
+
+def test_batch_shading_equals_shading_per_profile():
+    random = numpy.random.default_rng(11)
+    solar_altitude_series, solar_azimuth_series = generate_solar_position(random)
+    horizon_heights = random.uniform(0, 0.6, (PROFILES, AZIMUTHS))
+    horizon_azimuths = generate_table_azimuths(AZIMUTHS)
+
+    in_shade = calculate_surface_in_shade_series_for_horizon_profiles_pvgis(
+        solar_altitude_series=solar_altitude_series,
+        solar_azimuth_series=solar_azimuth_series,
+        horizon_heights=horizon_heights,
+        profiles_per_chunk=7,
+    )
+    assert in_shade.shape == (PROFILES, TIMESTAMPS)
+    assert in_shade.dtype == bool
+    for profile, heights in enumerate(horizon_heights):
+        expected = calculate_surface_in_shade_series_pvgis(
+            solar_altitude_series=solar_altitude_series,
+            solar_azimuth_series=solar_azimuth_series,
+            horizon_profile=DataArray(
+                heights, coords={"azimuth": horizon_azimuths}, dims="azimuth"
+            ),
+        )
+        numpy.testing.assert_array_equal(in_shade[profile], expected.value)
+
+
+def test_batch_shading_with_unsorted_horizon_azimuths():
+    random = numpy.random.default_rng(5)
+    solar_altitude_series, solar_azimuth_series = generate_solar_position(random)
+    horizon_heights = random.uniform(0, 0.6, (3, AZIMUTHS))
+    order = random.permutation(AZIMUTHS)
+    in_shade = calculate_surface_in_shade_series_for_horizon_profiles_pvgis(
+        solar_altitude_series=solar_altitude_series,
+        solar_azimuth_series=solar_azimuth_series,
+        horizon_heights=horizon_heights[:, order],
+        horizon_azimuths=generate_table_azimuths(AZIMUTHS)[order],
+    )
+    expected = calculate_surface_in_shade_series_for_horizon_profiles_pvgis(
+        solar_altitude_series=solar_altitude_series,
+        solar_azimuth_series=solar_azimuth_series,
+        horizon_heights=horizon_heights,
+    )
+    numpy.testing.assert_array_equal(in_shade, expected)
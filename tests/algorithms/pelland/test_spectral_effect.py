@@ -0,0 +1,129 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+import pytest
+from pandas import DataFrame
+from xarray import DataArray, Dataset
+
+from pvgisprototype.algorithms.pelland.spectral_effect import (
+    calculate_spectral_factor_pelland,
+    calculate_spectral_factors_pelland,
+)
+
+MODULE_TYPES = ["cSi", "CIGS", "aSi"]
+
+
+@pytest.fixture
+def spectral_inputs():
+    generator = numpy.random.default_rng(42)
+    wavelengths = numpy.arange(300.0, 1200.0, 50.0)
+    irradiance = DataArray(
+        generator.random((48, wavelengths.size)),
+        dims=("time", "center_wavelength"),
+        coords={"center_wavelength": wavelengths},
+    )
+    irradiance[5, 3] = numpy.nan
+    responsivity = Dataset(
+        {
+            module_type: ("center_wavelength", generator.random(wavelengths.size))
+            for module_type in MODULE_TYPES
+        },
+        coords={"center_wavelength": wavelengths},
+    )
+    reference_wavelengths = numpy.append(wavelengths, [1250.0, 1300.0])
+    reference_spectrum = DataFrame(
+        [generator.random(reference_wavelengths.size)],
+        index=["global"],
+        columns=reference_wavelengths,
+    )
+    return irradiance, responsivity, reference_spectrum
+
+
+def expected_spectral_factor(irradiance, responsivity, reference_spectrum):
+    """Direct evaluation of Pelland 2022 with xarray reductions"""
+    reference = reference_spectrum.loc["global", responsivity.center_wavelength.values]
+    reference_current_density = (
+        responsivity * reference.to_numpy()
+    ).sum() / reference.sum()
+    observed_current_density = (responsivity * irradiance).sum(
+        dim="center_wavelength"
+    ) / irradiance.sum(dim="center_wavelength")
+    return (observed_current_density / reference_current_density).to_numpy()
+
+
+def test_batched_spectral_factors_match_direct_evaluation(spectral_inputs):
+    irradiance, responsivity, reference_spectrum = spectral_inputs
+    spectral_factors = calculate_spectral_factors_pelland(
+        irradiance=irradiance,
+        responsivities={
+            module_type: responsivity[module_type] for module_type in MODULE_TYPES
+        },
+        reference_spectrum=reference_spectrum,
+    )
+    assert list(spectral_factors) == MODULE_TYPES
+    for module_type in MODULE_TYPES:
+        expected = expected_spectral_factor(
+            irradiance, responsivity[module_type], reference_spectrum
+        )
+        assert spectral_factors[module_type].value.shape == (48,)
+        assert numpy.allclose(spectral_factors[module_type].value, expected)
+
+
+def test_single_spectral_factor_matches_batched(spectral_inputs):
+    irradiance, responsivity, reference_spectrum = spectral_inputs
+    single = calculate_spectral_factor_pelland(
+        irradiance=irradiance,
+        responsivity=responsivity["CIGS"],
+        reference_spectrum=reference_spectrum,
+    )
+    batched = calculate_spectral_factors_pelland(
+        irradiance=irradiance,
+        responsivities={"CIGS": responsivity["CIGS"]},
+        reference_spectrum=reference_spectrum,
+    )
+    assert numpy.array_equal(single.value, batched["CIGS"].value)
+
+
+def test_batched_spectral_factors_do_not_depend_on_other_modules(spectral_inputs):
+    irradiance, responsivity, reference_spectrum = spectral_inputs
+    responsivities = {
+        "cSi": responsivity["cSi"],
+        "CIGS": responsivity["CIGS"].sel(center_wavelength=slice(400.0, 1000.0)),
+        "aSi": responsivity["aSi"].sel(center_wavelength=slice(300.0, 800.0)),
+    }
+    batched = calculate_spectral_factors_pelland(
+        irradiance=irradiance,
+        responsivities=responsivities,
+        reference_spectrum=reference_spectrum,
+    )
+    for module_type, module_responsivity in responsivities.items():
+        single = calculate_spectral_factor_pelland(
+            irradiance=irradiance,
+            responsivity=module_responsivity,
+            reference_spectrum=reference_spectrum,
+        )
+        numpy.testing.assert_allclose(batched[module_type].value, single.value)
+        numpy.testing.assert_allclose(
+            single.value,
+            expected_spectral_factor(
+                irradiance.sel(
+                    center_wavelength=module_responsivity.center_wavelength
+                ),
+                module_responsivity,
+                reference_spectrum,
+            ),
+        )
@@ -0,0 +1,99 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+from zoneinfo import ZoneInfo
+
+import numpy
+import pytest
+from pandas import date_range
+
+from pvgisprototype import LinkeTurbidityFactor
+from pvgisprototype.api.irradiance.clear_sky_table import (
+    CLEAR_SKY_TABLE_TOLERANCE_DEFAULT,
+    interpolate_bilinear,
+    open_clear_sky_table,
+    write_clear_sky_table,
+)
+from pvgisprototype.api.irradiance.diffuse.clear_sky.horizontal import (
+    calculate_clear_sky_diffuse_horizontal_irradiance,
+)
+from pvgisprototype.api.irradiance.direct.horizontal import (
+    calculate_clear_sky_direct_horizontal_irradiance_series,
+)
+from pvgisprototype.api.series.linke_turbidity import expand_monthly_linke_turbidity
+
+LONGITUDE = 8.0
+LATITUDE = 45.0
+ELEVATION = 214.0
+MONTHLY_LINKE_TURBIDITY = numpy.linspace(2, 4, 12)
+
+
+@pytest.fixture(scope="module")
+def clear_sky_table(tmp_path_factory):
+    path = tmp_path_factory.mktemp("tables") / "location.clearsky"
+    write_clear_sky_table(
+        longitude=[LONGITUDE],
+        latitude=[LATITUDE],
+        elevation=ELEVATION,
+        path=path,
+        monthly_linke_turbidity=MONTHLY_LINKE_TURBIDITY,
+    )
+    return open_clear_sky_table(path)
+
+
+def test_interpolate_bilinear_is_exact_for_bilinear_tables():
+    days, times = numpy.meshgrid(numpy.arange(4), numpy.arange(5), indexing="ij")
+    table = 2.0 * days + 3.0 * times + days * times
+    day = numpy.array([0.5, 1.25, 2.0])
+    time = numpy.array([3.5, 0.0, 4.0])
+    expected = 2.0 * day + 3.0 * time + day * time
+    numpy.testing.assert_allclose(interpolate_bilinear(table, day, time), expected)
+
+
+@pytest.mark.parametrize("year", [2021, 2024])
+def test_clear_sky_table_against_analytical_path(clear_sky_table, year):
+    timestamps = date_range(f"{year}-01-01 00:07", f"{year}-12-31 23:07", freq="h")
+    arguments = {
+        "longitude": numpy.radians(LONGITUDE),
+        "latitude": numpy.radians(LATITUDE),
+        "timestamps": timestamps,
+        "timezone": ZoneInfo("UTC"),
+        "linke_turbidity_factor_series": expand_monthly_linke_turbidity(
+            MONTHLY_LINKE_TURBIDITY, timestamps
+        ),
+    }
+    for calculate, extra_arguments in (
+        (calculate_clear_sky_direct_horizontal_irradiance_series, {"elevation": ELEVATION}),
+        (calculate_clear_sky_diffuse_horizontal_irradiance, {}),
+    ):
+        analytical = calculate(**arguments, **extra_arguments)
+        looked_up = calculate(**arguments, **extra_arguments, clear_sky_table=clear_sky_table)
+        assert looked_up.data_source == str(clear_sky_table.path)
+        assert numpy.abs(looked_up.value - analytical.value).max() <= CLEAR_SKY_TABLE_TOLERANCE_DEFAULT
+
+
+def test_clear_sky_table_does_not_apply_to_other_linke_turbidity(clear_sky_table):
+    timestamps = date_range("2021-06-01", periods=24, freq="h")
+    direct_horizontal_irradiance = calculate_clear_sky_direct_horizontal_irradiance_series(
+        longitude=numpy.radians(LONGITUDE),
+        latitude=numpy.radians(LATITUDE),
+        elevation=ELEVATION,
+        timestamps=timestamps,
+        timezone=ZoneInfo("UTC"),
+        linke_turbidity_factor_series=LinkeTurbidityFactor(value=numpy.full(24, 5.0)),
+        clear_sky_table=clear_sky_table,
+    )
+    assert direct_horizontal_irradiance.data_source != str(clear_sky_table.path)
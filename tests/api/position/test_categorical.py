@@ -0,0 +1,67 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+
+from pvgisprototype.api.position.categorical import (
+    CATEGORY_UNSET,
+    SHADING_STATE_CODES,
+    SHADING_STATE_UNSET,
+    SUN_HORIZON_POSITION_CODES,
+    create_categorical_series,
+    decode_categorical_field,
+    decode_shading_state_series,
+    decode_sun_horizon_position_series,
+)
+from pvgisprototype.api.position.models import ShadingState, SunHorizonPositionModel
+
+
+def test_categorical_series_is_compact_and_unset():
+    series = create_categorical_series((24,))
+    assert series.dtype == numpy.int8
+    assert numpy.all(series == CATEGORY_UNSET)
+
+
+def test_decode_sun_horizon_position_series():
+    series = create_categorical_series((4,))
+    series[:2] = SUN_HORIZON_POSITION_CODES[SunHorizonPositionModel.below]
+    series[2] = SUN_HORIZON_POSITION_CODES[SunHorizonPositionModel.above]
+    decoded = decode_sun_horizon_position_series(series)
+    assert decoded.tolist() == ["Below", "Below", "Above", None]
+
+
+def test_decode_shading_state_series():
+    series = create_categorical_series((len(SHADING_STATE_CODES) + 1,))
+    for code in SHADING_STATE_CODES.values():
+        series[code] = code
+    decoded = decode_shading_state_series(series)
+    assert decoded.tolist() == [
+        ShadingState.sunlit.value,
+        ShadingState.potentially_sunlit.value,
+        ShadingState.in_shade.value,
+        SHADING_STATE_UNSET,
+    ]
+
+
+def test_decode_categorical_field_only_for_codes():
+    codes = numpy.array([0, 1], dtype="int8")
+    assert decode_categorical_field("shading_state", codes).tolist() == [
+        ShadingState.sunlit.value,
+        ShadingState.potentially_sunlit.value,
+    ]
+    labels = numpy.array(["Sunlit"], dtype=object)
+    assert decode_categorical_field("shading_state", labels) is labels
+    assert decode_categorical_field("value", codes) is codes
@@ -0,0 +1,112 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+import pytest
+from pandas import date_range
+from xarray import DataArray
+
+from pvgisprototype import TemperatureSeries, WindSpeedSeries
+from pvgisprototype.api.power.broadband import (
+    calculate_photovoltaic_power_output_series,
+)
+from pvgisprototype.api.power.grid import (
+    calculate_photovoltaic_power_output_series_over_grid,
+)
+from pvgisprototype.constants import WIND_SPEED_DEFAULT
+from pvgisprototype.core.arrays import NDArrayBackend
+
+TIMESTAMPS = date_range("2013-06-01", "2013-06-02", freq="h")
+LATITUDES = [45.0, 45.5]
+LONGITUDES = [8.0, 8.5, 9.0]
+SURFACE_POSITION = {
+    "surface_orientation": numpy.radians(180),
+    "surface_tilt": numpy.radians(30),
+}
+
+
+def _grid_series(random, low, high, name):
+    return DataArray(
+        random.uniform(
+            low, high, size=(TIMESTAMPS.size, len(LATITUDES), len(LONGITUDES))
+        ).astype("float32"),
+        coords={"time": TIMESTAMPS, "lat": LATITUDES, "lon": LONGITUDES},
+        dims=("time", "lat", "lon"),
+        name=name,
+    )
+
+
+@pytest.fixture
+def grid_inputs():
+    random = numpy.random.default_rng(39)
+    return {
+        "elevation": DataArray(
+            random.uniform(0, 1000, size=(len(LATITUDES), len(LONGITUDES))),
+            coords={"lat": LATITUDES, "lon": LONGITUDES},
+            dims=("lat", "lon"),
+        ),
+        "global_horizontal_irradiance": _grid_series(random, 0, 800, "ghi"),
+        "direct_horizontal_irradiance": _grid_series(random, 0, 400, "dni"),
+        "temperature_series": _grid_series(random, 5, 30, "temperature"),
+    }
+
+
+def test_grid_matches_per_location_pipeline(grid_inputs):
+    photovoltaic_power = calculate_photovoltaic_power_output_series_over_grid(
+        timestamps=TIMESTAMPS,
+        **grid_inputs,
+        **SURFACE_POSITION,
+    )
+    assert photovoltaic_power.dims == ("lat", "lon", "time")
+
+    pixel = {"lat": 45.5, "lon": 9.0}
+    expected = calculate_photovoltaic_power_output_series(
+        longitude=numpy.radians(pixel["lon"]),
+        latitude=numpy.radians(pixel["lat"]),
+        elevation=float(grid_inputs["elevation"].sel(pixel)),
+        timestamps=TIMESTAMPS,
+        global_horizontal_irradiance=grid_inputs["global_horizontal_irradiance"]
+        .sel(pixel)
+        .values,
+        direct_horizontal_irradiance=grid_inputs["direct_horizontal_irradiance"]
+        .sel(pixel)
+        .values,
+        temperature_series=TemperatureSeries(
+            value=grid_inputs["temperature_series"].sel(pixel).values
+        ),
+        wind_speed_series=WindSpeedSeries(
+            value=numpy.full(TIMESTAMPS.size, WIND_SPEED_DEFAULT, dtype="float32")
+        ),
+        **SURFACE_POSITION,
+    )
+    numpy.testing.assert_allclose(photovoltaic_power.sel(pixel).values, expected.value)
+
+
+def test_chunked_grid_is_lazy_and_identical(grid_inputs):
+    eager = calculate_photovoltaic_power_output_series_over_grid(
+        timestamps=TIMESTAMPS,
+        **grid_inputs,
+        **SURFACE_POSITION,
+    )
+    lazy = calculate_photovoltaic_power_output_series_over_grid(
+        timestamps=TIMESTAMPS,
+        chunks={"lat": 1, "lon": 2},
+        **grid_inputs,
+        **SURFACE_POSITION,
+    )
+    assert NDArrayBackend.from_object(lazy.data) == NDArrayBackend.DASK
+    assert lazy.data.chunks == ((1, 1), (2, 1), (TIMESTAMPS.size,))
+    numpy.testing.assert_array_equal(lazy.compute().values, eager.values)
@@ -0,0 +1,97 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import threading
+from functools import partial
+
+import pytest
+
+from pvgisprototype.api.series.concurrent import read_concurrently
+from pvgisprototype.core.caching import clear_request_caches, custom_cached
+
+
+def read(value, barrier=None):
+    if barrier is not None:
+        barrier.wait(timeout=5)  # deadlocks unless read concurrently
+    return value * 2
+
+
+def test_read_concurrently_by_name():
+    barrier = threading.Barrier(3)
+    readers = {name: partial(read, value, barrier) for name, value in zip("abc", (1, 2, 3))}
+    assert read_concurrently(readers=readers) == {"a": 2, "b": 4, "c": 6}
+
+
+def test_read_sequentially_equals_concurrently():
+    readers = {name: partial(read, value) for name, value in zip("abc", (1, 2, 3))}
+    assert read_concurrently(readers=readers, multi_thread=False) == read_concurrently(
+        readers=readers, multi_thread=True
+    )
+
+
+def test_read_concurrently_raises():
+    def fail():
+        raise ValueError("unreadable")
+
+    with pytest.raises(ValueError, match="unreadable"):
+        read_concurrently(readers={"a": partial(read, 1), "b": fail})
+
+
+def test_read_concurrently_profile(capsys):
+    read_concurrently(readers={"a": partial(read, 1), "b": partial(read, 2)}, profile=True)
+    output = capsys.readouterr().out
+    assert "Read a in" in output
+    assert "Read b in" in output
+    assert "Read 2 inputs in" in output
+
+
+def test_read_concurrently_shares_request_caches():
+    calls = []
+
+    @custom_cached
+    def select(value):
+        calls.append(value)
+        return value * 2
+
+    clear_request_caches()
+    readers = {name: partial(select, value) for name, value in zip("ab", (1, 2))}
+    assert read_concurrently(readers=readers) == {"a": 2, "b": 4}
+    # selections cached by the workers are hits in the calling thread
+    assert select(1) == 2
+    assert select(2) == 4
+    assert sorted(calls) == [1, 2]
+    clear_request_caches()
+
+
+def test_cached_selection_from_many_threads():
+    barrier = threading.Barrier(8)
+
+    @custom_cached
+    def select(value):
+        return value * 2
+
+    def read_selection(value):
+        barrier.wait(timeout=5)  # call the cached function at once
+        return select(value)
+
+    clear_request_caches()
+    readers = {str(value): partial(read_selection, value) for value in range(8)}
+    for _ in range(20):
+        barrier.reset()
+        assert read_concurrently(readers=readers) == {
+            str(value): value * 2 for value in range(8)
+        }
+    clear_request_caches()
@@ -0,0 +1,125 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+import pytest
+from xarray import DataArray
+
+from pvgisprototype import SolarAzimuth
+from pvgisprototype.algorithms.hofierka.position.shading import (
+    calculate_horizon_height_series,
+)
+from pvgisprototype.api.series.horizon_profile import (
+    get_horizon_profile_from_array_or_set,
+)
+from pvgisprototype.api.series.horizon_table import (
+    build_horizon_table,
+    generate_table_azimuths,
+    interpolate_horizon_height,
+    is_horizon_table,
+    open_horizon_table,
+    write_horizon_table,
+)
+from pvgisprototype.constants import RADIANS
+
+AZIMUTHS = 48
+
+
+@pytest.fixture
+def gridded_horizon_profile():
+    random = numpy.random.default_rng(7)
+    return DataArray(
+        random.uniform(0, 0.3, size=(3, 4, AZIMUTHS)),
+        coords={
+            "lat": [45.0, 45.1, 45.2],
+            "lon": [8.0, 8.1, 8.2, 8.3],
+            "azimuth": generate_table_azimuths(AZIMUTHS),
+        },
+        dims=("lat", "lon", "azimuth"),
+        name="horizon_height",
+    )
+
+
+def test_interpolate_horizon_height_wraps_around():
+    heights = numpy.array([0.0, 0.1, 0.2, 0.3])
+    azimuth = numpy.array([0.0, numpy.pi / 4, 7 * numpy.pi / 4, 2 * numpy.pi, -numpy.pi / 4])
+    numpy.testing.assert_allclose(
+        interpolate_horizon_height(heights, azimuth),
+        [0.0, 0.05, 0.15, 0.0, 0.15],
+    )
+
+
+def test_build_horizon_table_keeps_equally_spaced_azimuths(gridded_horizon_profile):
+    table = build_horizon_table(gridded_horizon_profile)
+    assert table.dtype == numpy.float32
+    assert table.shape == (3, 4, AZIMUTHS)
+    numpy.testing.assert_allclose(table, gridded_horizon_profile.values, rtol=1e-6)
+
+
+def test_build_horizon_table_resamples_periodically():
+    azimuths = numpy.array([0.3, 1.5, 3.0, 4.0, 5.5])
+    heights = numpy.array([0.1, 0.2, 0.05, 0.3, 0.0])
+    profile = DataArray(heights, coords={"azimuth": azimuths}, dims="azimuth")
+    table = build_horizon_table(profile, size=36)
+    expected = numpy.interp(
+        generate_table_azimuths(36), azimuths, heights, period=2 * numpy.pi
+    )
+    numpy.testing.assert_allclose(table, expected, rtol=1e-6)
+
+
+def test_horizon_table_round_trip(tmp_path, gridded_horizon_profile):
+    path = write_horizon_table(gridded_horizon_profile, tmp_path / "profile.horizon")
+    assert is_horizon_table(path)
+    horizon_table = open_horizon_table(path)
+    assert isinstance(horizon_table.heights, numpy.memmap)
+    assert open_horizon_table(path) is horizon_table
+    numpy.testing.assert_allclose(
+        horizon_table.select(longitude=8.21, latitude=45.09),
+        gridded_horizon_profile.sel(lon=8.2, lat=45.1).values,
+        rtol=1e-6,
+    )
+    with pytest.raises(ValueError):
+        horizon_table.select(longitude=9.0, latitude=45.0, tolerance=0.1)
+
+
+def test_horizon_height_from_table_equals_from_profile(tmp_path, gridded_horizon_profile):
+    horizon_table = open_horizon_table(
+        write_horizon_table(gridded_horizon_profile, tmp_path / "profile.horizon")
+    )
+    solar_azimuth_series = SolarAzimuth(
+        value=numpy.linspace(0, 2 * numpy.pi, 97, endpoint=False),
+        unit=RADIANS,
+    )
+    profile = gridded_horizon_profile.sel(lon=8.1, lat=45.2)
+    from_profile = calculate_horizon_height_series(
+        solar_azimuth_series=solar_azimuth_series,
+        horizon_profile=profile,
+    )
+    from_table = calculate_horizon_height_series(
+        solar_azimuth_series=solar_azimuth_series,
+        horizon_profile=get_horizon_profile_from_array_or_set(
+            longitude=numpy.radians(8.1),
+            latitude=numpy.radians(45.2),
+            horizon_profile=horizon_table,
+        ),
+    )
+    expected = numpy.interp(
+        solar_azimuth_series.value,
+        numpy.append(profile.azimuth.values, 2 * numpy.pi),
+        numpy.append(profile.values, profile.values[0]),
+    )
+    numpy.testing.assert_allclose(from_profile.value, expected, rtol=1e-6)
+    numpy.testing.assert_allclose(from_table.value, expected, rtol=1e-6)
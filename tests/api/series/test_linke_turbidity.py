@@ -0,0 +1,83 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+import pytest
+from pandas import date_range
+from xarray import DataArray
+
+from pvgisprototype.api.series.linke_turbidity import (
+    MONTHS_IN_A_YEAR,
+    get_linke_turbidity_factor_series_from_array_or_set,
+    get_monthly_linke_turbidity_from_array_or_set,
+)
+
+
+@pytest.fixture
+def gridded_monthly_linke_turbidity():
+    random = numpy.random.default_rng(38)
+    return DataArray(
+        random.uniform(2, 7, size=(MONTHS_IN_A_YEAR, 2, 3)).astype("float32"),
+        coords={
+            "month": numpy.arange(1, MONTHS_IN_A_YEAR + 1),
+            "lat": [45.0, 45.1],
+            "lon": [8.0, 8.1, 8.2],
+        },
+        dims=("month", "lat", "lon"),
+        name="linke_turbidity",
+    )
+
+
+def test_monthly_linke_turbidity_of_nearest_pixel(gridded_monthly_linke_turbidity):
+    monthly = get_monthly_linke_turbidity_from_array_or_set(
+        longitude=numpy.radians(8.11),
+        latitude=numpy.radians(45.09),
+        linke_turbidity_factor_series=gridded_monthly_linke_turbidity,
+    )
+    numpy.testing.assert_array_equal(
+        monthly, gridded_monthly_linke_turbidity.sel(lat=45.1, lon=8.1).values
+    )
+
+
+def test_linke_turbidity_factor_series_is_indexed_by_month(
+    gridded_monthly_linke_turbidity,
+):
+    timestamps = date_range("2013-01-01", "2014-12-31", freq="7D")
+    linke_turbidity_factor_series = get_linke_turbidity_factor_series_from_array_or_set(
+        longitude=numpy.radians(8.2),
+        latitude=numpy.radians(45.0),
+        linke_turbidity_factor_series=gridded_monthly_linke_turbidity,
+        timestamps=timestamps,
+    )
+    expected = [
+        gridded_monthly_linke_turbidity.sel(lat=45.0, lon=8.2, month=month).item()
+        for month in timestamps.month
+    ]
+    assert linke_turbidity_factor_series.value.shape == timestamps.shape
+    numpy.testing.assert_array_equal(linke_turbidity_factor_series.value, expected)
+
+
+def test_monthly_linke_turbidity_requires_twelve_months(
+    gridded_monthly_linke_turbidity,
+):
+    with pytest.raises(ValueError):
+        get_monthly_linke_turbidity_from_array_or_set(
+            longitude=numpy.radians(8.0),
+            latitude=numpy.radians(45.0),
+            linke_turbidity_factor_series=gridded_monthly_linke_turbidity.isel(
+                month=slice(0, 6)
+            ),
+        )
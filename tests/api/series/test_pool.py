@@ -0,0 +1,79 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import os
+
+import numpy
+from pandas import date_range
+from xarray import DataArray, Dataset
+
+from pvgisprototype.api.series.pool import DatasetHandlePool
+
+
+def write_data_array(path, scale_factor: float = 0.1):
+    data_array = DataArray(
+        numpy.arange(24, dtype="float32").reshape(6, 2, 2),
+        coords={
+            "time": date_range("2020-01-01", periods=6, freq="h"),
+            "lat": [45.0, 46.0],
+            "lon": [8.0, 9.0],
+        },
+        name="SIS",
+    )
+    data_array.encoding.update(
+        dtype="int16", scale_factor=scale_factor, add_offset=0.0, _FillValue=-1
+    )
+    data_array.to_netcdf(path)
+    return path
+
+
+def test_pool_reuses_handles_and_metadata(tmp_path):
+    path = write_data_array(tmp_path / "sis.nc")
+    pool = DatasetHandlePool()
+    handle = pool.get(path)
+    assert pool.get(path) is handle
+    assert isinstance(handle.data, DataArray)
+    assert handle.variable == "SIS"
+    assert handle.scale_factor == 0.1
+    assert pool.get(path, mask_and_scale=True) is not handle
+    assert len(pool) == 2
+
+
+def test_pool_reads_datasets(tmp_path):
+    path = tmp_path / "set.nc"
+    Dataset({"a": ("x", [1, 2]), "b": ("x", [3, 4])}).to_netcdf(path)
+    assert isinstance(DatasetHandlePool().get(path).data, Dataset)
+
+
+def test_pool_evicts_least_recently_used(tmp_path):
+    paths = [write_data_array(tmp_path / f"{index}.nc") for index in range(3)]
+    pool = DatasetHandlePool(maxsize=2)
+    first = pool.get(paths[0])
+    pool.get(paths[1])
+    pool.get(paths[0])  # most recently used
+    pool.get(paths[2])
+    assert len(pool) == 2
+    assert pool.get(paths[0]) is first
+
+
+def test_pool_reopens_modified_files(tmp_path):
+    path = write_data_array(tmp_path / "sis.nc")
+    pool = DatasetHandlePool()
+    handle = pool.get(path)
+    statistics = os.stat(path)
+    os.utime(path, ns=(statistics.st_atime_ns, statistics.st_mtime_ns + 10**9))
+    assert pool.get(path) is not handle
+    assert len(pool) == 1
@@ -0,0 +1,147 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+import pytest
+from pandas import DatetimeIndex, date_range
+from xarray import DataArray, Dataset
+
+from pvgisprototype.api.series.spectral_factor import (
+    build_monthly_lookup_table,
+    expand_monthly_values,
+    get_spectral_factor_series_from_array_or_set,
+    is_monthly_time_series,
+    select_monthly_location_values,
+)
+
+
+def monthly_location_time_series(months: int = 12) -> DataArray:
+    return DataArray(
+        numpy.linspace(0.9, 1.1, months),
+        dims="time",
+        coords={"time": date_range("2013-01-01", periods=months, freq="MS")},
+    )
+
+
+def test_is_monthly_time_series():
+    assert is_monthly_time_series(monthly_location_time_series())
+    hourly = DataArray(
+        numpy.zeros(48),
+        dims="time",
+        coords={"time": date_range("2013-01-01", periods=48, freq="h")},
+    )
+    assert not is_monthly_time_series(hourly)
+
+
+@pytest.mark.parametrize(
+    "timestamps",
+    [
+        ["2013-01-31", "2013-02-01", "2013-03-15"],  # not month starts
+        ["2013-01-01 12:00", "2013-02-01 12:00"],  # not at midnight
+        ["2013-12-01", "2014-01-01"],  # not a single year
+    ],
+)
+def test_short_time_series_is_not_monthly(timestamps):
+    short = DataArray(
+        numpy.zeros(len(timestamps)),
+        dims="time",
+        coords={"time": DatetimeIndex(timestamps)},
+    )
+    assert not is_monthly_time_series(short)
+
+
+def test_expand_monthly_values_by_month_index():
+    location_time_series = monthly_location_time_series()
+    monthly_values = build_monthly_lookup_table(location_time_series)
+    timestamps = date_range("2020-01-01", "2021-12-31 23:00", freq="h")
+    spectral_factor = expand_monthly_values(
+        monthly_values, timestamps, dtype="float64"
+    )
+    assert spectral_factor.shape == timestamps.shape
+    assert numpy.array_equal(
+        spectral_factor, location_time_series.to_numpy()[timestamps.month - 1]
+    )
+
+
+def test_expand_monthly_values_for_missing_month():
+    monthly_values = build_monthly_lookup_table(monthly_location_time_series(11))
+    with pytest.raises(ValueError):
+        expand_monthly_values(monthly_values, date_range("2020-12-01", periods=3))
+
+
+def test_expand_monthly_values_keeps_nan_values():
+    location_time_series = monthly_location_time_series()
+    location_time_series[5] = numpy.nan  # e.g. a masked pixel
+    monthly_values = build_monthly_lookup_table(location_time_series)
+    spectral_factor = expand_monthly_values(
+        monthly_values, date_range("2020-05-31", periods=3), dtype="float64"
+    )
+    assert numpy.isnan(spectral_factor[1:]).all()
+    assert spectral_factor[0] == location_time_series[4]
+
+
+def monthly_spectral_factor_maps() -> Dataset:
+    return Dataset(
+        {
+            "spectral_factor": monthly_location_time_series()
+            .expand_dims(lon=[8.0], lat=[45.0])
+            .transpose("time", "lat", "lon")
+        }
+    )
+
+
+def test_monthly_spectral_factor_from_a_packed_file(tmp_path):
+    spectral_factor_maps = monthly_spectral_factor_maps()
+    path = tmp_path / "spectral_factor.nc"
+    spectral_factor_maps.to_netcdf(
+        path,
+        engine="h5netcdf",
+        encoding={
+            "spectral_factor": {
+                "dtype": "int16",
+                "scale_factor": 0.001,
+                "add_offset": 1.0,
+            }
+        },
+    )
+    monthly_values = select_monthly_location_values(
+        time_series=path,
+        longitude=8.0,
+        latitude=45.0,
+        mask_and_scale=True,
+    )
+    numpy.testing.assert_allclose(
+        monthly_values.values,
+        spectral_factor_maps["spectral_factor"].to_numpy().ravel(),
+        atol=0.001,
+    )
+
+
+def test_monthly_spectral_factor_from_a_dataset():
+    location_time_series = monthly_location_time_series()
+    spectral_factor_maps = monthly_spectral_factor_maps()
+    timestamps = date_range("2020-01-01", periods=48, freq="W")
+    spectral_factor_series = get_spectral_factor_series_from_array_or_set(
+        longitude=numpy.radians(8.0),
+        latitude=numpy.radians(45.0),
+        spectral_factor_series=spectral_factor_maps,
+        timestamps=timestamps,
+        dtype="float64",
+    )
+    assert numpy.array_equal(
+        spectral_factor_series.value,
+        location_time_series.to_numpy()[timestamps.month - 1],
+    )
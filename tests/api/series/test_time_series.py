@@ -0,0 +1,85 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+from math import radians
+
+import numpy
+from pandas import date_range
+from xarray import DataArray
+
+from pvgisprototype import TemperatureSeries
+from pvgisprototype.api.series.time_series import read_external_time_series
+
+
+TIMESTAMPS = date_range("2020-01-01", periods=6, freq="h")
+
+
+def write_data_array(path, name: str):
+    DataArray(
+        numpy.arange(24, dtype="float32").reshape(6, 2, 2),
+        coords={"time": TIMESTAMPS, "lat": [45.0, 46.0], "lon": [8.0, 9.0]},
+        name=name,
+    ).to_netcdf(path)
+    return path
+
+
+def read(tmp_path, profile: bool = False, **time_series):
+    parameters = {
+        "global_horizontal_irradiance": write_data_array(tmp_path / "sis.nc", "SIS"),
+        "direct_horizontal_irradiance": write_data_array(tmp_path / "sid.nc", "SID"),
+        "temperature_series": write_data_array(tmp_path / "t2m.nc", "t2m"),
+        "wind_speed_series": None,
+        "spectral_factor_series": None,
+    } | time_series
+    return read_external_time_series(
+        **parameters,
+        longitude=radians(8),
+        latitude=radians(45),
+        timestamps=TIMESTAMPS,
+        neighbor_lookup=None,
+        tolerance=None,
+        mask_and_scale=False,
+        in_memory=False,
+        dtype="float64",
+        array_backend="numpy",
+        multi_thread=True,
+        verbose=0,
+        log=0,
+        profile=profile,
+    )
+
+
+def test_read_external_time_series(tmp_path):
+    time_series = read(tmp_path)
+    expected = numpy.arange(0, 24, 4, dtype="float64")
+    numpy.testing.assert_array_equal(time_series["global_horizontal_irradiance"], expected)
+    assert time_series["direct_horizontal_irradiance"].dtype == numpy.float64
+    assert isinstance(time_series["temperature_series"], TemperatureSeries)
+    assert time_series["wind_speed_series"] is None
+
+
+def test_read_external_time_series_without_horizontal_irradiance(tmp_path):
+    time_series = read(tmp_path, direct_horizontal_irradiance=None)
+    assert time_series["direct_horizontal_irradiance"] is None
+    assert time_series["global_horizontal_irradiance"] == tmp_path / "sis.nc"
+
+
+def test_read_external_time_series_in_one_pool(tmp_path, capsys):
+    read(tmp_path, profile=True)
+    output = capsys.readouterr().out
+    assert "Read global_horizontal_irradiance in" in output
+    assert "Read temperature_series in" in output
+    assert output.count("inputs in") == 1
@@ -0,0 +1,96 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+import pytest
+from pandas import date_range
+from xarray import DataArray
+from xarray.backends import h5netcdf_
+
+from pvgisprototype.api.series.select import select_time_series
+
+HOURS = 24 * 90
+CHUNK_SIZE = 24  # one day per chunk
+
+
+@pytest.fixture
+def hourly_time_series(tmp_path):
+    path = tmp_path / "hourly.nc"
+    data_array = DataArray(
+        numpy.arange(HOURS * 4, dtype="float32").reshape(HOURS, 2, 2),
+        coords={
+            "time": date_range("2020-01-01", periods=HOURS, freq="h"),
+            "lat": [45.0, 46.0],
+            "lon": [8.0, 9.0],
+        },
+        name="SIS",
+    )
+    data_array.encoding.update(chunksizes=(CHUNK_SIZE, 2, 2))
+    data_array.to_netcdf(path, engine="h5netcdf")
+    return path, data_array
+
+
+@pytest.fixture
+def chunk_reads(monkeypatch):
+    """Record the time chunks read from the SIS variable"""
+    chunks = set()
+    getitem = h5netcdf_.H5NetCDFArrayWrapper._getitem
+
+    def counting_getitem(self, key):
+        if self.variable_name == "SIS":
+            time_key = key[0]
+            time_steps = (
+                range(*time_key.indices(self.shape[0]))
+                if isinstance(time_key, slice)
+                else numpy.atleast_1d(time_key)
+            )
+            chunks.update(int(step) // CHUNK_SIZE for step in time_steps)
+        return getitem(self, key)
+
+    monkeypatch.setattr(h5netcdf_.H5NetCDFArrayWrapper, "_getitem", counting_getitem)
+    return chunks
+
+
+def test_select_time_series_reads_only_requested_timestamps(hourly_time_series, chunk_reads):
+    path, data_array = hourly_time_series
+    timestamps = date_range("2020-02-01", "2020-02-07 23:00", freq="h")
+    series = select_time_series(
+        time_series=path,
+        longitude=8.0,
+        latitude=45.0,
+        timestamps=timestamps,
+        neighbor_lookup="nearest",
+    )
+    expected = data_array.sel(lon=8.0, lat=45.0, time=timestamps)
+    numpy.testing.assert_array_equal(series.values, expected.values)
+    # 7 days, plus one time step on either side for inexact matches
+    assert len(chunk_reads) <= 9
+
+
+def test_select_time_series_reads_only_requested_period(hourly_time_series, chunk_reads):
+    path, data_array = hourly_time_series
+    start_time, end_time = date_range("2020-03-10", "2020-03-12 23:00", periods=2)
+    series = select_time_series(
+        time_series=path,
+        longitude=8.0,
+        latitude=45.0,
+        timestamps=None,
+        start_time=start_time,
+        end_time=end_time,
+    )
+    expected = data_array.sel(lon=8.0, lat=45.0, time=slice(start_time, end_time))
+    numpy.testing.assert_array_equal(series.values, expected.values)
+    assert len(chunk_reads) <= 3
@@ -0,0 +1,117 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+import pytest
+from pandas import DataFrame
+
+from pvgisprototype.api.spectrum.helpers_pelland import (
+    _generate_banded_data_by_interpolation,
+    build_band_integration_matrix,
+    generate_banded_data,
+)
+
+REFERENCE_BANDS = DataFrame(
+    {
+        "Lower limit [nm]": [300.0, 412.5, 600.0],
+        "Center [nm]": [356.25, 506.25, 800.0],
+        "Upper limit [nm]": [412.5, 600.0, 1000.0],
+    }
+)
+WAVELENGTHS = numpy.arange(300.0, 1001.0, 25.0)
+
+
+def test_band_integration_of_linear_spectrum_is_exact():
+    """The trapezoidal rule is exact for spectra linear in wavelength"""
+    spectral_data = DataFrame(
+        [2 * WAVELENGTHS + 1, numpy.ones_like(WAVELENGTHS)], columns=WAVELENGTHS
+    )
+    banded_data = generate_banded_data(
+        reference_bands=REFERENCE_BANDS,
+        spectral_data=spectral_data,
+        data_type="spectrum",
+        dtype="float64",
+    )
+    lower = REFERENCE_BANDS["Lower limit [nm]"].to_numpy()
+    upper = REFERENCE_BANDS["Upper limit [nm]"].to_numpy()
+    expected_integral = (upper**2 + upper) - (lower**2 + lower)
+    assert numpy.allclose(banded_data.iloc[0], expected_integral)
+    assert numpy.allclose(banded_data.iloc[1], upper - lower)
+
+
+def test_band_averaged_responsivity():
+    spectral_data = DataFrame([numpy.full(WAVELENGTHS.size, 0.5)], columns=WAVELENGTHS)
+    banded_data = generate_banded_data(
+        reference_bands=REFERENCE_BANDS,
+        spectral_data=spectral_data,
+        data_type="responsivity",
+    )
+    assert banded_data.columns.name == "center_wavelength"
+    assert numpy.allclose(banded_data.to_numpy(), 0.5)
+
+
+def test_band_integration_matrix_is_cached_per_wavelength_grid():
+    matrix = build_band_integration_matrix(WAVELENGTHS, REFERENCE_BANDS, "spectrum")
+    assert matrix.shape == (len(REFERENCE_BANDS), WAVELENGTHS.size)
+    assert build_band_integration_matrix(
+        WAVELENGTHS.copy(), REFERENCE_BANDS, "spectrum"
+    ) is matrix
+
+
+@pytest.mark.parametrize("data_type", ["spectrum", "responsivity"])
+def test_banded_data_match_the_interpolation_of_the_data(data_type):
+    """Pin the band integration matrix against interpolating the data frame,
+    for bands that are not contiguous, data with missing values and band
+    edges beyond the data"""
+    generator = numpy.random.default_rng(7)
+    wavelengths = numpy.arange(300.0, 981.0, 20.0)
+    spectral_data = DataFrame(
+        generator.random((6, wavelengths.size)), columns=wavelengths
+    )
+    spectral_data.iloc[2, 5] = numpy.nan
+    spectral_data.iloc[4, -1] = numpy.nan
+    reference_bands = DataFrame(
+        {
+            "Lower limit [nm]": [310.0, 450.0, 700.0],
+            "Center [nm]": [355.0, 525.0, 850.0],
+            "Upper limit [nm]": [400.0, 600.0, 1000.0],
+        }
+    )
+    banded_data = generate_banded_data(
+        reference_bands=reference_bands,
+        spectral_data=spectral_data,
+        data_type=data_type,
+        dtype="float64",
+    )
+    expected = _generate_banded_data_by_interpolation(
+        reference_bands=reference_bands,
+        data=spectral_data,
+        data_type=data_type,
+        dtype="float64",
+    )
+    assert not banded_data.isna().any().any()
+    numpy.testing.assert_allclose(banded_data.to_numpy(), expected.to_numpy())
+
+
+def test_banded_data_of_unknown_data_type_are_missing():
+    spectral_data = DataFrame([numpy.ones(WAVELENGTHS.size)], columns=WAVELENGTHS)
+    banded_data = generate_banded_data(
+        reference_bands=REFERENCE_BANDS,
+        spectral_data=spectral_data,
+        data_type="irradiance",
+    )
+    assert banded_data.shape == (1, len(REFERENCE_BANDS))
+    assert banded_data.isna().all().all()
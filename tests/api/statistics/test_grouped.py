@@ -0,0 +1,109 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+import pytest
+from pandas import Series, date_range
+
+from pvgisprototype.api.statistics.grouped import (
+    SEASONS,
+    calculate_grouped_statistics,
+    generate_group_codes,
+    label_group_key,
+)
+from pvgisprototype.api.statistics.pandas import (
+    calculate_mean_of_series_per_time_unit,
+    calculate_statistics,
+)
+from pvgisprototype.api.statistics.polars import get_season
+
+TIMESTAMPS = date_range("2020-01-01", "2021-12-31 23:00", freq="3h")
+
+
+def series(seed: int = 0) -> numpy.ndarray:
+    values = numpy.random.default_rng(seed).uniform(0, 100, TIMESTAMPS.size)
+    values[::17] = numpy.nan
+    return values
+
+
+def test_seasons_are_ordered_as_xarray():
+    codes, keys = generate_group_codes(TIMESTAMPS, "season")
+    assert keys.tolist() == [0, 1, 2, 3]
+    assert [SEASONS[code] for code in codes] == [
+        get_season(month) for month in TIMESTAMPS.month
+    ]
+
+
+@pytest.mark.parametrize(
+    "frequency, pandas_grouper",
+    [
+        ("YE", "YE"),
+        ("ME", "ME"),
+        ("W", "W"),
+        ("D", "D"),
+        ("8h", "8h"),
+    ],
+)
+def test_grouped_statistics_match_pandas(frequency, pandas_grouper):
+    quantities = {"first": series(0), "second": series(1)}
+    statistics = calculate_grouped_statistics(
+        quantities=quantities, timestamps=TIMESTAMPS, frequency=frequency
+    )
+    for name, values in quantities.items():
+        resampled = Series(values, index=TIMESTAMPS).resample(pandas_grouper)
+        numpy.testing.assert_allclose(statistics[name]["sum"], resampled.sum())
+        numpy.testing.assert_allclose(statistics[name]["mean"], resampled.mean())
+        numpy.testing.assert_allclose(statistics[name]["std"], resampled.std())
+
+
+@pytest.mark.parametrize(
+    "frequency, labels",
+    [
+        ("Single", ["Single"]),
+        ("year", ["2020", "2021"]),
+        ("season", ["DJF", "JJA", "MAM"]),
+        ("month", ["Jan", "Feb", "Mar"]),
+        ("YE", ["2020", "2021"]),
+        ("ME", ["2020-01", "2020-02", "2020-03"]),
+        ("D", ["2020-01-01 00:00:00", "2020-01-02 00:00:00", "2020-01-03 00:00:00"]),
+    ],
+)
+def test_label_group_key(frequency, labels):
+    _, keys = generate_group_codes(TIMESTAMPS, frequency)
+    assert [label_group_key(key, frequency) for key in keys[:3].tolist()] == labels
+
+
+@pytest.mark.parametrize("frequency", ["ME", "D", "8h"])
+def test_pandas_statistics_match_resampling(frequency):
+    values = series(0)
+    resampled = Series(values, index=TIMESTAMPS).resample(frequency)
+    total, mean, standard_deviation, percentage = calculate_statistics(
+        values,
+        timestamps=TIMESTAMPS,
+        frequency=frequency,
+        reference_series=2,
+        dtype="float64",
+    )
+    numpy.testing.assert_allclose(total, resampled.sum().sum())
+    numpy.testing.assert_allclose(mean, resampled.mean().mean())
+    numpy.testing.assert_allclose(standard_deviation, resampled.std().mean())
+    numpy.testing.assert_allclose(percentage, total / 2 * 100)
+    numpy.testing.assert_allclose(
+        calculate_mean_of_series_per_time_unit(
+            values, timestamps=TIMESTAMPS, frequency=frequency
+        ),
+        resampled.sum().mean(),
+    )
@@ -0,0 +1,78 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+import pytest
+from pandas import Series, date_range
+
+from pvgisprototype.api.statistics.streaming import StreamingStatistics
+
+TIMESTAMPS = date_range("2000-01-01", "2003-12-31 23:00", freq="h")
+VALUES = numpy.random.default_rng(0).gamma(2, 100, TIMESTAMPS.size)
+VALUES[::7] = 0
+VALUES[::101] = numpy.nan
+
+
+def accumulate_per_year(frequency: str) -> StreamingStatistics:
+    statistics = StreamingStatistics(frequency=frequency)
+    for year in numpy.unique(TIMESTAMPS.year):
+        chunk = TIMESTAMPS.year == year
+        statistics.update(VALUES[chunk], TIMESTAMPS[chunk])
+    return statistics
+
+
+@pytest.mark.parametrize("frequency", ["month", "ME", "YE"])
+def test_streaming_statistics_match_full_series(frequency):
+    statistics = accumulate_per_year(frequency)
+    series = Series(VALUES, index=TIMESTAMPS)
+    grouped = (
+        series.groupby(TIMESTAMPS.month)
+        if frequency == "month"
+        else series.resample(frequency)
+    )
+    numpy.testing.assert_allclose(statistics.sums, grouped.sum())
+    numpy.testing.assert_allclose(statistics.means, grouped.mean())
+    numpy.testing.assert_allclose(statistics.standard_deviations, grouped.std())
+    assert statistics.counts.tolist() == grouped.count().tolist()
+
+
+def test_merged_statistics_match_sequential_updates():
+    sequential = accumulate_per_year("month")
+    merged = StreamingStatistics(frequency="month")
+    for year in numpy.unique(TIMESTAMPS.year):
+        chunk = TIMESTAMPS.year == year
+        partial = StreamingStatistics(frequency="month")
+        partial.update(VALUES[chunk], TIMESTAMPS[chunk])
+        merged.merge(partial)
+    numpy.testing.assert_allclose(merged.means, sequential.means)
+    numpy.testing.assert_allclose(merged.variances, sequential.variances)
+    numpy.testing.assert_array_equal(
+        merged.quantiles((0.5,)), sequential.quantiles((0.5,))
+    )
+
+
+def test_quantiles_within_relative_accuracy():
+    statistics = accumulate_per_year("month")
+    expected = (
+        Series(VALUES, index=TIMESTAMPS)
+        .groupby(TIMESTAMPS.month)
+        .quantile([0.1, 0.5, 0.9])
+        .unstack()
+        .to_numpy()
+    )
+    numpy.testing.assert_allclose(
+        statistics.quantiles((0.1, 0.5, 0.9)), expected, rtol=statistics.alpha
+    )
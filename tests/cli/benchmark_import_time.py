@@ -0,0 +1,92 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Import-time benchmark of the command line interface
+
+Each command runs in a fresh interpreter under `python -X importtime`. The
+best cumulative import time of the top-level imports over a few runs is
+compared against a budget.
+
+Timings depend on the machine and its load, i.e. running tests in parallel,
+so they are not part of the default test run. Run this benchmark with
+
+    python -m tests.cli.benchmark_import_time
+
+or the timed tests with `pytest --benchmark tests/cli/test_import_time.py`.
+"""
+import argparse
+import re
+import subprocess
+import sys
+
+# Budgets in seconds, with room for slower machines
+HELP_IMPORT_TIME_BUDGET = 1.0
+POSITION_IMPORT_TIME_BUDGET = 4.0
+POSITION_ARGUMENTS = ("position", "altitude", "8", "45", "2024-06-01T12:00")
+IMPORT_TIME_BUDGETS = {
+    ("--help",): HELP_IMPORT_TIME_BUDGET,
+    ("--version",): HELP_IMPORT_TIME_BUDGET,
+    POSITION_ARGUMENTS: POSITION_IMPORT_TIME_BUDGET,
+}
+REPEAT_DEFAULT = 3
+
+IMPORT_TIME_PATTERN = re.compile(r"import time:\s+\d+ \|\s+(\d+) \| (\S+)$")
+
+
+def run_with_importtime(*arguments: str) -> tuple[float, set[str]]:
+    """Return the import time in seconds and the imported modules of a command
+
+    Modules imported via `importlib.import_module()` are not timed themselves,
+    their own imports are reported as top-level ones.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "pvgisprototype.cli.cli", *arguments],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    import_time = 0
+    for line in result.stderr.splitlines():
+        match = IMPORT_TIME_PATTERN.match(line)
+        if match:  # top-level imports only, they include their own imports
+            import_time += int(match.group(1))
+    modules = set(re.findall(r"import time:.*\| +(\S+)$", result.stderr, re.M))
+
+    return import_time / 1e6, modules
+
+
+def best_import_time(arguments: tuple[str, ...], repeat: int = REPEAT_DEFAULT) -> float:
+    """Return the shortest import time of a command over `repeat` runs"""
+    return min(run_with_importtime(*arguments)[0] for _ in range(repeat))
+
+
+def main(repeat: int = REPEAT_DEFAULT) -> int:
+    """Print the import time of each command, fail if over its budget"""
+    exceeded = 0
+    for arguments, budget in IMPORT_TIME_BUDGETS.items():
+        import_time = best_import_time(arguments, repeat=repeat)
+        status = "ok" if import_time < budget else "over budget"
+        exceeded += import_time >= budget
+        print(f"{' '.join(arguments):<45} {import_time:6.3f} s / {budget:.1f} s  {status}")
+
+    return 1 if exceeded else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=REPEAT_DEFAULT)
+    sys.exit(main(repeat=parser.parse_args().repeat))
@@ -16,7 +16,7 @@
 #
 import pytest
 from typer.testing import CliRunner
-from pvgisprototype.cli.cli import app
+from pvgisprototype.cli.cli import LAZY_SUBCOMMANDS, app
 from itertools import product
 
 
@@ -51,15 +51,20 @@ class ValidateTyperApplication:
     def collect_commands(app):
         """Collect all commands and subcommands from the Typer app."""
         commands = []
-        for group in app.registered_groups:
+        groups = [(group.name, group.typer_instance) for group in app.registered_groups]
+        groups += [
+            (name, subcommand.typer_instance())
+            for name, subcommand in LAZY_SUBCOMMANDS.items()
+        ]
+        for group_name, typer_instance in groups:
             # Collect main command
-            commands.append([group.name])
+            commands.append([group_name])
 
             # Collect subcommands
-            if hasattr(group.typer_instance, 'registered_commands'):
-                for command in group.typer_instance.registered_commands:
+            if hasattr(typer_instance, 'registered_commands'):
+                for command in typer_instance.registered_commands:
                     if command.name:
-                        commands.append([group.name, command.name])
+                        commands.append([group_name, command.name])
 
         return commands
 
@@ -16,7 +16,7 @@
 #
 from rich import print
 from typer.testing import CliRunner
-from pvgisprototype.cli.cli import app
+from pvgisprototype.cli.cli import LAZY_SUBCOMMANDS, app
 
 runner = CliRunner()
 
@@ -38,27 +38,32 @@ def test_cli():
     failed_tests = 0
     failed_commands = []
 
-    # Iterate through all registered groups
-    for group in app.registered_groups:
-        result = runner.invoke(app, [group.name])
+    # Iterate through all registered and lazily imported groups
+    groups = [(group.name, group.typer_instance) for group in app.registered_groups]
+    groups += [
+        (name, subcommand.typer_instance())
+        for name, subcommand in LAZY_SUBCOMMANDS.items()
+    ]
+    for group_name, typer_instance in groups:
+        result = runner.invoke(app, [group_name])
         
         total_commands += 1
         
         # Test the main command group
         if result.exit_code == 0:
-            print(f"{check_mark} Group '{group.name}' passed.")
+            print(f"{check_mark} Group '{group_name}' passed.")
             passed_tests += 1
         else:
-            print(f"{x_mark} Group '{group.name}' failed with exit code {result.exit_code}.")
+            print(f"{x_mark} Group '{group_name}' failed with exit code {result.exit_code}.")
             failed_tests += 1
-            failed_commands.append(f"Group: {group.name}")
+            failed_commands.append(f"Group: {group_name}")
 
         # Retrieve and test subcommands
-        if hasattr(group.typer_instance, 'registered_commands'):
-            for command in group.typer_instance.registered_commands:
+        if hasattr(typer_instance, 'registered_commands'):
+            for command in typer_instance.registered_commands:
                 if command.name:
                     total_commands += 1
-                    subcommand = [group.name, command.name]
+                    subcommand = [group_name, command.name]
                     result = runner.invoke(app, subcommand)
 
                     if result.exit_code == 0:
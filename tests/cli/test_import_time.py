@@ -0,0 +1,68 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+"""
+Import-time budget of the command line interface
+
+The modules a command imports are checked on every run. The timings are
+benchmarks, see `benchmark_import_time.py`, run with `pytest --benchmark`.
+"""
+import pytest
+
+from pvgisprototype.cli.cli import LAZY_SUBCOMMANDS
+
+from .benchmark_import_time import (
+    HELP_IMPORT_TIME_BUDGET,
+    POSITION_ARGUMENTS,
+    POSITION_IMPORT_TIME_BUDGET,
+    best_import_time,
+    run_with_importtime,
+)
+
+
+@pytest.mark.parametrize("arguments", [["--help"], ["--version"]])
+def test_help_imports(arguments):
+    _, modules = run_with_importtime(*arguments)
+    assert not modules & {"matplotlib", "pandas", "pvlib", "xarray"}
+    assert not any(module.startswith("pvgisprototype.algorithms") for module in modules)
+
+
+def test_position_imports():
+    _, modules = run_with_importtime(*POSITION_ARGUMENTS)
+    assert "pvgisprototype.cli.position.altitude" in modules
+    assert not modules & {
+        "pvgisprototype.cli.series.series",
+        "pvgisprototype.cli.surface.surface",
+        "pvgisprototype.cli.power.power",
+    }
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("arguments", [("--help",), ("--version",)])
+def test_help_import_time(arguments):
+    assert best_import_time(arguments) < HELP_IMPORT_TIME_BUDGET
+
+
+@pytest.mark.benchmark
+def test_position_import_time():
+    assert best_import_time(POSITION_ARGUMENTS) < POSITION_IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize("name", LAZY_SUBCOMMANDS)
+def test_lazy_subcommand_help_is_up_to_date(name):
+    """The help listed statically matches the one of the sub-command"""
+    subcommand = LAZY_SUBCOMMANDS[name]
+    assert subcommand.load(name).help == subcommand.help
@@ -0,0 +1,51 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+from typer.testing import CliRunner
+
+from pvgisprototype.cli.cli import app
+
+runner = CliRunner()
+
+
+def test_power_broadband_streaming_statistics():
+    result = runner.invoke(
+        app,
+        [
+            "power",
+            "broadband",
+            "8",
+            "45",
+            "214",
+            "180",
+            "30",
+            "--start-time",
+            "2019-01-01",
+            "--end-time",
+            "2020-12-31 23:00",
+            "--streaming-statistics",
+            "YE",
+            "--groupby",
+            "YE",
+        ],
+        env={"COLUMNS": "200"},
+    )
+    assert result.exit_code == 0, result.output
+    assert "statistics" in result.output
+    assert "2019" in result.output
+    assert "2020" in result.output
+    assert "8760" in result.output  # hours in 2019
+    assert "8784" in result.output  # hours in 2020
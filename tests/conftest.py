@@ -16,6 +16,8 @@
 #
 import random
 
+import pytest
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -26,10 +28,38 @@ def pytest_addoption(parser):
         type=int,
         help="Only run random selected subset of N tests.",
     )
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="Run the timing benchmarks too, not under pytest-xdist.",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "benchmark: timing assertions, run with --benchmark on an idle machine",
+    )
 
 
 def pytest_collection_modifyitems(session, config, items):
     random_sample_size = config.getoption("--random-selection")
 
     if random_sample_size >= 0:
-        items[:] = random.sample(items, k=random_sample_size)
\ No newline at end of file
+        items[:] = random.sample(items, k=random_sample_size)
+
+    # Timings of parallel workers, i.e. of pytest-xdist, compete for the machine
+    in_parallel = hasattr(config, "workerinput") or getattr(
+        config.option, "numprocesses", None
+    ) not in (None, 0)
+    if config.getoption("--benchmark") and not in_parallel:
+        return
+    reason = (
+        "timing benchmarks do not run in parallel"
+        if in_parallel
+        else "timing benchmark, run with --benchmark"
+    )
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(pytest.mark.skip(reason=reason))
\ No newline at end of file
@@ -0,0 +1,61 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import timeit
+
+import numpy
+import pytest
+
+from pvgisprototype import LinkeTurbidityFactor, SolarAltitude
+from pvgisprototype.core.factory.data_model import CONTENT_HASH
+
+
+def test_content_hash_follows_content():
+    value = numpy.linspace(0, 1, 8760)
+    solar_altitude_series = SolarAltitude(value=value)
+    assert hash(solar_altitude_series) == hash(SolarAltitude(value=value.copy()))
+    assert hash(solar_altitude_series) != hash(SolarAltitude(value=value[::-1]))
+    assert hash(SolarAltitude(value=value[::2])) == hash(
+        SolarAltitude(value=numpy.ascontiguousarray(value[::2]))
+    )
+    assert hash(LinkeTurbidityFactor()) == hash(LinkeTurbidityFactor())
+
+
+def test_content_hash_is_memoised_and_invalidated():
+    solar_altitude_series = SolarAltitude(value=numpy.zeros(8760))
+    content_hash = hash(solar_altitude_series)
+    assert solar_altitude_series.__pydantic_private__[CONTENT_HASH] == content_hash
+
+    solar_altitude_series.value = numpy.ones(8760)  # field assignment
+    assert solar_altitude_series.__pydantic_private__[CONTENT_HASH] is None
+    content_hash = hash(solar_altitude_series)
+    assert content_hash != hash(SolarAltitude(value=numpy.zeros(8760)))
+
+    solar_altitude_series.value[0] = 0  # in place : explicit invalidation
+    solar_altitude_series.invalidate_memoised_values()
+    assert hash(solar_altitude_series) != content_hash
+
+
+@pytest.mark.benchmark
+def test_memoised_content_hash_is_cheap():
+    solar_altitude_series = SolarAltitude(value=numpy.random.rand(8760 * 10))
+    number = 100
+    first_hash_time = timeit.timeit(
+        lambda: (solar_altitude_series.invalidate_memoised_values(), hash(solar_altitude_series)),
+        number=number,
+    )
+    memoised_hash_time = timeit.timeit(lambda: hash(solar_altitude_series), number=number)
+    assert memoised_hash_time < first_hash_time / 10
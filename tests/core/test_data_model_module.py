@@ -0,0 +1,113 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from pvgisprototype.core.data_model import models
+from pvgisprototype.core.data_model.definitions import PVGIS_DATA_MODEL_DEFINITIONS
+from pvgisprototype.core.factory.data_model import DataModelFactory
+from pvgisprototype.core.factory.definition.write import render_data_model_module
+
+
+def test_data_model_module_is_up_to_date():
+    source = Path(models.__file__).read_text()
+    assert source == render_data_model_module(PVGIS_DATA_MODEL_DEFINITIONS)
+
+
+@pytest.mark.parametrize("data_model_name", list(PVGIS_DATA_MODEL_DEFINITIONS))
+def test_data_model_module_matches_definitions(data_model_name):
+    annotations, default_values, _, _ = DataModelFactory._resolve_data_model_fields(
+        data_model_name, PVGIS_DATA_MODEL_DEFINITIONS
+    )
+    data_model = getattr(models, data_model_name)
+    assert data_model_name in models.DATA_MODELS
+    assert list(data_model.model_fields) == list(annotations)
+    for field, value in default_values.items():
+        default = data_model.model_fields[field].default
+        if hasattr(value, "dtype"):
+            assert default.dtype == value.dtype
+            assert default.tolist() == value.tolist()
+        else:
+            assert default == value
+
+
+@pytest.mark.benchmark
+def test_data_model_module_loads_faster_than_dynamic_generation(monkeypatch):
+    monkeypatch.setattr(DataModelFactory, "_cache", dict(DataModelFactory._cache))
+    code = compile(Path(models.__file__).read_text(), models.__file__, "exec")
+
+    start = time.perf_counter()
+    namespace = {"__name__": "ahead_of_time_models"}
+    exec(code, namespace)
+    for data_model_name in namespace["DATA_MODELS"]:
+        namespace["data_model"](data_model_name)
+    ahead_of_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for data_model_name in PVGIS_DATA_MODEL_DEFINITIONS:
+        annotations, default_values, use_numpy_model, _ = (
+            DataModelFactory._resolve_data_model_fields(
+                data_model_name, PVGIS_DATA_MODEL_DEFINITIONS
+            )
+        )
+        DataModelFactory.create_data_model(
+            data_model_name, annotations, default_values, use_numpy_model
+        )
+    dynamic = time.perf_counter() - start
+
+    assert ahead_of_time < dynamic
+
+
+def test_data_models_are_generated_on_first_access():
+    code = (
+        "import pvgisprototype\n"
+        "from pvgisprototype.core.factory.data_model import DataModelFactory\n"
+        "assert not DataModelFactory._cache\n"
+        "from pvgisprototype import LocationShading\n"
+        "print(' '.join(DataModelFactory._cache))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    generated = output.split()
+    assert "LocationShading" in generated
+    assert len(generated) < len(PVGIS_DATA_MODEL_DEFINITIONS)
+
+
+def test_data_models_are_generated_once_across_threads():
+    code = (
+        "import sys\n"
+        "from concurrent.futures import ThreadPoolExecutor\n"
+        "from threading import Barrier\n"
+        "import pvgisprototype\n"
+        "sys.setswitchinterval(1e-6)\n"
+        "barrier = Barrier(8)\n"
+        "def first_access(_):\n"
+        "    barrier.wait()\n"
+        "    return pvgisprototype.SolarAltitude\n"
+        "with ThreadPoolExecutor(max_workers=8) as executor:\n"
+        "    data_models = set(executor.map(first_access, range(8)))\n"
+        "print(len(data_models))\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.split() == ["1"]
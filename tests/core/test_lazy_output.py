@@ -0,0 +1,93 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+
+from pvgisprototype import SolarAltitude
+from pvgisprototype.constants import DEGREES, RADIANS
+from pvgisprototype.core.factory.context import populate_context
+from pvgisprototype.core.factory.extra_methods import PENDING_OUTPUT
+
+
+def is_pending(data_model) -> bool:
+    return data_model.__pydantic_private__[PENDING_OUTPUT] is not None
+
+
+def test_unread_output_is_never_built(monkeypatch):
+    import pvgisprototype.core.factory.extra_methods as extra_methods
+
+    calls = []
+    monkeypatch.setattr(
+        extra_methods,
+        "populate_context",
+        lambda **kwargs: calls.append(kwargs),
+    )
+    solar_altitude = SolarAltitude(value=numpy.array([0.1, 0.2]), unit=RADIANS)
+    solar_altitude.build_output(verbose=0, fingerprint=True)
+    assert is_pending(solar_altitude)
+    assert "output" in solar_altitude.__dict__  # the field is still there
+    assert calls == []
+
+
+def test_read_output_equals_the_eagerly_built_one():
+    value = numpy.array([0.1, 0.2])
+    eager = SolarAltitude(value=value.copy(), unit=RADIANS)
+    populate_context(eager, verbose=0, fingerprint=True, angle_output_units=DEGREES)
+
+    lazy = SolarAltitude(value=value.copy(), unit=RADIANS)
+    lazy.build_output(verbose=0, fingerprint=True, angle_output_units=DEGREES)
+    numpy.testing.assert_array_equal(lazy.value, numpy.degrees(value))
+
+    assert list(lazy.output) == list(eager.output)
+    assert lazy.output["Fingerprint"] == eager.output["Fingerprint"]
+    value_title = f"{lazy.shortname} {lazy.symbol}"
+    numpy.testing.assert_array_equal(
+        lazy.output["Core"][value_title], eager.output["Core"][value_title]
+    )
+    numpy.testing.assert_array_equal(
+        lazy.output["Core"][value_title], numpy.degrees(value)
+    )
+    assert not is_pending(lazy)
+
+
+def test_equality_and_hash_do_not_build_the_output():
+    solar_altitude = SolarAltitude(value=numpy.array([0.1, 0.2]), unit=RADIANS)
+    solar_altitude.build_output(verbose=0, fingerprint=True)
+    other_solar_altitude = SolarAltitude(value=numpy.array([0.1, 0.2]), unit=RADIANS)
+    other_solar_altitude.build_output(verbose=0, fingerprint=False)
+
+    content_hash = hash(solar_altitude)
+    assert solar_altitude == other_solar_altitude
+    assert hash(other_solar_altitude) == content_hash
+    assert is_pending(solar_altitude) and is_pending(other_solar_altitude)
+
+
+def test_serialising_builds_the_pending_output():
+    solar_altitude = SolarAltitude(value=numpy.array([0.1, 0.2]), unit=RADIANS)
+    solar_altitude.build_output(verbose=0, fingerprint=True)
+    assert "Fingerprint" in solar_altitude.model_dump()["output"]
+    assert not is_pending(solar_altitude)
+
+    solar_altitude_series = SolarAltitude.series(
+        value=numpy.array([0.1, 0.2]), unit=RADIANS
+    )
+    solar_altitude_series.build_output(
+        verbose=0, fingerprint=True, angle_output_units=DEGREES
+    )
+    numpy.testing.assert_array_equal(
+        solar_altitude_series.value, numpy.degrees([0.1, 0.2])
+    )
+    assert "Fingerprint" in solar_altitude_series.model_dump()["output"]
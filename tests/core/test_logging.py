@@ -0,0 +1,215 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import ast
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy
+import pytest
+
+import pvgisprototype
+import pvgisprototype.log
+from pvgisprototype.constants import HASH_AFTER_THIS_VERBOSITY_LEVEL
+from pvgisprototype.core.hashing import generate_hash
+from pvgisprototype.log import (
+    initialize_logger,
+    is_enabled_for,
+    log_data_fingerprint,
+    log_function_call,
+    logger,
+    sample_data,
+)
+
+PACKAGE = Path(pvgisprototype.__file__).parent
+LAZY_LOGGING_PACKAGES = ("algorithms", "api", "core")
+
+
+@pytest.fixture
+def messages():
+    """Collect DEBUG messages, including their `alt` rendering"""
+    messages = []
+    handler = logger.add(
+        lambda message: messages.append(message.record),
+        level="DEBUG",
+    )
+    yield messages
+    logger.remove(handler)
+
+
+def test_disabled_levels_are_not_formatted(monkeypatch):
+    monkeypatch.setattr(logger._core, "min_level", logger.level("INFO").no)
+    assert not is_enabled_for("DEBUG")
+
+    def fail():
+        raise AssertionError("Formatted a disabled log message")
+
+    logger.debug(fail, alt=fail)
+
+
+def test_lazy_messages(messages):
+    assert is_enabled_for("DEBUG")
+    data = {"value": 1}
+    logger.debug(lambda: f"Data : {data}", alt=lambda: f"[bold]Data[/bold] : {data}")
+
+    assert [record["message"] for record in messages] == ["Data : {'value': 1}"]
+    assert messages[0]["extra"]["alt"] == "[bold]Data[/bold] : {'value': 1}"
+
+
+def test_function_calls_are_logged_only_if_enabled(monkeypatch, messages):
+    def function(log=0):
+        return log
+
+    monkeypatch.setattr(pvgisprototype.log, "LOG_FUNCTION_CALLS", False)
+    wrapped_function = log_function_call(function)
+    assert wrapped_function(log=7) == 7
+    assert not messages
+
+    monkeypatch.setattr(pvgisprototype.log, "LOG_FUNCTION_CALLS", True)
+    assert wrapped_function(log=7) == 7
+    assert messages[-1]["message"].startswith(
+        "> Call : function() from test_function_calls_are_logged_only_if_enabled()"
+    )
+
+
+def test_verbose_log_option_enables_function_calls(monkeypatch):
+    monkeypatch.setattr(pvgisprototype.log, "LOG_FUNCTION_CALLS", False)
+    monkeypatch.setattr(logger, "add", lambda *args, **kwargs: None)  # no stderr
+    context = SimpleNamespace(params={})
+    initialize_logger(context, log_level=HASH_AFTER_THIS_VERBOSITY_LEVEL)
+    assert not pvgisprototype.log.LOG_FUNCTION_CALLS
+    initialize_logger(context, log_level=HASH_AFTER_THIS_VERBOSITY_LEVEL + 1)
+    assert pvgisprototype.log.LOG_FUNCTION_CALLS
+
+
+def test_sample_data():
+    data = numpy.arange(1000, dtype="float64")
+    assert sample_data(data, budget=0) == (data, 1)
+    assert sample_data(data, budget=data.nbytes) == (data, 1)
+
+    sample, step = sample_data(data, budget=800)
+    assert step == 10
+    numpy.testing.assert_array_equal(sample, data[::10])
+
+
+def test_data_fingerprints_are_sampled(messages):
+    data = numpy.arange(1000, dtype="float64")
+    log_data_fingerprint(data, log_level=7, budget=800)
+    log_data_fingerprint(data, log_level=7, budget=0)
+
+    sampled, full = (record["message"] for record in messages)
+    assert "test_data_fingerprints_are_sampled()" in sampled
+    assert f"Hash {generate_hash(data[::10])} (sampled every 10 elements)" in sampled
+    assert full.endswith(f"Hash {generate_hash(data)}")
+
+
+def formats_eagerly(argument, calls_only: bool = False) -> bool:
+    """Is an argument an f-string, optionally one calling a function ?"""
+    if not isinstance(argument, ast.JoinedStr):
+        return False
+    if not calls_only:
+        return True
+    return any(isinstance(node, ast.Call) for node in ast.walk(argument))
+
+
+def uses_lazy_logger(tree: ast.Module) -> bool:
+    """Does a module log via `pvgisprototype.log`, which accepts callables ?
+
+    Other modules, i.e. the data model factory, log with plain loguru.
+    """
+    return any(
+        isinstance(node, ast.ImportFrom)
+        and node.module == "pvgisprototype.log"
+        and any(alias.name == "logger" for alias in node.names)
+        for node in ast.walk(tree)
+    )
+
+
+def eager_log_calls(path: Path, level: str = "debug", calls_only: bool = False):
+    """Yield `logger.<level>()` calls formatting an f-string at call time"""
+    tree = ast.parse(path.read_text())
+    if not uses_lazy_logger(tree):
+        return
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == level
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "logger"
+        ):
+            arguments = node.args[:1] + [
+                keyword.value for keyword in node.keywords if keyword.arg == "alt"
+            ]
+            if any(formats_eagerly(argument, calls_only) for argument in arguments):
+                yield f"{path.relative_to(PACKAGE.parent)}:{node.lineno}"
+
+
+@pytest.mark.parametrize("package", LAZY_LOGGING_PACKAGES)
+def test_debug_messages_are_lazy(package):
+    """Hot paths pass debug messages as callables, i.e. `lambda: f"..."`"""
+    eager_calls = [
+        call
+        for path in sorted((PACKAGE / package).rglob("*.py"))
+        for call in eager_log_calls(path)
+    ]
+    assert not eager_calls, "Eager f-string debug messages in :\n" + "\n".join(
+        eager_calls
+    )
+
+
+@pytest.mark.parametrize("package", LAZY_LOGGING_PACKAGES)
+def test_info_messages_are_lazy(package):
+    """Info messages which, i.e., decode a series, are passed as callables"""
+    eager_calls = [
+        call
+        for path in sorted((PACKAGE / package).rglob("*.py"))
+        for call in eager_log_calls(path, level="info", calls_only=True)
+    ]
+    assert not eager_calls, "Eager f-string info messages in :\n" + "\n".join(
+        eager_calls
+    )
+
+
+def lazy_messages_capturing_exceptions(path: Path):
+    """Yield lambdas capturing the name bound by `except ... as name`
+
+    The name is unbound after the except block, which flake8 reports (F821).
+    """
+    tree = ast.parse(path.read_text())
+    for handler in ast.walk(tree):
+        if not isinstance(handler, ast.ExceptHandler) or not handler.name:
+            continue
+        for statement in handler.body:
+            for node in ast.walk(statement):
+                if isinstance(node, ast.Lambda) and any(
+                    isinstance(name, ast.Name) and name.id == handler.name
+                    for name in ast.walk(node)
+                ):
+                    yield f"{path.relative_to(PACKAGE.parent)}:{node.lineno}"
+
+
+@pytest.mark.parametrize("package", LAZY_LOGGING_PACKAGES)
+def test_lazy_messages_do_not_capture_exceptions(package):
+    """Lazy messages format a local bound to the exception, i.e. `reason`"""
+    capturing_lambdas = [
+        call
+        for path in sorted((PACKAGE / package).rglob("*.py"))
+        for call in lazy_messages_capturing_exceptions(path)
+    ]
+    assert not capturing_lambdas, "Lambdas capturing exceptions in :\n" + "\n".join(
+        capturing_lambdas
+    )
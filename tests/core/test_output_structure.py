@@ -0,0 +1,51 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+
+from pvgisprototype import SolarAltitude
+from pvgisprototype.constants import RADIANS
+from pvgisprototype.core.factory.context import compile_output_structure
+
+
+def test_output_structure_is_compiled_once():
+    structure = compile_output_structure("SolarAltitude")
+    assert compile_output_structure("SolarAltitude") is structure
+
+    sections = {section.name: section for section in structure}
+    assert [field.field for field in sections["Core"].fields][:3] == [
+        "name",
+        "title",
+        "description",
+    ]
+    assert sections["Fingerprint"].parsed_condition is not None
+    assert sections["Fingerprint"].condition == "fingerprint is True"
+
+
+def test_output_follows_the_conditions():
+    solar_altitude = SolarAltitude(value=numpy.array([0.1, 0.2]), unit=RADIANS)
+    solar_altitude.build_output(verbose=0, fingerprint=False)
+    assert solar_altitude.output["Fingerprint"] == {}
+    assert solar_altitude.output["Sources"] == {}
+
+    solar_altitude.build_output(verbose=0, fingerprint=True)
+    fingerprint_title = "fingerprint fingerprint"  # no title nor symbol defined
+    assert list(solar_altitude.output["Fingerprint"]) == [fingerprint_title]
+
+    value_title = f"{solar_altitude.shortname} {solar_altitude.symbol}"
+    numpy.testing.assert_array_equal(
+        solar_altitude.output["Core"][value_title], solar_altitude.value
+    )
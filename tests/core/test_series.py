@@ -0,0 +1,67 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import timeit
+
+import numpy
+import pytest
+
+from pvgisprototype import DiffuseSkyReflectedInclinedIrradiance, SolarAltitude
+from pvgisprototype.constants import DEGREES, RADIANS
+from pvgisprototype.core.factory.series import DataModelSeries
+
+
+def test_series_unit_views():
+    value = numpy.linspace(-0.5, 1.5, 5)
+    solar_altitude_series = SolarAltitude.series(value=value, unit=RADIANS)
+    assert isinstance(solar_altitude_series, DataModelSeries)
+    assert solar_altitude_series.radians is value
+    numpy.testing.assert_allclose(solar_altitude_series.degrees, numpy.degrees(value))
+    assert solar_altitude_series.min_radians == SolarAltitude().min_radians
+    assert SolarAltitude.series(value=value, unit=DEGREES).degrees is value
+
+
+def test_series_converts_to_the_data_model():
+    value = numpy.ones(3)
+    diffuse_inclined_irradiance_series = DiffuseSkyReflectedInclinedIrradiance.series(
+        value=value
+    )
+    diffuse_inclined_irradiance_series.reflected = numpy.zeros(3)
+    diffuse_inclined_irradiance_series.value_before_reflectivity[...] = 1  # a copy
+    assert DiffuseSkyReflectedInclinedIrradiance().value_before_reflectivity.size == 0
+
+    data_model = diffuse_inclined_irradiance_series.to_model()
+    assert isinstance(data_model, DiffuseSkyReflectedInclinedIrradiance)
+    assert data_model.value is value
+    assert data_model.unit == DiffuseSkyReflectedInclinedIrradiance().unit
+    assert data_model.reflected is diffuse_inclined_irradiance_series.reflected
+
+    diffuse_inclined_irradiance_series.build_output(verbose=0, fingerprint=False)
+    assert diffuse_inclined_irradiance_series.output
+
+
+@pytest.mark.benchmark
+def test_series_is_cheaper_than_the_data_model():
+    value = numpy.zeros(8760, dtype="float32")
+    number = 1000
+    data_model_time = timeit.timeit(
+        lambda: DiffuseSkyReflectedInclinedIrradiance(value=value), number=number
+    )
+    series_time = timeit.timeit(
+        lambda: DiffuseSkyReflectedInclinedIrradiance.series(value=value),
+        number=number,
+    )
+    assert series_time < data_model_time
@@ -0,0 +1,60 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+import pytest
+
+from pvgisprototype import SolarAltitude
+from pvgisprototype.constants import DEGREES, RADIANS
+
+
+@pytest.fixture
+def solar_altitude_series():
+    return SolarAltitude(value=numpy.linspace(-0.5, 1.5, 8760), unit=RADIANS)
+
+
+def test_conversions_are_memoised(solar_altitude_series):
+    degrees = solar_altitude_series.degrees
+    numpy.testing.assert_allclose(degrees, numpy.degrees(solar_altitude_series.value))
+    assert solar_altitude_series.degrees is degrees
+    assert not degrees.flags.writeable
+    assert solar_altitude_series.radians is solar_altitude_series.value
+
+
+def test_conversions_follow_the_value(solar_altitude_series):
+    degrees = solar_altitude_series.degrees
+    solar_altitude_series.value = numpy.zeros(3)
+    numpy.testing.assert_array_equal(solar_altitude_series.degrees, numpy.zeros(3))
+
+    solar_altitude_series.value[0] = numpy.pi  # in place : explicit invalidation
+    solar_altitude_series.invalidate_memoised_values()
+    assert solar_altitude_series.degrees[0] == 180
+
+    solar_altitude_series.unit = DEGREES
+    assert solar_altitude_series.degrees is solar_altitude_series.value
+
+    copied_series = solar_altitude_series.model_copy(update={"value": numpy.ones(3)})
+    numpy.testing.assert_array_equal(copied_series.degrees, numpy.ones(3))
+    assert degrees is not solar_altitude_series.degrees
+
+
+def test_conversion_into_preallocated_array(solar_altitude_series):
+    out = numpy.empty_like(solar_altitude_series.value)
+    converted = solar_altitude_series.convert_to(DEGREES, out=out)
+    assert converted is out
+    numpy.testing.assert_allclose(out, numpy.degrees(solar_altitude_series.value))
+    assert solar_altitude_series.convert_to(RADIANS, out=out) is out
+    numpy.testing.assert_array_equal(out, solar_altitude_series.value)
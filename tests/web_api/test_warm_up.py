@@ -0,0 +1,58 @@
+#
+# Copyright (C) 2025 European Union
+#  
+#  
+# Licensed under the EUPL, Version 1.2 or – as soon they will be approved by the
+# European Commission – subsequent versions of the EUPL (the “Licence”);
+# You may not use this work except in compliance with the Licence.
+# You may obtain a copy of the Licence at:
+# *
+# https://joinup.ec.europa.eu/collection/eupl/eupl-text-eupl-12 
+# *
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the Licence is distributed on an “AS IS” basis, WITHOUT WARRANTIES OR CONDITIONS
+# OF ANY KIND, either express or implied. See the Licence for the specific language
+# governing permissions and limitations under the Licence.
+#
+import numpy
+from xarray import DataArray, open_dataarray
+
+from pvgisprototype.web_api.fastapi.warm_up import (
+    load_coordinate_indexes,
+    preload_page_cache,
+)
+
+
+def test_load_coordinate_indexes_of_lazily_opened_data(tmp_path):
+    path = tmp_path / "temperature.nc"
+    DataArray(
+        numpy.zeros((2, 3), dtype="float32"),
+        coords={
+            "lat": [45.0, 46.0],
+            "lon": [8.0, 9.0, 10.0],
+            "elevation": (("lat", "lon"), numpy.ones((2, 3))),
+        },
+        dims=("lat", "lon"),
+        name="t2m",
+    ).to_netcdf(path, engine="h5netcdf")
+    data = open_dataarray(path, engine="h5netcdf")
+    assert not data["elevation"].variable._in_memory
+
+    summary = load_coordinate_indexes({"temperature_series": data, "time_offset": None})
+
+    assert data["elevation"].variable._in_memory
+    assert summary == "loaded the coordinates of 1 datasets"
+    data.close()
+
+
+def test_preload_page_cache_walks_directory_stores(tmp_path):
+    store = tmp_path / "horizon.zarr"
+    (store / "horizon_height").mkdir(parents=True)
+    (store / "horizon_height" / "0.0").write_bytes(b"\0" * 1024)
+    (store / ".zmetadata").write_bytes(b"{}")
+    single = tmp_path / "sis.nc"
+    single.write_bytes(b"\0" * 1024)
+
+    summary = preload_page_cache([store, single, None])
+
+    assert summary.startswith("advised read-ahead of 3 files")